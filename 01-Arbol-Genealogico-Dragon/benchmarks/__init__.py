@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento del sistema de árbol genealógico.
+
+Se ejecutan como módulos desde la raíz del proyecto, por ejemplo:
+    python -m benchmarks.bench_raices
+"""
@@ -0,0 +1,82 @@
+"""
+Benchmark de la detección de ciclos sobre un pedigrí con fuerte colapso.
+
+Cada generación tiene ANCHO personas y cada una es hija de dos personas de
+la generación anterior (matrimonios entre hermanos y primos, al estilo
+Targaryen), así que los mismos ancestros se alcanzan por muchísimas ramas.
+Se mide el peor caso de _es_ancestro_de (el buscado no es ancestro y hay
+que recorrer todo el pedigrí) con la búsqueda iterativa, con el
+CacheAncestros y, para pocas generaciones, con la versión recursiva
+anterior, cuyo costo crece exponencialmente con la profundidad.
+
+Uso:
+    python -m benchmarks.bench_ancestros [generaciones ...]
+"""
+
+import sys
+from typing import Optional
+
+from benchmarks.comun import medir, silenciar_logs
+from src.models import Persona
+from src.repository import ArbolGenealogico
+from src.validators import CacheAncestros, FamilyValidator
+
+GENERACIONES_POR_DEFECTO = [10, 16, 20, 40]
+ANCHO = 4
+# Por encima de esta profundidad la versión recursiva tarda demasiado
+MAX_GENERACIONES_RECURSIVA = 20
+
+
+def construir_pedigri(generaciones: int, ancho: int = ANCHO) -> ArbolGenealogico:
+    """Registra 'generaciones' x 'ancho' personas; la persona i es hija de i e i+1 (mód. ancho)."""
+    arbol = ArbolGenealogico()
+    anterior = [arbol.registrar_persona(f"G0-{i}") for i in range(ancho)]
+    for g in range(1, generaciones):
+        actual = [arbol.registrar_persona(f"G{g}-{i}") for i in range(ancho)]
+        for i, hijo in enumerate(actual):
+            arbol.add_hijo(anterior[i], hijo)
+            arbol.add_hijo(anterior[(i + 1) % ancho], hijo)
+        anterior = actual
+    return arbol
+
+
+def es_ancestro_recursivo(buscar: Persona, inicio: Persona) -> bool:
+    """Copia de la búsqueda recursiva sin visitados, como referencia."""
+    for p in inicio.padres:
+        if p is not None and (p.id == buscar.id or es_ancestro_recursivo(buscar, p)):
+            return True
+    return False
+
+
+def main(generaciones: list[int]) -> None:
+    silenciar_logs()
+    print(
+        f"{'generaciones':>12} {'personas':>9} {'recursiva (µs)':>15} "
+        f"{'iterativa (µs)':>15} {'con cache (µs)':>15}"
+    )
+    for cantidad in generaciones:
+        arbol = construir_pedigri(cantidad)
+        ultima = arbol.get_persona(len(arbol.personas))
+        ajena = arbol.get_persona(len(arbol.personas) - 1)  # misma generación: no es ancestro
+
+        validador = FamilyValidator(arbol.personas)
+        iterativa = medir(lambda: validador._es_ancestro_de(ajena, ultima), 200)
+
+        cache = CacheAncestros()
+        validador_cache = FamilyValidator(arbol.personas, cache)
+        validador_cache._es_ancestro_de(ajena, ultima)  # calentar el cache
+        con_cache = medir(lambda: validador_cache._es_ancestro_de(ajena, ultima), 200)
+
+        recursiva: Optional[float] = None
+        if cantidad <= MAX_GENERACIONES_RECURSIVA:
+            recursiva = medir(lambda: es_ancestro_recursivo(ajena, ultima), 3)
+        texto_recursiva = f"{recursiva:>15.1f}" if recursiva is not None else f"{'-':>15}"
+
+        print(
+            f"{cantidad:>12} {len(arbol.personas):>9} {texto_recursiva} "
+            f"{iterativa:>15.1f} {con_cache:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(g) for g in sys.argv[1:]] or GENERACIONES_POR_DEFECTO)
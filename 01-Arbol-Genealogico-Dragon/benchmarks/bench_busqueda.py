@@ -0,0 +1,121 @@
+"""
+Benchmark de las búsquedas por nombre con índices.
+
+Compara cada consulta indexada con la alternativa sin índice: recorrer
+todas las personas del repositorio comparando nombres.
+
+Uso:
+    python -m benchmarks.bench_busqueda [personas]
+"""
+
+import re
+import sys
+import time
+
+from benchmarks.comun import construir_arbol_sintetico, medir, silenciar_logs
+from src.indices import clave_fonetica, distancia_edicion, normalizar_nombre, tokenizar
+from src.interfaces import ArbolRepository
+
+PERSONAS_POR_DEFECTO = 100_000
+
+
+def _prefijo_sin_indice(arbol: ArbolRepository, prefijo: str, limite: int) -> list[int]:
+    clave = normalizar_nombre(prefijo)
+    ids = sorted(
+        (normalizar_nombre(p.nombre), p.id)
+        for p in arbol.personas.values()
+        if normalizar_nombre(p.nombre).startswith(clave)
+    )
+    return [persona_id for _, persona_id in ids[:limite]]
+
+
+def _aproximado_sin_indice(arbol: ArbolRepository, nombre: str, distancia: int) -> list[int]:
+    clave = normalizar_nombre(nombre)
+    return [
+        p.id
+        for p in arbol.personas.values()
+        if distancia_edicion(clave, normalizar_nombre(p.nombre)) <= distancia
+    ]
+
+
+def _subcadena_sin_indice(arbol: ArbolRepository, texto: str) -> list[int]:
+    clave = normalizar_nombre(texto)
+    return [p.id for p in arbol.personas.values() if clave in normalizar_nombre(p.nombre)]
+
+
+def _regex_sin_indice(arbol: ArbolRepository, patron: str) -> list[int]:
+    regex = re.compile(patron, re.IGNORECASE)
+    return [p.id for p in arbol.personas.values() if regex.search(normalizar_nombre(p.nombre))]
+
+
+def _palabras_sin_indice(arbol: ArbolRepository, consulta: str) -> list[int]:
+    requeridas = set(tokenizar(consulta))
+    return [p.id for p in arbol.personas.values() if requeridas <= set(tokenizar(p.nombre))]
+
+
+def _fonetico_sin_indice(arbol: ArbolRepository, nombre: str) -> list[int]:
+    codigos = set(clave_fonetica(nombre))
+    return [p.id for p in arbol.personas.values() if codigos <= set(clave_fonetica(p.nombre))]
+
+
+def main(cantidad: int) -> None:
+    silenciar_logs()
+    arbol = construir_arbol_sintetico(cantidad)
+    consulta = "Persona 123"
+    # Primera consulta fuera de la medición: incorpora las altas pendientes
+    assert [p.id for p in arbol.buscar_por_prefijo(consulta)] == _prefijo_sin_indice(
+        arbol, consulta, 10
+    )
+
+    print(f"{cantidad} personas, consulta {consulta!r}")
+    print(f"{'búsqueda':<22} {'sin índice (µs)':>16} {'con índice (µs)':>16}")
+    sin_indice = medir(lambda: _prefijo_sin_indice(arbol, consulta, 10), repeticiones=5)
+    con_indice = medir(lambda: arbol.buscar_por_prefijo(consulta), repeticiones=10_000)
+    print(f"{'prefijo (10 primeros)':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+
+    # El BK-tree se arma en la primera consulta aproximada
+    inicio = time.perf_counter()
+    arbol.buscar_aproximado("x")
+    print(f"construcción del BK-tree: {time.perf_counter() - inicio:.2f} s")
+    errata = "Persna 12345"
+    for distancia in (1, 2):
+        assert sorted(p.id for p in arbol.buscar_aproximado(errata, distancia)) == sorted(
+            _aproximado_sin_indice(arbol, errata, distancia)
+        )
+        sin_indice = medir(lambda: _aproximado_sin_indice(arbol, errata, distancia), 1)
+        con_indice = medir(lambda: arbol.buscar_aproximado(errata, distancia), 10)
+        print(f"{f'aproximada (k={distancia})':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+
+    fragmento, patron = "na 4567", r"persona 9\d*1$"
+    assert [p.id for p in arbol.buscar_por_subcadena(fragmento)] == sorted(
+        _subcadena_sin_indice(arbol, fragmento)
+    )
+    assert [p.id for p in arbol.buscar_por_regex(patron)] == sorted(
+        _regex_sin_indice(arbol, patron)
+    )
+    sin_indice = medir(lambda: _subcadena_sin_indice(arbol, fragmento), 5)
+    con_indice = medir(lambda: arbol.buscar_por_subcadena(fragmento), 100)
+    print(f"{'subcadena':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+    sin_indice = medir(lambda: _regex_sin_indice(arbol, patron), 5)
+    con_indice = medir(lambda: arbol.buscar_por_regex(patron), 100)
+    print(f"{'regex':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+
+    palabras = "PERSONA 4567"
+    assert [p.id for p in arbol.buscar_por_palabras(palabras)] == sorted(
+        _palabras_sin_indice(arbol, palabras)
+    )
+    sin_indice = medir(lambda: _palabras_sin_indice(arbol, palabras), 5)
+    con_indice = medir(lambda: arbol.buscar_por_palabras(palabras), 10_000)
+    print(f"{'palabras (AND)':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+
+    sonido = "Perzona 4567"
+    assert [p.id for p in arbol.buscar_fonetico(sonido)] == sorted(
+        _fonetico_sin_indice(arbol, sonido)
+    )
+    sin_indice = medir(lambda: _fonetico_sin_indice(arbol, sonido), 2)
+    con_indice = medir(lambda: arbol.buscar_fonetico(sonido), 10_000)
+    print(f"{'fonética':<22} {sin_indice:>16.1f} {con_indice:>16.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else PERSONAS_POR_DEFECTO)
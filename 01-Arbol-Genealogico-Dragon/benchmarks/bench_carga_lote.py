@@ -0,0 +1,76 @@
+"""
+Benchmark de la carga en lote (registrar_personas_bulk + add_hijos_bulk)
+frente a registrar_persona + add_hijo uno por uno.
+
+Genera el mismo árbol aleatorio que construir_arbol_sintetico (cada persona
+no raíz es hija de una persona anterior). Con 'desordenado' los IDs se
+permutan, de modo que las relaciones contradicen el orden de alta y el lote
+debe validarse con el orden de Kahn completo.
+
+Uso:
+    python -m benchmarks.bench_carga_lote [tamaño ...]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.comun import silenciar_logs
+from src.repository import ArbolGenealogico
+from src.repository_columnar import ArbolColumnar
+
+TAMANOS_POR_DEFECTO = [10_000, 100_000, 1_000_000]
+RAICES = 10
+# Por encima de esta cantidad la carga de a una se omite
+MAX_CARGA_INDIVIDUAL = 100_000
+
+
+def generar_pares(cantidad: int, desordenado: bool, semilla: int = 42) -> list[tuple[int, int]]:
+    rng = random.Random(semilla)
+    ids = list(range(1, cantidad + 1))
+    if desordenado:
+        rng.shuffle(ids)
+    return [(ids[rng.randrange(i)], ids[i]) for i in range(RAICES, cantidad)]
+
+
+def cargar_de_a_uno(cantidad: int, pares: list[tuple[int, int]]) -> float:
+    inicio = time.perf_counter()
+    arbol = ArbolGenealogico()
+    for i in range(cantidad):
+        arbol.registrar_persona(f"Persona {i}")
+    for padre_id, hijo_id in pares:
+        arbol.add_hijo(arbol.get_persona(padre_id), arbol.get_persona(hijo_id))
+    return time.perf_counter() - inicio
+
+
+def cargar_en_lote(
+    arbol: ArbolGenealogico | ArbolColumnar, cantidad: int, pares: list[tuple[int, int]]
+) -> float:
+    inicio = time.perf_counter()
+    arbol.registrar_personas_bulk(f"Persona {i}" for i in range(cantidad))
+    arbol.add_hijos_bulk(pares)
+    return time.perf_counter() - inicio
+
+
+def main(tamanos: list[int]) -> None:
+    silenciar_logs()
+    print(
+        f"{'personas':>10} {'orden':>12} {'de a uno (s)':>13} {'lote (s)':>9} "
+        f"{'lote columnar (s)':>18}"
+    )
+    for cantidad in tamanos:
+        for desordenado in (False, True):
+            pares = generar_pares(cantidad, desordenado)
+            de_a_uno = (
+                f"{cargar_de_a_uno(cantidad, pares):>13.2f}"
+                if cantidad <= MAX_CARGA_INDIVIDUAL
+                else f"{'-':>13}"
+            )
+            lote = cargar_en_lote(ArbolGenealogico(), cantidad, pares)
+            columnar = cargar_en_lote(ArbolColumnar(), cantidad, pares)
+            etiqueta = "desordenado" if desordenado else "alta"
+            print(f"{cantidad:>10} {etiqueta:>12} {de_a_uno} {lote:>9.2f} {columnar:>18.2f}")
+
+
+if __name__ == "__main__":
+    main([int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO)
@@ -0,0 +1,58 @@
+"""
+Benchmark de la detección de ciclos en add_hijo durante una importación.
+
+Carga un linaje de N generaciones (cada persona hija de la anterior, el peor
+caso para la búsqueda de ancestros porque cada alta recorre todo el linaje)
+con y sin el OrdenTopologico incremental, y el mismo linaje registrado al
+revés, donde cada relación contradice el orden de alta y obliga a reordenar
+todos los ancestros ya cargados: es el peor caso del algoritmo de
+Pearce-Kelly y cuesta lo mismo que la búsqueda de ancestros.
+
+Uso:
+    python -m benchmarks.bench_ciclos [generaciones ...]
+"""
+
+import sys
+import time
+from typing import Optional
+
+from benchmarks.comun import silenciar_logs
+from src.repository import ArbolGenealogico
+
+GENERACIONES_POR_DEFECTO = [1_000, 5_000, 20_000]
+# Por encima de esta cantidad los casos cuadráticos tardan demasiado
+MAX_GENERACIONES_CUADRATICO = 5_000
+
+
+def importar_linaje(generaciones: int, usar_orden: bool, al_reves: bool = False) -> float:
+    """Registra y relaciona el linaje; retorna los segundos que tardan los add_hijo."""
+    arbol = ArbolGenealogico(usar_orden_topologico=usar_orden)
+    personas = [arbol.registrar_persona(f"Gen {i}") for i in range(generaciones)]
+    if al_reves:
+        personas.reverse()
+    inicio = time.perf_counter()
+    for padre, hijo in zip(personas, personas[1:]):
+        arbol.add_hijo(padre, hijo)
+    return time.perf_counter() - inicio
+
+
+def main(generaciones: list[int]) -> None:
+    silenciar_logs()
+    print(f"{'generaciones':>12} {'sin orden (s)':>14} {'con orden (s)':>14} {'al revés (s)':>13}")
+    for cantidad in generaciones:
+        cuadratico = cantidad <= MAX_GENERACIONES_CUADRATICO
+        sin_orden = importar_linaje(cantidad, usar_orden=False) if cuadratico else None
+        con_orden = importar_linaje(cantidad, usar_orden=True)
+        al_reves = importar_linaje(cantidad, usar_orden=True, al_reves=True) if cuadratico else None
+        print(
+            f"{cantidad:>12} {_segundos(sin_orden, 14)} {_segundos(con_orden, 14)} "
+            f"{_segundos(al_reves, 13)}"
+        )
+
+
+def _segundos(valor: Optional[float], ancho: int) -> str:
+    return f"{valor:>{ancho}.3f}" if valor is not None else f"{'-':>{ancho}}"
+
+
+if __name__ == "__main__":
+    main([int(g) for g in sys.argv[1:]] or GENERACIONES_POR_DEFECTO)
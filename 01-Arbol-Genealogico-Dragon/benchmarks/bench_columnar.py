@@ -0,0 +1,54 @@
+"""
+Benchmark de memoria del repositorio columnar frente a ArbolGenealogico.
+
+Construye el mismo árbol sintético en ambos backends y reporta los bytes
+por persona medidos con tracemalloc, más la proyección a 10M de personas.
+
+tracemalloc hace lenta la construcción, por eso el tamaño por defecto es
+menor que en los otros benchmarks; el costo por persona es lineal.
+
+Uso:
+    python -m benchmarks.bench_columnar [cantidad]
+"""
+
+import sys
+import tracemalloc
+from typing import Callable
+
+from benchmarks.comun import construir_arbol_sintetico, silenciar_logs
+from src.interfaces import ArbolRepository
+from src.repository import ArbolGenealogico
+from src.repository_columnar import ArbolColumnar
+
+CANTIDAD_POR_DEFECTO = 200_000
+PROYECCION = 10_000_000
+
+
+def _bytes_por_persona(fabrica: Callable[[], ArbolRepository], cantidad: int) -> float:
+    tracemalloc.start()
+    arbol = construir_arbol_sintetico(cantidad, arbol=fabrica())
+    if isinstance(arbol, ArbolColumnar):
+        arbol.compactar()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memoria / cantidad
+
+
+def main(cantidad: int) -> None:
+    silenciar_logs()
+    print(f"personas: {cantidad}")
+    backends: list[tuple[str, Callable[[], ArbolRepository]]] = [
+        ("ArbolGenealogico", ArbolGenealogico),
+        ("ArbolColumnar", ArbolColumnar),
+    ]
+    for nombre, fabrica in backends:
+        por_persona = _bytes_por_persona(fabrica, cantidad)
+        proyeccion_mb = por_persona * PROYECCION / 2**20
+        print(
+            f"{nombre:<17} {por_persona:8.1f} bytes/persona "
+            f"(~{proyeccion_mb:,.0f} MB para {PROYECCION:,} personas)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO)
@@ -0,0 +1,75 @@
+"""
+Benchmark del modo seguro_para_hilos de ArbolGenealogico: costo del lock
+por consulta en un solo hilo, y lecturas por segundo y espera máxima de un
+escritor con varios hilos lectores a la vez.
+
+Con el GIL las consultas no corren en paralelo en la CPU, pero el lock no
+las serializa entre sí: lo que se mide es que las lecturas no se bloqueen
+unas a otras y que el escritor no quede sin turno.
+
+Uso:
+    python -m benchmarks.bench_concurrencia [lectores ...]
+"""
+
+import sys
+import threading
+import time
+
+from benchmarks.comun import construir_arbol_sintetico, medir, silenciar_logs
+from src.repository import ArbolGenealogico
+
+LECTORES_POR_DEFECTO = [1, 2, 4, 8]
+PERSONAS = 10_000
+DURACION = 1.0
+
+
+def _con_lectores(arbol: ArbolGenealogico, lectores: int) -> tuple[float, float]:
+    """Retorna (lecturas por segundo, espera máxima del escritor en ms)."""
+    fin = time.perf_counter() + DURACION
+    lecturas = [0] * lectores
+    esperas: list[float] = []
+
+    def lector(indice: int) -> None:
+        persona_id = indice + 1
+        while time.perf_counter() < fin:
+            arbol.get_persona(persona_id)
+            arbol.buscar_por_prefijo("persona 1", 5)
+            lecturas[indice] += 2
+
+    def escritor() -> None:
+        numero = 0
+        while time.perf_counter() < fin:
+            inicio = time.perf_counter()
+            arbol.registrar_persona(f"Nueva {numero}")
+            esperas.append(time.perf_counter() - inicio)
+            numero += 1
+            time.sleep(0.01)
+
+    hilos = [threading.Thread(target=lector, args=(i,)) for i in range(lectores)]
+    hilos.append(threading.Thread(target=escritor))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return sum(lecturas) / DURACION, max(esperas) * 1000
+
+
+def main(cantidades: list[int]) -> None:
+    silenciar_logs()
+    simple = construir_arbol_sintetico(PERSONAS)
+    seguro = ArbolGenealogico(seguro_para_hilos=True)
+    construir_arbol_sintetico(PERSONAS, arbol=seguro)
+    # La primera búsqueda completa los índices (BK-tree incluido): fuera de la medición
+    seguro.buscar_por_prefijo("persona")
+    print(
+        f"get_persona: {medir(lambda: simple.get_persona(500), 100_000):.2f} µs sin locks, "
+        f"{medir(lambda: seguro.get_persona(500), 100_000):.2f} µs seguro_para_hilos"
+    )
+    print(f"{'lectores':>9} {'lecturas/s':>12} {'espera escritor (ms)':>21}")
+    for lectores in cantidades:
+        por_segundo, espera = _con_lectores(seguro, lectores)
+        print(f"{lectores:>9} {por_segundo:>12.0f} {espera:>21.2f}")
+
+
+if __name__ == "__main__":
+    main([int(c) for c in sys.argv[1:]] or LECTORES_POR_DEFECTO)
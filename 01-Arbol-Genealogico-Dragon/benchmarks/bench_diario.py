@@ -0,0 +1,72 @@
+"""
+Benchmark de persistir cada modificación: guardar un snapshot completo por
+cambio frente a agregar un registro al diario de ArbolDurable (con fsync por
+cambio, fsync cada 100 cambios y group commit de a 100), y tiempo de
+recuperación (snapshot más diario) al reabrir.
+
+Uso:
+    python -m benchmarks.bench_diario [tamaño ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_carga_lote import cargar_en_lote, generar_pares
+from benchmarks.comun import silenciar_logs
+from src.repository import ArbolGenealogico
+from src.repository_durable import ArbolDurable
+
+TAMANOS_POR_DEFECTO = [10_000, 100_000]
+CAMBIOS = 1000
+
+
+def _cambios_durables(arbol: ArbolDurable, lote: int) -> float:
+    """Registra CAMBIOS personas (de a ``lote`` por agrupar()) y retorna µs por cambio."""
+    inicio = time.perf_counter()
+    for desde in range(0, CAMBIOS, lote):
+        with arbol.agrupar():
+            for numero in range(desde, desde + lote):
+                arbol.registrar_persona(f"Nueva {numero}")
+    return (time.perf_counter() - inicio) / CAMBIOS * 1e6
+
+
+def main(tamanos: list[int]) -> None:
+    silenciar_logs()
+    print(
+        f"{'personas':>10} {'snapshot (ms)':>14} {'fsync (µs)':>11} {'fsync/100 (µs)':>15} "
+        f"{'lote 100 (µs)':>14} {'recuperar (s)':>14}"
+    )
+    with tempfile.TemporaryDirectory() as directorio:
+        for cantidad in tamanos:
+            ruta = os.path.join(directorio, f"arbol-{cantidad}.snap")
+            base = ArbolGenealogico()
+            cargar_en_lote(base, cantidad, generar_pares(cantidad, desordenado=False))
+            base.save_snapshot(ruta)
+
+            # Snapshot completo por cambio: pocas repeticiones alcanzan
+            repeticiones = 10
+            inicio = time.perf_counter()
+            for numero in range(repeticiones):
+                base.registrar_persona(f"Nueva {numero}")
+                base.save_snapshot(ruta)
+            snapshot = (time.perf_counter() - inicio) / repeticiones * 1000
+
+            tiempos = []
+            for fsync_cada, lote in ((1, 1), (100, 1), (1, 100)):
+                with ArbolDurable(ruta, fsync_cada=fsync_cada) as arbol:
+                    tiempos.append(_cambios_durables(arbol, lote))
+
+            inicio = time.perf_counter()
+            ArbolDurable(ruta).cerrar()
+            recuperar = time.perf_counter() - inicio
+
+            print(
+                f"{cantidad:>10} {snapshot:>14.1f} {tiempos[0]:>11.1f} {tiempos[1]:>15.1f} "
+                f"{tiempos[2]:>14.1f} {recuperar:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO)
@@ -0,0 +1,74 @@
+"""
+Benchmark de impresión del árbol con PrintArbolVisitor.
+
+Compara acumular todas las líneas y unirlas al final (get_resultado) con
+escribirlas en un stream a medida que se generan (destino=...). Informa el
+tiempo hasta la primera línea, el tiempo total y el pico de memoria medido
+con tracemalloc durante el recorrido. La salida va a os.devnull.
+
+Uso:
+    python -m benchmarks.bench_impresion [personas]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from typing import TextIO
+
+from benchmarks.comun import construir_arbol_sintetico, silenciar_logs
+from src.interfaces import ArbolRepository
+from src.visitors import PrintArbolVisitor
+
+PERSONAS_POR_DEFECTO = 200_000
+
+
+class _PrimeraLinea:
+    """Stream que anota cuándo llega la primera escritura y reenvía el resto."""
+
+    def __init__(self, destino: TextIO):
+        self.destino = destino
+        self.primera: float | None = None
+
+    def write(self, texto: str) -> int:
+        if self.primera is None:
+            self.primera = time.perf_counter()
+        return self.destino.write(texto)
+
+
+def _medir(arbol: ArbolRepository, destino: TextIO, en_stream: bool) -> tuple[float, float, int]:
+    """Retorna (segundos hasta la primera línea, segundos totales, pico de bytes)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    if en_stream:
+        espia = _PrimeraLinea(destino)
+        visitor = PrintArbolVisitor(destino=espia)  # type: ignore[arg-type]
+        arbol.recorrer_arbol_completo(visitor)
+        primera = (espia.primera or inicio) - inicio
+    else:
+        visitor = PrintArbolVisitor()
+        arbol.recorrer_arbol_completo(visitor)
+        destino.write(visitor.get_resultado())
+        primera = time.perf_counter() - inicio
+    total = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return primera, total, pico
+
+
+def main(cantidad: int) -> None:
+    silenciar_logs()
+    arbol = construir_arbol_sintetico(cantidad)
+    with open(os.devnull, "w", encoding="utf-8") as destino:
+        acumulado = _medir(arbol, destino, en_stream=False)
+        en_stream = _medir(arbol, destino, en_stream=True)
+
+    print(f"Árbol sintético de {cantidad} personas, salida a os.devnull")
+    print(f"{'modo':>12} {'1ra línea (s)':>14} {'total (s)':>10} {'pico (MiB)':>11}")
+    for nombre, (primera, total, pico) in (("acumulado", acumulado), ("stream", en_stream)):
+        print(f"{nombre:>12} {primera:>14.3f} {total:>10.2f} {pico / 2**20:>11.1f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [PERSONAS_POR_DEFECTO]))
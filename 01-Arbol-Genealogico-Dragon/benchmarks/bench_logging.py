@@ -0,0 +1,104 @@
+"""
+Benchmark del costo del logging por operación del repositorio.
+
+Mide el tiempo promedio de registrar_persona() + add_hijo() con tres
+configuraciones de los loggers ``src.*``:
+
+- sin logs: logging.disable(), la referencia de costo cero;
+- INFO directo: los handlers formatean y escriben en el hilo que loguea;
+- INFO en cola: solo se encola el registro (QueueHandler) y un
+  QueueListener formatea y escribe en otro hilo.
+
+En los tres casos los mensajes DEBUG se descartan antes de formatearse,
+porque las llamadas usan argumentos diferidos (``logger.debug("%s", x)``)
+y los cálculos costosos están protegidos con ``isEnabledFor``. La salida
+se escribe en os.devnull para medir el logging y no la terminal.
+
+Uso:
+    python -m benchmarks.bench_logging [operaciones]
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+from src.repository import ArbolGenealogico
+
+OPERACIONES_POR_DEFECTO = 20_000
+
+
+def _loggers_del_proyecto() -> list[logging.Logger]:
+    return [
+        logger
+        for nombre, logger in logging.root.manager.loggerDict.items()
+        if nombre.startswith("src") and isinstance(logger, logging.Logger)
+    ]
+
+
+def _redirigir(handler: logging.Handler) -> list[tuple[logging.Logger, list[logging.Handler]]]:
+    """Reemplaza los handlers de los loggers ``src.*`` y devuelve los originales."""
+    originales = []
+    for logger in _loggers_del_proyecto():
+        originales.append((logger, logger.handlers[:]))
+        logger.handlers = [handler]
+    return originales
+
+
+def _restaurar(originales: list[tuple[logging.Logger, list[logging.Handler]]]) -> None:
+    for logger, handlers in originales:
+        logger.handlers = handlers
+
+
+def _medir_operaciones(operaciones: int) -> float:
+    """Retorna microsegundos por operación (registro + relación padre-hijo)."""
+    arbol = ArbolGenealogico()
+    anterior = arbol.registrar_persona("Raíz")
+    inicio = time.perf_counter()
+    for i in range(operaciones):
+        persona = arbol.registrar_persona(f"Persona {i}")
+        arbol.add_hijo(anterior, persona)
+        anterior = persona
+    return (time.perf_counter() - inicio) / operaciones * 1e6
+
+
+def main(operaciones: int) -> None:
+    # Crea los loggers de los módulos antes de redirigirlos
+    ArbolGenealogico()
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    with open(os.devnull, "w", encoding="utf-8") as destino:
+        logging.disable(logging.CRITICAL)
+        sin_logs = _medir_operaciones(operaciones)
+        logging.disable(logging.NOTSET)
+
+        directo = logging.StreamHandler(destino)
+        directo.setFormatter(formatter)
+        originales = _redirigir(directo)
+        try:
+            con_info = _medir_operaciones(operaciones)
+        finally:
+            _restaurar(originales)
+
+        cola: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(cola, directo)
+        originales = _redirigir(logging.handlers.QueueHandler(cola))
+        listener.start()
+        try:
+            con_cola = _medir_operaciones(operaciones)
+        finally:
+            listener.stop()
+            _restaurar(originales)
+
+    print(f"{operaciones} operaciones (registrar_persona + add_hijo), logs a os.devnull")
+    print(f"{'configuración':>14} {'µs/op':>9} {'sobrecosto':>11}")
+    print(f"{'sin logs':>14} {sin_logs:>9.1f} {'-':>11}")
+    print(f"{'INFO directo':>14} {con_info:>9.1f} {con_info - sin_logs:>+11.1f}")
+    print(f"{'INFO en cola':>14} {con_cola:>9.1f} {con_cola - sin_logs:>+11.1f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [OPERACIONES_POR_DEFECTO]))
@@ -0,0 +1,94 @@
+"""
+Benchmark de memoria por persona: Persona compacta (__slots__ + IDs) frente
+a la representación anterior basada en __dict__ y referencias a objetos.
+
+Ambas variantes construyen el mismo árbol sintético (hasta dos padres por
+persona y parejas entre personas consecutivas) junto con su diccionario
+ID -> Persona, que es lo que mantiene el repositorio.
+
+Uso:
+    python -m benchmarks.bench_memoria_persona [cantidad]
+"""
+
+import random
+import sys
+import tracemalloc
+from typing import Callable, Optional
+
+from src.models import Persona
+
+CANTIDAD_POR_DEFECTO = 1_000_000
+
+
+class PersonaConDict:
+    """Réplica de la Persona original (atributos en __dict__, relaciones por objeto)."""
+
+    def __init__(self, person_id: int, nombre: str):
+        self.id = person_id
+        self.nombre: str = nombre
+        self.pareja: Optional["PersonaConDict"] = None
+        self.hijos: list["PersonaConDict"] = []
+        self.padres: tuple[Optional["PersonaConDict"], Optional["PersonaConDict"]] = (None, None)
+
+
+def _construir_con_dict(cantidad: int, nombres: list[str], padres: list[tuple[int, int]]):
+    personas = {i: PersonaConDict(i, nombres[i - 1]) for i in range(1, cantidad + 1)}
+    for hijo_id, (p0, p1) in enumerate(padres, start=1):
+        hijo = personas[hijo_id]
+        if p0:
+            personas[p0].hijos.append(hijo)
+        if p1:
+            personas[p1].hijos.append(hijo)
+        hijo.padres = (personas[p0] if p0 else None, personas[p1] if p1 else None)
+        if hijo_id % 2 == 0:
+            hijo.pareja = personas[hijo_id - 1]
+            personas[hijo_id - 1].pareja = hijo
+    return personas
+
+
+def _construir_compacto(cantidad: int, nombres: list[str], padres: list[tuple[int, int]]):
+    personas: dict[int, Persona] = {}
+    for i in range(1, cantidad + 1):
+        personas[i] = Persona(i, nombres[i - 1], registro=personas)
+    for hijo_id, (p0, p1) in enumerate(padres, start=1):
+        hijo = personas[hijo_id]
+        if p0:
+            personas[p0].hijos.append(hijo)
+        if p1:
+            personas[p1].hijos.append(hijo)
+        hijo.padres = (personas[p0] if p0 else None, personas[p1] if p1 else None)
+        if hijo_id % 2 == 0:
+            hijo.pareja = personas[hijo_id - 1]
+            personas[hijo_id - 1].pareja = hijo
+    return personas
+
+
+def _medir(construir: Callable[[], object]) -> int:
+    tracemalloc.start()
+    resultado = construir()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return memoria
+
+
+def main(cantidad: int) -> None:
+    rng = random.Random(42)
+    # Los nombres se crean fuera de la medición: son idénticos en ambas variantes
+    nombres = [f"Persona {i}" for i in range(1, cantidad + 1)]
+    padres = [
+        (0, 0) if i <= 10 else (rng.randrange(1, i), rng.randrange(1, i))
+        for i in range(1, cantidad + 1)
+    ]
+
+    con_dict = _medir(lambda: _construir_con_dict(cantidad, nombres, padres))
+    compacto = _medir(lambda: _construir_compacto(cantidad, nombres, padres))
+
+    print(f"personas: {cantidad}")
+    print(f"__dict__ + referencias : {con_dict / cantidad:8.1f} bytes/persona")
+    print(f"__slots__ + IDs        : {compacto / cantidad:8.1f} bytes/persona")
+    print(f"reducción              : {con_dict / compacto:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_POR_DEFECTO)
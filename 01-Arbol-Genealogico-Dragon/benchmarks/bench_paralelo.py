@@ -0,0 +1,56 @@
+"""
+Benchmark del recorrido en paralelo por componentes.
+
+El árbol sintético tiene un solo padre por persona, así que cada raíz es
+una casa independiente. Se ejecutan impresión (a os.devnull), búsqueda y
+estadísticas en una sola pasada, primero en este proceso y después
+repartiendo las casas entre procesos.
+
+Uso:
+    python -m benchmarks.bench_paralelo [personas] [casas] [procesos]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.comun import construir_arbol_sintetico, silenciar_logs
+from src.interfaces import ArbolRepository
+from src.visitors import EstadisticasVisitor, PrintArbolVisitor, SearchArbolVisitor
+
+PERSONAS_POR_DEFECTO = 200_000
+CASAS_POR_DEFECTO = 16
+
+
+def _medir(arbol: ArbolRepository, procesos: int) -> float:
+    with open(os.devnull, "w", encoding="utf-8") as destino:
+        visitors = (
+            PrintArbolVisitor(destino=destino),
+            SearchArbolVisitor("Persona 1"),
+            EstadisticasVisitor(),
+        )
+        inicio = time.perf_counter()
+        arbol.recorrer_arbol_completo(*visitors, procesos=procesos)
+        return time.perf_counter() - inicio
+
+
+def main(cantidad: int, casas: int, procesos: int) -> None:
+    silenciar_logs()
+    arbol = construir_arbol_sintetico(cantidad, raices=casas)
+    secuencial = _medir(arbol, 1)
+    paralelo = _medir(arbol, procesos)
+
+    print(f"{cantidad} personas en {casas} casas, {os.cpu_count()} CPU(s) disponibles")
+    print(f"{'procesos':>9} {'tiempo (s)':>11}")
+    print(f"{1:>9} {secuencial:>11.2f}")
+    print(f"{procesos:>9} {paralelo:>11.2f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    cantidad, casas, procesos = (argumentos + [0, 0, 0][len(argumentos) :])[:3]
+    main(
+        cantidad or PERSONAS_POR_DEFECTO,
+        casas or CASAS_POR_DEFECTO,
+        procesos or max(2, os.cpu_count() or 1),
+    )
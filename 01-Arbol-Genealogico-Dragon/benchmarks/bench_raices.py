@@ -0,0 +1,27 @@
+"""
+Benchmark de init_get_root: el costo debe depender de la cantidad de raíces,
+no del tamaño del árbol.
+
+Uso:
+    python -m benchmarks.bench_raices [tamaño ...]
+"""
+
+import sys
+
+from benchmarks.comun import construir_arbol_sintetico, medir, silenciar_logs
+
+TAMANOS_POR_DEFECTO = [1_000, 10_000, 100_000, 1_000_000]
+RAICES = 10
+
+
+def main(tamanos: list[int]) -> None:
+    silenciar_logs()
+    print(f"{'personas':>10} {'raíces':>7} {'init_get_root (µs)':>20}")
+    for tamano in tamanos:
+        arbol = construir_arbol_sintetico(tamano, raices=RAICES)
+        tiempo = medir(arbol.init_get_root)
+        print(f"{tamano:>10} {len(arbol.init_get_root()):>7} {tiempo:>20.2f}")
+
+
+if __name__ == "__main__":
+    main([int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO)
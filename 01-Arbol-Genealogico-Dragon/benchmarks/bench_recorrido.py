@@ -0,0 +1,116 @@
+"""
+Benchmark del motor de recorrido de visitors.
+
+Compara una búsqueda por nombre sobre todo el árbol hecha como antes
+(recursión con accept_visitor() por hijo y un set de visitados) con
+SearchArbolVisitor sobre iterar_recorrido() y MapaVisitados. También
+informa el tamaño del set frente al bytearray de visitados.
+
+Luego ejecuta impresión (a os.devnull), búsqueda y un conteo por
+profundidad, primero con una llamada a recorrer_arbol_completo() por
+visitor y después los tres juntos en una sola pasada.
+
+Uso:
+    python -m benchmarks.bench_recorrido [personas]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+
+from benchmarks.comun import construir_arbol_sintetico, silenciar_logs
+from src.interfaces import ArbolRepository
+from src.models import Persona
+from src.visitors import (
+    ArbolVisitorInterface,
+    PrintArbolVisitor,
+    SearchArbolVisitor,
+    VisitorRecorrido,
+)
+
+PERSONAS_POR_DEFECTO = 200_000
+
+
+class _BusquedaRecursiva(ArbolVisitorInterface):
+    """Referencia: la implementación recursiva previa de SearchArbolVisitor."""
+
+    def __init__(self, nombre_a_buscar: str):
+        self.resultado: list[Persona] = []
+        self.nombre_a_buscar = nombre_a_buscar.strip().lower()
+        self.visitados: set[int] = set()
+
+    def visitar(self, persona: Persona):
+        if persona.id in self.visitados:
+            return
+        self.visitados.add(persona.id)
+        if persona.nombre.strip().lower() == self.nombre_a_buscar:
+            self.resultado.append(persona)
+        for hijo in persona.hijos:
+            hijo.accept_visitor(self)
+
+
+class _ConteoPorProfundidad(VisitorRecorrido):
+    def __init__(self):
+        super().__init__()
+        self.conteo: Counter[int] = Counter()
+
+    def al_visitar(self, persona: Persona, profundidad: int, es_ultimo: bool) -> None:
+        self.conteo[profundidad] += 1
+
+
+def _comparar_fusion(arbol: ArbolRepository, buscado: str) -> None:
+    with open(os.devnull, "w", encoding="utf-8") as destino:
+        inicio = time.perf_counter()
+        for visitor in (
+            PrintArbolVisitor(destino=destino),
+            SearchArbolVisitor(buscado),
+            _ConteoPorProfundidad(),
+        ):
+            arbol.recorrer_arbol_completo(visitor)
+        separados = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        arbol.recorrer_arbol_completo(
+            PrintArbolVisitor(destino=destino), SearchArbolVisitor(buscado), _ConteoPorProfundidad()
+        )
+        fusionados = time.perf_counter() - inicio
+
+    print("\nImpresión + búsqueda + conteo por profundidad")
+    print(f"{'pasadas':>24} {'tiempo (s)':>11}")
+    print(f"{'una por visitor':>24} {separados:>11.3f}")
+    print(f"{'fusionadas':>24} {fusionados:>11.3f}")
+
+
+def main(cantidad: int) -> None:
+    silenciar_logs()
+    arbol = construir_arbol_sintetico(cantidad)
+    buscado = f"Persona {cantidad - 1}"
+
+    inicio = time.perf_counter()
+    recursivo = _BusquedaRecursiva(buscado)
+    arbol.recorrer_arbol_completo(recursivo)
+    con_recursion = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    motor = SearchArbolVisitor(buscado)
+    arbol.recorrer_arbol_completo(motor)
+    con_motor = time.perf_counter() - inicio
+
+    assert [p.id for p in recursivo.resultado] == [p.id for p in motor.resultado]
+    print(f"Búsqueda por nombre sobre {cantidad} personas")
+    print(f"{'implementación':>24} {'tiempo (s)':>11} {'visitados (KiB)':>16}")
+    print(
+        f"{'recursiva + set':>24} {con_recursion:>11.3f} "
+        f"{sys.getsizeof(recursivo.visitados) / 1024:>16.0f}"
+    )
+    print(
+        f"{'iterar_recorrido + mapa':>24} {con_motor:>11.3f} "
+        f"{sys.getsizeof(motor.visitados.marcas) / 1024:>16.0f}"
+    )
+    _comparar_fusion(arbol, buscado)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [PERSONAS_POR_DEFECTO]))
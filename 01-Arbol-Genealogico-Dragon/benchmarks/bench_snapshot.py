@@ -0,0 +1,59 @@
+"""
+Benchmark de save_snapshot() / load_snapshot() frente a reconstruir el árbol
+con la API de carga en lote (registrar_personas_bulk + add_hijos_bulk), y de
+abrir el mismo snapshot sin cargarlo con ArbolMapeado (con y sin CRC32).
+
+Uso:
+    python -m benchmarks.bench_snapshot [tamaño ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_carga_lote import cargar_en_lote, generar_pares
+from benchmarks.comun import silenciar_logs
+from src.repository import ArbolGenealogico
+from src.repository_mmap import ArbolMapeado
+
+TAMANOS_POR_DEFECTO = [10_000, 100_000, 1_000_000]
+
+
+def main(tamanos: list[int]) -> None:
+    silenciar_logs()
+    print(
+        f"{'personas':>10} {'lote (s)':>9} {'guardar (s)':>12} {'cargar (s)':>11} "
+        f"{'mapear (ms)':>12} {'sin CRC (ms)':>13} {'tamaño (MiB)':>13}"
+    )
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "arbol.snap")
+        for cantidad in tamanos:
+            arbol = ArbolGenealogico()
+            lote = cargar_en_lote(arbol, cantidad, generar_pares(cantidad, desordenado=False))
+
+            inicio = time.perf_counter()
+            arbol.save_snapshot(ruta)
+            guardar = time.perf_counter() - inicio
+            del arbol
+
+            inicio = time.perf_counter()
+            ArbolGenealogico.load_snapshot(ruta)
+            cargar = time.perf_counter() - inicio
+
+            mapeos = []
+            for verificar_crc in (True, False):
+                inicio = time.perf_counter()
+                with ArbolMapeado(ruta, verificar_crc=verificar_crc) as mapeado:
+                    mapeado.get_persona(cantidad // 2).hijos
+                mapeos.append((time.perf_counter() - inicio) * 1000)
+
+            tamano = os.path.getsize(ruta) / 2**20
+            print(
+                f"{cantidad:>10} {lote:>9.2f} {guardar:>12.2f} {cargar:>11.2f} "
+                f"{mapeos[0]:>12.1f} {mapeos[1]:>13.2f} {tamano:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO)
@@ -0,0 +1,82 @@
+"""
+Benchmark de clasificación de relaciones candidatas: validar() con excepciones
+frente a check() y validar_lote(), que devuelven registros compactos.
+
+Sobre un árbol sintético donde cada persona no raíz ya tiene sus dos padres
+se generan relaciones padre-hijo al azar, casi todas inválidas (límite de
+padres, ciclos, repetidas), y se cuenta cuántas son válidas con cada
+mecanismo.
+
+Uso:
+    python -m benchmarks.bench_validacion [personas] [candidatas]
+"""
+
+import logging
+import random
+import sys
+import time
+
+from benchmarks.comun import construir_arbol_sintetico, silenciar_logs
+from src.exceptions import ArbolGenealogicoError
+from src.repository import ArbolGenealogico
+from src.validators import FamilyValidator
+
+PERSONAS_POR_DEFECTO = 100_000
+CANDIDATAS_POR_DEFECTO = 200_000
+
+
+def main(cantidad_personas: int, cantidad_candidatas: int) -> None:
+    silenciar_logs()
+    arbol = construir_arbol_sintetico(cantidad_personas)
+    # validar() sigue formateando sus mensajes de error; solo se evita imprimirlos
+    logging.disable(logging.ERROR)
+    assert isinstance(arbol, ArbolGenealogico)
+    personas = arbol.personas
+    rng = random.Random(7)
+    segundos_padres = []
+    for hijo_id in range(2, cantidad_personas + 1):
+        padre0_id, padre1_id = personas[hijo_id].padres_ids
+        if padre0_id and not padre1_id:
+            candidato = rng.randrange(1, hijo_id)
+            if candidato != padre0_id:
+                segundos_padres.append((candidato, hijo_id))
+    arbol.add_hijos_bulk(segundos_padres)
+    candidatas = [
+        (rng.randint(1, cantidad_personas), rng.randint(1, cantidad_personas))
+        for _ in range(cantidad_candidatas)
+    ]
+    validador = FamilyValidator(personas, detector_ciclos=arbol._orden)
+
+    inicio = time.perf_counter()
+    validas_excepciones = 0
+    for padre_id, hijo_id in candidatas:
+        try:
+            validador.validar(personas[padre_id], personas[hijo_id], "hijo")
+            validas_excepciones += 1
+        except ArbolGenealogicoError:
+            pass
+    con_excepciones = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    validas_check = sum(
+        validador.check(personas[padre_id], personas[hijo_id], "hijo") is None
+        for padre_id, hijo_id in candidatas
+    )
+    con_check = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultados = validador.validar_lote(candidatas)
+    con_lote = time.perf_counter() - inicio
+
+    print(f"{cantidad_candidatas} relaciones candidatas sobre {cantidad_personas} personas")
+    print(f"{'mecanismo':>22} {'tiempo (s)':>11} {'válidas':>9}")
+    print(f"{'validar() + except':>22} {con_excepciones:>11.2f} {validas_excepciones:>9}")
+    print(f"{'check()':>22} {con_check:>11.2f} {validas_check:>9}")
+    # En lote el cupo de padres se descuenta entre relaciones del mismo lote
+    validas_lote = cantidad_candidatas - len(resultados)
+    print(f"{'validar_lote()':>22} {con_lote:>11.2f} {validas_lote:>9}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [PERSONAS_POR_DEFECTO, CANDIDATAS_POR_DEFECTO]))
@@ -0,0 +1,77 @@
+"""
+Benchmark de ArbolVersionado: costo de publicar una versión por modificación
+(copy-on-write del camino en el trie) frente a copiar el dict de personas
+entero, costo de fijar una versión para leer, y rondas de escribir y
+buscar: los índices se comparten entre versiones, así que una búsqueda
+después de cada alta no debería reconstruirlos.
+
+Uso:
+    python -m benchmarks.bench_versiones [tamaño ...]
+"""
+
+import sys
+import time
+
+from benchmarks.bench_carga_lote import cargar_en_lote, generar_pares
+from benchmarks.comun import medir, silenciar_logs
+from src.interfaces import ArbolRepository
+from src.repository import ArbolGenealogico
+from src.repository_versionado import ArbolVersionado
+
+TAMANOS_POR_DEFECTO = [10_000, 100_000, 1_000_000]
+CAMBIOS = 1000
+RONDAS_BUSQUEDA = 200
+
+
+def _escribir_y_buscar(arbol: ArbolRepository) -> float:
+    """µs por ronda de alta seguida de una búsqueda por prefijo y otra por nombre."""
+    arbol.buscar_por_prefijo("persona 1")  # construye los índices fuera de la medición
+    inicio = time.perf_counter()
+    for numero in range(RONDAS_BUSQUEDA):
+        arbol.registrar_persona(f"Buscada {numero}")
+        arbol.buscar_por_prefijo("buscada", 5)
+        arbol.buscar_por_nombre(f"Buscada {numero}")
+    return (time.perf_counter() - inicio) / RONDAS_BUSQUEDA * 1e6
+
+
+def main(tamanos: list[int]) -> None:
+    silenciar_logs()
+    print(
+        f"{'personas':>10} {'envolver (s)':>13} {'clásico (µs)':>13} {'versionado (µs)':>16} "
+        f"{'copia dict (µs)':>16} {'fijar (µs)':>11} "
+        f"{'alta+buscar clásico (µs)':>25} {'alta+buscar versionado (µs)':>28}"
+    )
+    for cantidad in tamanos:
+        clasico = ArbolGenealogico()
+        cargar_en_lote(clasico, cantidad, generar_pares(cantidad, desordenado=False))
+        raiz = clasico.init_get_root()[0]
+
+        inicio = time.perf_counter()
+        arbol = ArbolVersionado(clasico)
+        envolver = time.perf_counter() - inicio
+
+        # Alta más relación con el primer ancestro, como en la carga normal
+        inicio = time.perf_counter()
+        for numero in range(CAMBIOS):
+            arbol.add_hijo(raiz, arbol.registrar_persona(f"Nueva {numero}"))
+        versionado = (time.perf_counter() - inicio) / CAMBIOS * 1e6
+
+        base = ArbolGenealogico()
+        cargar_en_lote(base, cantidad, generar_pares(cantidad, desordenado=False))
+        raiz_base = base.init_get_root()[0]
+        inicio = time.perf_counter()
+        for numero in range(CAMBIOS):
+            base.add_hijo(raiz_base, base.registrar_persona(f"Nueva {numero}"))
+        sin_versiones = (time.perf_counter() - inicio) / CAMBIOS * 1e6
+
+        copia = medir(lambda: dict(clasico.personas), repeticiones=20)
+        fijar = medir(arbol.version, repeticiones=100_000)
+        print(
+            f"{cantidad:>10} {envolver:>13.2f} {sin_versiones:>13.1f} {versionado:>16.1f} "
+            f"{copia:>16.0f} {fijar:>11.3f} "
+            f"{_escribir_y_buscar(base):>25.1f} {_escribir_y_buscar(arbol):>28.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(t) for t in sys.argv[1:]] or TAMANOS_POR_DEFECTO)
@@ -0,0 +1,55 @@
+"""
+Utilidades compartidas por los benchmarks: árboles sintéticos y medición.
+"""
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from src.repository import ArbolGenealogico
+
+if TYPE_CHECKING:
+    from src.interfaces import ArbolRepository
+
+
+def silenciar_logs() -> None:
+    """Desactiva los logs INFO/DEBUG para no medir la escritura a consola."""
+    logging.disable(logging.INFO)
+
+
+def construir_arbol_sintetico(
+    cantidad: int,
+    raices: int = 10,
+    semilla: int = 42,
+    arbol: Optional["ArbolRepository"] = None,
+) -> "ArbolRepository":
+    """
+    Construye un árbol usando la API pública del repositorio.
+
+    Cada persona que no es raíz recibe como padre a una persona anterior
+    elegida al azar, lo que produce linajes de profundidad logarítmica.
+
+    Args:
+        cantidad: Total de personas a registrar.
+        raices: Cantidad de personas sin padres.
+        semilla: Semilla del generador aleatorio (resultados reproducibles).
+        arbol: Repositorio a poblar (por defecto, un ArbolGenealogico nuevo).
+    """
+    rng = random.Random(semilla)
+    if arbol is None:
+        arbol = ArbolGenealogico()
+    for i in range(cantidad):
+        arbol.registrar_persona(f"Persona {i}")
+    for i in range(raices, cantidad):
+        padre = arbol.get_persona(rng.randrange(i) + 1)
+        arbol.add_hijo(padre, arbol.get_persona(i + 1))
+    return arbol
+
+
+def medir(funcion: Callable[[], object], repeticiones: int = 1000) -> float:
+    """Retorna el tiempo promedio por llamada en microsegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
@@ -4,23 +4,39 @@ House of the Dragon Genealogy System
 
 from .exceptions import (
     ArbolGenealogicoError,
+    ArbolSoloLecturaError,
     CicloTemporalError,
+    ConsultaInvalidaError,
+    DiarioFallidoError,
+    DiarioInvalidoError,
     EliminacionConDescendientesError,
     IDInvalidoError,
     LimitePadresExcedidoError,
+    LoteRelacionesError,
     ParejaNoExisteError,
     PersonaNoEncontradaError,
     RelacionIncestuosaError,
     RelacionInvalidaError,
+    SnapshotInvalidoError,
     ValidacionError,
 )
 from .models import Persona
 from .repository import ArbolGenealogico
+from .repository_columnar import ArbolColumnar
+from .repository_durable import ArbolDurable
+from .repository_mmap import ArbolMapeado
+from .repository_sqlite import ArbolSQLite
+from .repository_versionado import ArbolVersionado
 from .ui import DinastiaUI
 
 __all__ = [
     "Persona",
     "ArbolGenealogico",
+    "ArbolColumnar",
+    "ArbolMapeado",
+    "ArbolSQLite",
+    "ArbolDurable",
+    "ArbolVersionado",
     "DinastiaUI",
     # Excepciones
     "ArbolGenealogicoError",
@@ -33,6 +49,12 @@ __all__ = [
     "RelacionIncestuosaError",
     "ParejaNoExisteError",
     "EliminacionConDescendientesError",
+    "LoteRelacionesError",
+    "ConsultaInvalidaError",
+    "SnapshotInvalidoError",
+    "ArbolSoloLecturaError",
+    "DiarioInvalidoError",
+    "DiarioFallidoError",
 ]
 
 __version__ = "1.0.0"
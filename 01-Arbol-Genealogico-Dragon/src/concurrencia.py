@@ -0,0 +1,159 @@
+"""
+Lock de lectura/escritura para usar un repositorio desde varios hilos.
+
+Muchas lecturas pueden avanzar juntas; una escritura espera a que terminen
+las lecturas en curso y se ejecuta sola. Se prefiere a los escritores: en
+cuanto uno espera, las lecturas nuevas esperan detrás de él, así una
+corriente continua de lecturas no deja a las modificaciones sin turno.
+
+El lock es reentrante por hilo: un método que toma el lock puede llamar a
+otro que también lo toma (una lectura dentro de una escritura, o una
+lectura dentro de otra) sin bloquearse. Pasar de lectura a escritura no
+está permitido, porque dos lectores que lo intentaran a la vez se
+esperarían mutuamente para siempre.
+
+Los métodos de una clase se marcan con @con_lectura / @con_escritura, que
+no los modifican: proteger_metodos() los envuelve solo en las instancias
+que lo necesitan, así el modo sin locks no paga ningún costo por llamada.
+"""
+
+import functools
+import threading
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Optional, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Atributo con el que los decoradores marcan el modo de cada método
+_MODO = "_modo_lock"
+
+
+class LockLecturaEscritura:
+    """Lock de lectura/escritura que prefiere a los escritores, reentrante por hilo."""
+
+    def __init__(self) -> None:
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escritores_esperando = 0
+        # Hilo que tiene la escritura (None si nadie)
+        self._escritor: Optional[int] = None
+        # Por hilo: si ya tiene una lectura tomada
+        self._local = threading.local()
+
+    def adquirir_lectura(self) -> bool:
+        """
+        Toma el lock compartido.
+
+        Returns:
+            bool: False si el hilo ya tenía el lock (reentrada): en ese caso
+            no hay que llamar a liberar_lectura().
+        """
+        if self._escritor == threading.get_ident() or getattr(self._local, "leyendo", False):
+            return False
+        with self._condicion:
+            while self._escritor is not None or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+        self._local.leyendo = True
+        return True
+
+    def liberar_lectura(self) -> None:
+        self._local.leyendo = False
+        with self._condicion:
+            self._lectores -= 1
+            if self._lectores == 0:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self) -> bool:
+        """
+        Toma el lock exclusivo.
+
+        Returns:
+            bool: False si el hilo ya tenía la escritura (reentrada).
+
+        Raises:
+            RuntimeError: Si el hilo tiene una lectura tomada.
+        """
+        hilo = threading.get_ident()
+        if self._escritor == hilo:
+            return False
+        if getattr(self._local, "leyendo", False):
+            raise RuntimeError("No se puede pasar de lectura a escritura con el mismo lock")
+        with self._condicion:
+            self._escritores_esperando += 1
+            try:
+                while self._escritor is not None or self._lectores:
+                    self._condicion.wait()
+            finally:
+                self._escritores_esperando -= 1
+            self._escritor = hilo
+        return True
+
+    def liberar_escritura(self) -> None:
+        with self._condicion:
+            self._escritor = None
+            self._condicion.notify_all()
+
+    @contextmanager
+    def lectura(self) -> Generator[None, None, None]:
+        """Toma el lock compartido durante el bloque."""
+        if not self.adquirir_lectura():
+            yield
+            return
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
+
+    @contextmanager
+    def escritura(self) -> Generator[None, None, None]:
+        """Toma el lock exclusivo durante el bloque (ver adquirir_escritura())."""
+        if not self.adquirir_escritura():
+            yield
+            return
+        try:
+            yield
+        finally:
+            self.liberar_escritura()
+
+
+def con_lectura(metodo: Callable[P, T]) -> Callable[P, T]:
+    """Marca un método de consulta: con proteger_metodos() toma la lectura."""
+    setattr(metodo, _MODO, "lectura")
+    return metodo
+
+
+def con_escritura(metodo: Callable[P, T]) -> Callable[P, T]:
+    """Marca un método que modifica el objeto: con proteger_metodos() toma la escritura."""
+    setattr(metodo, _MODO, "escritura")
+    return metodo
+
+
+def _envolver(metodo: Callable[P, T], lock: LockLecturaEscritura, modo: str) -> Callable[P, T]:
+    if modo == "lectura":
+        adquirir, liberar = lock.adquirir_lectura, lock.liberar_lectura
+    else:
+        adquirir, liberar = lock.adquirir_escritura, lock.liberar_escritura
+
+    @functools.wraps(metodo)
+    def envoltura(*args: P.args, **kwargs: P.kwargs) -> T:
+        if not adquirir():
+            return metodo(*args, **kwargs)
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            liberar()
+
+    return envoltura
+
+
+def proteger_metodos(objeto: object, lock: LockLecturaEscritura) -> None:
+    """Reemplaza, solo en ``objeto``, cada método marcado por uno que toma ``lock``."""
+    clase = type(objeto)
+    for nombre in dir(clase):
+        # Se mira el atributo que resuelve la clase: una subclase puede redefinirlo
+        modo = getattr(getattr(clase, nombre, None), _MODO, None)
+        if modo is not None:
+            setattr(objeto, nombre, _envolver(getattr(objeto, nombre), lock, modo))
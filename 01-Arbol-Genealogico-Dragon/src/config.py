@@ -7,10 +7,27 @@ from pathlib import Path
 class AppConfig:
     log_dir: Path = Path("logs")
     log_file: str = "arbol_genealogico.log"
+    log_en_cola: bool = False
+    # "memoria" (ArbolGenealogico), "columnar" (ArbolColumnar), "sqlite" (ArbolSQLite)
+    # o "durable" (ArbolDurable: snapshot más diario de cambios)
+    repositorio: str = "memoria"
+    ruta_db: Path = Path("arbol_genealogico.db")
+    ruta_snapshot: Path = Path("arbol_genealogico.snap")
 
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Carga configuración desde variables de entorno"""
         log_dir = Path(os.getenv("LOG_DIR", "logs"))
         log_file = os.getenv("LOG_FILE", "arbol_genealogico.log")
-        return cls(log_dir=log_dir, log_file=log_file)
+        log_en_cola = os.getenv("LOG_QUEUE", "").lower() in ("1", "true", "si", "sí", "yes")
+        repositorio = os.getenv("ARBOL_REPOSITORIO", "memoria").strip().lower()
+        ruta_db = Path(os.getenv("ARBOL_DB", "arbol_genealogico.db"))
+        ruta_snapshot = Path(os.getenv("ARBOL_SNAPSHOT", "arbol_genealogico.snap"))
+        return cls(
+            log_dir=log_dir,
+            log_file=log_file,
+            log_en_cola=log_en_cola,
+            repositorio=repositorio,
+            ruta_db=ruta_db,
+            ruta_snapshot=ruta_snapshot,
+        )
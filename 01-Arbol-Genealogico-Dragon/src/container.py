@@ -3,8 +3,12 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from .interfaces import ArbolRepository, DataLoaderProtocol, UIProtocol
 
+from .config import AppConfig
 from .data_loader import DataLoaderDemo
 from .repository import ArbolGenealogico
+from .repository_columnar import ArbolColumnar
+from .repository_durable import ArbolDurable
+from .repository_sqlite import ArbolSQLite
 from .ui import DinastiaUI
 
 
@@ -52,21 +56,44 @@ class ApplicationContainer:
     para gestionar el ciclo de vida de las dependencias.
     """
 
-    def __init__(self):
-        self._arbol: ArbolGenealogico | None = None
+    def __init__(self, config: AppConfig | None = None):
+        """
+        Args:
+            config: Configuración de la aplicación (elige el repositorio).
+                Si es None, se usan los valores por defecto (árbol en memoria).
+        """
+        self._config = config if config is not None else AppConfig()
+        self._arbol: "ArbolRepository | None" = None
         self._ui: DinastiaUI | None = None
 
-    def get_arbol(self) -> ArbolGenealogico:
+    def get_arbol(self) -> "ArbolRepository":
         """
-        Obtiene una instancia de ArbolGenealogico (singleton).
+        Obtiene una instancia del repositorio configurado (singleton).
 
-        Si no existe, crea una nueva y la almacena para futuras llamadas.
+        Si no existe, crea una nueva según ``AppConfig.repositorio`` y la
+        almacena para futuras llamadas.
 
         Returns:
-            ArbolGenealogico: Instancia única del repositorio.
+            ArbolRepository: Instancia única del repositorio.
+
+        Raises:
+            ValueError: Si el repositorio configurado no existe.
         """
         if self._arbol is None:
-            self._arbol = ArbolGenealogico()
+            match self._config.repositorio:
+                case "memoria":
+                    self._arbol = ArbolGenealogico()
+                case "columnar":
+                    self._arbol = ArbolColumnar()
+                case "sqlite":
+                    self._arbol = ArbolSQLite(self._config.ruta_db)
+                case "durable":
+                    self._arbol = ArbolDurable(self._config.ruta_snapshot)
+                case otro:
+                    raise ValueError(
+                        f"Repositorio desconocido: {otro!r} "
+                        "(use memoria, columnar, sqlite o durable)"
+                    )
         return self._arbol
 
     def get_ui(self) -> DinastiaUI:
@@ -53,8 +53,15 @@ class DataLoaderDemo:
             pass
 
     def _get_persona(self, arbol: "ArbolRepository", nombre: str) -> Persona:
-        """Recupera una persona por nombre del árbol existente."""
-        for p in arbol.personas.values():
+        """
+        Recupera una persona por nombre del árbol existente.
+
+        Usa el índice de nombres del repositorio en lugar de recorrer todas
+        las personas: la carga hace una búsqueda por cada relación, así que
+        un recorrido lineal la volvería cuadrática con datasets grandes.
+        Como el índice no distingue mayúsculas, se confirma el nombre exacto.
+        """
+        for p in arbol.buscar_por_nombre(nombre):
             if p.nombre == nombre:
                 return p
         raise PersonaNoEncontradaError(
@@ -0,0 +1,238 @@
+"""
+Diario de escritura anticipada (write-ahead log) de las modificaciones del árbol.
+
+Cada modificación se agrega al final del diario como un registro binario
+compacto, en lugar de reescribir un snapshot completo. Disposición de un
+segmento del diario (enteros little-endian):
+
+    cabecera   16 bytes: magia, versión, CRC32 del snapshot base
+    registros  crc32 (uint32), largo del contenido (uint32), tipo (uint8), contenido
+
+El CRC32 de cada registro cubre largo, tipo y contenido. Un registro
+incompleto o dañado al final del último segmento es un corte a mitad de
+escritura: marca el fin del diario y se descarta al reabrirlo.
+
+Los registros se acumulan en memoria y se escriben juntos al confirmar
+(group commit); el fsync se hace cada ``fsync_cada`` confirmaciones o cada
+``intervalo_fsync`` segundos, según la durabilidad que se necesite.
+"""
+
+import os
+import struct
+import time
+import zlib
+from enum import IntEnum
+from pathlib import Path
+from typing import NamedTuple
+
+from .exceptions import DiarioInvalidoError
+from .models import SIN_ID
+from .snapshot import Ruta
+
+MAGIA = b"ARBOLWAL"
+VERSION = 1
+# CRC32 "base" de un diario que empieza con el árbol vacío (sin snapshot)
+SIN_SNAPSHOT = 0
+
+# magia, versión, CRC32 del snapshot sobre el que se aplican los registros
+_CABECERA = struct.Struct("<8sHxxI")
+# crc32, largo del contenido, tipo
+_REGISTRO = struct.Struct("<IIB")
+_CRC = struct.Struct("<I")
+_LARGO_TIPO = struct.Struct("<IB")
+_ID = struct.Struct("<q")
+_DOS_IDS = struct.Struct("<qq")
+
+
+class TipoRegistro(IntEnum):
+    """Modificación guardada en un registro del diario."""
+
+    REGISTRAR_PERSONA = 1  # ID y nombre en UTF-8
+    ADD_HIJO = 2  # padre e hijo
+    ADD_PAREJA = 3  # ambas personas
+    REMOVE_PAREJA = 4  # ambas personas
+    ELIMINAR_PERSONA = 5  # ID
+
+
+class Registro(NamedTuple):
+    """Registro decodificado: ``id2`` es SIN_ID y ``nombre`` vacío si no aplican."""
+
+    tipo: TipoRegistro
+    id1: int
+    id2: int = SIN_ID
+    nombre: str = ""
+
+
+class LecturaDiario(NamedTuple):
+    """Contenido de un segmento del diario."""
+
+    base: int
+    registros: list[Registro]
+    # Bytes hasta el último registro completo (lo que sigue es un corte)
+    fin_valido: int
+    tamano: int
+
+
+def codificar_registro(registro: Registro) -> bytes:
+    """Serializa un registro con su CRC32."""
+    tipo = registro.tipo
+    if tipo is TipoRegistro.REGISTRAR_PERSONA:
+        contenido = _ID.pack(registro.id1) + registro.nombre.encode("utf-8")
+    elif tipo is TipoRegistro.ELIMINAR_PERSONA:
+        contenido = _ID.pack(registro.id1)
+    else:
+        contenido = _DOS_IDS.pack(registro.id1, registro.id2)
+    cuerpo = _LARGO_TIPO.pack(len(contenido), tipo) + contenido
+    return _CRC.pack(zlib.crc32(cuerpo)) + cuerpo
+
+
+def _decodificar(tipo: TipoRegistro, contenido: bytes) -> Registro:
+    if tipo is TipoRegistro.REGISTRAR_PERSONA:
+        (persona_id,) = _ID.unpack_from(contenido)
+        return Registro(tipo, persona_id, nombre=contenido[_ID.size :].decode("utf-8"))
+    if tipo is TipoRegistro.ELIMINAR_PERSONA:
+        return Registro(tipo, *_ID.unpack(contenido))
+    return Registro(tipo, *_DOS_IDS.unpack(contenido))
+
+
+def leer_diario(ruta: Ruta) -> LecturaDiario:
+    """
+    Lee un segmento del diario hasta el último registro completo y válido.
+
+    Raises:
+        DiarioInvalidoError: Si el archivo no es un diario o es de otra versión.
+    """
+    contenido = Path(ruta).read_bytes()
+    if len(contenido) < _CABECERA.size:
+        raise DiarioInvalidoError(str(ruta), "cabecera truncada")
+    magia, version, base = _CABECERA.unpack_from(contenido)
+    if magia != MAGIA:
+        raise DiarioInvalidoError(str(ruta), "no es un diario del árbol")
+    if version != VERSION:
+        raise DiarioInvalidoError(str(ruta), f"versión {version} no soportada")
+
+    registros: list[Registro] = []
+    posicion = _CABECERA.size
+    while posicion + _REGISTRO.size <= len(contenido):
+        crc, largo, tipo = _REGISTRO.unpack_from(contenido, posicion)
+        fin = posicion + _REGISTRO.size + largo
+        if fin > len(contenido) or zlib.crc32(contenido[posicion + _CRC.size : fin]) != crc:
+            break
+        try:
+            registros.append(
+                _decodificar(TipoRegistro(tipo), contenido[posicion + _REGISTRO.size : fin])
+            )
+        except (ValueError, struct.error):
+            break
+        posicion = fin
+    return LecturaDiario(base, registros, posicion, len(contenido))
+
+
+def sincronizar_directorio(ruta: Path) -> None:
+    """Hace fsync del directorio para que una creación o un renombre sobreviva a un corte."""
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows no lo permite
+        return
+    descriptor = os.open(ruta.parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class DiarioEscritura:
+    """
+    Segmento abierto del diario, al que se agregan registros.
+
+    Los registros agregados quedan en memoria hasta confirmar(), que los
+    escribe con una sola llamada; el fsync sigue la política configurada.
+    """
+
+    def __init__(
+        self, ruta: Ruta, fin_valido: int, fsync_cada: int = 1, intervalo_fsync: float = 0.0
+    ):
+        """
+        Abre un segmento existente para agregar registros al final.
+
+        Args:
+            ruta: Segmento ya creado (ver crear()).
+            fin_valido: Bytes válidos del segmento (ver leer_diario()); lo que
+                sigue es un corte a mitad de escritura y se descarta.
+            fsync_cada: Cada cuántas confirmaciones se hace fsync (1 = siempre).
+            intervalo_fsync: Si es mayor que 0, también se hace fsync cuando
+                pasaron esos segundos desde el último.
+        """
+        if fsync_cada < 1:
+            raise ValueError("fsync_cada debe ser al menos 1")
+        self.ruta = Path(ruta)
+        self._archivo = open(self.ruta, "r+b")
+        self._archivo.truncate(fin_valido)
+        self._archivo.seek(fin_valido)
+        self.tamano = fin_valido
+        self._pendientes: list[bytes] = []
+        self._fsync_cada = fsync_cada
+        self._intervalo_fsync = intervalo_fsync
+        self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+    @classmethod
+    def crear(
+        cls, ruta: Ruta, base: int, fsync_cada: int = 1, intervalo_fsync: float = 0.0
+    ) -> "DiarioEscritura":
+        """
+        Crea un segmento vacío de forma atómica y lo abre.
+
+        Args:
+            ruta: Archivo del segmento.
+            base: CRC32 del snapshot sobre el que se aplican sus registros.
+            fsync_cada: Como en el constructor.
+            intervalo_fsync: Como en el constructor.
+        """
+        destino = Path(ruta)
+        temporal = destino.with_name(destino.name + ".tmp")
+        with open(temporal, "wb") as archivo:
+            archivo.write(_CABECERA.pack(MAGIA, VERSION, base))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, destino)
+        sincronizar_directorio(destino)
+        return cls(destino, _CABECERA.size, fsync_cada, intervalo_fsync)
+
+    def agregar(self, registro: Registro) -> None:
+        """Agrega un registro al lote en curso (se escribe al confirmar)."""
+        self._pendientes.append(codificar_registro(registro))
+
+    def confirmar(self) -> None:
+        """Escribe los registros pendientes juntos y hace fsync si corresponde."""
+        if not self._pendientes:
+            return
+        bloque = b"".join(self._pendientes)
+        self._pendientes = []
+        self._archivo.write(bloque)
+        self._archivo.flush()
+        self.tamano += len(bloque)
+        self._sin_fsync += 1
+        if self._sin_fsync >= self._fsync_cada or (
+            self._intervalo_fsync > 0
+            and time.monotonic() - self._ultimo_fsync >= self._intervalo_fsync
+        ):
+            self.sincronizar()
+
+    def sincronizar(self) -> None:
+        """Fuerza el fsync de todo lo confirmado."""
+        if self._sin_fsync:
+            os.fsync(self._archivo.fileno())
+            self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def descartar(self) -> None:
+        """Cierra el archivo sin escribir los registros pendientes."""
+        self._pendientes = []
+        self._archivo.close()
+
+    def cerrar(self) -> None:
+        """Confirma lo pendiente, hace fsync y cierra el archivo."""
+        if self._archivo.closed:
+            return
+        self.confirmar()
+        self.sincronizar()
+        self._archivo.close()
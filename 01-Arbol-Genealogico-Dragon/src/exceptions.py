@@ -5,7 +5,12 @@ Este módulo define una jerarquía de excepciones que permite un manejo
 de errores más específico y expresivo, siguiendo principios SOLID y Clean Code.
 """
 
-from typing import Literal
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from .models import Persona
+    from .validators import ResultadoValidacion
 
 
 class ArbolGenealogicoError(Exception):
@@ -276,6 +281,48 @@ class ParejaNoExisteError(RelacionInvalidaError):
         )
 
 
+class LoteRelacionesError(ValidacionError):
+    """
+    Excepción lanzada cuando un lote de relaciones (add_hijos_bulk) es rechazado.
+
+    El lote se aplica completo o no se aplica: si alguna relación es inválida
+    no se modifica el árbol y esta excepción informa todos los errores.
+
+    Los errores se guardan como registros compactos (ResultadoValidacion);
+    solo se formatea el mensaje del primero. Las excepciones de cada relación
+    se construyen al leer 'errores'.
+
+    Attributes:
+        resultados: Registros de las relaciones inválidas, ordenados por posición
+    """
+
+    def __init__(
+        self,
+        resultados: Sequence["ResultadoValidacion"],
+        personas: Mapping[int, "Persona"],
+    ):
+        """
+        Inicializa la excepción de lote rechazado.
+
+        Args:
+            resultados: Registros de las relaciones inválidas (al menos uno)
+            personas: Personas del repositorio, para resolver nombres al formatear
+        """
+        primero = resultados[0]
+        message = (
+            f"Lote rechazado: {len(resultados)} relación(es) inválida(s). "
+            f"Primera (posición {primero.posicion}): {primero.mensaje(personas)}"
+        )
+        super().__init__(message)
+        self.resultados = resultados
+        self._personas = personas
+
+    @property
+    def errores(self) -> list[tuple[int, ArbolGenealogicoError]]:
+        """(posición en el lote, excepción) por cada relación inválida."""
+        return [(r.posicion, r.a_excepcion(self._personas)) for r in self.resultados]
+
+
 class EliminacionConDescendientesError(ArbolGenealogicoError):
     """
     Excepción lanzada cuando se intenta eliminar una persona con descendientes.
@@ -304,3 +351,119 @@ class EliminacionConDescendientesError(ArbolGenealogicoError):
         super().__init__(message)
         self.persona_nombre = persona_nombre
         self.cantidad_hijos = cantidad_hijos
+
+
+class ConsultaInvalidaError(ValidacionError):
+    """
+    Excepción lanzada cuando una consulta de búsqueda no se puede interpretar.
+
+    Por ejemplo, una expresión regular mal formada en la búsqueda por regex.
+
+    Attributes:
+        consulta: Texto de la consulta rechazada
+    """
+
+    def __init__(self, consulta: str, razon: str):
+        """
+        Inicializa la excepción de consulta inválida.
+
+        Args:
+            consulta: Texto de la consulta rechazada
+            razon: Motivo por el que no se pudo interpretar
+        """
+        super().__init__(f"Consulta inválida '{consulta}': {razon}")
+        self.consulta = consulta
+
+
+class SnapshotInvalidoError(ArbolGenealogicoError):
+    """
+    Excepción lanzada cuando un archivo de snapshot no se puede cargar.
+
+    Cubre archivos que no son snapshots, de una versión no soportada,
+    truncados o dañados (CRC32 que no coincide).
+
+    Attributes:
+        ruta: Archivo que se intentó cargar
+    """
+
+    def __init__(self, ruta: str, razon: str):
+        """
+        Inicializa la excepción de snapshot inválido.
+
+        Args:
+            ruta: Archivo que se intentó cargar
+            razon: Motivo por el que se rechazó
+        """
+        super().__init__(f"Snapshot inválido '{ruta}': {razon}")
+        self.ruta = ruta
+
+
+class ArbolSoloLecturaError(ArbolGenealogicoError):
+    """
+    Excepción lanzada al intentar modificar un árbol de solo lectura.
+
+    Por ejemplo, ArbolMapeado, que lee un snapshot directamente desde un mmap,
+    o una VersionArbol publicada por ArbolVersionado.
+
+    Attributes:
+        operacion: Operación rechazada
+    """
+
+    def __init__(self, operacion: str):
+        """
+        Inicializa la excepción de árbol de solo lectura.
+
+        Args:
+            operacion: Operación rechazada (por ejemplo, "registrar_persona")
+        """
+        super().__init__(f"El árbol es de solo lectura: no se permite {operacion}()")
+        self.operacion = operacion
+
+
+class DiarioInvalidoError(ArbolGenealogicoError):
+    """
+    Excepción lanzada cuando el diario de cambios (WAL) no se puede aplicar.
+
+    Cubre archivos que no son diarios, de una versión no soportada, dañados
+    antes del final o que no corresponden al snapshot guardado.
+
+    Attributes:
+        ruta: Archivo del diario rechazado
+    """
+
+    def __init__(self, ruta: str, razon: str):
+        """
+        Inicializa la excepción de diario inválido.
+
+        Args:
+            ruta: Archivo del diario rechazado
+            razon: Motivo por el que se rechazó
+        """
+        super().__init__(f"Diario inválido '{ruta}': {razon}")
+        self.ruta = ruta
+
+
+class DiarioFallidoError(ArbolGenealogicoError):
+    """
+    Excepción lanzada al usar un ArbolDurable después de que falló una
+    escritura de su diario.
+
+    El árbol en memoria puede tener cambios que no llegaron al disco, así que
+    deja de usarse: hay que volver a abrirlo, y se recupera lo que sí se guardó.
+
+    Attributes:
+        ruta: Segmento del diario cuya escritura falló
+    """
+
+    def __init__(self, ruta: str, razon: str):
+        """
+        Inicializa la excepción de diario fallido.
+
+        Args:
+            ruta: Segmento del diario cuya escritura falló
+            razon: Error original de la escritura
+        """
+        super().__init__(
+            f"Falló la escritura del diario '{ruta}' ({razon}): el árbol debe volver a abrirse"
+        )
+        self.ruta = ruta
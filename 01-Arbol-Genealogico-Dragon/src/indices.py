@@ -0,0 +1,666 @@
+"""
+Índices de búsqueda por nombre, mantenidos junto al repositorio.
+
+Cada índice recibe altas y bajas (ID + nombre) y responde consultas con IDs,
+sin recorrer el árbol. IndicesBusqueda agrupa todos los índices para que los
+repositorios los actualicen con una sola llamada por persona.
+"""
+
+import importlib
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Set
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, NamedTuple, Optional, TypeAlias, Union
+
+from .exceptions import ConsultaInvalidaError
+
+
+def _modulo_parser_re() -> ModuleType:
+    """Parser interno del módulo ``re``: no tiene API estable ni tipos."""
+    try:  # Python 3.11+
+        return importlib.import_module("re._parser")
+    except ImportError:  # pragma: no cover - Python 3.10
+        return importlib.import_module("sre_parse")
+
+
+_PARSER_RE = _modulo_parser_re()
+_REPETICIONES = {"MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"}
+_VACIO: frozenset[int] = frozenset()
+_PALABRA = re.compile(r"\w+")
+
+
+def normalizar_nombre(nombre: str) -> str:
+    """Normaliza un nombre para búsquedas (sin mayúsculas ni espacios extremos)."""
+    return nombre.strip().lower()
+
+
+def tokenizar(texto: str) -> list[str]:
+    """
+    Separa un texto en palabras sin mayúsculas ni acentos.
+
+    Usa casefold() y la descomposición NFKD para quitar las marcas
+    diacríticas: "Jaehaerys I el Conciliador" y "jaehaerys i él conciliádor"
+    producen los mismos tokens.
+    """
+    texto = texto.casefold()
+    if not texto.isascii():
+        descompuesto = unicodedata.normalize("NFKD", texto)
+        texto = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return _PALABRA.findall(texto)
+
+
+class IndicePrefijos:
+    """
+    Índice de prefijos sobre nombres normalizados, para autocompletar.
+
+    Guarda un arreglo ordenado de pares (nombre normalizado, ID): los nombres
+    con un mismo prefijo quedan contiguos, así que una consulta es una
+    búsqueda binaria más la lectura de los resultados, O(|prefijo| · log n + k).
+
+    Las altas se acumulan en ``_pendientes`` y se incorporan en la siguiente
+    consulta: pocas con inserción ordenada y muchas (carga en lote) con un
+    único sort, que Timsort resuelve como la mezcla de dos tramos ordenados.
+    Ocupa una tupla por persona, mucho menos que un trie de diccionarios.
+    """
+
+    # Hasta cuántas altas pendientes conviene insertar una por una
+    MAX_INSERCIONES_SUELTAS = 32
+
+    def __init__(self) -> None:
+        self._ordenados: list[tuple[str, int]] = []
+        self._pendientes: list[tuple[str, int]] = []
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        self._pendientes.append((normalizar_nombre(nombre), persona_id))
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        entrada = (normalizar_nombre(nombre), persona_id)
+        ordenados = self._ordenados
+        posicion = bisect_left(ordenados, entrada)
+        if posicion < len(ordenados) and ordenados[posicion] == entrada:
+            del ordenados[posicion]
+        elif entrada in self._pendientes:
+            self._pendientes.remove(entrada)
+
+    def buscar(self, prefijo: str, limite: int = 10) -> list[int]:
+        """
+        Retorna hasta ``limite`` IDs cuyo nombre normalizado empieza con ``prefijo``.
+
+        Los resultados salen en orden alfabético de nombre y, a igual nombre, por ID.
+        """
+        self.incorporar_pendientes()
+        clave = normalizar_nombre(prefijo)
+        ordenados = self._ordenados
+        resultado: list[int] = []
+        posicion = bisect_left(ordenados, (clave,))
+        while (
+            len(resultado) < limite
+            and posicion < len(ordenados)
+            and ordenados[posicion][0].startswith(clave)
+        ):
+            resultado.append(ordenados[posicion][1])
+            posicion += 1
+        return resultado
+
+    def incorporar_pendientes(self) -> None:
+        """Pasa las altas pendientes al arreglo ordenado (buscar() lo hace solo)."""
+        pendientes = self._pendientes
+        if not pendientes:
+            return
+        if len(pendientes) <= self.MAX_INSERCIONES_SUELTAS:
+            for entrada in pendientes:
+                insort(self._ordenados, entrada)
+        else:
+            self._ordenados.extend(pendientes)
+            self._ordenados.sort()
+        self._pendientes = []
+
+    def __len__(self) -> int:
+        return len(self._ordenados) + len(self._pendientes)
+
+
+def distancia_edicion(a: str, b: str) -> int:
+    """
+    Distancia de Levenshtein: inserciones, borrados y reemplazos de un carácter.
+
+    Es una métrica (cumple la desigualdad triangular), que es lo que necesita
+    el BK-tree para descartar subárboles.
+    """
+    return _distancia_con_patron(_Patron(a), b)
+
+
+class _Patron:
+    """Máscaras de bits de un texto, reutilizables para compararlo con muchos otros."""
+
+    __slots__ = ("mascaras", "longitud")
+
+    def __init__(self, texto: str) -> None:
+        self.mascaras: dict[str, int] = {}
+        for posicion, caracter in enumerate(texto):
+            self.mascaras[caracter] = self.mascaras.get(caracter, 0) | (1 << posicion)
+        self.longitud = len(texto)
+
+
+def _distancia_con_patron(patron: _Patron, texto: str) -> int:
+    """
+    Levenshtein bit-paralelo (Myers/Hyyrö): una columna de la tabla por
+    carácter de ``texto``, con operaciones sobre enteros en lugar de celdas.
+    """
+    if not patron.longitud:
+        return len(texto)
+    mascaras = patron.mascaras
+    todos = (1 << patron.longitud) - 1
+    ultimo = 1 << (patron.longitud - 1)
+    positivos, negativos, distancia = todos, 0, patron.longitud
+    for caracter in texto:
+        iguales = mascaras.get(caracter, 0)
+        vertical = iguales | negativos
+        horizontal = (((iguales & positivos) + positivos) ^ positivos) | iguales
+        suben = negativos | ~(horizontal | positivos)
+        bajan = positivos & horizontal
+        if suben & ultimo:
+            distancia += 1
+        elif bajan & ultimo:
+            distancia -= 1
+        suben = (suben << 1) | 1
+        bajan <<= 1
+        positivos = (bajan | ~(vertical | suben)) & todos
+        negativos = suben & vertical & todos
+    return distancia
+
+
+class _NodoBK:
+    """Nodo del BK-tree: un nombre distinto, sus IDs e hijos por distancia."""
+
+    __slots__ = ("clave", "ids", "hijos")
+
+    def __init__(self, clave: str) -> None:
+        self.clave = clave
+        self.ids: set[int] = set()
+        self.hijos: dict[int, "_NodoBK"] = {}
+
+
+class IndiceDifuso:
+    """
+    BK-tree sobre nombres normalizados, para búsquedas "a distancia <= k".
+
+    Cada hijo de un nodo cuelga de la distancia entre ambos nombres. Por la
+    desigualdad triangular, si la consulta está a distancia ``d`` del nodo,
+    solo los hijos con arista en ``[d - k, d + k]`` pueden tener resultados:
+    el resto del árbol se descarta sin compararlo.
+
+    Hay un nodo por nombre distinto; los homónimos comparten nodo. Las bajas
+    vacían el conjunto de IDs pero dejan el nodo, que sigue sirviendo para
+    guiar la búsqueda. Como IndicePrefijos, las altas de nombres nuevos se
+    insertan en la siguiente consulta.
+    """
+
+    def __init__(self) -> None:
+        self._raiz: Optional[_NodoBK] = None
+        self._nodos: dict[str, _NodoBK] = {}
+        self._pendientes: list[tuple[str, int]] = []
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        clave = normalizar_nombre(nombre)
+        nodo = self._nodos.get(clave)
+        if nodo is not None:
+            nodo.ids.add(persona_id)
+        else:
+            self._pendientes.append((clave, persona_id))
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        clave = normalizar_nombre(nombre)
+        nodo = self._nodos.get(clave)
+        if nodo is not None and persona_id in nodo.ids:
+            nodo.ids.discard(persona_id)
+        elif (clave, persona_id) in self._pendientes:
+            self._pendientes.remove((clave, persona_id))
+
+    def buscar(self, nombre: str, distancia_maxima: int = 2) -> list[int]:
+        """
+        Retorna los IDs cuyo nombre normalizado está a ``distancia_maxima`` o menos.
+
+        Los resultados salen de más cercano a más lejano y, a igual distancia,
+        por nombre y por ID.
+        """
+        self.incorporar_pendientes()
+        if self._raiz is None:
+            return []
+        patron = _Patron(normalizar_nombre(nombre))
+        encontrados: list[tuple[int, str, int]] = []
+        pendientes = [self._raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            distancia = _distancia_con_patron(patron, nodo.clave)
+            if distancia <= distancia_maxima:
+                encontrados.extend((distancia, nodo.clave, i) for i in nodo.ids)
+            for arista, hijo in nodo.hijos.items():
+                if distancia - distancia_maxima <= arista <= distancia + distancia_maxima:
+                    pendientes.append(hijo)
+        encontrados.sort()
+        return [persona_id for _, _, persona_id in encontrados]
+
+    def incorporar_pendientes(self) -> None:
+        """Inserta en el árbol las altas pendientes (buscar() lo hace solo)."""
+        for clave, persona_id in self._pendientes:
+            nodo = self._nodos.get(clave)
+            if nodo is None:
+                nodo = self._nodos[clave] = _NodoBK(clave)
+                self._insertar_nodo(nodo)
+            nodo.ids.add(persona_id)
+        self._pendientes = []
+
+    def _insertar_nodo(self, nuevo: _NodoBK) -> None:
+        if self._raiz is None:
+            self._raiz = nuevo
+            return
+        patron = _Patron(nuevo.clave)
+        actual = self._raiz
+        while True:
+            distancia = _distancia_con_patron(patron, actual.clave)
+            siguiente = actual.hijos.get(distancia)
+            if siguiente is None:
+                actual.hijos[distancia] = nuevo
+                return
+            actual = siguiente
+
+    def __len__(self) -> int:
+        return sum(len(nodo.ids) for nodo in self._nodos.values()) + len(self._pendientes)
+
+
+def trigramas(texto: str) -> set[str]:
+    """Retorna los fragmentos de 3 caracteres consecutivos de ``texto``."""
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class _Alternativas(NamedTuple):
+    """Elemento ``a|b|...`` de un patrón: alcanza con que coincida una rama."""
+
+    ramas: list["_Secuencia"]
+
+
+# Patrón reducido a lo que usa el filtro de trigramas: un carácter literal,
+# una secuencia obligatoria (grupo, o repetición de al menos una vez),
+# alternativas, o None para cualquier otro elemento (corta los literales)
+_Elemento: TypeAlias = Union[str, "_Secuencia", _Alternativas, None]
+_Secuencia: TypeAlias = list[_Elemento]
+
+
+def _analizar_patron(patron: str) -> Optional[_Secuencia]:
+    """
+    Reduce ``patron`` (ya validado con re.compile) a los elementos del filtro.
+
+    Es el único lugar que lee la salida del parser interno de ``re``: si no
+    tiene la forma esperada retorna None y la búsqueda revisa todos los nombres.
+    """
+    try:
+        return _traducir_subpatron(_PARSER_RE.parse(patron, re.IGNORECASE))
+    except (AttributeError, IndexError, TypeError, ValueError, re.error):
+        return None
+
+
+def _traducir_subpatron(subpatron: Any) -> _Secuencia:
+    elementos: _Secuencia = []
+    for operacion, argumento in subpatron:
+        nombre = getattr(operacion, "name", None)
+        if nombre == "LITERAL":
+            elementos.append(chr(argumento))
+        elif nombre == "SUBPATTERN":
+            elementos.append(_traducir_subpatron(argumento[-1]))
+        elif nombre in _REPETICIONES and argumento[0] >= 1:
+            elementos.append(_traducir_subpatron(argumento[2]))
+        elif nombre == "BRANCH":
+            elementos.append(_Alternativas([_traducir_subpatron(r) for r in argumento[1]]))
+        else:
+            elementos.append(None)
+    return elementos
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas, para búsquedas por subcadena y por regex.
+
+    Cada trigrama de un nombre normalizado apunta al conjunto de IDs que lo
+    contienen (su lista de apariciones). Una subcadena de 3 o más caracteres
+    solo puede estar en los nombres que contienen todos sus trigramas: se
+    intersectan esas listas, de la más corta a la más larga, y solo esos
+    candidatos se verifican contra el texto real.
+
+    Las expresiones regulares se traducen a un filtro equivalente: los tramos
+    literales obligatorios del patrón exigen sus trigramas (AND) y las
+    alternativas ``a|b`` unen los candidatos de cada rama (OR). Si el patrón
+    no exige ningún tramo de 3 caracteres se verifican todos los nombres.
+    """
+
+    def __init__(self) -> None:
+        self._apariciones: dict[str, set[int]] = {}
+        self._nombres: dict[int, str] = {}
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        clave = normalizar_nombre(nombre)
+        self._nombres[persona_id] = clave
+        for trigrama in trigramas(clave):
+            self._apariciones.setdefault(trigrama, set()).add(persona_id)
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        clave = self._nombres.pop(persona_id, None)
+        if clave is None:
+            return
+        for trigrama in trigramas(clave):
+            ids = self._apariciones[trigrama]
+            ids.discard(persona_id)
+            if not ids:
+                del self._apariciones[trigrama]
+
+    def buscar_subcadena(self, texto: str) -> list[int]:
+        """Retorna, ordenados, los IDs cuyo nombre normalizado contiene ``texto``."""
+        clave = normalizar_nombre(texto)
+        candidatos = self._candidatos_literal(clave)
+        nombres = self._nombres
+        if candidatos is None:
+            return [i for i, nombre in nombres.items() if clave in nombre]
+        return sorted(i for i in candidatos if clave in nombres[i])
+
+    def buscar_regex(self, patron: str) -> list[int]:
+        """
+        Retorna, ordenados, los IDs cuyo nombre normalizado contiene el patrón.
+
+        El patrón se busca en cualquier posición (``re.search``) y sin
+        distinguir mayúsculas; ``^`` y ``$`` anclan al comienzo y al final.
+
+        Raises:
+            ConsultaInvalidaError: Si el patrón no es una expresión regular válida.
+        """
+        try:
+            regex = re.compile(patron, re.IGNORECASE)
+        except re.error as e:
+            raise ConsultaInvalidaError(patron, str(e)) from e
+        elementos = _analizar_patron(patron)
+        candidatos = None if elementos is None else self._candidatos_patron(elementos)
+        nombres = self._nombres
+        if candidatos is None:
+            return [i for i, nombre in nombres.items() if regex.search(nombre)]
+        return sorted(i for i in candidatos if regex.search(nombres[i]))
+
+    def _candidatos_literal(self, literal: str) -> Optional[Set[int]]:
+        """IDs que contienen todos los trigramas de ``literal`` (None: sin filtro)."""
+        requeridos = trigramas(literal)
+        if not requeridos:
+            return None
+        listas = sorted((self._apariciones.get(t, _VACIO) for t in requeridos), key=len)
+        return listas[0].intersection(*listas[1:])
+
+    def _candidatos_patron(self, elementos: _Secuencia) -> Optional[Set[int]]:
+        """
+        Filtro de trigramas de un patrón reducido por _analizar_patron().
+
+        Retorna los IDs que pueden coincidir, o None si el patrón no permite
+        descartar a nadie. Los tramos de literales consecutivos se cortan ante
+        cualquier otro elemento, así que el filtro nunca descarta de más.
+        """
+        filtros: list[Set[int]] = []
+        tramo: list[str] = []
+
+        def cerrar_tramo() -> None:
+            if tramo:
+                candidatos = self._candidatos_literal("".join(tramo).lower())
+                if candidatos is not None:
+                    filtros.append(candidatos)
+                tramo.clear()
+
+        for elemento in elementos:
+            if isinstance(elemento, str):
+                tramo.append(elemento)
+                continue
+            cerrar_tramo()
+            if isinstance(elemento, list):
+                interno = self._candidatos_patron(elemento)
+            elif isinstance(elemento, _Alternativas):
+                interno = self._candidatos_alternativas(elemento)
+            else:
+                interno = None
+            if interno is not None:
+                filtros.append(interno)
+        cerrar_tramo()
+
+        if not filtros:
+            return None
+        filtros.sort(key=len)
+        candidatos = filtros[0]
+        for filtro in filtros[1:]:
+            candidatos = candidatos & filtro
+        return candidatos
+
+    def _candidatos_alternativas(self, alternativas: _Alternativas) -> Optional[Set[int]]:
+        """Unión de los filtros de cada rama (None si alguna rama no filtra)."""
+        union: set[int] = set()
+        for rama in alternativas.ramas:
+            candidatos = self._candidatos_patron(rama)
+            if candidatos is None:
+                return None
+            union |= candidatos
+        return union
+
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+
+class IndiceTokens:
+    """
+    Índice invertido de palabras, para búsquedas de texto completo.
+
+    Cada token (ver tokenizar()) apunta al conjunto de IDs cuyo nombre lo
+    contiene. Las consultas combinan palabras con AND (separadas por
+    espacios) y grupos con OR (la palabra ``OR`` en mayúsculas): cada grupo
+    intersecta sus listas de la más corta a la más larga, así el costo lo
+    marca la palabra menos frecuente, y los grupos se unen al final.
+    """
+
+    # Separador de grupos alternativos en una consulta
+    OPERADOR_OR = "OR"
+
+    def __init__(self) -> None:
+        self._apariciones: dict[str, set[int]] = {}
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        for token in tokenizar(nombre):
+            self._apariciones.setdefault(token, set()).add(persona_id)
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        for token in set(tokenizar(nombre)):
+            ids = self._apariciones.get(token)
+            if ids is None:
+                continue
+            ids.discard(persona_id)
+            if not ids:
+                del self._apariciones[token]
+
+    def buscar(self, consulta: str) -> list[int]:
+        """
+        Retorna, ordenados, los IDs que cumplen la consulta.
+
+        Ejemplo: ``"aegon conquistador OR jaehaerys"`` encuentra los nombres
+        con "aegon" y "conquistador", más los que tienen "jaehaerys".
+        """
+        resultado: set[int] = set()
+        for grupo in self._grupos(consulta):
+            listas = sorted((self._apariciones.get(t, _VACIO) for t in grupo), key=len)
+            resultado |= listas[0].intersection(*listas[1:])
+        return sorted(resultado)
+
+    def _grupos(self, consulta: str) -> list[set[str]]:
+        """Separa la consulta en grupos OR de tokens AND, descartando grupos vacíos."""
+        grupos: list[set[str]] = [set()]
+        for palabra in consulta.split():
+            if palabra == self.OPERADOR_OR:
+                grupos.append(set())
+            else:
+                grupos[-1].update(tokenizar(palabra))
+        return [grupo for grupo in grupos if grupo]
+
+    def __len__(self) -> int:
+        return len(self._apariciones)
+
+
+_VOCALES = frozenset("aeiouy")
+# Letras que suenan igual en español (seseo, yeísmo, b/v) comparten código
+_CODIGO_LETRA = {
+    "b": "B", "v": "B", "w": "B", "p": "P", "f": "F", "m": "M", "n": "N",
+    "d": "D", "t": "T", "l": "L", "r": "R", "s": "S", "z": "S", "k": "K",
+    "q": "K", "j": "J", "x": "KS",
+}  # fmt: skip
+# Marca de vocal: separa consonantes iguales ("Nana") y se descarta al final
+_VOCAL = "·"
+
+
+@lru_cache(maxsize=4096)
+def _codigo_palabra(palabra: str) -> str:
+    """
+    Código fonético de una palabra ya tokenizada (sin mayúsculas ni acentos).
+
+    Se memoriza: los nombres de una dinastía repiten mucho las mismas palabras.
+    """
+    if not any(c.isalpha() and c not in _VOCALES for c in palabra):
+        return palabra  # Números romanos, cifras, iniciales vocálicas sueltas
+    codigos: list[str] = []
+    largo = len(palabra)
+    i = 0
+    while i < largo:
+        letra = palabra[i]
+        siguiente = palabra[i + 1] if i + 1 < largo else ""
+        avance = 1
+        if letra == "h":
+            codigo = ""  # Muda (las combinaciones "ch" y "ph" se tratan antes)
+        elif letra == "c" and siguiente == "h":
+            codigo, avance = "X", 2
+        elif letra == "p" and siguiente == "h":
+            codigo, avance = "F", 2
+        elif letra == "l" and siguiente == "l":
+            codigo, avance = "Y", 2
+        elif letra in "qg" and siguiente == "u" and palabra[i + 2 : i + 3] in ("e", "i"):
+            codigo, avance = ("K" if letra == "q" else "G"), 2
+        elif letra == "c":
+            codigo = "S" if siguiente in ("e", "i", "y") else "K"
+        elif letra == "g":
+            codigo = "J" if siguiente in ("e", "i", "y") else "G"
+        elif letra == "y":
+            # Consonante solo al comienzo ante vocal ("Yara"); si no, vocal ("Visenya")
+            codigo = "Y" if i == 0 and siguiente in _VOCALES else _VOCAL
+        elif letra in _VOCALES:
+            codigo = "A" if i == 0 else _VOCAL
+        else:
+            codigo = _CODIGO_LETRA.get(letra, letra)
+        if codigo and (not codigos or codigos[-1] != codigo):
+            codigos.append(codigo)
+        i += avance
+    return "".join(c for c in codigos if c != _VOCAL)
+
+
+def clave_fonetica(texto: str) -> list[str]:
+    """
+    Códigos fonéticos de las palabras de un texto, con reglas del español.
+
+    Al estilo Soundex/Metaphone: la h es muda, b/v/w se igualan, z y c
+    ante e/i suenan como s, ll como y, "qu"/"gu" ante e/i pierden la u, y
+    se descartan las vocales (salvo una inicial, que se marca como "A").
+    Las vocales dobles y las semivocales de los nombres valyrios
+    ("ae", "ny") desaparecen con ellas, y las consonantes repetidas se
+    reducen a una. "Vissenia" y "Visenya" dan ``["BSN"]``; "Jaehaerys" y
+    "Jaherys" dan ``["JRS"]``.
+    """
+    return [_codigo_palabra(palabra) for palabra in tokenizar(texto)]
+
+
+class IndiceFonetico:
+    """
+    Índice de códigos fonéticos, para buscar nombres por cómo suenan.
+
+    Los códigos se calculan una vez, al indexar a la persona, y cada código
+    apunta a los IDs cuyo nombre tiene una palabra con ese sonido. Buscar es
+    calcular los códigos de la consulta y leer sus conjuntos (intersectados
+    si la consulta tiene varias palabras), sin recalcular los de nadie.
+    """
+
+    def __init__(self) -> None:
+        self._por_codigo: dict[str, set[int]] = {}
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        for codigo in clave_fonetica(nombre):
+            self._por_codigo.setdefault(codigo, set()).add(persona_id)
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        for codigo in set(clave_fonetica(nombre)):
+            ids = self._por_codigo.get(codigo)
+            if ids is None:
+                continue
+            ids.discard(persona_id)
+            if not ids:
+                del self._por_codigo[codigo]
+
+    def buscar(self, nombre: str) -> list[int]:
+        """Retorna, ordenados, los IDs con todas las palabras de ``nombre`` por sonido."""
+        codigos = set(clave_fonetica(nombre))
+        if not codigos:
+            return []
+        listas = sorted((self._por_codigo.get(c, _VACIO) for c in codigos), key=len)
+        return sorted(listas[0].intersection(*listas[1:]))
+
+    def __len__(self) -> int:
+        return len(self._por_codigo)
+
+
+class IndicesBusqueda:
+    """
+    Conjunto de índices de búsqueda que el repositorio mantiene al día.
+
+    Attributes:
+        prefijos: Índice de prefijos para autocompletar.
+        difuso: BK-tree para búsquedas tolerantes a errores de tipeo.
+        trigramas: Índice invertido para búsquedas por subcadena y regex.
+        tokens: Índice invertido de palabras, sin acentos, para texto completo.
+        fonetico: Códigos fonéticos de las palabras, para buscar por sonido.
+    """
+
+    def __init__(self) -> None:
+        self.prefijos = IndicePrefijos()
+        self.difuso = IndiceDifuso()
+        self.trigramas = IndiceTrigramas()
+        self.tokens = IndiceTokens()
+        self.fonetico = IndiceFonetico()
+
+    def agregar(self, persona_id: int, nombre: str) -> None:
+        """Indexa a una persona recién registrada."""
+        self.prefijos.agregar(persona_id, nombre)
+        self.difuso.agregar(persona_id, nombre)
+        self.trigramas.agregar(persona_id, nombre)
+        self.tokens.agregar(persona_id, nombre)
+        self.fonetico.agregar(persona_id, nombre)
+
+    def quitar(self, persona_id: int, nombre: str) -> None:
+        """Quita a una persona eliminada de todos los índices."""
+        self.prefijos.quitar(persona_id, nombre)
+        self.difuso.quitar(persona_id, nombre)
+        self.trigramas.quitar(persona_id, nombre)
+        self.tokens.quitar(persona_id, nombre)
+        self.fonetico.quitar(persona_id, nombre)
+
+    def incorporar_pendientes(self) -> None:
+        """
+        Incorpora ya las altas que prefijos y difuso dejan para la próxima consulta.
+
+        Después, mientras no haya altas nuevas, las búsquedas no modifican
+        los índices y pueden correr en paralelo.
+        """
+        self.prefijos.incorporar_pendientes()
+        self.difuso.incorporar_pendientes()
+
+    @classmethod
+    def construir(cls, personas: Iterable[tuple[int, str]]) -> "IndicesBusqueda":
+        """Construye los índices a partir de pares (ID, nombre)."""
+        indices = cls()
+        for persona_id, nombre in personas:
+            indices.agregar(persona_id, nombre)
+        return indices
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Protocol
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional, Protocol
 
 if TYPE_CHECKING:
     from .models import Persona
@@ -16,7 +17,7 @@ class ArbolRepository(Protocol):
 
     # Propiedad para acceder a las personas
     @property
-    def personas(self) -> dict[int, "Persona"]:
+    def personas(self) -> Mapping[int, "Persona"]:
         ...  # pragma: no cover
 
     def registrar_persona(self, nombre: str) -> "Persona":
@@ -34,6 +35,18 @@ class ArbolRepository(Protocol):
         """
         ...  # pragma: no cover
 
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list["Persona"]:
+        """
+        Registra muchas personas de una vez.
+
+        Args:
+            nombres: Nombres de las personas a registrar, en orden.
+
+        Returns:
+            list[Persona]: Las personas registradas, en el mismo orden.
+        """
+        ...  # pragma: no cover
+
     def get_persona(self, persona_id: int) -> "Persona":
         """
         Obtiene una persona por su ID.
@@ -49,6 +62,95 @@ class ArbolRepository(Protocol):
         """
         ...  # pragma: no cover
 
+    def buscar_por_nombre(self, nombre: str) -> list["Persona"]:
+        """
+        Busca personas por nombre exacto usando un índice (sin recorrer el árbol).
+
+        Args:
+            nombre: Nombre a buscar (se ignoran mayúsculas y espacios extremos).
+
+        Returns:
+            Lista de personas con ese nombre.
+        """
+        ...  # pragma: no cover
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre empieza con el prefijo dado (autocompletar).
+
+        Args:
+            prefijo: Comienzo del nombre (se ignoran mayúsculas y espacios extremos).
+            limite: Cantidad máxima de resultados.
+
+        Returns:
+            Hasta ``limite`` personas, en orden alfabético de nombre.
+        """
+        ...  # pragma: no cover
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre está a pocas ediciones del buscado.
+
+        Args:
+            nombre: Nombre buscado (se ignoran mayúsculas y espacios extremos).
+            distancia_maxima: Máximo de caracteres insertados, borrados o reemplazados.
+
+        Returns:
+            Las personas encontradas, de la más parecida a la menos.
+        """
+        ...  # pragma: no cover
+
+    def buscar_por_subcadena(self, texto: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre contiene el texto dado.
+
+        Args:
+            texto: Fragmento buscado (se ignoran mayúsculas y espacios extremos).
+
+        Returns:
+            Personas encontradas, ordenadas por ID.
+        """
+        ...  # pragma: no cover
+
+    def buscar_por_regex(self, patron: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre coincide con una expresión regular.
+
+        Args:
+            patron: Expresión regular, sin distinguir mayúsculas.
+
+        Returns:
+            Personas encontradas, ordenadas por ID.
+
+        Raises:
+            ConsultaInvalidaError: Si el patrón no es válido.
+        """
+        ...  # pragma: no cover
+
+    def buscar_por_palabras(self, consulta: str) -> list["Persona"]:
+        """
+        Busca personas por palabras de su nombre, sin distinguir mayúsculas ni acentos.
+
+        Args:
+            consulta: Palabras que deben estar todas; ``OR`` separa alternativas.
+
+        Returns:
+            Personas encontradas, ordenadas por ID.
+        """
+        ...  # pragma: no cover
+
+    def buscar_fonetico(self, nombre: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre suena como el dado (reglas del español).
+
+        Args:
+            nombre: Nombre tal como se pronuncia.
+
+        Returns:
+            Personas encontradas, ordenadas por ID.
+        """
+        ...  # pragma: no cover
+
     def init_get_root(self) -> list["Persona"]:
         """
         Obtiene las raíces del árbol (personas sin padres).
@@ -58,12 +160,21 @@ class ArbolRepository(Protocol):
         """
         ...  # pragma: no cover
 
-    def recorrer_arbol_completo(self, visitor: "ArbolVisitorInterface") -> None:
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
         """
         Recorre el árbol completo usando el patrón Visitor.
 
         Args:
             visitor: Visitante que procesará cada persona del árbol.
+            *otros_visitors: Visitantes adicionales; se ejecutan en la misma
+                pasada por el árbol cuando usan el motor de recorrido.
+            procesos: 1 recorre en este proceso; otro valor reparte los
+                linajes independientes entre procesos (0 = uno por CPU).
         """
         ...  # pragma: no cover
 
@@ -80,6 +191,18 @@ class ArbolRepository(Protocol):
         """
         ...  # pragma: no cover
 
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """
+        Establece muchas relaciones padre-hijo de forma atómica.
+
+        Args:
+            pares: Relaciones como (padre_id, hijo_id).
+
+        Raises:
+            LoteRelacionesError: Si alguna relación no es válida; no se aplica ninguna.
+        """
+        ...  # pragma: no cover
+
     def add_pareja(self, persona1: "Persona", persona2: "Persona") -> None:
         """
         Establece una relación de pareja entre dos personas.
@@ -120,6 +243,72 @@ class ArbolRepository(Protocol):
         ...  # pragma: no cover
 
 
+class FuentePersonas(Protocol):
+    """
+    Protocolo para almacenes que exponen personas como vistas (PersonaVista).
+
+    Lo implementan los repositorios que no guardan un objeto Python por
+    persona: las vistas leen y escriben sus datos a través de estos métodos.
+    Las relaciones se expresan con IDs, usando SIN_ID (0) para "sin relación".
+    """
+
+    def nombre_de(self, persona_id: int) -> str:
+        """Retorna el nombre de la persona."""
+        ...  # pragma: no cover
+
+    def pareja_de(self, persona_id: int) -> int:
+        """Retorna el ID de la pareja o SIN_ID."""
+        ...  # pragma: no cover
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        """Retorna los IDs de ambos padres (SIN_ID si no están definidos)."""
+        ...  # pragma: no cover
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        """Retorna los IDs de los hijos en orden de alta."""
+        ...  # pragma: no cover
+
+    def vista(self, persona_id: int) -> Optional["Persona"]:
+        """Retorna una vista de la persona, o None si el ID es SIN_ID."""
+        ...  # pragma: no cover
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        """Escribe el ID de pareja sin validaciones (equivale a asignar el atributo)."""
+        ...  # pragma: no cover
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        """Escribe los IDs de padres sin validaciones (equivale a asignar el atributo)."""
+        ...  # pragma: no cover
+
+
+class DetectorCiclos(Protocol):
+    """
+    Protocolo para estructuras que responden si una relación padre-hijo
+    cerraría un ciclo temporal (por ejemplo, OrdenTopologico).
+
+    FamilyValidator lo usa, si se le pasa uno, en lugar de buscar ancestros.
+    """
+
+    def crearia_ciclo(self, padre_id: int, hijo_id: int) -> bool:
+        """Retorna True si agregar la relación padre -> hijo formaría un ciclo."""
+        ...  # pragma: no cover
+
+    def respeta_orden(self, padre_id: int, hijo_id: int) -> bool:
+        """
+        Retorna True si la relación es compatible con el orden actual: un lote
+        de relaciones que lo respetan no puede formar ciclos.
+        """
+        ...  # pragma: no cover
+
+    def relaciones_en_ciclo(self, pares: Sequence[tuple[int, int]]) -> Optional[list[int]]:
+        """
+        Retorna las posiciones de ``pares`` que, agregados todos a la vez,
+        formarían parte de un ciclo, o None si el detector no puede
+        resolverlo sin recorrer el árbol (lo hace entonces el validador).
+        """
+        ...  # pragma: no cover
+
+
 class DataLoaderProtocol(Protocol):
     """
     Protocolo para cargadores de datos.
@@ -39,11 +39,12 @@ def setup_application_logging(config: AppConfig | None = None) -> None:
         name="src",
         level=logging.INFO,
         log_file=log_file,
+        usar_cola=config.log_en_cola,
     )
 
     logger = logging.getLogger("src")
     _log_banner(logger, f"{APP_NAME} - Iniciado")
-    logger.info(f"Logging configurado - Archivo: {log_file.absolute()}")
+    logger.info("Logging configurado - Archivo: %s", log_file.absolute())
 
 
 def _log_banner(logger: logging.Logger, message: str) -> None:
@@ -78,14 +79,23 @@ def _load_application_data(
     """
     Carga los datos de demostración en el árbol.
 
+    Un repositorio persistente que ya tiene personas (por ejemplo, una base
+    SQLite de una ejecución anterior) se conserva tal cual.
+
     Args:
         data_loader: Cargador de datos.
         arbol: Repositorio del árbol genealógico.
         logger: Logger para registrar operaciones.
     """
+    if len(arbol.personas) > 0:
+        logger.info(
+            "Árbol existente con %s personas: se omiten los datos de demostración",
+            len(arbol.personas),
+        )
+        return
     logger.info("Cargando datos de demostración...")
     data_loader.cargar_datos(arbol)
-    logger.info(f"Datos cargados exitosamente: {len(arbol.personas)} personas registradas")
+    logger.info("Datos cargados exitosamente: %s personas registradas", len(arbol.personas))
 
 
 def _run_application_ui(ui: "UIProtocol", logger: logging.Logger) -> None:
@@ -119,7 +129,7 @@ def _handle_critical_error(
         logger: Logger para registrar el error.
         output: Output para mostrar mensajes al usuario (None para crear uno nuevo).
     """
-    logger.exception(f"Error crítico en la aplicación: {error}")
+    logger.exception("Error crítico en la aplicación: %s", error)
     logger.error("La aplicación se cerrará debido a un error crítico")
     if output is None:
         output = ConsoleOutput()
@@ -136,6 +146,7 @@ def _cleanup(logger: logging.Logger) -> None:
     """
     logger.debug("Ejecutando limpieza final...")
     _log_banner(logger, f"{APP_NAME} - Finalizado")
+    LoggerConfig.detener_colas()
 
 
 def main(config: AppConfig | None = None, container: ContainerProtocol | None = None) -> None:
@@ -154,6 +165,8 @@ def main(config: AppConfig | None = None, container: ContainerProtocol | None =
     Raises:
         SystemExit: Siempre termina con sys.exit() para indicar estado de salida.
     """
+    if config is None:
+        config = AppConfig.from_env()
     setup_application_logging(config)
     logger = logging.getLogger(__name__)
     output: UserOutputInterface = ConsoleOutput()
@@ -162,7 +175,7 @@ def main(config: AppConfig | None = None, container: ContainerProtocol | None =
         logger.info("Inicializando aplicación...")
 
         if container is None:
-            container = ApplicationContainer()
+            container = ApplicationContainer(config)
 
         arbol, data_loader, ui = _initialize_dependencies(container)
 
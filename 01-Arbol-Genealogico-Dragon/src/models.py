@@ -1,8 +1,16 @@
-from typing import TYPE_CHECKING, Optional
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from typing import TYPE_CHECKING, Optional, overload
+
+from .exceptions import IDInvalidoError, PersonaNoEncontradaError
 
 if TYPE_CHECKING:
+    from .interfaces import FuentePersonas
     from .visitors import ArbolVisitorInterface
 
+# Valor reservado para "sin relación": los IDs válidos son enteros positivos
+SIN_ID = 0
+
 
 class Persona:
     """
@@ -12,22 +20,40 @@ class Persona:
     incluyendo su identificador único, nombre, su pareja, sus hijos
     y sus padres (biológicos o reconocidos).
 
+    Representación compacta: usa __slots__ y guarda las relaciones como IDs
+    (pareja y padres como enteros, hijos en un array('q')). Las referencias
+    a objetos se resuelven a través del registro compartido con el
+    repositorio (el diccionario ``personas`` de ArbolGenealogico), lo que
+    evita el grafo cíclico de objetos y reduce la memoria por persona.
+
     Atributos:
         id (int): Identificador único de la persona.
         nombre (str): Nombre completo de la persona.
         pareja (Optional[Persona]): Referencia a la pareja actual de la persona, si existe.
-        hijos (list[Persona]): Lista de objetos Persona que representan los hijos de esta persona.
+        hijos (HijosPersona): Secuencia mutable de objetos Persona que representan
+        los hijos de esta persona.
         padres (tuple[Optional[Persona], Optional[Persona]]): Tupla de longitud 2
         con las referencias a los padres biológicos o reconocidos
         (pueden ser None si no están definidos).
     """
 
+    __slots__ = (
+        "id",
+        "nombre",
+        "_pareja_id",
+        "_padre0_id",
+        "_padre1_id",
+        "_hijos_ids",
+        "_registro",
+    )
+
     def __init__(
         self,
         person_id: int,
         nombre: str,
         pareja: Optional["Persona"] = None,
         hijos: Optional[list["Persona"]] = None,
+        registro: Optional[dict[int, "Persona"]] = None,
     ):
         """
         Inicializa una instancia de Persona.
@@ -38,12 +64,165 @@ class Persona:
             pareja (Optional[Persona], opcional): Pareja de la persona. Por defecto es None.
             hijos (Optional[list[Persona]], opcional): Lista de hijos de la persona.
                 Si no se proporciona, se inicializa como una lista vacía.
+            registro (Optional[dict[int, Persona]], opcional): Diccionario ID -> Persona
+                usado para resolver relaciones. El repositorio pasa su propio
+                diccionario de personas; si se omite, se crea al vincular personas.
         """
-        self.id = person_id
+        self.id: int = person_id
         self.nombre: str = nombre
-        self.pareja: Optional["Persona"] = pareja or None
-        self.hijos: list["Persona"] = hijos or []
-        self.padres: tuple[Optional["Persona"], Optional["Persona"]] = (None, None)
+        self._pareja_id: int = SIN_ID
+        self._padre0_id: int = SIN_ID
+        self._padre1_id: int = SIN_ID
+        self._hijos_ids: Optional["array[int]"] = None
+        self._registro: Optional[dict[int, "Persona"]] = registro
+        if pareja is not None:
+            self.pareja = pareja
+        if hijos:
+            self.hijos.extend(hijos)
+
+    @classmethod
+    def desde_ids(
+        cls,
+        person_id: int,
+        nombre: str,
+        pareja_id: int,
+        padres_ids: tuple[int, int],
+        hijos_ids: "array[int]",
+        registro: dict[int, "Persona"],
+    ) -> "Persona":
+        """
+        Crea una persona con sus relaciones ya expresadas como IDs, sin validar.
+
+        Sirve para reconstruir personas a partir de datos compactos (por
+        ejemplo, una instantánea enviada a otro proceso). Quien llama debe
+        agregar la persona a ``registro``.
+        """
+        persona = cls.__new__(cls)
+        persona.id = person_id
+        persona.nombre = nombre
+        persona._registro = registro
+        persona._pareja_id = pareja_id
+        persona._padre0_id, persona._padre1_id = padres_ids
+        persona._hijos_ids = hijos_ids if len(hijos_ids) else None
+        return persona
+
+    @classmethod
+    def desde_columnas(
+        cls,
+        ids: Sequence[int],
+        nombres: Sequence[str],
+        parejas: Sequence[int],
+        padres0: Sequence[int],
+        padres1: Sequence[int],
+        hijos_inicio: Sequence[int],
+        hijos: "array[int]",
+        registro: dict[int, "Persona"],
+    ) -> None:
+        """
+        Crea muchas personas a partir de columnas paralelas y las agrega a ``registro``.
+
+        Equivale a llamar desde_ids() por cada posición, pero en un único
+        ciclo sin llamadas ni tuplas intermedias por persona. Los hijos de la
+        persona ``i`` son ``hijos[hijos_inicio[i] : hijos_inicio[i + 1]]``.
+        """
+        nueva = cls.__new__
+        desde = hijos_inicio[0]
+        for persona_id, nombre, pareja_id, padre0, padre1, hasta in zip(
+            ids, nombres, parejas, padres0, padres1, hijos_inicio[1:]
+        ):
+            persona = nueva(cls)
+            persona.id = persona_id
+            persona.nombre = nombre
+            persona._registro = registro
+            persona._pareja_id = pareja_id
+            persona._padre0_id = padre0
+            persona._padre1_id = padre1
+            persona._hijos_ids = hijos[desde:hasta] if hasta > desde else None
+            registro[persona_id] = persona
+            desde = hasta
+
+    # ==================== RESOLUCIÓN DE REFERENCIAS ====================
+
+    def vincular(self, otra: "Persona") -> None:
+        """
+        Garantiza que ``otra`` pueda resolverse desde el registro de esta persona.
+
+        Dentro de un repositorio ambas comparten el mismo registro y esto es una
+        simple comparación; para personas sueltas (p. ej. en tests) se crea o
+        se amplía un registro común.
+
+        Raises:
+            IDInvalidoError: Si el registro ya tiene otra persona con el mismo ID.
+        """
+        registro = self._registro
+        if registro is not None and registro is otra._registro:
+            return
+        if registro is None:
+            if otra._registro is None:
+                otra._registro = {otra.id: otra}
+            self._agregar_a(otra._registro)
+        else:
+            otra._agregar_a(registro)
+
+    def _agregar_a(self, registro: dict[int, "Persona"]) -> None:
+        """Comparte ``registro``, agregándose si su ID todavía no está ocupado."""
+        existente = registro.setdefault(self.id, self)
+        if existente is not self:
+            raise IDInvalidoError(f"El ID {self.id} ya es de otra persona: {existente}")
+        self._registro = registro
+
+    def resolver(self, persona_id: int) -> Optional["Persona"]:
+        """Devuelve la persona con ``persona_id`` o None si el ID es SIN_ID o no existe."""
+        if persona_id == SIN_ID or self._registro is None:
+            return None
+        return self._registro.get(persona_id)
+
+    # ==================== PROPIEDADES PÚBLICAS ====================
+
+    @property
+    def pareja(self) -> Optional["Persona"]:
+        return self.resolver(self._pareja_id)
+
+    @pareja.setter
+    def pareja(self, valor: Optional["Persona"]) -> None:
+        if valor is None:
+            self._pareja_id = SIN_ID
+        else:
+            self.vincular(valor)
+            self._pareja_id = valor.id
+
+    @property
+    def padres(self) -> tuple[Optional["Persona"], Optional["Persona"]]:
+        return (self.resolver(self._padre0_id), self.resolver(self._padre1_id))
+
+    @padres.setter
+    def padres(self, valor: tuple[Optional["Persona"], Optional["Persona"]]) -> None:
+        padre0, padre1 = valor
+        if padre0 is not None:
+            self.vincular(padre0)
+        if padre1 is not None:
+            self.vincular(padre1)
+        self._padre0_id = SIN_ID if padre0 is None else padre0.id
+        self._padre1_id = SIN_ID if padre1 is None else padre1.id
+
+    @property
+    def hijos(self) -> MutableSequence["Persona"]:
+        return HijosPersona(self)
+
+    @property
+    def pareja_id(self) -> int:
+        """ID de la pareja (SIN_ID si no tiene), sin resolver el objeto."""
+        return self._pareja_id
+
+    @property
+    def padres_ids(self) -> tuple[int, int]:
+        """IDs de ambos padres (SIN_ID si no están definidos), sin resolver objetos."""
+        return (self._padre0_id, self._padre1_id)
+
+    @property
+    def hijos_ids(self) -> "array[int]":
+        """IDs de los hijos, en orden de alta (sin resolver objetos)."""
+        return self._hijos_ids if self._hijos_ids is not None else array("q")
 
     def accept_visitor(self, visitor: "ArbolVisitorInterface") -> None:
         """
@@ -72,3 +251,187 @@ class Persona:
             str: Representación legible de la persona.
         """
         return self.__str__()
+
+
+class HijosPersona(MutableSequence[Persona]):
+    """
+    Vista mutable sobre los hijos de una persona.
+
+    Se comporta como una lista de Persona (append, remove, len, iteración),
+    pero lee y escribe directamente el array de IDs de la persona dueña,
+    resolviendo cada ID a través de su registro.
+    """
+
+    __slots__ = ("_persona",)
+
+    def __init__(self, persona: Persona):
+        self._persona = persona
+
+    def _ids(self) -> "array[int]":
+        persona = self._persona
+        if persona._hijos_ids is None:  # pyright: ignore[reportPrivateUsage]
+            persona._hijos_ids = array("q")  # pyright: ignore[reportPrivateUsage]
+        return persona._hijos_ids  # pyright: ignore[reportPrivateUsage]
+
+    def _a_persona(self, persona_id: int) -> Persona:
+        persona = self._persona.resolver(persona_id)
+        if persona is None:
+            raise PersonaNoEncontradaError(
+                persona_id=persona_id,
+                message=f"Hijo con ID {persona_id} de {self._persona} fuera del registro",
+            )
+        return persona
+
+    def __len__(self) -> int:
+        ids = self._persona._hijos_ids  # pyright: ignore[reportPrivateUsage]
+        return 0 if ids is None else len(ids)
+
+    def __iter__(self) -> Iterator[Persona]:
+        ids = self._persona._hijos_ids  # pyright: ignore[reportPrivateUsage]
+        if ids is None:
+            return iter(())
+        return (self._a_persona(i) for i in ids)
+
+    def __contains__(self, valor: object) -> bool:
+        ids = self._persona._hijos_ids  # pyright: ignore[reportPrivateUsage]
+        return (
+            isinstance(valor, Persona)
+            and ids is not None
+            and valor.id in ids
+            and (self._a_persona(valor.id) is valor)
+        )
+
+    @overload
+    def __getitem__(self, indice: int) -> Persona: ...
+
+    @overload
+    def __getitem__(self, indice: slice) -> list[Persona]: ...
+
+    def __getitem__(self, indice: int | slice) -> Persona | list[Persona]:
+        if isinstance(indice, slice):
+            return [self._a_persona(i) for i in self._ids()[indice]]
+        return self._a_persona(self._ids()[indice])
+
+    @overload
+    def __setitem__(self, indice: int, valor: Persona) -> None: ...
+
+    @overload
+    def __setitem__(self, indice: slice, valor: Iterable[Persona]) -> None: ...
+
+    def __setitem__(self, indice: int | slice, valor: Persona | Iterable[Persona]) -> None:
+        if isinstance(indice, slice):
+            if isinstance(valor, Persona):
+                raise TypeError("Para asignar un slice de hijos se requiere un iterable de Persona")
+            nuevos = list(valor)
+            for hijo in nuevos:
+                self._persona.vincular(hijo)
+            self._ids()[indice] = array("q", (h.id for h in nuevos))
+        else:
+            if not isinstance(valor, Persona):
+                raise TypeError(f"Un hijo debe ser una Persona, no {type(valor).__name__}")
+            self._persona.vincular(valor)
+            self._ids()[indice] = valor.id
+
+    def __delitem__(self, indice: int | slice) -> None:
+        del self._ids()[indice]
+
+    def insert(self, index: int, value: Persona) -> None:
+        self._persona.vincular(value)
+        self._ids().insert(index, value.id)
+
+    def append(self, value: Persona) -> None:
+        self._persona.vincular(value)
+        self._ids().append(value.id)
+
+    def remove(self, value: Persona) -> None:
+        try:
+            self._ids().remove(value.id)
+        except ValueError:
+            raise ValueError(f"{value} no es hijo de {self._persona}") from None
+
+    def __eq__(self, otro: object) -> bool:
+        if isinstance(otro, HijosPersona):
+            return list(self) == list(otro)
+        if isinstance(otro, list):
+            return list(self) == otro
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class PersonaVista(Persona):
+    """
+    Vista liviana (flyweight) de una persona almacenada fuera de objetos Python.
+
+    No guarda datos propios más allá del ID: nombre y relaciones se leen de la
+    fuente (por ejemplo, las columnas de ArbolColumnar) en cada acceso. Se
+    crean al vuelo, por lo que dos vistas de la misma persona son iguales
+    (==) aunque no sean el mismo objeto.
+
+    Los hijos se devuelven como una lista nueva: para modificar relaciones
+    se deben usar los métodos del repositorio.
+    """
+
+    __slots__ = ("_fuente",)
+
+    def __init__(self, persona_id: int, fuente: "FuentePersonas"):
+        self.id = persona_id
+        self._fuente = fuente
+
+    @property
+    def nombre(self) -> str:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return self._fuente.nombre_de(self.id)
+
+    def resolver(self, persona_id: int) -> Optional[Persona]:
+        return self._fuente.vista(persona_id)
+
+    def vincular(self, otra: Persona) -> None:
+        """Las vistas comparten la fuente: no hay registro que ampliar."""
+
+    @property
+    def pareja(self) -> Optional[Persona]:
+        return self._fuente.vista(self._fuente.pareja_de(self.id))
+
+    @pareja.setter
+    def pareja(self, valor: Optional[Persona]) -> None:
+        self._fuente.asignar_pareja(self.id, SIN_ID if valor is None else valor.id)
+
+    @property
+    def padres(self) -> tuple[Optional[Persona], Optional[Persona]]:
+        padre0, padre1 = self._fuente.padres_de(self.id)
+        return (self._fuente.vista(padre0), self._fuente.vista(padre1))
+
+    @padres.setter
+    def padres(self, valor: tuple[Optional[Persona], Optional[Persona]]) -> None:
+        padre0, padre1 = valor
+        self._fuente.asignar_padres(
+            self.id,
+            SIN_ID if padre0 is None else padre0.id,
+            SIN_ID if padre1 is None else padre1.id,
+        )
+
+    @property
+    def pareja_id(self) -> int:
+        return self._fuente.pareja_de(self.id)
+
+    @property
+    def padres_ids(self) -> tuple[int, int]:
+        return self._fuente.padres_de(self.id)
+
+    @property
+    def hijos(self) -> MutableSequence[Persona]:
+        fuente = self._fuente
+        return [PersonaVista(i, fuente) for i in fuente.hijos_de(self.id)]
+
+    @property
+    def hijos_ids(self) -> "array[int]":
+        return array("q", self._fuente.hijos_de(self.id))
+
+    def __eq__(self, otro: object) -> bool:
+        if isinstance(otro, PersonaVista):
+            return self.id == otro.id and self._fuente is otro._fuente
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._fuente), self.id))
@@ -0,0 +1,295 @@
+"""
+Orden topológico dinámico del grafo padre -> hijo (algoritmo de Pearce-Kelly).
+
+Mantiene un rango entero por persona tal que todo padre tiene un rango menor
+que sus hijos. Una relación nueva padre -> hijo que ya respeta el orden se
+acepta en O(1); si no lo respeta, solo se exploran y reordenan las personas
+cuyo rango está entre el del hijo y el del padre. Si en esa región el padre
+es alcanzable desde el hijo, la relación cerraría un ciclo.
+
+Referencia: D. J. Pearce y P. H. J. Kelly, "A Dynamic Topological Sort
+Algorithm for Directed Acyclic Graphs", ACM JEA 11 (2006).
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Optional
+
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Sucesores = Callable[[int], Iterable[int]]
+
+
+def ordenar_topologicamente(
+    nodos: Iterable[int], sucesores: Sucesores
+) -> tuple[list[int], set[int]]:
+    """
+    Orden topológico de Kahn sobre los nodos dados.
+
+    Returns:
+        El orden de los nodos que no participan de ciclos ni descienden de
+        uno, y el conjunto de los que quedaron sin ordenar (vacío si el grafo
+        es acíclico).
+    """
+    grado: dict[int, int] = dict.fromkeys(nodos, 0)
+    for nodo in grado:
+        for siguiente in sucesores(nodo):
+            grado[siguiente] += 1
+
+    orden = [nodo for nodo, entrantes in grado.items() if entrantes == 0]
+    # 'orden' funciona también como cola: se recorre mientras crece
+    for nodo in orden:
+        for siguiente in sucesores(nodo):
+            grado[siguiente] -= 1
+            if grado[siguiente] == 0:
+                orden.append(siguiente)
+
+    restantes = {nodo for nodo, entrantes in grado.items() if entrantes > 0}
+    return orden, restantes
+
+
+def componentes_fuertes(nodos: set[int], sucesores: Sucesores) -> dict[int, int]:
+    """
+    Componentes fuertemente conexas (Tarjan, con pila explícita).
+
+    Solo considera las aristas entre nodos del conjunto. Dos nodos están en
+    la misma componente si y solo si forman parte de un mismo ciclo.
+
+    Returns:
+        Diccionario nodo -> número de componente.
+    """
+    indice: dict[int, int] = {}
+    minimo: dict[int, int] = {}
+    componente: dict[int, int] = {}
+    pila_tarjan: list[int] = []
+    en_pila: set[int] = set()
+    contador = 0
+
+    for raiz in nodos:
+        if raiz in indice:
+            continue
+        indice[raiz] = minimo[raiz] = contador
+        contador += 1
+        pila_tarjan.append(raiz)
+        en_pila.add(raiz)
+        llamadas = [(raiz, iter(sucesores(raiz)))]
+        while llamadas:
+            nodo, pendientes = llamadas[-1]
+            for siguiente in pendientes:
+                if siguiente not in nodos:
+                    continue
+                if siguiente not in indice:
+                    indice[siguiente] = minimo[siguiente] = contador
+                    contador += 1
+                    pila_tarjan.append(siguiente)
+                    en_pila.add(siguiente)
+                    llamadas.append((siguiente, iter(sucesores(siguiente))))
+                    break
+                if siguiente in en_pila:
+                    minimo[nodo] = min(minimo[nodo], indice[siguiente])
+            else:
+                llamadas.pop()
+                if llamadas:
+                    anterior = llamadas[-1][0]
+                    minimo[anterior] = min(minimo[anterior], minimo[nodo])
+                if minimo[nodo] == indice[nodo]:
+                    while True:
+                        miembro = pila_tarjan.pop()
+                        en_pila.discard(miembro)
+                        componente[miembro] = indice[nodo]
+                        if miembro == nodo:
+                            break
+    return componente
+
+
+class OrdenTopologico:
+    """
+    Orden topológico incremental sobre IDs de personas.
+
+    No guarda las relaciones: las consulta al repositorio dueño a través de
+    ``sucesores`` (IDs de los hijos) y ``predecesores`` (IDs de los padres,
+    con SIN_ID para "sin padre"), así que no duplica memoria por relación.
+
+    Las bajas de relaciones o personas nunca invalidan el orden; solo hay que
+    avisar al agregar personas (``agregar_nodo``), al quitarlas
+    (``quitar_nodo``) y al agregar relaciones (``agregar_arista``).
+    """
+
+    def __init__(self, sucesores: Sucesores, predecesores: Callable[[int], Iterable[int]]):
+        self._sucesores = sucesores
+        self._predecesores = predecesores
+        self._rango: dict[int, int] = {}
+        self._siguiente_rango = 0
+        # Última búsqueda hacia adelante (padre, hijo, región) para reutilizarla
+        # entre crearia_ciclo() y agregar_arista() de la misma relación
+        self._ultima_busqueda: Optional[tuple[int, int, list[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._rango)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return persona_id in self._rango
+
+    def rango(self, persona_id: int) -> int:
+        """Retorna la posición de la persona en el orden (menor = más antiguo)."""
+        return self._rango[persona_id]
+
+    def agregar_nodo(self, persona_id: int) -> None:
+        """Agrega una persona sin relaciones al final del orden."""
+        self._rango[persona_id] = self._siguiente_rango
+        self._siguiente_rango += 1
+
+    def quitar_nodo(self, persona_id: int) -> None:
+        """Quita una persona; los huecos en los rangos no afectan el orden."""
+        self._rango.pop(persona_id, None)
+        self._ultima_busqueda = None
+
+    @property
+    def siguiente_rango(self) -> int:
+        """Rango que recibirá la próxima persona agregada."""
+        return self._siguiente_rango
+
+    def restaurar(self, rangos: dict[int, int], siguiente_rango: int) -> None:
+        """
+        Reemplaza todos los rangos por unos guardados (por ejemplo, en un snapshot).
+
+        No verifica que respeten las relaciones: quien llama garantiza que
+        provienen de este mismo grafo.
+        """
+        self._rango = rangos
+        self._siguiente_rango = siguiente_rango
+        self._ultima_busqueda = None
+
+    def reconstruir(self, nodos: Iterable[int]) -> None:
+        """
+        Recalcula todos los rangos con un orden de Kahn sobre el grafo actual.
+
+        Conviene después de agregar muchas relaciones de una vez (por ejemplo,
+        add_hijos_bulk) en lugar de reordenar relación por relación.
+
+        Raises:
+            RuntimeError: Si el grafo tiene ciclos (los rangos no cambian).
+        """
+        orden, restantes = ordenar_topologicamente(nodos, self._sucesores)
+        if restantes:
+            raise RuntimeError(
+                f"reconstruir() sobre un grafo con ciclos ({len(restantes)} persona(s) sin orden)"
+            )
+        self._rango = {persona_id: rango for rango, persona_id in enumerate(orden)}
+        self._siguiente_rango = len(orden)
+        self._ultima_busqueda = None
+        logger.debug("Orden topológico reconstruido para %s persona(s)", len(orden))
+
+    def respeta_orden(self, padre_id: int, hijo_id: int) -> bool:
+        """
+        Indica si el padre ya está antes que el hijo en el orden actual.
+
+        Un conjunto de relaciones que respetan el orden nunca forma un ciclo,
+        ni por sí mismas ni combinadas entre ellas.
+        """
+        return self._rango[padre_id] < self._rango[hijo_id]
+
+    def relaciones_en_ciclo(self, pares: Sequence[tuple[int, int]]) -> Optional[list[int]]:
+        """
+        Ninguna, si todas las relaciones respetan el orden; si no, None: el
+        orden solo no alcanza para decir cuáles cierran un ciclo.
+        """
+        if all(self.respeta_orden(padre_id, hijo_id) for padre_id, hijo_id in pares):
+            return []
+        return None
+
+    def crearia_ciclo(self, padre_id: int, hijo_id: int) -> bool:
+        """
+        Indica si agregar la relación padre -> hijo cerraría un ciclo.
+
+        Es O(1) cuando el padre ya está antes que el hijo en el orden; si no,
+        busca al padre entre los descendientes del hijo con rango menor o
+        igual al del padre.
+        """
+        if padre_id == hijo_id:
+            return True
+        limite = self._rango[padre_id]
+        if limite < self._rango[hijo_id]:
+            return False
+        return self._buscar_adelante(padre_id, hijo_id, limite) is None
+
+    def agregar_arista(self, padre_id: int, hijo_id: int) -> None:
+        """
+        Registra la relación padre -> hijo, reordenando la región afectada.
+
+        La relación debe haberse validado antes con ``crearia_ciclo``.
+
+        Raises:
+            RuntimeError: Si la relación cerraría un ciclo (el orden no cambia).
+        """
+        rango = self._rango
+        limite_superior = rango[padre_id]
+        limite_inferior = rango[hijo_id]
+        if limite_superior < limite_inferior:
+            self._ultima_busqueda = None
+            return
+
+        adelante = self._buscar_adelante(padre_id, hijo_id, limite_superior)
+        self._ultima_busqueda = None
+        if adelante is None:
+            raise RuntimeError(
+                f"agregar_arista({padre_id}, {hijo_id}) sobre una relación que forma un ciclo"
+            )
+        atras = self._buscar_atras(padre_id, limite_inferior)
+
+        # Los ancestros afectados del padre van antes que los descendientes
+        # afectados del hijo, reutilizando los mismos rangos
+        atras.sort(key=rango.__getitem__)
+        adelante.sort(key=rango.__getitem__)
+        afectados = atras + adelante
+        rangos = sorted(rango[i] for i in afectados)
+        for persona_id, nuevo_rango in zip(afectados, rangos):
+            rango[persona_id] = nuevo_rango
+        logger.debug("Orden topológico: %s persona(s) reordenada(s)", len(afectados))
+
+    def _buscar_adelante(self, padre_id: int, hijo_id: int, limite: int) -> Optional[list[int]]:
+        """
+        Descendientes del hijo con rango menor al límite (incluido el hijo).
+
+        Retorna None si el padre (el único con rango igual al límite) es
+        alcanzable, es decir, si la relación formaría un ciclo.
+        """
+        ultima = self._ultima_busqueda
+        if ultima is not None and ultima[0] == padre_id and ultima[1] == hijo_id:
+            return ultima[2]
+
+        rango = self._rango
+        sucesores = self._sucesores
+        visitados = {hijo_id}
+        region = [hijo_id]
+        pendientes = [hijo_id]
+        while pendientes:
+            for siguiente in sucesores(pendientes.pop()):
+                rango_siguiente = rango[siguiente]
+                if rango_siguiente == limite:
+                    self._ultima_busqueda = None
+                    return None
+                if rango_siguiente < limite and siguiente not in visitados:
+                    visitados.add(siguiente)
+                    region.append(siguiente)
+                    pendientes.append(siguiente)
+        self._ultima_busqueda = (padre_id, hijo_id, region)
+        return region
+
+    def _buscar_atras(self, padre_id: int, limite: int) -> list[int]:
+        """Ancestros del padre con rango mayor al límite (incluido el padre)."""
+        rango = self._rango
+        predecesores = self._predecesores
+        visitados = {padre_id}
+        region = [padre_id]
+        pendientes = [padre_id]
+        while pendientes:
+            for anterior in predecesores(pendientes.pop()):
+                if anterior in visitados or anterior not in rango:
+                    continue
+                if rango[anterior] > limite:
+                    visitados.add(anterior)
+                    region.append(anterior)
+                    pendientes.append(anterior)
+        return region
@@ -0,0 +1,251 @@
+"""
+Recorrido del árbol en paralelo por linajes independientes.
+
+El bosque de raíces suele dividirse en componentes conexas disjuntas (casas
+sin parentesco entre sí). Cada componente se puede recorrer por separado:
+se agrupan en lotes, cada lote se envía a un proceso como una instantánea
+compacta de arrays de IDs, el proceso reconstruye sus personas y ejecuta
+copias parciales de los visitors, y al final los visitors originales
+combinan los parciales en el orden de los lotes.
+"""
+
+import os
+from array import array
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, cast
+
+from .models import SIN_ID, Persona
+from .utils.logger import get_logger
+from .visitors import (
+    ArbolVisitorInterface,
+    MapaVisitados,
+    VisitorCombinable,
+    VisitorRecorrido,
+    recorrer_fusionado,
+)
+
+logger = get_logger(__name__)
+
+# Los lotes más chicos que esto no compensan el costo de enviarlos a un proceso
+PERSONAS_MINIMAS_POR_LOTE = 10_000
+
+
+class Instantanea(NamedTuple):
+    """
+    Copia compacta de un conjunto de componentes, lista para serializar.
+
+    La persona ``i`` es ``ids[i]``; sus hijos son
+    ``hijos[hijos_inicio[i] - hijos_inicio[0] : hijos_inicio[i + 1] - hijos_inicio[0]]``
+    (los cortes de una instantánea mayor conservan los desplazamientos originales).
+    """
+
+    raices: "array[int]"
+    ids: "array[int]"
+    nombres: list[str]
+    parejas: "array[int]"
+    padres0: "array[int]"
+    padres1: "array[int]"
+    hijos_inicio: "array[int]"
+    hijos: "array[int]"
+
+    @staticmethod
+    def vacia() -> "Instantanea":
+        """Retorna una instantánea sin personas."""
+        return Instantanea(
+            array("q"),
+            array("q"),
+            [],
+            array("q"),
+            array("q"),
+            array("q"),
+            array("q", [0]),
+            array("q"),
+        )
+
+    def cortar(self, desde: int, hasta: int, raices_desde: int, raices_hasta: int) -> "Instantanea":
+        """Retorna las personas ``[desde, hasta)`` y las raíces ``[raices_desde, raices_hasta)``."""
+        return Instantanea(
+            self.raices[raices_desde:raices_hasta],
+            self.ids[desde:hasta],
+            self.nombres[desde:hasta],
+            self.parejas[desde:hasta],
+            self.padres0[desde:hasta],
+            self.padres1[desde:hasta],
+            self.hijos_inicio[desde : hasta + 1],
+            self.hijos[self.hijos_inicio[desde] : self.hijos_inicio[hasta]],
+        )
+
+
+def tomar_instantanea(
+    raices: Sequence[Persona], personas: Mapping[int, Persona]
+) -> tuple[Instantanea, list[tuple[int, int]]]:
+    """
+    Copia el bosque en arrays de IDs, agrupando las personas por componente conexa.
+
+    Una componente reúne los linajes que comparten alguna persona. Se
+    recorren sin recursión las relaciones padre-hijo en ambos sentidos desde
+    cada raíz todavía no alcanzada, copiando cada persona al encontrarla.
+
+    Returns:
+        La instantánea y, por componente, el fin (exclusivo) de sus personas
+        en ``ids`` y de sus raíces en ``raices``. Las componentes quedan en el
+        orden de su primera raíz y, dentro de cada una, las raíces en su
+        orden original.
+    """
+    instantanea = Instantanea.vacia()
+    ids, nombres, parejas = instantanea.ids, instantanea.nombres, instantanea.parejas
+    padres0, padres1, hijos, hijos_inicio = (
+        instantanea.padres0,
+        instantanea.padres1,
+        instantanea.hijos,
+        instantanea.hijos_inicio,
+    )
+    orden_raiz = {raiz.id: i for i, raiz in enumerate(raices)}
+    vistos = MapaVisitados()
+    cortes: list[tuple[int, int]] = []
+    for raiz in raices:
+        if raiz.id in vistos:
+            continue
+        raices_componente: list[int] = []
+        vistos.add(raiz.id)
+        pendientes = [raiz.id]
+        while pendientes:
+            actual_id = pendientes.pop()
+            actual = personas[actual_id]
+            padre0, padre1 = actual.padres_ids
+            hijos_actual = actual.hijos_ids
+            ids.append(actual_id)
+            nombres.append(actual.nombre)
+            parejas.append(actual.pareja_id)
+            padres0.append(padre0)
+            padres1.append(padre1)
+            hijos.extend(hijos_actual)
+            hijos_inicio.append(len(hijos))
+            if padre0 == SIN_ID and padre1 == SIN_ID:
+                raices_componente.append(actual_id)
+            for vecino in (padre0, padre1, *hijos_actual):
+                if vecino != SIN_ID and vecino not in vistos:
+                    vistos.add(vecino)
+                    pendientes.append(vecino)
+        raices_componente.sort(key=orden_raiz.__getitem__)
+        instantanea.raices.extend(raices_componente)
+        cortes.append((len(ids), len(instantanea.raices)))
+    return instantanea, cortes
+
+
+def _recorrer_instantanea(
+    instantanea: Instantanea, parciales: list[VisitorCombinable]
+) -> list[VisitorCombinable]:
+    """Tarea de cada proceso: reconstruye las personas y ejecuta los parciales."""
+    registro: dict[int, Persona] = {}
+    inicio = instantanea.hijos_inicio
+    base = inicio[0]
+    hijos = instantanea.hijos
+    for i, persona_id in enumerate(instantanea.ids):
+        registro[persona_id] = Persona.desde_ids(
+            persona_id,
+            instantanea.nombres[i],
+            instantanea.parejas[i],
+            (instantanea.padres0[i], instantanea.padres1[i]),
+            hijos[inicio[i] - base : inicio[i + 1] - base],
+            registro,
+        )
+    recorrer_fusionado(
+        [registro[r] for r in instantanea.raices],
+        [p for p in parciales if isinstance(p, ArbolVisitorInterface)],
+    )
+    # Las personas devueltas en los parciales no arrastran todo el registro al serializarse
+    registro.clear()
+    return parciales
+
+
+def _armar_lotes(
+    instantanea: Instantanea, cortes: list[tuple[int, int]], procesos: int
+) -> list[Instantanea]:
+    """Reparte componentes consecutivas en lotes de tamaño parecido (varios por proceso)."""
+    objetivo = max(PERSONAS_MINIMAS_POR_LOTE, len(instantanea.ids) // (procesos * 4) + 1)
+    lotes: list[Instantanea] = []
+    desde = raices_desde = 0
+    for hasta, raices_hasta in cortes:
+        if hasta - desde >= objetivo:
+            lotes.append(instantanea.cortar(desde, hasta, raices_desde, raices_hasta))
+            desde, raices_desde = hasta, raices_hasta
+    if desde < len(instantanea.ids):
+        lotes.append(
+            instantanea.cortar(desde, len(instantanea.ids), raices_desde, len(instantanea.raices))
+        )
+    return lotes
+
+
+def recorrer_en_paralelo(
+    raices: Sequence[Persona],
+    personas: Mapping[int, Persona],
+    visitors: Sequence[ArbolVisitorInterface],
+    procesos: Optional[int] = None,
+) -> None:
+    """
+    Ejecuta los visitors repartiendo los linajes independientes entre procesos.
+
+    Solo los visitors que son VisitorCombinable y VisitorRecorrido, y que
+    todavía no visitaron a nadie, se ejecutan en paralelo; el resto se
+    recorre en este proceso con recorrer_fusionado(). Los resultados quedan
+    agrupados por componente (en el orden de su primera raíz) en lugar de
+    raíz por raíz. Si hay un solo lote o un solo proceso, todo se recorre
+    aquí sin instantáneas.
+
+    Args:
+        raices: Raíces del árbol, en orden.
+        personas: Personas del repositorio por ID.
+        visitors: Visitors a ejecutar.
+        procesos: Cantidad de procesos (por defecto, os.cpu_count()).
+    """
+    procesos = procesos or os.cpu_count() or 1
+    combinables: list[VisitorCombinable] = []
+    secuenciales: list[ArbolVisitorInterface] = []
+    for visitor in visitors:
+        if (
+            isinstance(visitor, VisitorCombinable)
+            and isinstance(visitor, VisitorRecorrido)
+            and not visitor.visitados
+        ):
+            combinables.append(visitor)
+        else:
+            secuenciales.append(visitor)
+
+    instantanea = Instantanea.vacia()
+    cortes: list[tuple[int, int]] = []
+    lotes: list[Instantanea] = []
+    if combinables and procesos > 1:
+        instantanea, cortes = tomar_instantanea(raices, personas)
+        lotes = _armar_lotes(instantanea, cortes, procesos)
+    if len(lotes) <= 1:
+        logger.debug("Recorrido paralelo sin beneficio: se recorre en este proceso")
+        recorrer_fusionado(raices, visitors)
+        return
+
+    logger.debug(
+        "Recorriendo %s componente(s) en %s lote(s) con %s proceso(s)",
+        len(cortes),
+        len(lotes),
+        procesos,
+    )
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [
+            pool.submit(_recorrer_instantanea, lote, [v.nuevo_parcial() for v in combinables])
+            for lote in lotes
+        ]
+        for futuro in futuros:
+            for visitor, parcial in zip(combinables, futuro.result()):
+                visitor.combinar(parcial, personas)
+
+    visitados = MapaVisitados()
+    visitados.reservar(max(instantanea.ids))
+    for persona_id in instantanea.ids:
+        visitados.marcas[persona_id] = 1
+    for visitor in combinables:
+        # Solo se eligieron como combinables los que también son VisitorRecorrido
+        cast(VisitorRecorrido, visitor).visitados = visitados.copia()
+
+    if secuenciales:
+        recorrer_fusionado(raices, secuenciales)
@@ -1,14 +1,27 @@
-from typing import TYPE_CHECKING
-
+import gc
+import logging
+import threading
+from array import array
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Optional
+
+from .concurrencia import LockLecturaEscritura, con_escritura, con_lectura, proteger_metodos
 from .exceptions import (
     ArbolGenealogicoError,
     IDInvalidoError,
+    LoteRelacionesError,
     PersonaNoEncontradaError,
     RelacionInvalidaError,
 )
-from .models import Persona
+from .indices import IndicesBusqueda, normalizar_nombre
+from .models import SIN_ID, Persona
+from .orden_topologico import OrdenTopologico
+from .recorrido_paralelo import recorrer_en_paralelo
+from .snapshot import BANDERA_ORDEN, DatosSnapshot, Ruta, escribir_snapshot, leer_snapshot
 from .utils.logger import get_logger
-from .validators import FamilyValidator
+from .validators import CacheAncestros, FamilyValidator
+from .visitors import recorrer_fusionado
 
 if TYPE_CHECKING:
     from .visitors import ArbolVisitorInterface
@@ -20,11 +33,71 @@ logger = get_logger(__name__)
 class ArbolGenealogico:  # funcionará como repositorio de personas
     """Clase que representa el árbol genealógico"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        usar_cache_ancestros: bool = False,
+        usar_orden_topologico: bool = True,
+        seguro_para_hilos: bool = False,
+    ):
+        """
+        Args:
+            usar_cache_ancestros: Si es True, la búsqueda de ancestros reutiliza un
+                CacheAncestros entre llamadas (más memoria, consultas repetidas
+                más rápidas en pedigríes con mucho colapso).
+            usar_orden_topologico: Si es True (por defecto), los ciclos se detectan
+                con un OrdenTopologico incremental: las relaciones que respetan el
+                orden se aceptan en O(1) sin recorrer ancestros.
+            seguro_para_hilos: Si es True, el árbol se puede usar desde varios
+                hilos: las consultas toman un LockLecturaEscritura compartido
+                y avanzan en paralelo; cada modificación lo toma exclusivo y
+                se ve completa o no se ve (ver lectura()).
+        """
         self.personas: dict[int, Persona] = {}
+        self._cache_ancestros: CacheAncestros | None = (
+            CacheAncestros() if usar_cache_ancestros else None
+        )
+        # Orden topológico padre -> hijo para detectar ciclos sin recorrer ancestros
+        self._orden: OrdenTopologico | None = (
+            OrdenTopologico(
+                sucesores=lambda persona_id: self.personas[persona_id].hijos_ids,
+                predecesores=lambda persona_id: self.personas[persona_id].padres_ids,
+            )
+            if usar_orden_topologico
+            else None
+        )
         self._proximo_id: int = 1
+        # Índice nombre normalizado -> IDs, mantenido por registrar/eliminar
+        # (None tras load_snapshot(): se reconstruye en la primera búsqueda)
+        self._indice_nombres: Optional[dict[str, set[int]]] = {}
+        # Índices de búsqueda aproximada (prefijos, etc.), mantenidos igual
+        self._indices: Optional[IndicesBusqueda] = IndicesBusqueda()
+        # Raíces (personas sin padres) como conjunto ordenado por inserción
+        self._raices: dict[int, Persona] = {}
+        self._raices_quitadas: int = 0
+        self._lock_rw: Optional[LockLecturaEscritura] = (
+            LockLecturaEscritura() if seguro_para_hilos else None
+        )
+        # Los índices se completan al consultarlos: entre lectores, de a uno
+        self._materializacion = threading.Lock()
+        if self._lock_rw is not None:
+            proteger_metodos(self, self._lock_rw)
         logger.debug("Árbol genealógico inicializado (vacío)")
 
+    def lectura(self) -> AbstractContextManager[None]:
+        """
+        Bloque en el que el árbol no cambia (sin efecto si no es seguro_para_hilos).
+
+        Cada consulta ya toma el lock por su cuenta; este bloque sirve para
+        hacer varias consultas coherentes entre sí o para leer ``personas``
+        y los atributos de las personas sin que un escritor las modifique.
+
+        Example:
+            >>> with arbol.lectura():
+            ...     total = sum(len(p.hijos) for p in arbol.personas.values())
+        """
+        return self._lock_rw.lectura() if self._lock_rw is not None else nullcontext()
+
+    @con_escritura
     def registrar_persona(self, nombre: str):
         """
         Registra una nueva persona en el arbol.
@@ -43,31 +116,293 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             Persona: El objeto persona recién registrado.
         """
         nuevo_id = self._proximo_id
-        logger.debug(f"Intentando registrar persona: {nombre} (ID asignado: {nuevo_id})")
+        logger.debug("Intentando registrar persona: %s (ID asignado: %s)", nombre, nuevo_id)
 
         try:
             validador = FamilyValidator(self.personas)
             validador.validar_id(nuevo_id)
-            nueva_persona = Persona(nuevo_id, nombre)
+            nueva_persona = Persona(nuevo_id, nombre, registro=self.personas)
             self.personas[nuevo_id] = nueva_persona
+            self._indexar_nombre(nueva_persona)
+            self._raices[nuevo_id] = nueva_persona
+            if self._orden is not None:
+                self._orden.agregar_nodo(nuevo_id)
             self._proximo_id += 1
 
-            logger.info(f"Persona registrada exitosamente: {nueva_persona.nombre} (ID: {nuevo_id})")
-            logger.debug(f"Total de personas en árbol: {len(self.personas)}")
+            logger.info(
+                "Persona registrada exitosamente: %s (ID: %s)", nueva_persona.nombre, nuevo_id
+            )
+            logger.debug("Total de personas en árbol: %s", len(self.personas))
 
             return nueva_persona
         except (IDInvalidoError, ArbolGenealogicoError) as e:
             # Las excepciones personalizadas ya tienen mensajes descriptivos,
             # las propagamos directamente sin envolverlas
-            logger.warning(f"Error al registrar persona '{nombre}': {e}")
+            logger.warning("Error al registrar persona '%s': %s", nombre, e)
             raise
 
+    @con_escritura
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list["Persona"]:
+        """
+        Registra muchas personas de una vez, con IDs consecutivos.
+
+        Equivale a llamar registrar_persona() por cada nombre, pero valida el
+        rango de IDs una sola vez y escribe un único mensaje de log.
+
+        Args:
+            nombres: Nombres a registrar, en orden.
+
+        Raises:
+            IDInvalidoError: Si algún ID del rango a asignar ya existe.
+
+        Returns:
+            list[Persona]: Las personas registradas, en el mismo orden.
+        """
+        nombres = list(nombres)
+        if not nombres:
+            return []
+        personas = self.personas
+        primer_id = self._proximo_id
+        ids_nuevos = range(primer_id, primer_id + len(nombres))
+        ocupado = next((i for i in ids_nuevos if i in personas), None)
+        FamilyValidator(personas).validar_id(primer_id if ocupado is None else ocupado)
+
+        raices = self._raices
+        orden = self._orden
+        nuevas: list[Persona] = []
+        for nuevo_id, nombre in zip(ids_nuevos, nombres):
+            nueva_persona = Persona(nuevo_id, nombre, registro=personas)
+            personas[nuevo_id] = nueva_persona
+            self._indexar_nombre(nueva_persona)
+            raices[nuevo_id] = nueva_persona
+            if orden is not None:
+                orden.agregar_nodo(nuevo_id)
+            nuevas.append(nueva_persona)
+        self._proximo_id = ids_nuevos.stop
+
+        logger.info(
+            "%s persona(s) registrada(s) en lote (IDs %s-%s)",
+            len(nuevas),
+            primer_id,
+            ids_nuevos[-1],
+        )
+        return nuevas
+
+    @staticmethod
+    def normalizar_nombre(nombre: str) -> str:
+        """Normaliza un nombre para búsquedas (mismo criterio que SearchArbolVisitor)."""
+        return normalizar_nombre(nombre)
+
+    def _indexar_nombre(self, persona: "Persona") -> None:
+        """Agrega la persona al índice de nombres y a los índices de búsqueda."""
+        if self._indice_nombres is not None:
+            clave = self.normalizar_nombre(persona.nombre)
+            self._indice_nombres.setdefault(clave, set()).add(persona.id)
+        if self._indices is not None:
+            self._indices.agregar(persona.id, persona.nombre)
+
+    def _desindexar_nombre(self, persona: "Persona") -> None:
+        """Quita la persona de los índices, descartando claves vacías."""
+        if self._indices is not None:
+            self._indices.quitar(persona.id, persona.nombre)
+        if self._indice_nombres is None:
+            return
+        clave = self.normalizar_nombre(persona.nombre)
+        ids = self._indice_nombres.get(clave)
+        if ids is None:
+            return
+        ids.discard(persona.id)
+        if not ids:
+            del self._indice_nombres[clave]
+
+    def _indice_exacto(self) -> dict[str, set[int]]:
+        """Devuelve el índice de nombres, construyéndolo si se descartó al cargar."""
+        if self._indice_nombres is None:
+            with self._materializacion:
+                if self._indice_nombres is None:
+                    indice: dict[str, set[int]] = {}
+                    for persona in self.personas.values():
+                        clave = self.normalizar_nombre(persona.nombre)
+                        indice.setdefault(clave, set()).add(persona.id)
+                    self._indice_nombres = indice
+        return self._indice_nombres
+
+    def _indices_busqueda(self) -> IndicesBusqueda:
+        """Devuelve los índices de búsqueda, construyéndolos si se descartaron al cargar."""
+        if self._lock_rw is None:
+            if self._indices is None:
+                self._indices = IndicesBusqueda.construir(
+                    (persona.id, persona.nombre) for persona in self.personas.values()
+                )
+            return self._indices
+        # Con varios lectores a la vez, construir los índices e incorporar
+        # las altas pendientes (que hacen las búsquedas) se hace de a uno:
+        # después, las búsquedas solo leen
+        with self._materializacion:
+            if self._indices is None:
+                self._indices = IndicesBusqueda.construir(
+                    (persona.id, persona.nombre) for persona in self.personas.values()
+                )
+            self._indices.incorporar_pendientes()
+            return self._indices
+
+    @con_lectura
+    def buscar_por_nombre(self, nombre: str) -> list["Persona"]:
+        """
+        Busca personas por nombre exacto (sin distinguir mayúsculas ni espacios extremos).
+
+        Usa el índice de nombres, por lo que el costo es O(1) más la cantidad
+        de resultados, sin recorrer el árbol.
+
+        Args:
+            nombre: Nombre a buscar.
+
+        Returns:
+            list[Persona]: Personas con ese nombre, ordenadas por ID.
+        """
+        ids = self._indice_exacto().get(self.normalizar_nombre(nombre))
+        if not ids:
+            return []
+        return [self.personas[persona_id] for persona_id in sorted(ids)]
+
+    @con_lectura
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre empieza con ``prefijo`` (para autocompletar).
+
+        Usa el índice de prefijos: búsqueda binaria más la lectura de los
+        resultados, sin recorrer el árbol.
+
+        Args:
+            prefijo: Comienzo del nombre (se ignoran mayúsculas y espacios extremos).
+            limite: Cantidad máxima de resultados.
+
+        Returns:
+            list[Persona]: Hasta ``limite`` personas, en orden alfabético.
+        """
+        ids = self._indices_busqueda().prefijos.buscar(prefijo, limite)
+        return [self.personas[i] for i in ids]
+
+    @con_lectura
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre difiere en a lo sumo ``distancia_maxima`` ediciones.
+
+        Tolera errores de tipeo ("Deamon" encuentra a "Daemon") usando el
+        BK-tree de nombres, que descarta ramas enteras sin compararlas.
+
+        Args:
+            nombre: Nombre buscado (se ignoran mayúsculas y espacios extremos).
+            distancia_maxima: Cantidad máxima de caracteres insertados,
+                borrados o reemplazados.
+
+        Returns:
+            list[Persona]: Las personas encontradas, de la más parecida a la menos.
+        """
+        ids = self._indices_busqueda().difuso.buscar(nombre, distancia_maxima)
+        return [self.personas[i] for i in ids]
+
+    @con_lectura
+    def buscar_por_subcadena(self, texto: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre contiene ``texto`` en cualquier posición.
+
+        Usa el índice de trigramas: solo se verifican los nombres que
+        contienen todos los trigramas del texto.
+
+        Args:
+            texto: Fragmento buscado (se ignoran mayúsculas y espacios extremos).
+
+        Returns:
+            list[Persona]: Personas encontradas, ordenadas por ID.
+        """
+        ids = self._indices_busqueda().trigramas.buscar_subcadena(texto)
+        return [self.personas[i] for i in ids]
+
+    @con_lectura
+    def buscar_por_regex(self, patron: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre coincide con una expresión regular.
+
+        El patrón se busca en cualquier posición y sin distinguir mayúsculas.
+        Sus tramos literales se usan como filtro de trigramas antes de
+        evaluar la regex sobre los candidatos.
+
+        Args:
+            patron: Expresión regular (ej.: ``Aegon.*II``).
+
+        Returns:
+            list[Persona]: Personas encontradas, ordenadas por ID.
+
+        Raises:
+            ConsultaInvalidaError: Si el patrón no es una expresión regular válida.
+        """
+        ids = self._indices_busqueda().trigramas.buscar_regex(patron)
+        return [self.personas[i] for i in ids]
+
+    @con_lectura
+    def buscar_por_palabras(self, consulta: str) -> list["Persona"]:
+        """
+        Busca personas por palabras de su nombre, sin distinguir acentos.
+
+        Las palabras separadas por espacios deben estar todas (AND); la
+        palabra ``OR`` separa alternativas. "jaehaerys" encuentra a
+        "Jaehaerys I el Conciliador" y "conciliádor" también.
+
+        Args:
+            consulta: Palabras buscadas (ej.: ``"aegon II OR aemond"``).
+
+        Returns:
+            list[Persona]: Personas encontradas, ordenadas por ID.
+        """
+        ids = self._indices_busqueda().tokens.buscar(consulta)
+        return [self.personas[i] for i in ids]
+
+    @con_lectura
+    def buscar_fonetico(self, nombre: str) -> list["Persona"]:
+        """
+        Busca personas cuyo nombre suena como ``nombre`` ("Vissenia" -> "Visenya").
+
+        Los códigos fonéticos de cada persona se calculan al registrarla; la
+        consulta solo calcula los suyos y lee los conjuntos del índice.
+
+        Args:
+            nombre: Nombre tal como se pronuncia; con varias palabras, deben sonar todas.
+
+        Returns:
+            list[Persona]: Personas encontradas, ordenadas por ID.
+        """
+        ids = self._indices_busqueda().fonetico.buscar(nombre)
+        return [self.personas[i] for i in ids]
+
+    def _quitar_raiz(self, persona_id: int) -> None:
+        """
+        Quita una persona del conjunto de raíces.
+
+        Los dict no liberan espacio al borrar claves y su iteración recorre la
+        tabla completa, así que se compacta cuando las bajas superan a las
+        raíces vigentes (costo amortizado O(1)).
+        """
+        if self._raices.pop(persona_id, None) is None:
+            return
+        self._raices_quitadas += 1
+        if self._raices_quitadas > 2 * len(self._raices) + 32:
+            self._raices = dict(self._raices.items())
+            self._raices_quitadas = 0
+
+    @con_lectura
     def init_get_root(self) -> list["Persona"]:
-        """Buscamos en nuestro diccionario de personas aquellas que no tienen padres asignados."""
-        raices = [p for p in self.personas.values() if p.padres[0] is None and p.padres[1] is None]
-        logger.debug(f"Buscando raíces del árbol: {len(raices)} raíz(ces) encontrada(s)")
+        """
+        Devuelve las personas que no tienen padres asignados.
+
+        El conjunto de raíces se mantiene al registrar, relacionar y eliminar
+        personas, por lo que el costo es O(#raíces) y no recorre todo el árbol.
+        """
+        raices = list(self._raices.values())
+        logger.debug("Buscando raíces del árbol: %s raíz(ces) encontrada(s)", len(raices))
         return raices
 
+    @con_lectura
     def get_persona(self, persona_id: int) -> "Persona":
         """
         Devuelve la persona con el ID especificado.
@@ -81,29 +416,63 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
         Raises:
             PersonaNoEncontradaError: Si la persona no existe en el árbol.
         """
-        logger.debug(f"Buscando persona con ID: {persona_id}")
+        logger.debug("Buscando persona con ID: %s", persona_id)
 
         if persona_id not in self.personas:
             logger.warning(
-                f"Persona con ID {persona_id} no encontrada (total personas: {len(self.personas)})"
+                "Persona con ID %s no encontrada (total personas: %s)",
+                persona_id,
+                len(self.personas),
             )
             raise PersonaNoEncontradaError(persona_id=persona_id)
 
         persona = self.personas[persona_id]
-        logger.debug(f"Persona encontrada: {persona.nombre} (ID: {persona_id})")
+        logger.debug("Persona encontrada: %s (ID: %s)", persona.nombre, persona_id)
         return persona
 
-    def recorrer_arbol_completo(self, visitor: "ArbolVisitorInterface") -> None:
-        """Refinamiento: El árbol sabe cómo ser recorrido íntegramente"""
-        logger.debug(f"Recorriendo árbol completo con visitor: {type(visitor).__name__}")
-        raices = self.init_get_root()
+    @con_lectura
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """
+        Refinamiento: El árbol sabe cómo ser recorrido íntegramente.
 
-        for raiz in raices:
-            logger.debug(f"Procesando raíz: {raiz.nombre}")
-            raiz.accept_visitor(visitor)
+        Con varios visitors, los que usan el motor de recorrido comparten una
+        sola pasada por el árbol (ver recorrer_fusionado).
 
+        Con ``procesos`` distinto de 1 (0 = un proceso por CPU), los linajes
+        independientes se recorren en paralelo y los resultados se agrupan
+        por componente (ver recorrer_en_paralelo).
+        """
+        visitors = (visitor, *otros_visitors)
+        logger.debug(
+            "Recorriendo árbol completo con visitor(s): %s",
+            ", ".join(type(v).__name__ for v in visitors),
+        )
+        if procesos == 1:
+            recorrer_fusionado(self.init_get_root(), visitors)
+        else:
+            recorrer_en_paralelo(self.init_get_root(), self.personas, visitors, procesos or None)
         logger.debug("Recorrido del árbol completado")
 
+    def _verificar_vigentes(self, *personas: "Persona") -> None:
+        """
+        Rechaza personas que no son las del árbol.
+
+        Una persona creada fuera del árbol no pasa por los índices ni por la
+        numeración de IDs, y una que otro hilo eliminó entre obtenerla y
+        pasarla a una modificación ya no está en ``personas``: relacionarlas
+        dejaría vínculos con alguien que el árbol no conoce.
+        """
+        for persona in personas:
+            if self.personas.get(persona.id) is not persona:
+                logger.warning("Persona con ID %s no está en el árbol", persona.id)
+                raise PersonaNoEncontradaError(persona_id=persona.id)
+
+    @con_escritura
     def add_hijo(self, padre: "Persona", hijo: "Persona") -> None:
         """Añade un hijo a una persona.
 
@@ -116,6 +485,8 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             CicloTemporalError: Si se detecta un ciclo temporal
             LimitePadresExcedidoError: Si el hijo ya tiene 2 padres
             RelacionIncestuosaError: Si existe relación de pareja entre padre e hijo
+            PersonaNoEncontradaError: Si alguna de las personas no está en el
+                árbol (creada fuera de él, o eliminada por otro hilo)
 
         Example:
             >>> arbol = ArbolGenealogico()
@@ -123,13 +494,22 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             >>> hijo = arbol.registrar_persona("Gaemon")
             >>> arbol.add_hijo(padre, hijo)
         """
+        self._verificar_vigentes(padre, hijo)
         logger.debug(
-            f"Intentando agregar relación padre-hijo: {padre.nombre} (ID: {padre.id}) -> {hijo.nombre} (ID: {hijo.id})"  # noqa: E501
+            "Intentando agregar relación padre-hijo: %s (ID: %s) -> %s (ID: %s)",
+            padre.nombre,
+            padre.id,
+            hijo.nombre,
+            hijo.id,
         )
 
         try:
-            validator = FamilyValidator(self.personas)
+            validator = FamilyValidator(
+                self.personas, self._cache_ancestros, detector_ciclos=self._orden
+            )
             validator.validar(padre, hijo, "hijo")
+            if self._orden is not None:
+                self._orden.agregar_arista(padre.id, hijo.id)
 
             padre.hijos.append(hijo)
 
@@ -137,20 +517,75 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
                 hijo.padres = (padre, hijo.padres[1])
             elif hijo.padres[1] is None:
                 hijo.padres = (hijo.padres[0], padre)
+            self._quitar_raiz(hijo.id)
+            if self._cache_ancestros is not None:
+                self._cache_ancestros.invalidar_descendientes(hijo)
 
-            logger.info(f"Relación padre-hijo creada exitosamente: {padre.nombre} -> {hijo.nombre}")
-            logger.debug(
-                f"Hijo ahora tiene {len([p for p in hijo.padres if p is not None])} padre(s)"
+            logger.info(
+                "Relación padre-hijo creada exitosamente: %s -> %s", padre.nombre, hijo.nombre
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Hijo ahora tiene %s padre(s)", sum(p != SIN_ID for p in hijo.padres_ids)
+                )
 
         except RelacionInvalidaError as e:
             # Las excepciones de validación ya tienen mensajes descriptivos,
             # las propagamos directamente para mantener el contexto
             logger.warning(
-                f"Error al añadir relación padre-hijo ({padre.nombre} -> {hijo.nombre}): {e}"
+                "Error al añadir relación padre-hijo (%s -> %s): %s", padre.nombre, hijo.nombre, e
             )
             raise
 
+    @con_escritura
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """
+        Añade muchas relaciones padre-hijo (padre_id, hijo_id) de forma atómica.
+
+        Valida el lote completo de una vez con FamilyValidator.validar_lote
+        (mismas reglas que add_hijo, con una sola búsqueda de ciclos para todo
+        el lote) y solo después lo aplica. Si alguna relación es inválida, el
+        árbol no se modifica.
+
+        Args:
+            pares: Relaciones a agregar como (padre_id, hijo_id), en orden.
+
+        Raises:
+            LoteRelacionesError: Si alguna relación es inválida; 'resultados' tiene
+                un registro compacto por cada una y 'errores' sus excepciones.
+        """
+        pares = list(pares)
+        orden = self._orden
+        validador = FamilyValidator(self.personas, self._cache_ancestros, detector_ciclos=orden)
+        errores = validador.validar_lote(pares, "hijo")
+        if errores:
+            logger.warning(
+                "Lote de %s relación(es) rechazado: %s error(es)", len(pares), len(errores)
+            )
+            raise LoteRelacionesError(errores, self.personas)
+
+        # Se decide antes de aplicar: después el orden ya no refleja el árbol
+        reordenar = orden is not None and not all(orden.respeta_orden(*par) for par in pares)
+
+        personas = self.personas
+        for padre_id, hijo_id in pares:
+            padre = personas[padre_id]
+            hijo = personas[hijo_id]
+            padre.hijos.append(hijo)
+            padre0_id, padre1_id = hijo.padres_ids
+            if padre0_id == SIN_ID:
+                hijo.padres = (padre, hijo.resolver(padre1_id))
+            else:
+                hijo.padres = (hijo.resolver(padre0_id), padre)
+            self._quitar_raiz(hijo_id)
+
+        if self._cache_ancestros is not None:
+            self._cache_ancestros.invalidar()
+        if orden is not None and reordenar:
+            orden.reconstruir(personas.keys())
+        logger.info("%s relación(es) padre-hijo creada(s) en lote", len(pares))
+
+    @con_escritura
     def add_pareja(self, persona1: "Persona", persona2: "Persona") -> None:
         """
         Añade una pareja a dos personas.
@@ -162,9 +597,16 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
         Raises:
             RelacionInvalidaError: Si la relación es inválida
             RelacionIncestuosaError: Si son padre-hijo y no pueden ser pareja
+            PersonaNoEncontradaError: Si alguna de las personas no está en el
+                árbol (creada fuera de él, o eliminada por otro hilo)
         """
+        self._verificar_vigentes(persona1, persona2)
         logger.debug(
-            f"Intentando agregar relación de pareja: {persona1.nombre} (ID: {persona1.id}) <-> {persona2.nombre} (ID: {persona2.id})"  # noqa: E501
+            "Intentando agregar relación de pareja: %s (ID: %s) <-> %s (ID: %s)",
+            persona1.nombre,
+            persona1.id,
+            persona2.nombre,
+            persona2.id,
         )
 
         try:
@@ -175,16 +617,22 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             persona2.pareja = persona1
 
             logger.info(
-                f"Relación de pareja creada exitosamente: {persona1.nombre} <-> {persona2.nombre}"
+                "Relación de pareja creada exitosamente: %s <-> %s",
+                persona1.nombre,
+                persona2.nombre,
             )
 
         except RelacionInvalidaError as e:
             # Propagar la excepción específica manteniendo el contexto
             logger.warning(
-                f"Error al añadir relación de pareja ({persona1.nombre} <-> {persona2.nombre}): {e}"
+                "Error al añadir relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
             )
             raise
 
+    @con_escritura
     def remove_pareja(self, persona1: "Persona", persona2: "Persona") -> None:
         """
         Remueve una pareja de dos personas.
@@ -195,9 +643,16 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
 
         Raises:
             ParejaNoExisteError: Si las personas no son pareja entre sí
+            PersonaNoEncontradaError: Si alguna de las personas no está en el
+                árbol (creada fuera de él, o eliminada por otro hilo)
         """
+        self._verificar_vigentes(persona1, persona2)
         logger.debug(
-            f"Intentando remover relación de pareja: {persona1.nombre} (ID: {persona1.id}) <-> {persona2.nombre} (ID: {persona2.id})"  # noqa: E501
+            "Intentando remover relación de pareja: %s (ID: %s) <-> %s (ID: %s)",
+            persona1.nombre,
+            persona1.id,
+            persona2.nombre,
+            persona2.id,
         )
 
         try:
@@ -208,16 +663,22 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             persona2.pareja = None
 
             logger.info(
-                f"Relación de pareja removida exitosamente: {persona1.nombre} <-> {persona2.nombre}"
+                "Relación de pareja removida exitosamente: %s <-> %s",
+                persona1.nombre,
+                persona2.nombre,
             )
 
         except RelacionInvalidaError as e:
             # Propagar la excepción específica (ParejaNoExisteError)
             logger.warning(
-                f"Error al remover relación de pareja ({persona1.nombre} <-> {persona2.nombre}): {e}"  # noqa: E501
+                "Error al remover relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
             )
             raise
 
+    @con_escritura
     def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
         """
         Elimina una persona del árbol.
@@ -232,28 +693,34 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
                                              confirmar_rotura es False
         """
         logger.debug(
-            f"Intentando eliminar persona con ID: {persona_id} (confirmar_rotura: {confirmar_rotura})"  # noqa: E501
+            "Intentando eliminar persona con ID: %s (confirmar_rotura: %s)",
+            persona_id,
+            confirmar_rotura,
         )
 
         if persona_id not in self.personas:
-            logger.warning(f"Intento de eliminar persona inexistente (ID: {persona_id})")
+            logger.warning("Intento de eliminar persona inexistente (ID: %s)", persona_id)
             raise PersonaNoEncontradaError(persona_id=persona_id)
 
         persona = self.personas[persona_id]
-        logger.debug(
-            f"Persona a eliminar: {persona.nombre} (tiene {len(persona.hijos)} hijo(s), pareja: {persona.pareja is not None})"  # noqa: E501
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Persona a eliminar: %s (tiene %s hijo(s), pareja: %s)",
+                persona.nombre,
+                len(persona.hijos),
+                persona.pareja is not None,
+            )
 
         # chequear impacto eliminacion
         if persona.hijos and not confirmar_rotura:
-            logger.debug(f"Persona {persona.nombre} tiene descendientes, validando impacto")
+            logger.debug("Persona %s tiene descendientes, validando impacto", persona.nombre)
             validador = FamilyValidator(self.personas)
             # Esta validación lanzará EliminacionConDescendientesError si tiene hijos
             validador.validar_impacto_eliminacion(persona)
 
         # 1 desvincular la pareja
         if persona.pareja:
-            logger.debug(f"Desvinculando pareja: {persona.nombre} <-> {persona.pareja.nombre}")
+            logger.debug("Desvinculando pareja: %s <-> %s", persona.nombre, persona.pareja.nombre)
             persona.pareja.pareja = None
             persona.pareja = None
 
@@ -264,7 +731,7 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
                 p.hijos.remove(persona)
                 padres_desvinculados += 1
         if padres_desvinculados > 0:
-            logger.debug(f"Desvinculados {padres_desvinculados} padre(s) de {persona.nombre}")
+            logger.debug("Desvinculados %s padre(s) de %s", padres_desvinculados, persona.nombre)
 
         # 3 desvincular los hijos
         hijos_desvinculados = len(persona.hijos)
@@ -275,10 +742,141 @@ class ArbolGenealogico:  # funcionará como repositorio de personas
             if p_lista[1] and p_lista[1].id == persona.id:
                 p_lista[1] = None
             h.padres = (p_lista[0], p_lista[1])
+            if h.padres[0] is None and h.padres[1] is None:
+                self._raices[h.id] = h
         if hijos_desvinculados > 0:
-            logger.debug(f"Desvinculados {hijos_desvinculados} hijo(s) de {persona.nombre}")
+            logger.debug("Desvinculados %s hijo(s) de %s", hijos_desvinculados, persona.nombre)
+
+        if self._cache_ancestros is not None:
+            self._cache_ancestros.invalidar()
 
         # 4 eliminar la persona
         del self.personas[persona_id]
-        logger.info(f"Persona eliminada exitosamente: {persona.nombre} (ID: {persona_id})")
-        logger.debug(f"Total de personas restantes en árbol: {len(self.personas)}")
+        self._quitar_raiz(persona_id)
+        if self._orden is not None:
+            self._orden.quitar_nodo(persona_id)
+        self._desindexar_nombre(persona)
+        logger.info("Persona eliminada exitosamente: %s (ID: %s)", persona.nombre, persona_id)
+        logger.debug("Total de personas restantes en árbol: %s", len(self.personas))
+
+    # ==================== SNAPSHOTS ====================
+
+    def save_snapshot(self, ruta: Ruta) -> None:
+        """
+        Guarda el árbol completo en un snapshot binario (ver src/snapshot.py).
+
+        Conserva IDs, nombres, relaciones, el orden de las raíces y el orden
+        topológico, así que load_snapshot() reconstruye exactamente este árbol.
+
+        Args:
+            ruta: Archivo de destino (se reemplaza de forma atómica).
+        """
+        datos = self.datos_snapshot()
+        escribir_snapshot(ruta, datos)
+        logger.info("Snapshot guardado en %s: %s persona(s)", ruta, len(datos.ids))
+
+    @con_lectura
+    def datos_snapshot(self) -> DatosSnapshot:
+        """
+        Copia el estado actual del árbol a las columnas de un snapshot.
+
+        La copia no comparte nada con el árbol, así que puede codificarse y
+        escribirse (por ejemplo, en otro hilo) mientras el árbol sigue cambiando.
+        """
+        personas = self.personas
+        ids = array("q", personas)
+        parejas, padres0, padres1 = array("q"), array("q"), array("q")
+        hijos, hijos_inicio = array("q"), array("q", [0])
+        nombres, nombres_inicio = bytearray(), array("q", [0])
+        for persona in personas.values():
+            padre0, padre1 = persona.padres_ids
+            parejas.append(persona.pareja_id)
+            padres0.append(padre0)
+            padres1.append(padre1)
+            hijos.extend(persona.hijos_ids)
+            hijos_inicio.append(len(hijos))
+            nombres += persona.nombre.encode("utf-8")
+            nombres_inicio.append(len(nombres))
+        orden = self._orden
+        rangos = (
+            array("q", map(orden.rango, ids))
+            if orden is not None
+            else array("q", bytes(8 * len(ids)))
+        )
+        return DatosSnapshot(
+            ids,
+            parejas,
+            padres0,
+            padres1,
+            rangos,
+            hijos_inicio,
+            hijos,
+            array("q", self._raices),
+            nombres_inicio,
+            bytes(nombres),
+            banderas=BANDERA_ORDEN if orden is not None else 0,
+            proximo_id=self._proximo_id,
+            siguiente_rango=orden.siguiente_rango if orden is not None else 0,
+        )
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        ruta: Ruta,
+        usar_cache_ancestros: bool = False,
+        usar_orden_topologico: bool = True,
+        seguro_para_hilos: bool = False,
+    ) -> "ArbolGenealogico":
+        """
+        Crea un árbol a partir de un snapshot guardado con save_snapshot().
+
+        Las personas se reconstruyen directamente desde los arrays, sin
+        validar relación por relación ni escribir logs por persona: el
+        snapshot ya fue validado al armar el árbol original y su CRC32
+        garantiza que no cambió. Los índices de búsqueda se construyen en la
+        primera consulta que los necesite.
+
+        Args:
+            ruta: Archivo del snapshot.
+            usar_cache_ancestros: Igual que en el constructor.
+            usar_orden_topologico: Igual que en el constructor.
+            seguro_para_hilos: Igual que en el constructor.
+
+        Raises:
+            SnapshotInvalidoError: Si el archivo no es un snapshot válido.
+
+        Returns:
+            ArbolGenealogico: El árbol reconstruido.
+        """
+        datos = leer_snapshot(ruta)
+        arbol = cls(usar_cache_ancestros, usar_orden_topologico, seguro_para_hilos)
+        personas = arbol.personas
+        # Crear millones de objetos dispararía el recolector de ciclos una y
+        # otra vez sobre las mismas personas: se pausa durante la carga
+        recolector_activo = gc.isenabled()
+        gc.disable()
+        try:
+            Persona.desde_columnas(
+                datos.ids,
+                datos.todos_los_nombres(),
+                datos.parejas,
+                datos.padres0,
+                datos.padres1,
+                datos.hijos_inicio,
+                datos.hijos,  # type: ignore[arg-type]
+                personas,
+            )
+        finally:
+            if recolector_activo:
+                gc.enable()
+        arbol._raices = {raiz_id: personas[raiz_id] for raiz_id in datos.raices}
+        arbol._proximo_id = datos.proximo_id
+        arbol._indice_nombres = None
+        arbol._indices = None
+        if arbol._orden is not None:
+            if datos.banderas & BANDERA_ORDEN:
+                arbol._orden.restaurar(dict(zip(datos.ids, datos.rangos)), datos.siguiente_rango)
+            else:
+                arbol._orden.reconstruir(personas)
+        logger.info("Snapshot cargado desde %s: %s persona(s)", ruta, len(personas))
+        return arbol
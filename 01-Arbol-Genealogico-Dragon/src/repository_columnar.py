@@ -0,0 +1,570 @@
+"""
+Repositorio columnar (struct-of-arrays) para árboles genealógicos muy grandes.
+
+En lugar de un objeto Python por persona, los datos viven en columnas
+paralelas indexadas por ID:
+
+- padre 0, padre 1 y pareja: array('i') de IDs (SIN_ID = sin relación)
+- nombres: un único bytearray UTF-8 más un array('q') de offsets
+- hijos: formato CSR (inicio por persona + array de IDs), con una capa de
+  modificaciones por persona que se pliega al CSR al compactar
+- índice de nombres: tabla hash con direccionamiento abierto sobre array('i'),
+  construida en la primera búsqueda y mantenida desde entonces
+
+Las personas se entregan como PersonaVista, vistas livianas que leen las
+columnas en cada acceso. Cumple el protocolo ArbolRepository, así que
+DinastiaUI y DataLoaderDemo funcionan sin cambios.
+
+Se usa el módulo estándar ``array`` y no NumPy porque el proyecto no tiene
+dependencias de runtime; el diseño de memoria es el mismo.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional
+
+from .exceptions import (
+    ArbolGenealogicoError,
+    IDInvalidoError,
+    LoteRelacionesError,
+    PersonaNoEncontradaError,
+    RelacionInvalidaError,
+)
+from .indices import IndicesBusqueda
+from .models import SIN_ID, Persona, PersonaVista
+from .recorrido_paralelo import recorrer_en_paralelo
+from .repository import ArbolGenealogico
+from .utils.logger import get_logger
+from .validators import FamilyValidator
+from .visitors import recorrer_fusionado
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+# Marcas de la tabla hash de nombres (los IDs válidos son positivos)
+_CELDA_VACIA = 0
+_CELDA_BORRADA = -1
+
+
+class _PersonasColumnar(Mapping[int, Persona]):
+    """Mapping de solo lectura ID -> PersonaVista sobre las columnas del árbol."""
+
+    __slots__ = ("_arbol",)
+
+    def __init__(self, arbol: "ArbolColumnar"):
+        self._arbol = arbol
+
+    def __getitem__(self, persona_id: int) -> Persona:
+        if not self._arbol.existe(persona_id):
+            raise KeyError(persona_id)
+        return PersonaVista(persona_id, self._arbol)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return isinstance(persona_id, int) and self._arbol.existe(persona_id)
+
+    def __iter__(self) -> Iterator[int]:
+        vivos = self._arbol.vivos
+        return (i for i in range(1, len(vivos)) if vivos[i])
+
+    def __len__(self) -> int:
+        return self._arbol.cantidad
+
+
+class ArbolColumnar:
+    """Árbol genealógico con almacenamiento columnar y vistas flyweight."""
+
+    # Cantidad mínima de personas con hijos modificados antes de compactar el CSR
+    MIN_MODIFICADOS_COMPACTAR = 1024
+
+    def __init__(self):
+        # La posición 0 está reservada para SIN_ID en todas las columnas
+        self._padre0: array[int] = array("i", [SIN_ID])
+        self._padre1: array[int] = array("i", [SIN_ID])
+        self._pareja: array[int] = array("i", [SIN_ID])
+        self.vivos = bytearray(1)
+        self._nombres = bytearray()
+        self._nombre_offsets: array[int] = array("q", [0, 0])
+        # CSR de hijos para los IDs < len(_hijos_inicio) - 1
+        self._hijos_inicio: array[int] = array("q", [0, 0])
+        self._hijos_csr: array[int] = array("i")
+        self._hijos_modificados: dict[int, array[int]] = {}
+        # Vacía hasta la primera búsqueda por nombre (luego, potencia de 2)
+        self._tabla_nombres: array[int] = array("i")
+        self._tabla_usadas: int = 0
+        # Índices de búsqueda aproximada: se construyen en la primera consulta
+        self._indices: Optional[IndicesBusqueda] = None
+        self._raices: dict[int, None] = {}
+        self._raices_quitadas: int = 0
+        self._personas = _PersonasColumnar(self)
+        self.cantidad: int = 0
+        logger.debug("Árbol columnar inicializado (vacío)")
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        return self._personas
+
+    @property
+    def _proximo_id(self) -> int:
+        return len(self.vivos)
+
+    def existe(self, persona_id: int) -> bool:
+        """Indica si el ID corresponde a una persona registrada y no eliminada."""
+        return 0 < persona_id < len(self.vivos) and self.vivos[persona_id] == 1
+
+    # ==================== FuentePersonas ====================
+
+    def nombre_de(self, persona_id: int) -> str:
+        inicio = self._nombre_offsets[persona_id]
+        fin = self._nombre_offsets[persona_id + 1]
+        return self._nombres[inicio:fin].decode("utf-8")
+
+    def pareja_de(self, persona_id: int) -> int:
+        return self._pareja[persona_id]
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        return (self._padre0[persona_id], self._padre1[persona_id])
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        modificados = self._hijos_modificados.get(persona_id)
+        if modificados is not None:
+            return modificados
+        if persona_id < len(self._hijos_inicio) - 1:
+            inicio = self._hijos_inicio[persona_id]
+            fin = self._hijos_inicio[persona_id + 1]
+            return self._hijos_csr[inicio:fin]
+        return ()
+
+    def vista(self, persona_id: int) -> Optional[Persona]:
+        if persona_id == SIN_ID:
+            return None
+        return PersonaVista(persona_id, self)
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        self._pareja[persona_id] = pareja_id
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        self._padre0[persona_id] = padre0_id
+        self._padre1[persona_id] = padre1_id
+        if padre0_id == SIN_ID and padre1_id == SIN_ID:
+            self._raices[persona_id] = None
+        else:
+            self._quitar_raiz(persona_id)
+
+    # ==================== ArbolRepository ====================
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """
+        Registra una nueva persona agregando una fila a cada columna.
+
+        Args:
+            nombre: El nombre a registrar.
+
+        Raises:
+            IDInvalidoError: Si el ID generado no es válido o ya existe.
+
+        Returns:
+            Persona: Vista de la persona recién registrada.
+        """
+        nuevo_id = self._proximo_id
+        logger.debug("Intentando registrar persona: %s (ID asignado: %s)", nombre, nuevo_id)
+
+        try:
+            FamilyValidator(self.personas).validar_id(nuevo_id)
+        except (IDInvalidoError, ArbolGenealogicoError) as e:
+            logger.warning("Error al registrar persona '%s': %s", nombre, e)
+            raise
+
+        self._nombres += nombre.encode("utf-8")
+        self._nombre_offsets.append(len(self._nombres))
+        self._padre0.append(SIN_ID)
+        self._padre1.append(SIN_ID)
+        self._pareja.append(SIN_ID)
+        self.vivos.append(1)
+        self.cantidad += 1
+        self._raices[nuevo_id] = None
+        if self._tabla_nombres:
+            self._insertar_nombre(nuevo_id, ArbolGenealogico.normalizar_nombre(nombre))
+        if self._indices is not None:
+            self._indices.agregar(nuevo_id, nombre)
+
+        logger.info("Persona registrada exitosamente: %s (ID: %s)", nombre, nuevo_id)
+        return PersonaVista(nuevo_id, self)
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """
+        Registra muchas personas de una vez extendiendo cada columna.
+
+        Los índices de nombres se descartan y se reconstruyen en la próxima búsqueda.
+
+        Returns:
+            list[Persona]: Vistas de las personas registradas, en orden.
+        """
+        codificados = [nombre.encode("utf-8") for nombre in nombres]
+        if not codificados:
+            return []
+        primer_id = self._proximo_id
+        FamilyValidator(self.personas).validar_id(primer_id)
+
+        offsets = self._nombre_offsets
+        fin = len(self._nombres)
+        for codificado in codificados:
+            fin += len(codificado)
+            offsets.append(fin)
+        self._nombres += b"".join(codificados)
+        cantidad = len(codificados)
+        vacias = array("i", bytes(4 * cantidad))
+        self._padre0.extend(vacias)
+        self._padre1.extend(vacias)
+        self._pareja.extend(vacias)
+        self.vivos.extend(b"\x01" * cantidad)
+        self.cantidad += cantidad
+        ids_nuevos = range(primer_id, primer_id + cantidad)
+        self._raices.update(dict.fromkeys(ids_nuevos))
+        self._tabla_nombres = array("i")
+        self._indices = None
+
+        logger.info(
+            "%s persona(s) registrada(s) en lote (IDs %s-%s)", cantidad, primer_id, ids_nuevos[-1]
+        )
+        return [PersonaVista(persona_id, self) for persona_id in ids_nuevos]
+
+    def get_persona(self, persona_id: int) -> Persona:
+        """
+        Devuelve una vista de la persona con el ID especificado.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe en el árbol.
+        """
+        if not self.existe(persona_id):
+            logger.warning("Persona con ID %s no encontrada", persona_id)
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return PersonaVista(persona_id, self)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        """
+        Busca personas por nombre exacto normalizado usando la tabla hash de nombres.
+
+        La tabla se construye en la primera búsqueda (O(n)) y luego se mantiene
+        al registrar y eliminar, por lo que las consultas siguientes son O(1).
+        """
+        clave = ArbolGenealogico.normalizar_nombre(nombre)
+        if not self._tabla_nombres:
+            self._construir_tabla_nombres()
+        ids = sorted(self._buscar_nombre(clave))
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        """Busca personas cuyo nombre empieza con ``prefijo``, en orden alfabético."""
+        ids = self._indices_busqueda().prefijos.buscar(prefijo, limite)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        """Busca personas a ``distancia_maxima`` ediciones o menos, de la más parecida."""
+        ids = self._indices_busqueda().difuso.buscar(nombre, distancia_maxima)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        """Busca personas cuyo nombre contiene ``texto``, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_subcadena(texto)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        """Busca personas cuyo nombre coincide con la regex, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_regex(patron)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        """Busca personas por palabras (AND/OR, sin acentos), ordenadas por ID."""
+        ids = self._indices_busqueda().tokens.buscar(consulta)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        """Busca personas cuyo nombre suena como ``nombre``, ordenadas por ID."""
+        ids = self._indices_busqueda().fonetico.buscar(nombre)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def init_get_root(self) -> list[Persona]:
+        """Devuelve las personas sin padres (conjunto mantenido incrementalmente)."""
+        return [PersonaVista(persona_id, self) for persona_id in self._raices]
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """
+        Recorre el árbol completo desde cada raíz, con varios visitors en una sola pasada.
+
+        Con ``procesos`` distinto de 1 los linajes independientes se recorren en paralelo.
+        """
+        visitors = (visitor, *otros_visitors)
+        logger.debug(
+            "Recorriendo árbol columnar con visitor(s): %s",
+            ", ".join(type(v).__name__ for v in visitors),
+        )
+        if procesos == 1:
+            recorrer_fusionado(self.init_get_root(), visitors)
+        else:
+            recorrer_en_paralelo(self.init_get_root(), self.personas, visitors, procesos or None)
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """
+        Añade un hijo a una persona con las mismas validaciones que ArbolGenealogico.
+
+        Raises:
+            RelacionInvalidaError: Si la relación es inválida (ciclos, límite de padres, etc.)
+        """
+        try:
+            FamilyValidator(self.personas).validar(padre, hijo, "hijo")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al añadir relación padre-hijo (%s -> %s): %s", padre.nombre, hijo.nombre, e
+            )
+            raise
+
+        self._hijos_mutables(padre.id).append(hijo.id)
+        if self._padre0[hijo.id] == SIN_ID:
+            self._padre0[hijo.id] = padre.id
+        elif self._padre1[hijo.id] == SIN_ID:
+            self._padre1[hijo.id] = padre.id
+        self._quitar_raiz(hijo.id)
+        self._compactar_si_corresponde()
+        logger.info("Relación padre-hijo creada exitosamente: %s -> %s", padre.nombre, hijo.nombre)
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """
+        Añade muchas relaciones padre-hijo (padre_id, hijo_id) de forma atómica.
+
+        Mismas validaciones de lote que ArbolGenealogico.add_hijos_bulk; el CSR
+        de hijos se compacta, si corresponde, una sola vez al final.
+
+        Raises:
+            LoteRelacionesError: Si alguna relación es inválida (el árbol no cambia)
+        """
+        pares = list(pares)
+        errores = FamilyValidator(self.personas).validar_lote(pares, "hijo")
+        if errores:
+            logger.warning(
+                "Lote de %s relación(es) rechazado: %s error(es)", len(pares), len(errores)
+            )
+            raise LoteRelacionesError(errores, self.personas)
+
+        padre0 = self._padre0
+        padre1 = self._padre1
+        for padre_id, hijo_id in pares:
+            self._hijos_mutables(padre_id).append(hijo_id)
+            if padre0[hijo_id] == SIN_ID:
+                padre0[hijo_id] = padre_id
+            else:
+                padre1[hijo_id] = padre_id
+            self._quitar_raiz(hijo_id)
+        self._compactar_si_corresponde()
+        logger.info("%s relación(es) padre-hijo creada(s) en lote", len(pares))
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """
+        Añade una pareja a dos personas.
+
+        Raises:
+            RelacionInvalidaError: Si la relación es inválida
+        """
+        try:
+            FamilyValidator(self.personas).validar(persona1, persona2, "pareja")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al añadir relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
+            )
+            raise
+        self._pareja[persona1.id] = persona2.id
+        self._pareja[persona2.id] = persona1.id
+        logger.info(
+            "Relación de pareja creada exitosamente: %s <-> %s", persona1.nombre, persona2.nombre
+        )
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """
+        Remueve una pareja de dos personas.
+
+        Raises:
+            ParejaNoExisteError: Si las personas no son pareja entre sí
+        """
+        try:
+            FamilyValidator(self.personas).validar(persona1, persona2, "remover_pareja")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al remover relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
+            )
+            raise
+        self._pareja[persona1.id] = SIN_ID
+        self._pareja[persona2.id] = SIN_ID
+        logger.info(
+            "Relación de pareja removida exitosamente: %s <-> %s", persona1.nombre, persona2.nombre
+        )
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """
+        Elimina una persona del árbol. Su ID no se reutiliza.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe
+            EliminacionConDescendientesError: Si tiene descendientes y
+                                             confirmar_rotura es False
+        """
+        if not self.existe(persona_id):
+            logger.warning("Intento de eliminar persona inexistente (ID: %s)", persona_id)
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+
+        persona = PersonaVista(persona_id, self)
+        hijos = list(self.hijos_de(persona_id))
+        if hijos and not confirmar_rotura:
+            FamilyValidator.validar_impacto_eliminacion(persona)
+
+        nombre = persona.nombre
+        # 1 desvincular la pareja
+        pareja_id = self._pareja[persona_id]
+        if pareja_id != SIN_ID:
+            self._pareja[pareja_id] = SIN_ID
+            self._pareja[persona_id] = SIN_ID
+
+        # 2 desvincular los padres
+        for padre_id in self.padres_de(persona_id):
+            if padre_id != SIN_ID:
+                self._hijos_mutables(padre_id).remove(persona_id)
+
+        # 3 desvincular los hijos
+        for hijo_id in hijos:
+            if self._padre0[hijo_id] == persona_id:
+                self._padre0[hijo_id] = SIN_ID
+            if self._padre1[hijo_id] == persona_id:
+                self._padre1[hijo_id] = SIN_ID
+            if self._padre0[hijo_id] == SIN_ID and self._padre1[hijo_id] == SIN_ID:
+                self._raices[hijo_id] = None
+        if hijos:
+            self._hijos_modificados[persona_id] = array("i")
+
+        # 4 eliminar la persona
+        if self._tabla_nombres:
+            self._quitar_nombre(persona_id, ArbolGenealogico.normalizar_nombre(nombre))
+        if self._indices is not None:
+            self._indices.quitar(persona_id, nombre)
+        self.vivos[persona_id] = 0
+        self.cantidad -= 1
+        self._quitar_raiz(persona_id)
+        self._compactar_si_corresponde()
+        logger.info("Persona eliminada exitosamente: %s (ID: %s)", nombre, persona_id)
+
+    # ==================== CSR DE HIJOS ====================
+
+    def _hijos_mutables(self, persona_id: int) -> "array[int]":
+        """Devuelve la lista modificable de hijos, copiándola del CSR si hace falta."""
+        modificados = self._hijos_modificados.get(persona_id)
+        if modificados is None:
+            modificados = array("i", self.hijos_de(persona_id))
+            self._hijos_modificados[persona_id] = modificados
+        return modificados
+
+    def _compactar_si_corresponde(self) -> None:
+        umbral = max(self.MIN_MODIFICADOS_COMPACTAR, len(self.vivos) // 8)
+        if len(self._hijos_modificados) > umbral:
+            self.compactar()
+
+    def compactar(self) -> None:
+        """
+        Pliega las modificaciones de hijos al CSR.
+
+        Se ejecuta automáticamente cuando las personas con hijos modificados
+        superan 1/8 del árbol (costo amortizado O(1) por modificación).
+        """
+        total = len(self.vivos)
+        inicio: array[int] = array("q", bytes(8 * (total + 1)))
+        csr: array[int] = array("i")
+        for persona_id in range(total):
+            inicio[persona_id] = len(csr)
+            if self.vivos[persona_id]:
+                csr.extend(self.hijos_de(persona_id))
+        inicio[total] = len(csr)
+        self._hijos_inicio = inicio
+        self._hijos_csr = csr
+        self._hijos_modificados = {}
+        logger.debug("CSR de hijos compactado: %s personas, %s aristas", total - 1, len(csr))
+
+    # ==================== RAÍCES ====================
+
+    def _quitar_raiz(self, persona_id: int) -> None:
+        """Quita una raíz y compacta el dict cuando las bajas superan a las raíces."""
+        if persona_id not in self._raices:
+            return
+        del self._raices[persona_id]
+        self._raices_quitadas += 1
+        if self._raices_quitadas > 2 * len(self._raices) + 32:
+            self._raices = dict(self._raices.items())
+            self._raices_quitadas = 0
+
+    # ==================== ÍNDICES DE BÚSQUEDA ====================
+
+    def _indices_busqueda(self) -> IndicesBusqueda:
+        """Devuelve los índices de búsqueda, construyéndolos desde las columnas si hace falta."""
+        if self._indices is None:
+            self._indices = IndicesBusqueda.construir(
+                (persona_id, self.nombre_de(persona_id)) for persona_id in self.personas
+            )
+        return self._indices
+
+    # ==================== TABLA HASH DE NOMBRES ====================
+
+    def _construir_tabla_nombres(self) -> None:
+        capacidad = 8
+        while capacidad < 2 * self.cantidad + 8:
+            capacidad *= 2
+        self._tabla_nombres = array("i", bytes(4 * capacidad))
+        self._tabla_usadas = 0
+        for persona_id in self.personas:
+            self._insertar_nombre(persona_id, self._nombre_normalizado(persona_id))
+
+    def _nombre_normalizado(self, persona_id: int) -> str:
+        return ArbolGenealogico.normalizar_nombre(self.nombre_de(persona_id))
+
+    def _insertar_nombre(self, persona_id: int, clave: str) -> None:
+        tabla = self._tabla_nombres
+        if 3 * (self._tabla_usadas + 1) > 2 * len(tabla):
+            # La reconstrucción ya incluye a la persona (se marca viva antes)
+            self._construir_tabla_nombres()
+            return
+        mascara = len(tabla) - 1
+        posicion = hash(clave) & mascara
+        while tabla[posicion] > 0:
+            posicion = (posicion + 1) & mascara
+        if tabla[posicion] == _CELDA_VACIA:
+            self._tabla_usadas += 1
+        tabla[posicion] = persona_id
+
+    def _quitar_nombre(self, persona_id: int, clave: str) -> None:
+        tabla = self._tabla_nombres
+        mascara = len(tabla) - 1
+        posicion = hash(clave) & mascara
+        while tabla[posicion] != _CELDA_VACIA:
+            if tabla[posicion] == persona_id:
+                tabla[posicion] = _CELDA_BORRADA
+                return
+            posicion = (posicion + 1) & mascara
+
+    def _buscar_nombre(self, clave: str) -> list[int]:
+        tabla = self._tabla_nombres
+        mascara = len(tabla) - 1
+        posicion = hash(clave) & mascara
+        encontrados: list[int] = []
+        while tabla[posicion] != _CELDA_VACIA:
+            candidato = tabla[posicion]
+            if candidato > 0 and self._nombre_normalizado(candidato) == clave:
+                encontrados.append(candidato)
+            posicion = (posicion + 1) & mascara
+        return encontrados
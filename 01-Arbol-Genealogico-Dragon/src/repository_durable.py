@@ -0,0 +1,432 @@
+"""
+Árbol genealógico persistente: snapshot binario más diario de cambios (WAL).
+
+ArbolDurable envuelve un ArbolGenealogico en memoria. Cada modificación se
+aplica al árbol y se agrega al diario (src/diario.py) antes de retornar, así
+que sobrevive al fin del proceso sin reescribir el snapshot en cada cambio.
+Al abrir, se carga el último snapshot y se reaplica el diario.
+
+El diario se divide en segmentos numerados (``<snapshot>.wal.000001``...).
+Cada segmento guarda el CRC32 del snapshot sobre el que se aplican sus
+registros y de ahí en adelante. Compactar:
+
+1. copia el estado del árbol y calcula el CRC32 del nuevo snapshot,
+2. abre un segmento nuevo con ese CRC como base (los cambios siguientes van ahí),
+3. en segundo plano escribe el snapshot y borra los segmentos anteriores.
+
+Un corte en cualquier punto deja un estado recuperable: al abrir se busca
+el primer segmento cuya base es el snapshot guardado y se aplican ese y los
+siguientes; los anteriores ya están incluidos en el snapshot.
+
+Cada modificación se valida y se aplica en memoria con la API del árbol, y
+recién después se anota (dentro de agrupar(), al salir del bloque). Si
+escribir el diario falla, el árbol en memoria queda adelantado respecto del
+disco: en lugar de seguir divergiendo, ArbolDurable queda inutilizable y
+toda operación posterior lanza DiarioFallidoError. Al volver a abrirlo se
+recupera lo que sí llegó al disco.
+"""
+
+import threading
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional
+
+from .diario import (
+    SIN_SNAPSHOT,
+    DiarioEscritura,
+    Registro,
+    TipoRegistro,
+    leer_diario,
+    sincronizar_directorio,
+)
+from .exceptions import DiarioFallidoError, DiarioInvalidoError
+from .models import Persona
+from .repository import ArbolGenealogico
+from .snapshot import Ruta, codificar_snapshot, crc_de_snapshot, escribir_bloques
+from .utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+
+class ArbolDurable:
+    """ArbolGenealogico cuyas modificaciones se guardan en un diario y en snapshots."""
+
+    # Tamaño del segmento actual a partir del cual se compacta automáticamente
+    MAX_BYTES_DIARIO = 64 * 2**20
+
+    def __init__(
+        self,
+        ruta_snapshot: Ruta,
+        fsync_cada: int = 1,
+        intervalo_fsync: float = 0.0,
+        max_bytes_diario: int = MAX_BYTES_DIARIO,
+    ):
+        """
+        Abre (o crea) el árbol guardado en ``ruta_snapshot`` y sus segmentos de diario.
+
+        Args:
+            ruta_snapshot: Archivo del snapshot; los segmentos del diario se
+                guardan al lado, con el mismo nombre más ``.wal.NNNNNN``.
+            fsync_cada: Cada cuántas confirmaciones se hace fsync del diario
+                (1 = cada modificación es durable al retornar).
+            intervalo_fsync: Si es mayor que 0, también se hace fsync cuando
+                pasaron esos segundos desde el último.
+            max_bytes_diario: Al superar este tamaño, el segmento actual se
+                compacta en segundo plano.
+
+        Raises:
+            SnapshotInvalidoError: Si el snapshot está dañado.
+            DiarioInvalidoError: Si el diario está dañado o no corresponde al snapshot.
+        """
+        self._ruta_snapshot = Path(ruta_snapshot)
+        self._fsync_cada = fsync_cada
+        self._intervalo_fsync = intervalo_fsync
+        self._max_bytes_diario = max_bytes_diario
+        self._profundidad_lote = 0
+        self._compactacion: Optional[threading.Thread] = None
+        # Error de escritura del diario que inutilizó al árbol (ver _inutilizar())
+        self._fallo: Optional[Exception] = None
+        self.arbol, self._diario, self._numero = self._recuperar()
+
+    # ==================== RECUPERACIÓN ====================
+
+    def _segmento(self, numero: int) -> Path:
+        return self._ruta_snapshot.with_name(f"{self._ruta_snapshot.name}.wal.{numero:06d}")
+
+    def _segmentos(self) -> list[tuple[int, Path]]:
+        """Segmentos existentes, ordenados por número."""
+        prefijo = f"{self._ruta_snapshot.name}.wal."
+        segmentos: list[tuple[int, Path]] = []
+        for ruta in self._ruta_snapshot.parent.glob(prefijo + "*"):
+            sufijo = ruta.name[len(prefijo) :]
+            if sufijo.isdigit():
+                segmentos.append((int(sufijo), ruta))
+        return sorted(segmentos)
+
+    def _recuperar(self) -> tuple[ArbolGenealogico, DiarioEscritura, int]:
+        """Carga el snapshot, aplica los segmentos que le siguen y abre el último."""
+        if self._ruta_snapshot.exists():
+            arbol = ArbolGenealogico.load_snapshot(self._ruta_snapshot)
+            base = crc_de_snapshot(self._ruta_snapshot)
+        else:
+            arbol = ArbolGenealogico()
+            base = SIN_SNAPSHOT
+
+        segmentos = self._segmentos()
+        lecturas = [(numero, ruta, leer_diario(ruta)) for numero, ruta in segmentos]
+        primero = next(
+            (i for i, (_, _, lectura) in enumerate(lecturas) if lectura.base == base), None
+        )
+        if primero is None:
+            if lecturas:
+                raise DiarioInvalidoError(
+                    str(lecturas[0][1]), "ningún segmento corresponde al snapshot guardado"
+                )
+            numero = 1
+            diario = self._crear_diario(numero, base)
+            logger.info("Diario creado en %s", diario.ruta)
+            return arbol, diario, numero
+
+        # Los segmentos previos ya están incluidos en el snapshot
+        for _, ruta, _ in lecturas[:primero]:
+            ruta.unlink()
+        aplicados = 0
+        for posicion, (_, ruta, lectura) in enumerate(lecturas[primero:], start=primero):
+            if lectura.fin_valido != lectura.tamano:
+                if posicion != len(lecturas) - 1:
+                    raise DiarioInvalidoError(str(ruta), "registro dañado antes del final")
+                logger.warning(
+                    "Diario %s cortado a mitad de escritura: se descartan %s byte(s)",
+                    ruta,
+                    lectura.tamano - lectura.fin_valido,
+                )
+            for registro in lectura.registros:
+                self._aplicar(arbol, registro, ruta)
+            aplicados += len(lectura.registros)
+
+        numero, ruta, lectura = lecturas[-1]
+        diario = DiarioEscritura(ruta, lectura.fin_valido, self._fsync_cada, self._intervalo_fsync)
+        logger.info(
+            "Árbol recuperado de %s: %s persona(s), %s cambio(s) reaplicado(s) del diario",
+            self._ruta_snapshot,
+            len(arbol.personas),
+            aplicados,
+        )
+        return arbol, diario, numero
+
+    def _crear_diario(self, numero: int, base: int) -> DiarioEscritura:
+        """Crea el segmento ``numero`` sobre el snapshot de CRC ``base``."""
+        return DiarioEscritura.crear(
+            self._segmento(numero), base, self._fsync_cada, self._intervalo_fsync
+        )
+
+    @staticmethod
+    def _aplicar(arbol: ArbolGenealogico, registro: Registro, ruta: Path) -> None:
+        """Reaplica un registro con la API del árbol (que vuelve a validarlo)."""
+        tipo, id1, id2, nombre = registro
+        match tipo:
+            case TipoRegistro.REGISTRAR_PERSONA:
+                persona = arbol.registrar_persona(nombre)
+                if persona.id != id1:
+                    raise DiarioInvalidoError(
+                        str(ruta), f"se esperaba el ID {id1} y se asignó {persona.id}"
+                    )
+            case TipoRegistro.ADD_HIJO:
+                arbol.add_hijo(arbol.get_persona(id1), arbol.get_persona(id2))
+            case TipoRegistro.ADD_PAREJA:
+                arbol.add_pareja(arbol.get_persona(id1), arbol.get_persona(id2))
+            case TipoRegistro.REMOVE_PAREJA:
+                arbol.remove_pareja(arbol.get_persona(id1), arbol.get_persona(id2))
+            case TipoRegistro.ELIMINAR_PERSONA:
+                arbol.eliminar_persona(id1, confirmar_rotura=True)
+
+    # ==================== DIARIO ====================
+
+    def _anotar(self, *registros: Registro) -> None:
+        """Agrega los registros al diario y los confirma, salvo dentro de agrupar()."""
+        for registro in registros:
+            self._diario.agregar(registro)
+        if self._profundidad_lote == 0:
+            self._confirmar()
+
+    def _confirmar(self) -> None:
+        try:
+            self._diario.confirmar()
+        except Exception as e:
+            self._inutilizar(e)
+            raise
+        if self._diario.tamano >= self._max_bytes_diario and not self.compactando:
+            self.compactar()
+
+    def _inutilizar(self, error: Exception) -> None:
+        """Registra el primer fallo del diario: desde ahí toda operación lo informa."""
+        if self._fallo is None:
+            self._fallo = error
+            logger.error(
+                "Falló la escritura del diario %s; el árbol queda inutilizable: %s",
+                self._diario.ruta,
+                error,
+            )
+
+    def _verificar(self) -> None:
+        """
+        Raises:
+            DiarioFallidoError: Si una escritura del diario ya falló.
+        """
+        if self._fallo is not None:
+            raise DiarioFallidoError(str(self._diario.ruta), str(self._fallo)) from self._fallo
+
+    @contextmanager
+    def agrupar(self) -> Generator[None, None, None]:
+        """
+        Agrupa varias modificaciones en una sola escritura del diario (group commit).
+
+        Los cambios se aplican al árbol enseguida, pero se escriben juntos al
+        salir del bloque, con un único fsync.
+        """
+        self._verificar()
+        self._profundidad_lote += 1
+        try:
+            yield
+        finally:
+            self._profundidad_lote -= 1
+            if self._profundidad_lote == 0:
+                self._confirmar()
+
+    def sincronizar(self) -> None:
+        """Escribe y hace fsync de todo lo pendiente, sin importar la política."""
+        self._verificar()
+        self._confirmar()
+        try:
+            self._diario.sincronizar()
+        except Exception as e:
+            self._inutilizar(e)
+            raise
+
+    # ==================== COMPACTACIÓN ====================
+
+    @property
+    def compactando(self) -> bool:
+        """Indica si hay una compactación escribiendo en segundo plano."""
+        return self._compactacion is not None and self._compactacion.is_alive()
+
+    def compactar(self, en_segundo_plano: bool = True) -> None:
+        """
+        Pliega el diario en un snapshot nuevo.
+
+        La copia del estado y el cambio de segmento se hacen en este hilo;
+        escribir el snapshot y borrar los segmentos viejos, en otro (o en
+        este, con ``en_segundo_plano=False``). Mientras tanto el árbol se
+        puede seguir modificando: los cambios van al segmento nuevo.
+        """
+        self._verificar()
+        self.esperar_compactacion()
+        bloques, crc = codificar_snapshot(self.arbol.datos_snapshot())
+        try:
+            self._diario.cerrar()
+            self._numero += 1
+            self._diario = self._crear_diario(self._numero, crc)
+        except Exception as e:
+            self._inutilizar(e)
+            raise
+        logger.info("Compactando diario en %s (segmento %s)", self._ruta_snapshot, self._numero)
+        if en_segundo_plano:
+            self._compactacion = threading.Thread(
+                target=self._escribir_compactacion,
+                args=(bloques, crc, self._numero),
+                name="compactacion-diario",
+            )
+            self._compactacion.start()
+        else:
+            self._escribir_compactacion(bloques, crc, self._numero)
+
+    def _escribir_compactacion(self, bloques: list[bytes], crc: int, numero: int) -> None:
+        try:
+            escribir_bloques(self._ruta_snapshot, bloques, crc)
+            sincronizar_directorio(self._ruta_snapshot)
+            for anterior, ruta in self._segmentos():
+                if anterior < numero:
+                    ruta.unlink()
+            logger.info("Snapshot %s escrito; diario compactado", self._ruta_snapshot)
+        except OSError:
+            # Los segmentos se conservan: el árbol sigue siendo recuperable
+            logger.exception("Error al compactar el diario en %s", self._ruta_snapshot)
+
+    def esperar_compactacion(self) -> None:
+        """Espera a que termine la compactación en segundo plano, si hay una."""
+        if self._compactacion is not None:
+            self._compactacion.join()
+            self._compactacion = None
+
+    # ==================== CICLO DE VIDA ====================
+
+    def cerrar(self) -> None:
+        """
+        Espera la compactación pendiente y cierra el diario con fsync (sin
+        escribir nada más si el diario ya había fallado).
+        """
+        self.esperar_compactacion()
+        if self._fallo is not None:
+            self._diario.descartar()
+        else:
+            self._diario.cerrar()
+
+    def __enter__(self) -> "ArbolDurable":
+        return self
+
+    def __exit__(
+        self,
+        tipo: Optional[type[BaseException]],
+        error: Optional[BaseException],
+        traza: Optional[TracebackType],
+    ) -> None:
+        self.cerrar()
+
+    # ==================== ArbolRepository: consultas ====================
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        self._verificar()
+        return self.arbol.personas
+
+    def get_persona(self, persona_id: int) -> Persona:
+        self._verificar()
+        return self.arbol.get_persona(persona_id)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_por_nombre(nombre)
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_por_prefijo(prefijo, limite)
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_aproximado(nombre, distancia_maxima)
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_por_subcadena(texto)
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_por_regex(patron)
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_por_palabras(consulta)
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        self._verificar()
+        return self.arbol.buscar_fonetico(nombre)
+
+    def init_get_root(self) -> list[Persona]:
+        self._verificar()
+        return self.arbol.init_get_root()
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        self._verificar()
+        self.arbol.recorrer_arbol_completo(visitor, *otros_visitors, procesos=procesos)
+
+    # ==================== ArbolRepository: modificaciones ====================
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """Registra la persona y anota el alta (con su ID) en el diario."""
+        self._verificar()
+        persona = self.arbol.registrar_persona(nombre)
+        self._anotar(Registro(TipoRegistro.REGISTRAR_PERSONA, persona.id, nombre=nombre))
+        return persona
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """Registra las personas en lote y anota todas las altas en una sola escritura."""
+        self._verificar()
+        personas = self.arbol.registrar_personas_bulk(nombres)
+        self._anotar(
+            *(
+                Registro(TipoRegistro.REGISTRAR_PERSONA, persona.id, nombre=persona.nombre)
+                for persona in personas
+            )
+        )
+        return personas
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """Crea la relación padre-hijo y la anota en el diario."""
+        self._verificar()
+        self.arbol.add_hijo(padre, hijo)
+        self._anotar(Registro(TipoRegistro.ADD_HIJO, padre.id, hijo.id))
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """Crea las relaciones en lote (atómico) y las anota en una sola escritura."""
+        self._verificar()
+        pares = list(pares)
+        self.arbol.add_hijos_bulk(pares)
+        self._anotar(*(Registro(TipoRegistro.ADD_HIJO, padre, hijo) for padre, hijo in pares))
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Crea la relación de pareja y la anota en el diario."""
+        self._verificar()
+        self.arbol.add_pareja(persona1, persona2)
+        self._anotar(Registro(TipoRegistro.ADD_PAREJA, persona1.id, persona2.id))
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Quita la relación de pareja y lo anota en el diario."""
+        self._verificar()
+        self.arbol.remove_pareja(persona1, persona2)
+        self._anotar(Registro(TipoRegistro.REMOVE_PAREJA, persona1.id, persona2.id))
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """Elimina la persona y anota la baja en el diario."""
+        self._verificar()
+        self.arbol.eliminar_persona(persona_id, confirmar_rotura)
+        self._anotar(Registro(TipoRegistro.ELIMINAR_PERSONA, persona_id))
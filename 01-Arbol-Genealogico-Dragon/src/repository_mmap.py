@@ -0,0 +1,307 @@
+"""
+Repositorio de solo lectura sobre un snapshot mapeado en memoria (mmap).
+
+Abre un archivo escrito con ArbolGenealogico.save_snapshot() y lo consulta
+en el lugar, sin reconstruir el árbol:
+
+- las columnas de enteros (padres, pareja, hijos en CSR, raíces) son
+  ``memoryview`` sobre el mmap, así que abrir el árbol no crea un objeto
+  por persona y el costo de inicio no depende de su tamaño
+- los nombres se decodifican al pedirlos, con la tabla de offsets
+- las personas se entregan como PersonaVista, igual que en ArbolColumnar
+
+Como las páginas del archivo las comparte la caché del sistema operativo,
+varios procesos pueden abrir el mismo snapshot y consultar una genealogía
+muy grande con una sola copia en memoria. Los índices de nombres se
+construyen, por proceso, en la primera búsqueda que los necesita.
+
+Se usa ``memoryview`` y no NumPy porque el proyecto no tiene dependencias
+de runtime; el formato del archivo permite ambas vistas.
+"""
+
+import mmap
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, NoReturn, Optional
+
+from .exceptions import ArbolSoloLecturaError, PersonaNoEncontradaError, SnapshotInvalidoError
+from .indices import IndicesBusqueda, normalizar_nombre
+from .models import SIN_ID, Persona, PersonaVista
+from .recorrido_paralelo import recorrer_en_paralelo
+from .snapshot import Ruta, interpretar_snapshot
+from .utils.logger import get_logger
+from .visitors import recorrer_fusionado
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+
+class _PersonasMapeadas(Mapping[int, Persona]):
+    """Mapping de solo lectura ID -> PersonaVista sobre las columnas del snapshot."""
+
+    __slots__ = ("_arbol",)
+
+    def __init__(self, arbol: "ArbolMapeado"):
+        self._arbol = arbol
+
+    def __getitem__(self, persona_id: int) -> Persona:
+        if self._arbol.fila(persona_id) is None:
+            raise KeyError(persona_id)
+        return PersonaVista(persona_id, self._arbol)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return isinstance(persona_id, int) and self._arbol.fila(persona_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._arbol.datos.ids)
+
+    def __len__(self) -> int:
+        return len(self._arbol.datos.ids)
+
+
+class ArbolMapeado:
+    """
+    Árbol genealógico de solo lectura que lee un snapshot desde un mmap.
+
+    Se usa como context manager (o llamando a cerrar()) para liberar el
+    mapeo. Las operaciones que modifican el árbol lanzan ArbolSoloLecturaError.
+
+    Example:
+        >>> with ArbolMapeado("dinastia.snap") as arbol:
+        ...     arbol.buscar_por_nombre("Aegon I")
+    """
+
+    def __init__(self, ruta: Ruta, verificar_crc: bool = True):
+        """
+        Mapea el snapshot en memoria y valida su cabecera.
+
+        Args:
+            ruta: Archivo escrito con save_snapshot().
+            verificar_crc: Si es False no se verifica el CRC32, que obliga a
+                leer el archivo entero; útil cuando otro proceso ya lo verificó.
+
+        Raises:
+            SnapshotInvalidoError: Si el archivo no es un snapshot válido.
+        """
+        self._ruta = str(ruta)
+        with open(ruta, "rb") as archivo:
+            try:
+                self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # mmap no admite archivos vacíos
+                raise SnapshotInvalidoError(self._ruta, "archivo truncado") from e
+        try:
+            self.datos = interpretar_snapshot(
+                self._mapa, self._ruta, copiar=False, verificar_crc=verificar_crc
+            )
+        except SnapshotInvalidoError:
+            self._mapa.close()
+            raise
+        ids = self.datos.ids
+        # Los IDs están ordenados: si el último es n, son exactamente 1..n
+        self._denso = len(ids) == 0 or ids[-1] == len(ids)
+        self._indice_nombres: Optional[dict[str, list[int]]] = None
+        self._indices: Optional[IndicesBusqueda] = None
+        self._personas = _PersonasMapeadas(self)
+        logger.info("Snapshot mapeado desde %s: %s persona(s)", self._ruta, len(ids))
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        return self._personas
+
+    def fila(self, persona_id: int) -> Optional[int]:
+        """Retorna la posición de la persona en las columnas, o None si no existe."""
+        ids = self.datos.ids
+        if self._denso:
+            return persona_id - 1 if 0 < persona_id <= len(ids) else None
+        fila = bisect_left(ids, persona_id)
+        return fila if fila < len(ids) and ids[fila] == persona_id else None
+
+    def _fila_existente(self, persona_id: int) -> int:
+        fila = self.fila(persona_id)
+        if fila is None:
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return fila
+
+    # ==================== CICLO DE VIDA ====================
+
+    def cerrar(self) -> None:
+        """Libera las vistas y el mmap; el árbol deja de poder consultarse."""
+        if self._mapa.closed:
+            return
+        for seccion in self.datos:
+            if isinstance(seccion, memoryview):
+                seccion.release()
+        self._indices = None
+        self._indice_nombres = None
+        self._mapa.close()
+        logger.debug("Snapshot %s desmapeado", self._ruta)
+
+    def __enter__(self) -> "ArbolMapeado":
+        return self
+
+    def __exit__(
+        self,
+        tipo: Optional[type[BaseException]],
+        error: Optional[BaseException],
+        traza: Optional[TracebackType],
+    ) -> None:
+        self.cerrar()
+
+    # ==================== FuentePersonas ====================
+
+    def nombre_de(self, persona_id: int) -> str:
+        return self.datos.nombre(self._fila_existente(persona_id))
+
+    def pareja_de(self, persona_id: int) -> int:
+        return self.datos.parejas[self._fila_existente(persona_id)]
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        fila = self._fila_existente(persona_id)
+        return (self.datos.padres0[fila], self.datos.padres1[fila])
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        # Se copia a una lista: una vista que sobreviva impediría cerrar el mmap
+        fila = self._fila_existente(persona_id)
+        inicio = self.datos.hijos_inicio
+        return self.datos.hijos[inicio[fila] : inicio[fila + 1]].tolist()  # type: ignore[union-attr]
+
+    def vista(self, persona_id: int) -> Optional[Persona]:
+        if persona_id == SIN_ID:
+            return None
+        return PersonaVista(persona_id, self)
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        self._rechazar("asignar_pareja")
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        self._rechazar("asignar_padres")
+
+    # ==================== ArbolRepository: consultas ====================
+
+    def get_persona(self, persona_id: int) -> Persona:
+        """
+        Devuelve una vista de la persona con el ID especificado.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no está en el snapshot.
+        """
+        if self.fila(persona_id) is None:
+            logger.warning("Persona con ID %s no encontrada", persona_id)
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return PersonaVista(persona_id, self)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        """
+        Busca personas por nombre exacto normalizado.
+
+        El índice se construye en la primera búsqueda (decodifica todos los
+        nombres una vez) y las consultas siguientes son O(1).
+        """
+        if self._indice_nombres is None:
+            indice: dict[str, list[int]] = {}
+            for persona_id, texto in zip(self.datos.ids, self.datos.todos_los_nombres()):
+                indice.setdefault(normalizar_nombre(texto), []).append(persona_id)
+            self._indice_nombres = indice
+        ids = self._indice_nombres.get(normalizar_nombre(nombre), [])
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        """Busca personas cuyo nombre empieza con ``prefijo``, en orden alfabético."""
+        ids = self._indices_busqueda().prefijos.buscar(prefijo, limite)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        """Busca personas a ``distancia_maxima`` ediciones o menos, de la más parecida."""
+        ids = self._indices_busqueda().difuso.buscar(nombre, distancia_maxima)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        """Busca personas cuyo nombre contiene ``texto``, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_subcadena(texto)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        """Busca personas cuyo nombre coincide con la regex, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_regex(patron)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        """Busca personas por palabras (AND/OR, sin acentos), ordenadas por ID."""
+        ids = self._indices_busqueda().tokens.buscar(consulta)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        """Busca personas cuyo nombre suena como ``nombre``, ordenadas por ID."""
+        ids = self._indices_busqueda().fonetico.buscar(nombre)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def init_get_root(self) -> list[Persona]:
+        """Devuelve las raíces en el orden guardado en el snapshot."""
+        return [PersonaVista(persona_id, self) for persona_id in self.datos.raices]
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """
+        Recorre el árbol completo desde cada raíz, con varios visitors en una sola pasada.
+
+        Con ``procesos`` distinto de 1 los linajes independientes se recorren en paralelo.
+        """
+        visitors = (visitor, *otros_visitors)
+        logger.debug(
+            "Recorriendo árbol mapeado con visitor(s): %s",
+            ", ".join(type(v).__name__ for v in visitors),
+        )
+        if procesos == 1:
+            recorrer_fusionado(self.init_get_root(), visitors)
+        else:
+            recorrer_en_paralelo(self.init_get_root(), self.personas, visitors, procesos or None)
+
+    def _indices_busqueda(self) -> IndicesBusqueda:
+        """Devuelve los índices de búsqueda, construyéndolos en la primera consulta."""
+        if self._indices is None:
+            self._indices = IndicesBusqueda.construir(
+                zip(self.datos.ids, self.datos.todos_los_nombres())
+            )
+        return self._indices
+
+    # ==================== ArbolRepository: modificaciones ====================
+
+    def _rechazar(self, operacion: str) -> NoReturn:
+        logger.warning("Operación %s rechazada: el árbol mapeado es de solo lectura", operacion)
+        raise ArbolSoloLecturaError(operacion)
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("registrar_persona")
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("registrar_personas_bulk")
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("add_hijo")
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("add_hijos_bulk")
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("add_pareja")
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("remove_pareja")
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """Raises: ArbolSoloLecturaError (el snapshot mapeado no se modifica)."""
+        self._rechazar("eliminar_persona")
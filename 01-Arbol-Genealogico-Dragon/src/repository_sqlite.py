@@ -0,0 +1,689 @@
+"""
+Repositorio persistente sobre SQLite (módulo estándar ``sqlite3``).
+
+Los datos viven en la base y no en memoria, así que el árbol sobrevive a los
+reinicios y puede ser más grande que la RAM:
+
+- personas: una fila por persona con nombre, nombre normalizado, pareja y
+  ambos padres (SIN_ID = sin relación), con índices por nombre normalizado
+  y, parcial, por las raíces
+- hijos: una fila por relación padre -> hijo, en orden de alta (rowid), con
+  índices por padre y por hijo
+- meta: próximo ID y cantidad de personas, para no recalcularlos al abrir
+
+Las consultas recursivas (ancestros, descendientes y detección de ciclos,
+también para un lote entero de relaciones) se resuelven en la base con CTE
+recursivas, y las cargas en lote usan
+``executemany`` dentro de una única transacción. Las personas se entregan
+como PersonaVista que leen la base en cada acceso.
+
+Las búsquedas por nombre exacto y por prefijo usan el índice de la base; las
+aproximadas (trigramas, palabras, fonética, edición) usan IndicesBusqueda en
+memoria, construidos en la primera consulta y mantenidos desde entonces.
+"""
+
+import sqlite3
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Optional
+
+from .exceptions import (
+    ArbolGenealogicoError,
+    IDInvalidoError,
+    LoteRelacionesError,
+    PersonaNoEncontradaError,
+    RelacionInvalidaError,
+)
+from .indices import IndicesBusqueda, normalizar_nombre
+from .models import SIN_ID, Persona, PersonaVista
+from .recorrido_paralelo import recorrer_en_paralelo
+from .snapshot import Ruta
+from .utils.logger import get_logger
+from .validators import FamilyValidator
+from .visitors import recorrer_fusionado
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+VERSION_ESQUEMA = 1
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS personas (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    nombre_normalizado TEXT NOT NULL,
+    pareja_id INTEGER NOT NULL DEFAULT 0,
+    padre0_id INTEGER NOT NULL DEFAULT 0,
+    padre1_id INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_personas_nombre ON personas (nombre_normalizado);
+CREATE INDEX IF NOT EXISTS idx_personas_raices ON personas (id)
+    WHERE padre0_id = 0 AND padre1_id = 0;
+
+CREATE TABLE IF NOT EXISTS hijos (
+    padre_id INTEGER NOT NULL,
+    hijo_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_hijos_padre ON hijos (padre_id);
+CREATE INDEX IF NOT EXISTS idx_hijos_hijo ON hijos (hijo_id);
+-- Relaciones con el padre de ID mayor que el hijo (ver respeta_orden)
+CREATE INDEX IF NOT EXISTS idx_hijos_invertidos ON hijos (padre_id) WHERE padre_id > hijo_id;
+
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (clave, valor) VALUES ('proximo_id', 1), ('cantidad', 0);
+"""
+
+# Relaciones de un lote a validar, solo durante relaciones_en_ciclo()
+_ESQUEMA_LOTE = """
+CREATE TEMP TABLE IF NOT EXISTS lote_hijos (
+    posicion INTEGER PRIMARY KEY,
+    padre_id INTEGER NOT NULL,
+    hijo_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS temp.idx_lote_padre ON lote_hijos (padre_id);
+CREATE INDEX IF NOT EXISTS temp.idx_lote_hijo ON lote_hijos (hijo_id);
+"""
+
+_ANCESTROS = """
+WITH RECURSIVE ancestros(id) AS (
+    SELECT padre_id FROM hijos WHERE hijo_id = ?
+    UNION
+    SELECT h.padre_id FROM hijos AS h JOIN ancestros AS a ON h.hijo_id = a.id
+)
+SELECT id FROM ancestros ORDER BY id
+"""
+
+_DESCENDIENTES = """
+WITH RECURSIVE descendientes(id) AS (
+    SELECT hijo_id FROM hijos WHERE padre_id = ?
+    UNION
+    SELECT h.hijo_id FROM hijos AS h JOIN descendientes AS d ON h.padre_id = d.id
+)
+SELECT id FROM descendientes ORDER BY id
+"""
+
+# El padre y sus ancestros: la recursión es una corrutina, así que EXISTS
+# termina apenas encuentra al hijo sin recorrer el resto del linaje
+_CREARIA_CICLO = """
+WITH RECURSIVE ancestros(id) AS (
+    VALUES (?)
+    UNION
+    SELECT h.padre_id FROM hijos AS h JOIN ancestros AS a ON h.hijo_id = a.id
+)
+SELECT EXISTS (SELECT 1 FROM ancestros WHERE id = ?)
+"""
+
+# Relaciones del lote que cierran un ciclo en hijos ∪ lote: las (padre, hijo)
+# en las que el hijo llega al padre. Primero se acota el núcleo, las personas
+# alcanzables desde algún hijo del lote que además llegan a algún padre del
+# lote (fuera de él no hay ciclos), y solo dentro del núcleo se sigue el
+# camino desde cada relación candidata
+_RELACIONES_EN_CICLO = """
+WITH RECURSIVE
+descendientes(id) AS (
+    SELECT hijo_id FROM lote_hijos
+    UNION
+    SELECT h.hijo_id FROM hijos AS h JOIN descendientes AS d ON h.padre_id = d.id
+    UNION
+    SELECT l.hijo_id FROM lote_hijos AS l JOIN descendientes AS d ON l.padre_id = d.id
+),
+ancestros(id) AS (
+    SELECT padre_id FROM lote_hijos
+    UNION
+    SELECT h.padre_id FROM hijos AS h JOIN ancestros AS a ON h.hijo_id = a.id
+    UNION
+    SELECT l.padre_id FROM lote_hijos AS l JOIN ancestros AS a ON l.hijo_id = a.id
+),
+nucleo(id) AS MATERIALIZED (
+    SELECT id FROM descendientes INTERSECT SELECT id FROM ancestros
+),
+caminos(posicion, id) AS (
+    SELECT posicion, hijo_id FROM lote_hijos
+    WHERE padre_id IN (SELECT id FROM nucleo) AND hijo_id IN (SELECT id FROM nucleo)
+    UNION
+    SELECT c.posicion, h.hijo_id FROM hijos AS h JOIN caminos AS c ON h.padre_id = c.id
+    WHERE h.hijo_id IN (SELECT id FROM nucleo)
+    UNION
+    SELECT c.posicion, l.hijo_id FROM lote_hijos AS l JOIN caminos AS c ON l.padre_id = c.id
+    WHERE l.hijo_id IN (SELECT id FROM nucleo)
+)
+SELECT l.posicion FROM lote_hijos AS l
+WHERE EXISTS (SELECT 1 FROM caminos AS c WHERE c.posicion = l.posicion AND c.id = l.padre_id)
+ORDER BY l.posicion
+"""
+
+# En UPDATE las expresiones ven los valores previos: el primer padre libre
+# recibe al nuevo padre
+_ASIGNAR_PADRE = """
+UPDATE personas SET
+    padre0_id = CASE WHEN padre0_id = 0 THEN :padre ELSE padre0_id END,
+    padre1_id = CASE WHEN padre0_id = 0 THEN padre1_id ELSE :padre END
+WHERE id = :hijo
+"""
+
+_QUITAR_PADRE = """
+UPDATE personas SET
+    padre0_id = CASE WHEN padre0_id = :padre THEN 0 ELSE padre0_id END,
+    padre1_id = CASE WHEN padre1_id = :padre THEN 0 ELSE padre1_id END
+WHERE id IN (SELECT hijo_id FROM hijos WHERE padre_id = :padre)
+"""
+
+# Mayor que cualquier carácter de un nombre: cota superior de los prefijos
+_FIN_PREFIJO = "\U0010ffff"
+
+
+class _PersonasSQLite(Mapping[int, Persona]):
+    """Mapping de solo lectura ID -> PersonaVista sobre la tabla de personas."""
+
+    __slots__ = ("_arbol",)
+
+    def __init__(self, arbol: "ArbolSQLite"):
+        self._arbol = arbol
+
+    def __getitem__(self, persona_id: int) -> Persona:
+        if not self._arbol.existe(persona_id):
+            raise KeyError(persona_id)
+        return PersonaVista(persona_id, self._arbol)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return isinstance(persona_id, int) and self._arbol.existe(persona_id)
+
+    def __iter__(self) -> Iterator[int]:
+        cursor = self._arbol.conexion.execute("SELECT id FROM personas ORDER BY id")
+        return (persona_id for (persona_id,) in cursor)
+
+    def __len__(self) -> int:
+        return self._arbol.cantidad
+
+
+class ArbolSQLite:
+    """
+    Árbol genealógico persistido en una base SQLite.
+
+    Se usa como context manager (o llamando a cerrar()) para cerrar la
+    conexión. Con la ruta por defecto (":memory:") la base es temporal.
+
+    Example:
+        >>> with ArbolSQLite("dinastia.db") as arbol:
+        ...     arbol.registrar_persona("Aegon I")
+    """
+
+    def __init__(self, ruta: Ruta = ":memory:"):
+        """
+        Abre (o crea) la base y su esquema.
+
+        Args:
+            ruta: Archivo de la base, o ":memory:" para una base temporal.
+        """
+        self._ruta = str(ruta)
+        self.conexion = sqlite3.connect(self._ruta)
+        self.conexion.executescript(
+            "PRAGMA journal_mode = WAL; PRAGMA synchronous = NORMAL;" + _ESQUEMA + _ESQUEMA_LOTE
+        )
+        self.conexion.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+        meta = dict(self.conexion.execute("SELECT clave, valor FROM meta"))
+        self._proximo_id: int = meta["proximo_id"]
+        self.cantidad: int = meta["cantidad"]
+        # Índices de búsqueda aproximada: se construyen en la primera consulta
+        self._indices: Optional[IndicesBusqueda] = None
+        self._personas = _PersonasSQLite(self)
+        logger.info("Base SQLite abierta en %s: %s persona(s)", self._ruta, self.cantidad)
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        return self._personas
+
+    def existe(self, persona_id: int) -> bool:
+        """Indica si el ID corresponde a una persona guardada en la base."""
+        fila = self.conexion.execute("SELECT 1 FROM personas WHERE id = ?", (persona_id,))
+        return fila.fetchone() is not None
+
+    def _vistas(self, cursor: Iterable[tuple[int]]) -> list[Persona]:
+        return [PersonaVista(persona_id, self) for (persona_id,) in cursor]
+
+    def _guardar_contadores(self, proximo_id: int, cantidad: int) -> None:
+        """Escribe los contadores en la transacción en curso (se aplican al confirmarla)."""
+        self.conexion.executemany(
+            "UPDATE meta SET valor = ? WHERE clave = ?",
+            ((proximo_id, "proximo_id"), (cantidad, "cantidad")),
+        )
+
+    # ==================== CICLO DE VIDA ====================
+
+    def cerrar(self) -> None:
+        """Cierra la conexión; los cambios ya están confirmados."""
+        self.conexion.close()
+        logger.debug("Base SQLite %s cerrada", self._ruta)
+
+    def __enter__(self) -> "ArbolSQLite":
+        return self
+
+    def __exit__(
+        self,
+        tipo: Optional[type[BaseException]],
+        error: Optional[BaseException],
+        traza: Optional[TracebackType],
+    ) -> None:
+        self.cerrar()
+
+    # ==================== FuentePersonas ====================
+
+    def nombre_de(self, persona_id: int) -> str:
+        (nombre,) = self._fila("SELECT nombre FROM personas WHERE id = ?", persona_id)
+        return nombre
+
+    def pareja_de(self, persona_id: int) -> int:
+        (pareja_id,) = self._fila("SELECT pareja_id FROM personas WHERE id = ?", persona_id)
+        return pareja_id
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        return self._fila("SELECT padre0_id, padre1_id FROM personas WHERE id = ?", persona_id)
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        cursor = self.conexion.execute(
+            "SELECT hijo_id FROM hijos WHERE padre_id = ? ORDER BY rowid", (persona_id,)
+        )
+        return [hijo_id for (hijo_id,) in cursor]
+
+    def vista(self, persona_id: int) -> Optional[Persona]:
+        if persona_id == SIN_ID:
+            return None
+        return PersonaVista(persona_id, self)
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        with self.conexion:
+            self.conexion.execute(
+                "UPDATE personas SET pareja_id = ? WHERE id = ?", (pareja_id, persona_id)
+            )
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        with self.conexion:
+            self.conexion.execute(
+                "UPDATE personas SET padre0_id = ?, padre1_id = ? WHERE id = ?",
+                (padre0_id, padre1_id, persona_id),
+            )
+
+    def _fila(self, consulta: str, persona_id: int) -> Any:
+        """Ejecuta ``consulta`` (con el ID como único parámetro) y retorna su fila."""
+        fila = self.conexion.execute(consulta, (persona_id,)).fetchone()
+        if fila is None:
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return fila
+
+    # ==================== DetectorCiclos ====================
+
+    def crearia_ciclo(self, padre_id: int, hijo_id: int) -> bool:
+        """Retorna True si el hijo es el padre o uno de sus ancestros (CTE recursiva)."""
+        (hay_ciclo,) = self.conexion.execute(_CREARIA_CICLO, (padre_id, hijo_id)).fetchone()
+        return bool(hay_ciclo)
+
+    def respeta_orden(self, padre_id: int, hijo_id: int) -> bool:
+        """
+        Usa el orden de los IDs como orden topológico: mientras ninguna
+        relación tenga un padre de ID mayor que su hijo, un lote de relaciones
+        de IDs crecientes no puede formar ciclos.
+        """
+        return padre_id < hijo_id and not self._hay_relaciones_invertidas()
+
+    def _hay_relaciones_invertidas(self) -> bool:
+        """Si alguna relación guardada tiene el padre de ID mayor (índice parcial)."""
+        (hay_invertidas,) = self.conexion.execute(
+            "SELECT EXISTS (SELECT 1 FROM hijos WHERE padre_id > hijo_id)"
+        ).fetchone()
+        return bool(hay_invertidas)
+
+    def relaciones_en_ciclo(self, pares: Sequence[tuple[int, int]]) -> Optional[list[int]]:
+        """
+        Resuelve los ciclos del lote en la base, sin cargar el árbol en memoria.
+
+        Si todas las relaciones van de un ID menor a uno mayor y las guardadas
+        también, no hay ciclos posibles y no se consulta nada más. Si no, el
+        lote se copia a una tabla temporal y una CTE recursiva sobre
+        hijos ∪ lote encuentra las relaciones que cierran un ciclo.
+        """
+        if all(padre_id < hijo_id for padre_id, hijo_id in pares) and (
+            not self._hay_relaciones_invertidas()
+        ):
+            return []
+        with self.conexion:
+            self.conexion.execute("DELETE FROM lote_hijos")
+            self.conexion.executemany(
+                "INSERT INTO lote_hijos (posicion, padre_id, hijo_id) VALUES (?, ?, ?)",
+                ((posicion, *par) for posicion, par in enumerate(pares)),
+            )
+            en_ciclo = [posicion for (posicion,) in self.conexion.execute(_RELACIONES_EN_CICLO)]
+            self.conexion.execute("DELETE FROM lote_hijos")
+        return en_ciclo
+
+    # ==================== CONSULTAS RECURSIVAS ====================
+
+    def ancestros(self, persona_id: int) -> list[Persona]:
+        """
+        Retorna todos los ancestros de la persona, ordenados por ID.
+
+        Se resuelve en la base con una CTE recursiva: cada ancestro aparece
+        una sola vez aunque se llegue a él por varias ramas.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe.
+        """
+        self.get_persona(persona_id)
+        return self._vistas(self.conexion.execute(_ANCESTROS, (persona_id,)))
+
+    def descendientes(self, persona_id: int) -> list[Persona]:
+        """
+        Retorna todos los descendientes de la persona, ordenados por ID.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe.
+        """
+        self.get_persona(persona_id)
+        return self._vistas(self.conexion.execute(_DESCENDIENTES, (persona_id,)))
+
+    # ==================== ArbolRepository ====================
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """
+        Registra una nueva persona insertando su fila.
+
+        Raises:
+            IDInvalidoError: Si el ID generado no es válido o ya existe.
+
+        Returns:
+            Persona: Vista de la persona recién registrada.
+        """
+        nuevo_id = self._proximo_id
+        logger.debug("Intentando registrar persona: %s (ID asignado: %s)", nombre, nuevo_id)
+
+        try:
+            FamilyValidator(self.personas).validar_id(nuevo_id)
+        except (IDInvalidoError, ArbolGenealogicoError) as e:
+            logger.warning("Error al registrar persona '%s': %s", nombre, e)
+            raise
+
+        with self.conexion:
+            self.conexion.execute(
+                "INSERT INTO personas (id, nombre, nombre_normalizado) VALUES (?, ?, ?)",
+                (nuevo_id, nombre, normalizar_nombre(nombre)),
+            )
+            self._guardar_contadores(nuevo_id + 1, self.cantidad + 1)
+        self._proximo_id += 1
+        self.cantidad += 1
+        if self._indices is not None:
+            self._indices.agregar(nuevo_id, nombre)
+
+        logger.info("Persona registrada exitosamente: %s (ID: %s)", nombre, nuevo_id)
+        return PersonaVista(nuevo_id, self)
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """
+        Registra muchas personas con un único executemany en una transacción.
+
+        Los índices de búsqueda en memoria se descartan y se reconstruyen en
+        la próxima búsqueda que los necesite.
+
+        Returns:
+            list[Persona]: Vistas de las personas registradas, en orden.
+        """
+        nombres = list(nombres)
+        if not nombres:
+            return []
+        primer_id = self._proximo_id
+        FamilyValidator(self.personas).validar_id(primer_id)
+        ids_nuevos = range(primer_id, primer_id + len(nombres))
+
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT INTO personas (id, nombre, nombre_normalizado) VALUES (?, ?, ?)",
+                (
+                    (persona_id, nombre, normalizar_nombre(nombre))
+                    for persona_id, nombre in zip(ids_nuevos, nombres)
+                ),
+            )
+            self._guardar_contadores(ids_nuevos.stop, self.cantidad + len(nombres))
+        self._proximo_id = ids_nuevos.stop
+        self.cantidad += len(nombres)
+        self._indices = None
+
+        logger.info(
+            "%s persona(s) registrada(s) en lote (IDs %s-%s)",
+            len(nombres),
+            primer_id,
+            ids_nuevos[-1],
+        )
+        return [PersonaVista(persona_id, self) for persona_id in ids_nuevos]
+
+    def get_persona(self, persona_id: int) -> Persona:
+        """
+        Devuelve una vista de la persona con el ID especificado.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe en la base.
+        """
+        if not self.existe(persona_id):
+            logger.warning("Persona con ID %s no encontrada", persona_id)
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return PersonaVista(persona_id, self)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        """Busca personas por nombre exacto normalizado con el índice de la base."""
+        cursor = self.conexion.execute(
+            "SELECT id FROM personas WHERE nombre_normalizado = ? ORDER BY id",
+            (normalizar_nombre(nombre),),
+        )
+        return self._vistas(cursor)
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        """
+        Busca personas cuyo nombre empieza con ``prefijo``, en orden alfabético.
+
+        Es un rango sobre el índice de nombres normalizados: SQLite compara
+        los textos byte a byte en UTF-8, que respeta el orden de los caracteres.
+        """
+        clave = normalizar_nombre(prefijo)
+        cursor = self.conexion.execute(
+            "SELECT id FROM personas WHERE nombre_normalizado >= ? AND nombre_normalizado < ? "
+            "ORDER BY nombre_normalizado, id LIMIT ?",
+            (clave, clave + _FIN_PREFIJO, limite),
+        )
+        return self._vistas(cursor)
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        """Busca personas a ``distancia_maxima`` ediciones o menos, de la más parecida."""
+        ids = self._indices_busqueda().difuso.buscar(nombre, distancia_maxima)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        """Busca personas cuyo nombre contiene ``texto``, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_subcadena(texto)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        """Busca personas cuyo nombre coincide con la regex, ordenadas por ID."""
+        ids = self._indices_busqueda().trigramas.buscar_regex(patron)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        """Busca personas por palabras (AND/OR, sin acentos), ordenadas por ID."""
+        ids = self._indices_busqueda().tokens.buscar(consulta)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        """Busca personas cuyo nombre suena como ``nombre``, ordenadas por ID."""
+        ids = self._indices_busqueda().fonetico.buscar(nombre)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def init_get_root(self) -> list[Persona]:
+        """Devuelve las personas sin padres, por ID, con el índice parcial de raíces."""
+        cursor = self.conexion.execute(
+            "SELECT id FROM personas WHERE padre0_id = 0 AND padre1_id = 0 ORDER BY id"
+        )
+        return self._vistas(cursor)
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """
+        Recorre el árbol completo desde cada raíz, con varios visitors en una sola pasada.
+
+        Con ``procesos`` distinto de 1 los linajes independientes se recorren en paralelo.
+        """
+        visitors = (visitor, *otros_visitors)
+        logger.debug(
+            "Recorriendo árbol SQLite con visitor(s): %s",
+            ", ".join(type(v).__name__ for v in visitors),
+        )
+        if procesos == 1:
+            recorrer_fusionado(self.init_get_root(), visitors)
+        else:
+            recorrer_en_paralelo(self.init_get_root(), self.personas, visitors, procesos or None)
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """
+        Añade un hijo a una persona con las mismas validaciones que ArbolGenealogico.
+
+        Los ciclos se buscan con una CTE recursiva sobre los ancestros del padre.
+
+        Raises:
+            RelacionInvalidaError: Si la relación es inválida (ciclos, límite de padres, etc.)
+        """
+        try:
+            FamilyValidator(self.personas, detector_ciclos=self).validar(padre, hijo, "hijo")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al añadir relación padre-hijo (%s -> %s): %s", padre.nombre, hijo.nombre, e
+            )
+            raise
+
+        self._insertar_relaciones([(padre.id, hijo.id)])
+        logger.info("Relación padre-hijo creada exitosamente: %s -> %s", padre.nombre, hijo.nombre)
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """
+        Añade muchas relaciones padre-hijo (padre_id, hijo_id) en una sola transacción.
+
+        Mismas validaciones de lote que ArbolGenealogico.add_hijos_bulk; los
+        ciclos se buscan en la base (ver relaciones_en_ciclo()).
+
+        Raises:
+            LoteRelacionesError: Si alguna relación es inválida (la base no cambia)
+        """
+        pares = list(pares)
+        validador = FamilyValidator(self.personas, detector_ciclos=self)
+        errores = validador.validar_lote(pares, "hijo")
+        if errores:
+            logger.warning(
+                "Lote de %s relación(es) rechazado: %s error(es)", len(pares), len(errores)
+            )
+            raise LoteRelacionesError(errores, self.personas)
+
+        self._insertar_relaciones(pares)
+        logger.info("%s relación(es) padre-hijo creada(s) en lote", len(pares))
+
+    def _insertar_relaciones(self, pares: Sequence[tuple[int, int]]) -> None:
+        with self.conexion:
+            self.conexion.executemany("INSERT INTO hijos (padre_id, hijo_id) VALUES (?, ?)", pares)
+            self.conexion.executemany(
+                _ASIGNAR_PADRE,
+                ({"padre": padre_id, "hijo": hijo_id} for padre_id, hijo_id in pares),
+            )
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """
+        Añade una pareja a dos personas.
+
+        Raises:
+            RelacionInvalidaError: Si la relación es inválida
+        """
+        try:
+            FamilyValidator(self.personas).validar(persona1, persona2, "pareja")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al añadir relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
+            )
+            raise
+        self._guardar_parejas(((persona2.id, persona1.id), (persona1.id, persona2.id)))
+        logger.info(
+            "Relación de pareja creada exitosamente: %s <-> %s", persona1.nombre, persona2.nombre
+        )
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """
+        Remueve una pareja de dos personas.
+
+        Raises:
+            ParejaNoExisteError: Si las personas no son pareja entre sí
+        """
+        try:
+            FamilyValidator(self.personas).validar(persona1, persona2, "remover_pareja")
+        except RelacionInvalidaError as e:
+            logger.warning(
+                "Error al remover relación de pareja (%s <-> %s): %s",
+                persona1.nombre,
+                persona2.nombre,
+                e,
+            )
+            raise
+        self._guardar_parejas(((SIN_ID, persona1.id), (SIN_ID, persona2.id)))
+        logger.info(
+            "Relación de pareja removida exitosamente: %s <-> %s", persona1.nombre, persona2.nombre
+        )
+
+    def _guardar_parejas(self, filas: Iterable[tuple[int, int]]) -> None:
+        with self.conexion:
+            self.conexion.executemany("UPDATE personas SET pareja_id = ? WHERE id = ?", filas)
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """
+        Elimina una persona y sus relaciones en una transacción. Su ID no se reutiliza.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no existe
+            EliminacionConDescendientesError: Si tiene descendientes y
+                                             confirmar_rotura es False
+        """
+        persona = self.get_persona(persona_id)
+        if not confirmar_rotura and self.hijos_de(persona_id):
+            FamilyValidator.validar_impacto_eliminacion(persona)
+
+        nombre = persona.nombre
+        pareja_id = self.pareja_de(persona_id)
+        with self.conexion:
+            # 1 desvincular la pareja
+            if pareja_id != SIN_ID:
+                self.conexion.execute(
+                    "UPDATE personas SET pareja_id = 0 WHERE id = ?", (pareja_id,)
+                )
+            # 2 desvincular los padres
+            self.conexion.execute("DELETE FROM hijos WHERE hijo_id = ?", (persona_id,))
+            # 3 desvincular los hijos
+            self.conexion.execute(_QUITAR_PADRE, {"padre": persona_id})
+            self.conexion.execute("DELETE FROM hijos WHERE padre_id = ?", (persona_id,))
+            # 4 eliminar la persona
+            self.conexion.execute("DELETE FROM personas WHERE id = ?", (persona_id,))
+            self._guardar_contadores(self._proximo_id, self.cantidad - 1)
+        self.cantidad -= 1
+        if self._indices is not None:
+            self._indices.quitar(persona_id, nombre)
+        logger.info("Persona eliminada exitosamente: %s (ID: %s)", nombre, persona_id)
+
+    # ==================== ÍNDICES DE BÚSQUEDA ====================
+
+    def _indices_busqueda(self) -> IndicesBusqueda:
+        """Devuelve los índices de búsqueda, construyéndolos desde la base si hace falta."""
+        if self._indices is None:
+            self._indices = IndicesBusqueda.construir(
+                self.conexion.execute("SELECT id, nombre FROM personas ORDER BY id")
+            )
+        return self._indices
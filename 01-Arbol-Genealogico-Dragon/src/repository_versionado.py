@@ -0,0 +1,236 @@
+"""
+Árbol genealógico con versiones inmutables para lectores concurrentes (MVCC).
+
+ArbolVersionado envuelve un ArbolGenealogico. Los escritores se serializan
+con un lock: cada modificación se aplica al árbol y, al terminar, publica
+una VersionArbol nueva con las personas que cambiaron (copy-on-write, ver
+src/versiones.py). Los lectores no toman el lock de los escritores:
+version() retorna la última versión publicada en O(1) y esa versión no
+cambia mientras se la recorre, aunque los escritores sigan publicando otras.
+Solo las búsquedas toman, mientras consultan, el lock de los índices que
+comparten todas las versiones.
+
+    version = arbol.version()          # fija una vista consistente
+    version.recorrer_arbol_completo(PrintArbolVisitor())
+    version.buscar_por_prefijo("Rhae")  # misma versión, mismo estado
+
+Las personas que entrega ArbolVersionado (get_persona, búsquedas, altas)
+son vistas que leen la última versión en cada acceso, como las de un árbol
+mutable; para varias lecturas coherentes entre sí se fija una versión con
+version() y se consulta esa.
+"""
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Optional
+
+from .models import SIN_ID, Persona, PersonaVista
+from .repository import ArbolGenealogico
+from .utils.logger import get_logger
+from .versiones import FilaPersona, VersionArbol
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+
+class _PersonasVigentes(Mapping[int, Persona]):
+    """Mapping ID -> PersonaVista sobre la última versión publicada."""
+
+    __slots__ = ("_arbol",)
+
+    def __init__(self, arbol: "ArbolVersionado"):
+        self._arbol = arbol
+
+    def __getitem__(self, persona_id: int) -> Persona:
+        if persona_id not in self._arbol.version().personas:
+            raise KeyError(persona_id)
+        return PersonaVista(persona_id, self._arbol)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return persona_id in self._arbol.version().personas
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._arbol.version().personas)
+
+    def __len__(self) -> int:
+        return self._arbol.version().cantidad
+
+
+class ArbolVersionado:
+    """ArbolGenealogico cuyas lecturas se hacen sobre versiones inmutables."""
+
+    def __init__(self, arbol: Optional[ArbolGenealogico] = None):
+        """
+        Args:
+            arbol: Árbol a envolver (por ejemplo, uno cargado con
+                load_snapshot()); por defecto, uno vacío. Pasa a ser de
+                ArbolVersionado: no se debe modificar directamente.
+        """
+        self.arbol = arbol if arbol is not None else ArbolGenealogico()
+        self._escritura = threading.Lock()
+        self._personas = _PersonasVigentes(self)
+        self._version = VersionArbol.vacia().con_cambios(
+            {
+                persona.id: FilaPersona.de_persona(persona)
+                for persona in self.arbol.personas.values()
+            }
+        )
+        logger.debug("Árbol versionado inicializado con %s persona(s)", self._version.cantidad)
+
+    def version(self) -> VersionArbol:
+        """Retorna la última versión publicada (O(1), sin locks)."""
+        return self._version
+
+    def _publicar(self, ids: Iterable[int]) -> None:
+        """Publica una versión nueva con las filas actuales de ``ids`` (None si ya no están)."""
+        personas = self.arbol.personas
+        cambios: dict[int, Optional[FilaPersona]] = {}
+        for persona_id in ids:
+            if persona_id == SIN_ID:
+                continue
+            persona = personas.get(persona_id)
+            cambios[persona_id] = None if persona is None else FilaPersona.de_persona(persona)
+        # Asignar la referencia es atómico: un lector ve la versión anterior o esta
+        self._version = self._version.con_cambios(cambios)
+        logger.debug(
+            "Versión %s publicada (%s persona(s) modificada(s))",
+            self._version.numero,
+            len(cambios),
+        )
+
+    # ==================== FuentePersonas ====================
+    # Las vistas de ArbolVersionado leen, en cada acceso, la última versión
+    # publicada; las de version() quedan fijas en su versión.
+
+    def nombre_de(self, persona_id: int) -> str:
+        return self._version.nombre_de(persona_id)
+
+    def pareja_de(self, persona_id: int) -> int:
+        return self._version.pareja_de(persona_id)
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        return self._version.padres_de(persona_id)
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        return self._version.hijos_de(persona_id)
+
+    def vista(self, persona_id: int) -> Optional[Persona]:
+        if persona_id == SIN_ID:
+            return None
+        return PersonaVista(persona_id, self)
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        with self._escritura:
+            personas = self.arbol.personas
+            personas[persona_id].pareja = personas.get(pareja_id)
+            self._publicar((persona_id,))
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        with self._escritura:
+            personas = self.arbol.personas
+            personas[persona_id].padres = (personas.get(padre0_id), personas.get(padre1_id))
+            self._publicar((persona_id,))
+
+    def _vistas(self, personas: Iterable[Persona]) -> list[Persona]:
+        return [PersonaVista(persona.id, self) for persona in personas]
+
+    # ==================== ArbolRepository: consultas ====================
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        return self._personas
+
+    def get_persona(self, persona_id: int) -> Persona:
+        self._version.get_persona(persona_id)
+        return PersonaVista(persona_id, self)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        return self._vistas(self._version.buscar_por_nombre(nombre))
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        return self._vistas(self._version.buscar_por_prefijo(prefijo, limite))
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        return self._vistas(self._version.buscar_aproximado(nombre, distancia_maxima))
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        return self._vistas(self._version.buscar_por_subcadena(texto))
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        return self._vistas(self._version.buscar_por_regex(patron))
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        return self._vistas(self._version.buscar_por_palabras(consulta))
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        return self._vistas(self._version.buscar_fonetico(nombre))
+
+    def init_get_root(self) -> list[Persona]:
+        return self._vistas(self._version.init_get_root())
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """Recorre la versión vigente al empezar: el recorrido no ve cambios a mitad de camino."""
+        self._version.recorrer_arbol_completo(visitor, *otros_visitors, procesos=procesos)
+
+    # ==================== ArbolRepository: modificaciones ====================
+    # Las personas recibidas pueden ser vistas de una versión: se resuelven
+    # por ID en el árbol envuelto.
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """Registra la persona y publica una versión que la incluye."""
+        with self._escritura:
+            persona = self.arbol.registrar_persona(nombre)
+            self._publicar((persona.id,))
+        return PersonaVista(persona.id, self)
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """Registra las personas en lote y las publica en una sola versión."""
+        with self._escritura:
+            ids = [persona.id for persona in self.arbol.registrar_personas_bulk(nombres)]
+            self._publicar(ids)
+        return [PersonaVista(persona_id, self) for persona_id in ids]
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """Crea la relación padre-hijo y publica ambas personas."""
+        with self._escritura:
+            arbol = self.arbol
+            arbol.add_hijo(arbol.get_persona(padre.id), arbol.get_persona(hijo.id))
+            self._publicar((padre.id, hijo.id))
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """Crea las relaciones en lote (atómico) y las publica en una sola versión."""
+        pares = list(pares)
+        with self._escritura:
+            self.arbol.add_hijos_bulk(pares)
+            self._publicar({persona_id for par in pares for persona_id in par})
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Crea la relación de pareja y publica ambas personas."""
+        with self._escritura:
+            arbol = self.arbol
+            arbol.add_pareja(arbol.get_persona(persona1.id), arbol.get_persona(persona2.id))
+            self._publicar((persona1.id, persona2.id))
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Quita la relación de pareja y publica ambas personas."""
+        with self._escritura:
+            arbol = self.arbol
+            arbol.remove_pareja(arbol.get_persona(persona1.id), arbol.get_persona(persona2.id))
+            self._publicar((persona1.id, persona2.id))
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """Elimina la persona y publica la baja junto con sus parientes desvinculados."""
+        with self._escritura:
+            persona = self.arbol.personas.get(persona_id)
+            afectados = [persona_id]
+            if persona is not None:
+                afectados += [persona.pareja_id, *persona.padres_ids, *persona.hijos_ids]
+            self.arbol.eliminar_persona(persona_id, confirmar_rotura)
+            self._publicar(afectados)
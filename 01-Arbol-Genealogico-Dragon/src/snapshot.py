@@ -0,0 +1,260 @@
+"""
+Formato binario de instantáneas (snapshots) del árbol genealógico.
+
+Guarda el árbol como arrays de enteros de ancho fijo más un bloque de
+nombres, para reconstruirlo con lecturas en bloque y sin validar relación
+por relación. Disposición del archivo (enteros little-endian):
+
+    cabecera        64 bytes: magia, versión, banderas, cantidades, próximo ID
+    ids             n × int64, en orden creciente
+    parejas         n × int64 (SIN_ID si no tiene)
+    padres0         n × int64
+    padres1         n × int64
+    rangos          n × int64 (orden topológico; ceros sin BANDERA_ORDEN)
+    hijos_inicio    (n + 1) × int64, desplazamientos en 'hijos'
+    hijos           m × int64
+    raices          r × int64, en el orden de init_get_root()
+    nombres_inicio  (n + 1) × int64, desplazamientos en bytes en 'nombres'
+    nombres         bloque UTF-8 con los nombres concatenados
+    crc32           uint32 de todo lo anterior
+
+Todas las secciones de enteros quedan alineadas a 8 bytes, así que también
+se pueden leer sin copiar sobre un mmap del archivo.
+"""
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+from mmap import mmap
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from .exceptions import SnapshotInvalidoError
+
+MAGIA = b"ARBOLSNP"
+VERSION = 1
+# La persona i tiene rango topológico rangos[i] (si no, se recalcula al cargar)
+BANDERA_ORDEN = 1
+# El bloque de nombres es ASCII: desplazamientos en bytes y en caracteres coinciden
+BANDERA_ASCII = 2
+
+# magia, versión, banderas, n, m, r, bytes de nombres, próximo ID, siguiente rango
+_CABECERA = struct.Struct("<8sHHQQQQQQ4x")
+_CRC = struct.Struct("<I")
+_ENTERO = 8
+
+Ruta = Union[str, "os.PathLike[str]"]
+
+
+class DatosSnapshot(NamedTuple):
+    """
+    Contenido de un snapshot, con las secciones de enteros como secuencias.
+
+    Al leer con ``copiar=True`` las secciones son ``array('q')``; con
+    ``copiar=False`` son vistas (``memoryview``) sobre el buffer leído.
+    """
+
+    ids: "array[int] | memoryview"
+    parejas: "array[int] | memoryview"
+    padres0: "array[int] | memoryview"
+    padres1: "array[int] | memoryview"
+    rangos: "array[int] | memoryview"
+    hijos_inicio: "array[int] | memoryview"
+    hijos: "array[int] | memoryview"
+    raices: "array[int] | memoryview"
+    nombres_inicio: "array[int] | memoryview"
+    nombres: "bytes | memoryview"
+    banderas: int
+    proximo_id: int
+    siguiente_rango: int
+
+    def nombre(self, i: int) -> str:
+        """Decodifica el nombre de la persona ``i`` desde el bloque de nombres."""
+        return str(self.nombres[self.nombres_inicio[i] : self.nombres_inicio[i + 1]], "utf-8")
+
+    def todos_los_nombres(self) -> list[str]:
+        """Decodifica todos los nombres, en orden (una sola decodificación si son ASCII)."""
+        inicio = self.nombres_inicio
+        if self.banderas & BANDERA_ASCII:
+            texto = bytes(self.nombres).decode("ascii")
+            return [texto[desde:hasta] for desde, hasta in zip(inicio, inicio[1:])]
+        return [self.nombre(i) for i in range(len(self.ids))]
+
+
+def _a_bytes(enteros: "array[int]") -> bytes:
+    if sys.byteorder == "big":  # pragma: no cover - plataformas big-endian
+        enteros = array("q", enteros)
+        enteros.byteswap()
+    return enteros.tobytes()
+
+
+def codificar_snapshot(datos: DatosSnapshot) -> tuple[list[bytes], int]:
+    """
+    Serializa el snapshot en bloques, sin escribirlo.
+
+    Returns:
+        Los bloques en orden (sin el trailer) y su CRC32, que es el valor
+        del trailer y sirve para identificar el snapshot (ver crc_de_snapshot).
+    """
+    nombres = bytes(datos.nombres)
+    banderas = datos.banderas | (BANDERA_ASCII if nombres.isascii() else 0)
+    cabecera = _CABECERA.pack(
+        MAGIA,
+        VERSION,
+        banderas,
+        len(datos.ids),
+        len(datos.hijos),
+        len(datos.raices),
+        len(nombres),
+        datos.proximo_id,
+        datos.siguiente_rango,
+    )
+    bloques = [
+        cabecera,
+        *(
+            _a_bytes(seccion)  # type: ignore[arg-type]
+            for seccion in (
+                datos.ids,
+                datos.parejas,
+                datos.padres0,
+                datos.padres1,
+                datos.rangos,
+                datos.hijos_inicio,
+                datos.hijos,
+                datos.raices,
+                datos.nombres_inicio,
+            )
+        ),
+        nombres,
+    ]
+    crc = 0
+    for bloque in bloques:
+        crc = zlib.crc32(bloque, crc)
+    return bloques, crc
+
+
+def escribir_bloques(ruta: Ruta, bloques: list[bytes], crc: int) -> None:
+    """
+    Escribe un snapshot ya codificado en ``ruta`` de forma atómica.
+
+    Se escribe a un archivo temporal en el mismo directorio y se reemplaza
+    el destino al final, así un corte a mitad de escritura no deja un
+    snapshot truncado en lugar del anterior.
+    """
+    destino = Path(ruta)
+    temporal = destino.with_name(destino.name + ".tmp")
+    with open(temporal, "wb") as archivo:
+        for bloque in bloques:
+            archivo.write(bloque)
+        archivo.write(_CRC.pack(crc))
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, destino)
+
+
+def escribir_snapshot(ruta: Ruta, datos: DatosSnapshot) -> int:
+    """
+    Escribe el snapshot en ``ruta`` de forma atómica.
+
+    Returns:
+        El CRC32 del snapshot escrito.
+    """
+    bloques, crc = codificar_snapshot(datos)
+    escribir_bloques(ruta, bloques, crc)
+    return crc
+
+
+def crc_de_snapshot(ruta: Ruta) -> int:
+    """
+    Retorna el CRC32 guardado al final del snapshot, sin leer el resto.
+
+    Identifica la versión del snapshot (por ejemplo, para saber sobre cuál se
+    escribió un diario de cambios); no verifica el contenido.
+
+    Raises:
+        SnapshotInvalidoError: Si el archivo es demasiado corto.
+    """
+    with open(ruta, "rb") as archivo:
+        archivo.seek(0, os.SEEK_END)
+        if archivo.tell() < _CABECERA.size + _CRC.size:
+            raise SnapshotInvalidoError(str(ruta), "archivo truncado")
+        archivo.seek(-_CRC.size, os.SEEK_END)
+        (crc,) = _CRC.unpack(archivo.read(_CRC.size))
+    return crc
+
+
+def leer_snapshot(ruta: Ruta) -> DatosSnapshot:
+    """
+    Lee y verifica un snapshot completo, copiando las secciones a arrays.
+
+    Raises:
+        SnapshotInvalidoError: Si el archivo no es un snapshot, es de otra
+            versión, está truncado o su CRC32 no coincide.
+    """
+    contenido = Path(ruta).read_bytes()
+    return interpretar_snapshot(contenido, str(ruta), copiar=True)
+
+
+def interpretar_snapshot(
+    buffer: "bytes | mmap | memoryview", origen: str, copiar: bool, verificar_crc: bool = True
+) -> DatosSnapshot:
+    """
+    Verifica el CRC32 y separa las secciones de un snapshot ya en memoria.
+
+    Args:
+        buffer: Contenido completo del archivo (bytes, mmap o memoryview).
+        origen: Nombre del archivo, para los mensajes de error.
+        copiar: Si es True, las secciones se copian a ``array('q')``; si no,
+            son vistas sobre ``buffer`` (no se copia nada).
+        verificar_crc: Si es False no se calcula el CRC32, que obliga a leer
+            el archivo entero (útil sobre un mmap ya verificado por otro proceso).
+
+    Raises:
+        SnapshotInvalidoError: Si el contenido no es un snapshot válido.
+    """
+    total = len(buffer)
+    if total < _CABECERA.size + _CRC.size:
+        raise SnapshotInvalidoError(origen, "archivo truncado")
+    magia, version, banderas, n, m, r, bytes_nombres, proximo_id, siguiente_rango = (
+        _CABECERA.unpack_from(buffer)
+    )
+    if magia != MAGIA:
+        raise SnapshotInvalidoError(origen, "no es un snapshot del árbol")
+    if version != VERSION:
+        raise SnapshotInvalidoError(origen, f"versión {version} no soportada")
+    largos = (n, n, n, n, n, n + 1, m, r, n + 1)
+    fin_enteros = _CABECERA.size + _ENTERO * sum(largos)
+    if total != fin_enteros + bytes_nombres + _CRC.size:
+        raise SnapshotInvalidoError(origen, "archivo truncado o con datos de más")
+    if verificar_crc:
+        (crc,) = _CRC.unpack_from(buffer, total - _CRC.size)
+        # La vista se libera aun si falla, para que un mmap se pueda cerrar
+        with memoryview(buffer) as contenido:
+            crc_calculado = zlib.crc32(contenido[: -_CRC.size])
+        if crc_calculado != crc:
+            raise SnapshotInvalidoError(origen, "el CRC32 no coincide (archivo dañado)")
+
+    vista = memoryview(buffer)
+    secciones: list["array[int] | memoryview"] = []
+    posicion = _CABECERA.size
+    for largo in largos:
+        crudo = vista[posicion : posicion + _ENTERO * largo]
+        if copiar or sys.byteorder == "big":
+            seccion = array("q")
+            seccion.frombytes(crudo)
+            if sys.byteorder == "big":  # pragma: no cover - plataformas big-endian
+                seccion.byteswap()
+            secciones.append(seccion)
+        else:
+            secciones.append(crudo.cast("q"))
+        posicion += _ENTERO * largo
+    nombres = vista[posicion : posicion + bytes_nombres]
+    return DatosSnapshot(
+        *secciones,
+        nombres=bytes(nombres) if copiar else nombres,
+        banderas=banderas,
+        proximo_id=proximo_id,
+        siguiente_rango=siguiente_rango,
+    )
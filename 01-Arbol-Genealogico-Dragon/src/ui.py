@@ -1,3 +1,4 @@
+import sys
 from typing import TYPE_CHECKING, Literal, overload
 
 from .exceptions import (
@@ -5,12 +6,12 @@ from .exceptions import (
     EliminacionConDescendientesError,
     PersonaNoEncontradaError,
 )
-from .repository import ArbolGenealogico
 from .utils.ui_logger import create_ui_logger
-from .visitors import PrintArbolVisitor, SearchArbolVisitor
+from .visitors import PrintArbolVisitor
 
 if TYPE_CHECKING:
-    pass
+    from .interfaces import ArbolRepository
+    from .models import Persona
 
 # Inicializar logger de UI al nivel del módulo
 # Esto sigue el patrón Singleton: una sola instancia para todo el módulo
@@ -18,7 +19,7 @@ _ui_logger = create_ui_logger("src.ui")
 
 
 class DinastiaUI:
-    def __init__(self, arbol_gen: "ArbolGenealogico") -> None:
+    def __init__(self, arbol_gen: "ArbolRepository") -> None:
         self.arbol = arbol_gen
         # Log de inicialización
         _ui_logger.info(
@@ -100,12 +101,13 @@ class DinastiaUI:
         """
         try:
             print("Ingrese el nombre de la persona a buscar:")
+            print("(termine con * para buscar por prefijo, ej.: Aeg*)")
+            print("(termine con ~ o ~N para tolerar N errores de tipeo, ej.: Deamon~1)")
+            print("(*texto* busca dentro del nombre y /regex/ por expresión regular)")
             nombre = self.pedir_dato(mensaje="Nombre: ", es_entero=False)
             _ui_logger.info(f"Buscando persona con nombre: {nombre}")
 
-            visitor = SearchArbolVisitor(nombre)
-            self.arbol.recorrer_arbol_completo(visitor)
-            resultados = visitor.obtener_resultado()
+            resultados = self._buscar_segun_consulta(nombre)
 
             if not resultados:
                 UIMessages.error("No se encontraron resultados.")
@@ -120,17 +122,56 @@ class DinastiaUI:
             UIMessages.error(str(e))
             _ui_logger.error(f"Error en búsqueda: {e}")
 
+    def _buscar_segun_consulta(self, consulta: str) -> list["Persona"]:
+        """
+        Elige el modo de búsqueda según la forma de la consulta.
+
+        - ``/patrón/``: nombres que coinciden con la expresión regular.
+        - ``*texto*``: nombres que contienen ``texto``.
+        - ``texto*``: nombres que empiezan con ``texto`` (autocompletar).
+        - ``texto~`` o ``texto~N``: nombres a N ediciones o menos (2 por defecto).
+        - cualquier otra: nombre exacto (sin distinguir mayúsculas); si no hay
+          ninguno, por palabras sin acentos (``OR`` separa alternativas) y,
+          por último, por cómo suena el nombre.
+        """
+        consulta = consulta.strip()
+        if len(consulta) > 1 and consulta.startswith("/") and consulta.endswith("/"):
+            _ui_logger.debug(f"Búsqueda por regex: {consulta}")
+            return self.arbol.buscar_por_regex(consulta[1:-1])
+        if len(consulta) > 1 and consulta.startswith("*") and consulta.endswith("*"):
+            _ui_logger.debug(f"Búsqueda por subcadena: {consulta}")
+            return self.arbol.buscar_por_subcadena(consulta[1:-1])
+        if consulta.endswith("*"):
+            _ui_logger.debug(f"Búsqueda por prefijo: {consulta}")
+            return self.arbol.buscar_por_prefijo(consulta[:-1])
+        nombre, separador, distancia = consulta.rpartition("~")
+        if separador and (distancia == "" or distancia.isdigit()):
+            _ui_logger.debug(f"Búsqueda aproximada: {consulta}")
+            return self.arbol.buscar_aproximado(nombre, int(distancia or 2))
+        resultados = self.arbol.buscar_por_nombre(consulta)
+        if not resultados:
+            _ui_logger.debug(f"Sin coincidencia exacta, búsqueda por palabras: {consulta}")
+            resultados = self.arbol.buscar_por_palabras(consulta)
+        if not resultados:
+            _ui_logger.debug(f"Sin coincidencia por palabras, búsqueda fonética: {consulta}")
+            resultados = self.arbol.buscar_fonetico(consulta)
+        return resultados
+
     def mostrar_arbol(self):
         """
         Muestra el árbol genealógico completo mediante un visitante.
+        Las líneas se escriben en consola a medida que se recorren, sin armar
+        el árbol entero en memoria.
         Maneja el caso en que el árbol esté vacío y muestra un mensaje de error.
         """
         try:
             _ui_logger.info("Mostrando árbol genealógico completo")
-            visitor = PrintArbolVisitor()
+            visitor = PrintArbolVisitor(destino=sys.stdout)
             self.arbol.recorrer_arbol_completo(visitor)
-            resultado = visitor.get_resultado()
-            UIMessages.success(resultado)
+            if visitor.cantidad_lineas == 0:
+                UIMessages.success(visitor.get_resultado())
+            else:
+                UIMessages.success(f"Árbol mostrado: {visitor.cantidad_lineas} persona(s).")
             _ui_logger.info("Árbol mostrado exitosamente")
         except ArbolGenealogicoError as e:
             UIMessages.error(str(e))
@@ -10,10 +10,13 @@ Principios aplicados:
 - Dependency Inversion: Depende de abstracciones (logging estándar de Python)
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 class LoggerConfig:
@@ -27,6 +30,7 @@ class LoggerConfig:
         DEFAULT_LEVEL: Nivel de logging por defecto (INFO)
         DEFAULT_FORMAT: Formato estándar de los mensajes de log
         DEFAULT_DATE_FORMAT: Formato de fecha/hora para los logs
+        _listeners: QueueListener activos creados con ``usar_cola=True``
     """
 
     # Constantes de clase para configuración por defecto
@@ -34,12 +38,15 @@ class LoggerConfig:
     DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+    _listeners: ClassVar[list[logging.handlers.QueueListener]] = []
+
     @staticmethod
     def setup_logger(
         name: str,
         level: int = DEFAULT_LEVEL,
         log_file: Optional[Path] = None,
         format_string: Optional[str] = None,
+        usar_cola: bool = False,
     ) -> logging.Logger:
         """
         Configura y retorna un logger con handlers para consola y archivo.
@@ -57,6 +64,11 @@ class LoggerConfig:
                      Si se proporciona, se crea el directorio si no existe.
             format_string: Formato personalizado para los mensajes (opcional).
                           Si no se proporciona, usa DEFAULT_FORMAT.
+            usar_cola: Si es True, el logger solo encola los registros
+                      (QueueHandler) y un hilo QueueListener los formatea y
+                      escribe en consola/archivo. Así la E/S queda fuera del
+                      camino caliente de quien loguea. Los listeners se
+                      detienen con detener_colas() (registrado en atexit).
 
         Returns:
             Logger configurado y listo para usar. Si el logger ya existe
@@ -74,6 +86,9 @@ class LoggerConfig:
 
             >>> # Logger con nivel personalizado
             >>> logger = LoggerConfig.setup_logger(__name__, level=logging.DEBUG)
+
+            >>> # Logger con E/S en un hilo aparte
+            >>> logger = LoggerConfig.setup_logger(__name__, usar_cola=True)
         """
         logger = logging.getLogger(name)
 
@@ -91,10 +106,11 @@ class LoggerConfig:
 
         # Handler para consola (siempre presente)
         # Usa sys.stdout en lugar de sys.stderr para compatibilidad
+        handlers: list[logging.Handler] = []
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
         # Handler para archivo (opcional)
         # El archivo siempre guarda en nivel DEBUG para tener historial completo
@@ -104,10 +120,36 @@ class LoggerConfig:
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)  # Archivo siempre DEBUG
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        if usar_cola:
+            # El QueueHandler no filtra por nivel: cada handler real
+            # conserva su propio nivel gracias a respect_handler_level
+            cola: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(cola, *handlers, respect_handler_level=True)
+            listener.start()
+            LoggerConfig._listeners.append(listener)
+            handlers = [logging.handlers.QueueHandler(cola)]
+
+        for handler in handlers:
+            logger.addHandler(handler)
 
         return logger
 
+    @staticmethod
+    def detener_colas() -> None:
+        """
+        Detiene los QueueListener activos, vaciando antes los registros pendientes.
+
+        Es idempotente: se puede llamar varias veces (por ejemplo desde la
+        limpieza de la aplicación y luego desde atexit) sin efecto adicional.
+        """
+        while LoggerConfig._listeners:
+            LoggerConfig._listeners.pop().stop()
+
+
+atexit.register(LoggerConfig.detener_colas)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -1,23 +1,172 @@
-from typing import TYPE_CHECKING, Optional
+import logging
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from .exceptions import (
+    ArbolGenealogicoError,
     CicloTemporalError,
     EliminacionConDescendientesError,
     IDInvalidoError,
     LimitePadresExcedidoError,
     ParejaNoExisteError,
+    PersonaNoEncontradaError,
     RelacionIncestuosaError,
     RelacionInvalidaError,
 )
+from .models import SIN_ID
+from .orden_topologico import componentes_fuertes, ordenar_topologicamente
 from .utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from .interfaces import DetectorCiclos
     from .models import Persona
 
 # Inicializar logger para este módulo
 logger = get_logger(__name__)
 
 
+class CodigoValidacion(IntEnum):
+    """Motivo por el que check() / validar_lote() rechazan una relación."""
+
+    PERSONA_NO_ENCONTRADA = 1
+    PROPIO_PADRE = 2
+    RELACION_REPETIDA = 3
+    LIMITE_PADRES = 4
+    SON_PAREJA = 5
+    CICLO_TEMPORAL = 6
+    PROPIA_PAREJA = 7
+    YA_TIENE_PAREJA = 8
+    PADRE_HIJO_COMO_PAREJA = 9
+
+
+class ResultadoValidacion(NamedTuple):
+    """
+    Registro compacto de una relación inválida.
+
+    Solo guarda el código y los IDs involucrados; la excepción y su mensaje
+    se construyen recién al pedirlos, resolviendo los nombres contra las
+    personas del repositorio.
+
+    Significado de los IDs según el código:
+        PERSONA_NO_ENCONTRADA: persona1_id es el ID inexistente
+        YA_TIENE_PAREJA: persona1_id ya está en pareja con persona2_id
+        PADRE_HIJO_COMO_PAREJA: persona1_id es padre de persona2_id
+        resto de relaciones "hijo": (padre_id, hijo_id)
+        PROPIA_PAREJA: (persona1_id, persona2_id) de la relación
+    """
+
+    codigo: CodigoValidacion
+    persona1_id: int
+    persona2_id: int
+    posicion: int = 0
+
+    def a_excepcion(self, personas: Mapping[int, "Persona"]) -> ArbolGenealogicoError:
+        """Construye la misma excepción que lanzaría FamilyValidator.validar()."""
+        codigo = self.codigo
+        if codigo == CodigoValidacion.PERSONA_NO_ENCONTRADA:
+            return PersonaNoEncontradaError(persona_id=self.persona1_id)
+
+        nombre1 = personas[self.persona1_id].nombre
+        nombre2 = personas[self.persona2_id].nombre
+        match codigo:
+            case CodigoValidacion.PROPIO_PADRE:
+                return RelacionInvalidaError(
+                    message=f"{nombre1} no puede ser su propio padre",
+                    persona1_nombre=nombre1,
+                    persona2_nombre=nombre2,
+                    tipo_relacion="padre-hijo",
+                )
+            case CodigoValidacion.RELACION_REPETIDA:
+                return RelacionInvalidaError(
+                    message=f"{nombre1} ya es padre de {nombre2}",
+                    persona1_nombre=nombre1,
+                    persona2_nombre=nombre2,
+                    tipo_relacion="padre-hijo",
+                )
+            case CodigoValidacion.LIMITE_PADRES:
+                return LimitePadresExcedidoError(persona_nombre=nombre2)
+            case CodigoValidacion.SON_PAREJA:
+                return RelacionIncestuosaError(nombre2, nombre1, "padre-hijo")
+            case CodigoValidacion.CICLO_TEMPORAL:
+                return CicloTemporalError(nombre2, nombre1)
+            case CodigoValidacion.PROPIA_PAREJA:
+                return RelacionInvalidaError(f"{nombre1} no puede ser su propia pareja")
+            case CodigoValidacion.YA_TIENE_PAREJA:
+                return RelacionInvalidaError(f"{nombre1} ya tiene una pareja: {nombre2}.")
+            case CodigoValidacion.PADRE_HIJO_COMO_PAREJA:
+                return RelacionIncestuosaError(
+                    persona1_nombre=nombre1,
+                    persona2_nombre=nombre2,
+                    tipo_intento="pareja",
+                )
+
+    def mensaje(self, personas: Mapping[int, "Persona"]) -> str:
+        """Mensaje legible del error (el de la excepción equivalente)."""
+        return str(self.a_excepcion(personas))
+
+
+class CacheAncestros:
+    """
+    Memo reutilizable de ancestros por persona para la detección de ciclos.
+
+    Guarda, para cada ID consultado, el conjunto inmutable de IDs de sus
+    ancestros, calculado a partir de los conjuntos (ya memorizados) de sus
+    padres. El repositorio dueño debe invalidarlo ante cada mutación de
+    relaciones padre-hijo: al agregar un hijo solo cambian los ancestros
+    del hijo y sus descendientes, y al eliminar una persona se vacía.
+    """
+
+    def __init__(self):
+        self._ancestros: dict[int, frozenset[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ancestros)
+
+    def ancestros(self, persona: "Persona") -> frozenset[int]:
+        """
+        Retorna los IDs de todos los ancestros de la persona.
+
+        Recorre hacia arriba con pila explícita (post-orden), calculando
+        solo los conjuntos que no estén memorizados.
+        """
+        memo = self._ancestros
+        pila = [persona]
+        while pila:
+            actual = pila[-1]
+            if actual.id in memo:
+                pila.pop()
+                continue
+            padres = [p for p in actual.padres if p is not None]
+            pendientes = [p for p in padres if p.id not in memo]
+            if pendientes:
+                pila.extend(pendientes)
+                continue
+            ancestros: set[int] = set()
+            for p in padres:
+                ancestros.add(p.id)
+                ancestros |= memo[p.id]
+            memo[actual.id] = frozenset(ancestros)
+            pila.pop()
+        return memo[persona.id]
+
+    def invalidar_descendientes(self, persona: "Persona") -> None:
+        """Descarta los conjuntos de la persona y de todos sus descendientes."""
+        pendientes = [persona]
+        visitados: set[int] = set()
+        while pendientes:
+            actual = pendientes.pop()
+            if actual.id in visitados:
+                continue
+            visitados.add(actual.id)
+            self._ancestros.pop(actual.id, None)
+            pendientes.extend(actual.hijos)
+
+    def invalidar(self) -> None:
+        """Descarta todo el memo."""
+        self._ancestros.clear()
+
+
 class FamilyValidator:  # funcionará como validador de relaciones
     """Clase que valida las relaciones entre personas.
 
@@ -30,9 +179,16 @@ class FamilyValidator:  # funcionará como validador de relaciones
     datos primitivos (ID), la otra valida relaciones complejas entre objetos.
     """
 
-    def __init__(self, personas_existentes: dict[int, "Persona"]):
-        self.personas_existentes: dict[int, "Persona"] = personas_existentes
-        logger.debug(f"FamilyValidator inicializado con {len(personas_existentes)} personas")
+    def __init__(
+        self,
+        personas_existentes: Mapping[int, "Persona"],
+        cache_ancestros: Optional["CacheAncestros"] = None,
+        detector_ciclos: Optional["DetectorCiclos"] = None,
+    ):
+        self.personas_existentes: Mapping[int, "Persona"] = personas_existentes
+        self.cache_ancestros: Optional[CacheAncestros] = cache_ancestros
+        self.detector_ciclos: Optional[DetectorCiclos] = detector_ciclos
+        logger.debug("FamilyValidator inicializado con %s personas", len(personas_existentes))
 
     def validar(self, persona1: "Persona", persona2: "Persona", relacion: str):
         """
@@ -45,7 +201,12 @@ class FamilyValidator:  # funcionará como validador de relaciones
             ValueError: Si la relación es inválida
         """
         logger.debug(
-            f"Validando relación '{relacion}': {persona1.nombre} (ID: {persona1.id}) <-> {persona2.nombre} (ID: {persona2.id})"  # noqa: E501
+            "Validando relación '%s': %s (ID: %s) <-> %s (ID: %s)",
+            relacion,
+            persona1.nombre,
+            persona1.id,
+            persona2.nombre,
+            persona2.id,
         )
 
         match relacion:
@@ -58,7 +219,7 @@ class FamilyValidator:  # funcionará como validador de relaciones
             case "hijo":
                 self._validar_hijo(persona1, persona2)
             case _:
-                logger.error(f"Tipo de relación inválida: {relacion}")
+                logger.error("Tipo de relación inválida: %s", relacion)
                 raise RelacionInvalidaError(
                     message=f"Tipo de relación inválida: {relacion}",
                     tipo_relacion=relacion,
@@ -68,12 +229,13 @@ class FamilyValidator:  # funcionará como validador de relaciones
         """
         Valida que la persona pueda ser hijo de otra persona
         """
-        logger.debug(f"Validando relación padre-hijo: {padre.nombre} -> {hijo.nombre}")
+        logger.debug("Validando relación padre-hijo: %s -> %s", padre.nombre, hijo.nombre)
 
         # regla 1: no puede ser su propio padre
         if padre.id == hijo.id:
             logger.warning(
-                f"Intento de relación padre-hijo inválida: {padre.nombre} no puede ser su propio padre"  # noqa: E501
+                "Intento de relación padre-hijo inválida: %s no puede ser su propio padre",
+                padre.nombre,
             )
             raise RelacionInvalidaError(
                 message=f"{padre.nombre} no puede ser su propio padre",
@@ -81,18 +243,31 @@ class FamilyValidator:  # funcionará como validador de relaciones
                 persona2_nombre=hijo.nombre,
                 tipo_relacion="padre-hijo",
             )
-        # regla 2: maximo 2 padres
+        # regla 2: no se repite una relación que ya existe
+        if any(p is not None and p.id == padre.id for p in hijo.padres):
+            logger.warning(
+                "Intento de relación padre-hijo repetida: %s ya es padre de %s",
+                padre.nombre,
+                hijo.nombre,
+            )
+            raise RelacionInvalidaError(
+                message=f"{padre.nombre} ya es padre de {hijo.nombre}",
+                persona1_nombre=padre.nombre,
+                persona2_nombre=hijo.nombre,
+                tipo_relacion="padre-hijo",
+            )
+        # regla 3: maximo 2 padres
         self._limite_padres(hijo)
 
-        # regla 3: no puede ser pareja de su propio padre
+        # regla 4: no puede ser pareja de su propio padre
         self._no_pareja_descendiente(hijo, padre)
 
-        # regla 4: deteccion de ciclos, ej.:
+        # regla 5: deteccion de ciclos, ej.:
         # A es hijo de B, B es hijo de C, C es hijo de A.
         # No crear bucles infinitos
         self._deteccion_ciclos(hijo, padre)
 
-        logger.debug(f"Validación padre-hijo exitosa: {padre.nombre} -> {hijo.nombre}")
+        logger.debug("Validación padre-hijo exitosa: %s -> %s", padre.nombre, hijo.nombre)
 
     def _limite_padres(self, persona: "Persona") -> None:
         """
@@ -102,11 +277,12 @@ class FamilyValidator:  # funcionará como validador de relaciones
         Raises:
             ValueError: Si la persona ya tiene 2 padres
         """
-        padres_count = len([p for p in persona.padres if p is not None])
-        logger.debug(f"Verificando límite de padres para {persona.nombre}: {padres_count}/2")
+        if logger.isEnabledFor(logging.DEBUG):
+            padres_count = sum(p != SIN_ID for p in persona.padres_ids)
+            logger.debug("Verificando límite de padres para %s: %s/2", persona.nombre, padres_count)
 
         if persona.padres[0] is not None and persona.padres[1] is not None:
-            logger.warning(f"Límite de padres excedido para {persona.nombre}: ya tiene 2 padres")
+            logger.warning("Límite de padres excedido para %s: ya tiene 2 padres", persona.nombre)
             raise LimitePadresExcedidoError(
                 persona_nombre=persona.nombre,
             )
@@ -133,47 +309,310 @@ class FamilyValidator:  # funcionará como validador de relaciones
         Raises:
             ValueError: Si existe relación de pareja entre ambos
         """
-        logger.debug(f"Validando que {hijo.nombre} y {padre.nombre} no sean pareja")
+        logger.debug("Validando que %s y %s no sean pareja", hijo.nombre, padre.nombre)
 
         if (hijo.pareja is not None) and (hijo.pareja.id == padre.id):
             logger.warning(
-                f"Relación inválida detectada: {hijo.nombre} y {padre.nombre} son pareja"
+                "Relación inválida detectada: %s y %s son pareja", hijo.nombre, padre.nombre
             )
 
             raise RelacionIncestuosaError(hijo.nombre, padre.nombre, "padre-hijo")
         if (padre.pareja is not None) and (padre.pareja.id == hijo.id):
             logger.warning(
-                f"Relación inválida detectada: {padre.nombre} y {hijo.nombre} son pareja"
+                "Relación inválida detectada: %s y %s son pareja", padre.nombre, hijo.nombre
             )
             raise RelacionIncestuosaError(padre.nombre, hijo.nombre, "padre-hijo")
 
     def _deteccion_ciclos(self, hijo: "Persona", padre: "Persona"):
         """
-        Funcion recursiva que detecta ciclos en el arbol genealógico
+        Detecta si la relación padre-hijo cerraría un ciclo en el árbol genealógico.
+
+        Usa el detector de ciclos del repositorio si lo hay (orden topológico
+        incremental); si no, busca al hijo entre los ancestros del padre.
         """
         logger.debug(
-            f"Buscando ciclos temporales: {hijo.nombre} podría ser ancestro de {padre.nombre}?"
+            "Buscando ciclos temporales: %s podría ser ancestro de %s?", hijo.nombre, padre.nombre
         )
 
-        if self._es_ancestro_de(hijo, padre):
-            logger.error(f"¡Ciclo temporal detectado! {hijo.nombre} es ancestro de {padre.nombre}")
+        if self.detector_ciclos is not None:
+            hay_ciclo = self.detector_ciclos.crearia_ciclo(padre.id, hijo.id)
+        else:
+            hay_ciclo = self._es_ancestro_de(hijo, padre)
+
+        if hay_ciclo:
+            logger.error(
+                "¡Ciclo temporal detectado! %s es ancestro de %s", hijo.nombre, padre.nombre
+            )
             raise CicloTemporalError(hijo.nombre, padre.nombre)
 
-        logger.debug(f"No se detectaron ciclos temporales entre {hijo.nombre} y {padre.nombre}")
+        logger.debug("No se detectaron ciclos temporales entre %s y %s", hijo.nombre, padre.nombre)
 
     def _es_ancestro_de(self, buscar: "Persona", inicio: "Persona") -> bool:
         """
-        sube por el arbol desde 'inicio' buscando a 'buscar'
+        Sube por el árbol desde 'inicio' buscando a 'buscar'.
+
+        Búsqueda en profundidad con pila explícita y conjunto de visitados:
+        cada ancestro se explora una sola vez aunque aparezca por varias ramas
+        (colapso de pedigrí por matrimonios entre parientes) y los linajes
+        profundos no agotan el límite de recursión. Termina apenas encuentra
+        a 'buscar'. Si el validador tiene un CacheAncestros, responde desde él.
         """
-        logger.debug(f"Buscando si {buscar.nombre} es ancestro de {inicio.nombre}")
-        # Si no, busca recursivamente en los padres de los padres.
-        for p in inicio.padres:
-            if p is not None:
-                if p.id == buscar.id or self._es_ancestro_de(buscar, p):
-                    logger.debug(f"¡Encontrado! {buscar.nombre} es ancestro de {inicio.nombre}")
-                    return True
+        logger.debug("Buscando si %s es ancestro de %s", buscar.nombre, inicio.nombre)
+
+        if self.cache_ancestros is not None:
+            return buscar.id in self.cache_ancestros.ancestros(inicio)
+
+        pendientes = [p for p in inicio.padres if p is not None]
+        visitados: set[int] = set()
+        while pendientes:
+            actual = pendientes.pop()
+            if actual.id == buscar.id:
+                logger.debug("¡Encontrado! %s es ancestro de %s", buscar.nombre, inicio.nombre)
+                return True
+            if actual.id in visitados:
+                continue
+            visitados.add(actual.id)
+            for p in actual.padres:
+                if p is not None and p.id not in visitados:
+                    pendientes.append(p)
         return False
 
+    # ==================== VALIDACIÓN SIN EXCEPCIONES ====================
+
+    def check(
+        self, persona1: "Persona", persona2: "Persona", relacion: str
+    ) -> Optional["ResultadoValidacion"]:
+        """
+        Valida una relación "hijo" o "pareja" sin lanzar excepciones.
+
+        Aplica las mismas reglas que validar(), pero informa el problema como
+        un registro compacto: no construye excepciones ni formatea mensajes.
+
+        Args:
+            persona1: Padre (relación "hijo") o primera persona (relación "pareja")
+            persona2: Hijo o segunda persona
+            relacion: "hijo" o "pareja"
+
+        Returns:
+            ResultadoValidacion | None: El primer problema encontrado, o None si es válida.
+
+        Raises:
+            RelacionInvalidaError: Si el tipo de relación no es "hijo" ni "pareja"
+        """
+        match relacion:
+            case "hijo":
+                libres = persona2.padres_ids.count(SIN_ID)
+                resultado = self._chequear_hijo(persona1, persona2, libres, False, 0)
+                if resultado is None and self._crearia_ciclo(persona1, persona2):
+                    resultado = ResultadoValidacion(
+                        CodigoValidacion.CICLO_TEMPORAL, persona1.id, persona2.id
+                    )
+                return resultado
+            case "pareja":
+                return self._chequear_pareja(
+                    persona1, persona2, persona1.pareja_id, persona2.pareja_id, 0
+                )
+            case _:
+                raise RelacionInvalidaError(
+                    message=f"Tipo de relación inválida: {relacion}",
+                    tipo_relacion=relacion,
+                )
+
+    def validar_lote(
+        self, pares: Sequence[tuple[int, int]], relacion: str = "hijo"
+    ) -> list["ResultadoValidacion"]:
+        """
+        Valida un lote completo de relaciones dadas como pares de IDs.
+
+        Cada relación se valida como si el lote se aplicara en orden: el cupo
+        de padres y las parejas se descuentan relación por relación. Para
+        "hijo", los ciclos se buscan en el árbol existente más todo el lote con
+        un único orden de Kahn; si el validador tiene un detector de ciclos y
+        todas las relaciones respetan su orden, ese recorrido se omite.
+
+        No lanza excepciones por relaciones inválidas: retorna registros
+        compactos que se formatean solo si hace falta (a_excepcion, mensaje).
+
+        Args:
+            pares: (padre_id, hijo_id) para "hijo"; (persona1_id, persona2_id) para "pareja"
+            relacion: "hijo" o "pareja"
+
+        Returns:
+            list[ResultadoValidacion]: Un registro por relación inválida, ordenados
+                por posición. Vacía si el lote es válido.
+
+        Raises:
+            RelacionInvalidaError: Si el tipo de relación no es "hijo" ni "pareja"
+        """
+        match relacion:
+            case "hijo":
+                resultados = self._validar_lote_hijos(pares)
+            case "pareja":
+                resultados = self._validar_lote_parejas(pares)
+            case _:
+                raise RelacionInvalidaError(
+                    message=f"Tipo de relación inválida: {relacion}",
+                    tipo_relacion=relacion,
+                )
+        logger.debug("Lote de %s relación(es) validado: %s error(es)", len(pares), len(resultados))
+        return resultados
+
+    def _crearia_ciclo(self, padre: "Persona", hijo: "Persona") -> bool:
+        if self.detector_ciclos is not None:
+            return self.detector_ciclos.crearia_ciclo(padre.id, hijo.id)
+        return self._es_ancestro_de(hijo, padre)
+
+    @staticmethod
+    def _chequear_hijo(
+        padre: "Persona", hijo: "Persona", libres: int, repetida: bool, posicion: int
+    ) -> Optional["ResultadoValidacion"]:
+        """Reglas de validar(..., "hijo") salvo ciclos, como registro compacto."""
+        padre_id = padre.id
+        hijo_id = hijo.id
+        if padre_id == hijo_id:
+            return ResultadoValidacion(CodigoValidacion.PROPIO_PADRE, padre_id, hijo_id, posicion)
+        if repetida or padre_id in hijo.padres_ids:
+            return ResultadoValidacion(
+                CodigoValidacion.RELACION_REPETIDA, padre_id, hijo_id, posicion
+            )
+        if libres == 0:
+            return ResultadoValidacion(CodigoValidacion.LIMITE_PADRES, padre_id, hijo_id, posicion)
+        if hijo.pareja_id == padre_id or padre.pareja_id == hijo_id:
+            return ResultadoValidacion(CodigoValidacion.SON_PAREJA, padre_id, hijo_id, posicion)
+        return None
+
+    @staticmethod
+    def _chequear_pareja(
+        persona1: "Persona", persona2: "Persona", pareja1_id: int, pareja2_id: int, posicion: int
+    ) -> Optional["ResultadoValidacion"]:
+        """Reglas de validar(..., "pareja") como registro compacto."""
+        id1 = persona1.id
+        id2 = persona2.id
+        if id1 == id2:
+            return ResultadoValidacion(CodigoValidacion.PROPIA_PAREJA, id1, id2, posicion)
+        if pareja1_id != SIN_ID:
+            return ResultadoValidacion(CodigoValidacion.YA_TIENE_PAREJA, id1, pareja1_id, posicion)
+        if pareja2_id != SIN_ID:
+            return ResultadoValidacion(CodigoValidacion.YA_TIENE_PAREJA, id2, pareja2_id, posicion)
+        if id1 in persona2.padres_ids:
+            return ResultadoValidacion(CodigoValidacion.PADRE_HIJO_COMO_PAREJA, id1, id2, posicion)
+        if id2 in persona1.padres_ids:
+            return ResultadoValidacion(CodigoValidacion.PADRE_HIJO_COMO_PAREJA, id2, id1, posicion)
+        return None
+
+    def _validar_lote_hijos(self, pares: Sequence[tuple[int, int]]) -> list["ResultadoValidacion"]:
+        personas = self.personas_existentes
+        resultados: list[ResultadoValidacion] = []
+        validas: list[int] = []
+        cupo_padres: dict[int, int] = {}
+        vistas: set[tuple[int, int]] = set()
+
+        for posicion, par in enumerate(pares):
+            padre_id, hijo_id = par
+            padre = personas.get(padre_id)
+            hijo = personas.get(hijo_id)
+            if padre is None or hijo is None:
+                faltante = padre_id if padre is None else hijo_id
+                resultados.append(
+                    ResultadoValidacion(
+                        CodigoValidacion.PERSONA_NO_ENCONTRADA, faltante, SIN_ID, posicion
+                    )
+                )
+                continue
+            libres = cupo_padres.get(hijo_id)
+            if libres is None:
+                libres = hijo.padres_ids.count(SIN_ID)
+            resultado = self._chequear_hijo(padre, hijo, libres, par in vistas, posicion)
+            if resultado is not None:
+                resultados.append(resultado)
+                continue
+            cupo_padres[hijo_id] = libres - 1
+            vistas.add(par)
+            validas.append(posicion)
+
+        resultados.extend(self._ciclos_en_lote(pares, validas))
+        resultados.sort(key=lambda resultado: resultado.posicion)
+        return resultados
+
+    def _validar_lote_parejas(
+        self, pares: Sequence[tuple[int, int]]
+    ) -> list["ResultadoValidacion"]:
+        personas = self.personas_existentes
+        resultados: list[ResultadoValidacion] = []
+        # Parejas asignadas por relaciones anteriores del mismo lote
+        parejas_lote: dict[int, int] = {}
+
+        for posicion, (id1, id2) in enumerate(pares):
+            persona1 = personas.get(id1)
+            persona2 = personas.get(id2)
+            if persona1 is None or persona2 is None:
+                faltante = id1 if persona1 is None else id2
+                resultados.append(
+                    ResultadoValidacion(
+                        CodigoValidacion.PERSONA_NO_ENCONTRADA, faltante, SIN_ID, posicion
+                    )
+                )
+                continue
+            pareja1_id = parejas_lote.get(id1, persona1.pareja_id)
+            pareja2_id = parejas_lote.get(id2, persona2.pareja_id)
+            resultado = self._chequear_pareja(persona1, persona2, pareja1_id, pareja2_id, posicion)
+            if resultado is not None:
+                resultados.append(resultado)
+                continue
+            parejas_lote[id1] = id2
+            parejas_lote[id2] = id1
+        return resultados
+
+    def _ciclos_en_lote(
+        self, pares: Sequence[tuple[int, int]], validas: list[int]
+    ) -> list["ResultadoValidacion"]:
+        """
+        Busca las relaciones del lote que forman parte de un ciclo.
+
+        Una relación padre -> hijo cierra un ciclo si, en el árbol con el lote
+        aplicado, ambos quedan en la misma componente fuertemente conexa. Si
+        hay un detector de ciclos, primero se le pregunta a él.
+        """
+        detector = self.detector_ciclos
+        if detector is not None:
+            del_detector = detector.relaciones_en_ciclo([pares[i] for i in validas])
+            if del_detector is not None:
+                return self._resultados_ciclo(pares, [validas[i] for i in del_detector])
+
+        personas = self.personas_existentes
+        hijos_nuevos: dict[int, list[int]] = {}
+        for posicion in validas:
+            padre_id, hijo_id = pares[posicion]
+            hijos_nuevos.setdefault(padre_id, []).append(hijo_id)
+
+        def sucesores(persona_id: int) -> Sequence[int]:
+            existentes = personas[persona_id].hijos_ids
+            nuevos = hijos_nuevos.get(persona_id)
+            return existentes if nuevos is None else [*existentes, *nuevos]
+
+        _, restantes = ordenar_topologicamente(personas.keys(), sucesores)
+        if not restantes:
+            return []
+
+        componente = componentes_fuertes(restantes, sucesores)
+        en_ciclo: list[int] = []
+        for posicion in validas:
+            padre_id, hijo_id = pares[posicion]
+            if hijo_id in componente and componente.get(padre_id) == componente[hijo_id]:
+                en_ciclo.append(posicion)
+        return self._resultados_ciclo(pares, en_ciclo)
+
+    @staticmethod
+    def _resultados_ciclo(
+        pares: Sequence[tuple[int, int]], en_ciclo: list[int]
+    ) -> list["ResultadoValidacion"]:
+        if en_ciclo:
+            logger.warning("Ciclos temporales en el lote: %s relación(es)", len(en_ciclo))
+        return [
+            ResultadoValidacion(CodigoValidacion.CICLO_TEMPORAL, *pares[posicion], posicion)
+            for posicion in en_ciclo
+        ]
+
     def validar_id(self, id_nuevo: Optional[int]):
         """
         Valida un identificador antes de crear una nueva persona.
@@ -189,48 +628,48 @@ class FamilyValidator:  # funcionará como validador de relaciones
         Raises:
             ValueError: Si el ID es inválido, nulo, o ya existe
         """
-        logger.debug(f"Validando ID: {id_nuevo}")
+        logger.debug("Validando ID: %s", id_nuevo)
 
         if id_nuevo is None:
             logger.warning("Intento de usar ID nulo")
             raise IDInvalidoError("El id no puede ser nulo")
 
         if id_nuevo <= 0:
-            logger.warning(f"ID inválido (debe ser positivo): {id_nuevo}")
+            logger.warning("ID inválido (debe ser positivo): %s", id_nuevo)
             raise IDInvalidoError(f"El id {id_nuevo} debe ser un entero positivo")
 
         if id_nuevo in self.personas_existentes:
             persona_existente = self.personas_existentes[id_nuevo]
-            logger.warning(f"ID {id_nuevo} ya existe: pertenece a {persona_existente.nombre}")
+            logger.warning("ID %s ya existe: pertenece a %s", id_nuevo, persona_existente.nombre)
             raise IDInvalidoError(f"El id {id_nuevo} ya pertenece a otra persona")
 
-        logger.debug(f"ID {id_nuevo} validado exitosamente")
+        logger.debug("ID %s validado exitosamente", id_nuevo)
 
     def _validar_pareja(self, persona1: "Persona", persona2: "Persona") -> None:
         """Valida que persona1 y persona2 puedan ser pareja
         Args: persona1, persona2 (Persona)
         """
-        logger.debug(f"Validando relación de pareja: {persona1.nombre} <-> {persona2.nombre}")
+        logger.debug("Validando relación de pareja: %s <-> %s", persona1.nombre, persona2.nombre)
 
         if persona1.id == persona2.id:
-            logger.warning(f"Intento de relación de pareja consigo mismo: {persona1.nombre}")
+            logger.warning("Intento de relación de pareja consigo mismo: %s", persona1.nombre)
             raise RelacionInvalidaError(f"{persona1.nombre} no puede ser su propia pareja")
 
         if persona1.pareja is not None:
-            logger.warning(f"{persona1.nombre} ya tiene pareja: {persona1.pareja.nombre}")
+            logger.warning("%s ya tiene pareja: %s", persona1.nombre, persona1.pareja.nombre)
             raise RelacionInvalidaError(
                 f"{persona1.nombre} ya tiene una pareja: {persona1.pareja.nombre}."
             )
 
         if persona2.pareja is not None:
-            logger.warning(f"{persona2.nombre} ya tiene pareja: {persona2.pareja.nombre}")
+            logger.warning("%s ya tiene pareja: %s", persona2.nombre, persona2.pareja.nombre)
             raise RelacionInvalidaError(
                 f"{persona2.nombre} ya tiene una pareja: {persona2.pareja.nombre}."
             )
 
         if persona1.id in [p.id for p in persona2.padres if p is not None]:
             logger.warning(
-                f"Relación padre-hijo detectada: {persona1.nombre} es padre de {persona2.nombre}"
+                "Relación padre-hijo detectada: %s es padre de %s", persona1.nombre, persona2.nombre
             )
             raise RelacionIncestuosaError(
                 persona1_nombre=persona1.nombre,
@@ -240,7 +679,7 @@ class FamilyValidator:  # funcionará como validador de relaciones
 
         if persona2.id in [p.id for p in persona1.padres if p is not None]:
             logger.warning(
-                f"Relación padre-hijo detectada: {persona2.nombre} es padre de {persona1.nombre}"
+                "Relación padre-hijo detectada: %s es padre de %s", persona2.nombre, persona1.nombre
             )
             raise RelacionIncestuosaError(
                 persona1_nombre=persona2.nombre,
@@ -248,14 +687,14 @@ class FamilyValidator:  # funcionará como validador de relaciones
                 tipo_intento="pareja",
             )
 
-        logger.debug(f"Validación de pareja exitosa: {persona1.nombre} <-> {persona2.nombre}")
+        logger.debug("Validación de pareja exitosa: %s <-> %s", persona1.nombre, persona2.nombre)
 
     def _validar_remover_pareja(self, persona1: "Persona", persona2: "Persona") -> None:
         """
         Valida que persona1 y persona2 puedan ser removidas de su pareja.
         Args: persona1, persona2 (Persona)
         """
-        logger.debug(f"Validando remover pareja: {persona1.nombre} <-> {persona2.nombre}")
+        logger.debug("Validando remover pareja: %s <-> %s", persona1.nombre, persona2.nombre)
 
         try:
             if persona1.pareja is None or persona2.pareja is None:
@@ -266,13 +705,13 @@ class FamilyValidator:  # funcionará como validador de relaciones
 
             if (persona1.pareja.id != persona2.id) or (persona2.pareja.id != persona1.id):
                 logger.warning(
-                    f"{persona1.nombre} y {persona2.nombre} no son pareja según registros"
+                    "%s y %s no son pareja según registros", persona1.nombre, persona2.nombre
                 )
                 raise ParejaNoExisteError(persona1.nombre, persona2.nombre, razon="no son pareja")
 
             logger.debug("Validación para remover pareja exitosa")
         except ValueError as e:
-            logger.warning(f"Error al validar remover pareja: {e}")
+            logger.warning("Error al validar remover pareja: %s", e)
             raise ValueError(f"Error al validar remover pareja: {e}")
 
     @staticmethod
@@ -281,12 +720,14 @@ class FamilyValidator:  # funcionará como validador de relaciones
         Valida el impacto de eliminar una persona.
         Args: persona (Persona)
         """
-        logger.debug(f"Validando impacto de eliminación para {persona.nombre}")
+        logger.debug("Validando impacto de eliminación para %s", persona.nombre)
 
         if persona.hijos:
             logger.warning(
-                f"Intento de eliminar persona con descendientes: {persona.nombre} tiene {len(persona.hijos)} hijo(s)"  # noqa: E501
+                "Intento de eliminar persona con descendientes: %s tiene %s hijo(s)",
+                persona.nombre,
+                len(persona.hijos),
             )
             raise EliminacionConDescendientesError(persona.nombre, len(persona.hijos))
 
-        logger.debug(f"Validación de impacto de eliminación exitosa para {persona.nombre}")
+        logger.debug("Validación de impacto de eliminación exitosa para %s", persona.nombre)
@@ -0,0 +1,496 @@
+"""
+Versiones inmutables del árbol con estructura compartida (copy-on-write).
+
+Una VersionArbol es una foto del árbol que nunca cambia: se puede leer
+desde muchos hilos sin locks mientras el escritor publica versiones nuevas
+(ver ArbolVersionado en src/repository_versionado.py).
+
+Las personas se guardan, por ID, en un VectorPersistente: un trie de 32
+ramas cuyos nodos son tuplas. Cambiar una persona copia solo el camino de
+la raíz a su hoja (log32 n nodos, 4 para un millón de personas) y el resto
+del trie se comparte con la versión anterior, así que publicar una versión
+cuesta O(log n) por persona modificada y fijar una para leer es O(1).
+
+Las raíces se llevan de versión en versión de la misma forma, y los índices
+de búsqueda se comparten entre las versiones de una misma línea: cada
+versión nueva solo les agrega las personas que dio de alta, en lugar de
+reconstruirlos.
+"""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain, groupby
+from typing import (
+    TYPE_CHECKING,
+    Generic,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    TypeAlias,
+    TypeVar,
+    cast,
+)
+
+from .exceptions import ArbolSoloLecturaError, PersonaNoEncontradaError
+from .indices import IndicesBusqueda, normalizar_nombre
+from .models import SIN_ID, Persona, PersonaVista
+from .recorrido_paralelo import recorrer_en_paralelo
+from .utils.logger import get_logger
+from .visitors import recorrer_fusionado
+
+if TYPE_CHECKING:
+    from .visitors import ArbolVisitorInterface
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_BITS = 5
+_ANCHO = 1 << _BITS
+_MASCARA = _ANCHO - 1
+# Nodo del trie: 32 hijos (nodos o None) o, en las hojas, 32 valores (o None)
+_Nodo: TypeAlias = tuple[object, ...]
+_VACIO: _Nodo = (None,) * _ANCHO
+
+
+class VectorPersistente(Generic[T]):
+    """
+    Mapa inmutable de enteros no negativos a valores, como trie de 32 ramas.
+
+    asignar() no modifica el vector: retorna uno nuevo que comparte con
+    este todos los nodos que no cambiaron. Las posiciones sin valor valen None.
+    """
+
+    __slots__ = ("_raiz", "_desplazamiento")
+
+    def __init__(self, raiz: _Nodo = _VACIO, desplazamiento: int = 0):
+        self._raiz = raiz
+        # Bits del índice que resuelve el nivel de la raíz (0 = la raíz es hoja)
+        self._desplazamiento = desplazamiento
+
+    def get(self, indice: int) -> Optional[T]:
+        """Retorna el valor en ``indice`` o None si no hay."""
+        desplazamiento = self._desplazamiento
+        if indice < 0 or indice >> (desplazamiento + _BITS):
+            return None
+        nodo: Optional[_Nodo] = self._raiz
+        # Los tipos de cast() van como texto: así no se evalúan en cada vuelta
+        while desplazamiento:
+            nodo = cast("Optional[_Nodo]", nodo[(indice >> desplazamiento) & _MASCARA])
+            if nodo is None:
+                return None
+            desplazamiento -= _BITS
+        return cast("Optional[T]", nodo[indice & _MASCARA])
+
+    def asignar(self, cambios: Iterable[tuple[int, Optional[T]]]) -> "VectorPersistente[T]":
+        """
+        Retorna un vector con los cambios (índice, valor) aplicados.
+
+        Los cambios se aplican juntos: cada nodo afectado se copia una sola
+        vez. Un valor None borra la posición.
+        """
+        ordenados = sorted(cambios, key=lambda cambio: cambio[0])
+        if not ordenados:
+            return self
+        if ordenados[0][0] < 0:
+            raise ValueError("Los índices de un VectorPersistente no pueden ser negativos")
+        raiz: _Nodo = self._raiz
+        desplazamiento = self._desplazamiento
+        # Agregar niveles hasta que el índice más grande entre en el trie
+        while ordenados[-1][0] >> (desplazamiento + _BITS):
+            raiz = (raiz,) + _VACIO[1:]
+            desplazamiento += _BITS
+        return VectorPersistente(_asignar_en(raiz, desplazamiento, ordenados), desplazamiento)
+
+    def items(self) -> Iterator[tuple[int, T]]:
+        """Recorre los pares (índice, valor) no vacíos en orden de índice."""
+        # Las hojas solo guardan valores T (o None, que _recorrer saltea)
+        return cast("Iterator[tuple[int, T]]", _recorrer(self._raiz, self._desplazamiento, 0))
+
+
+def _asignar_en(
+    nodo: Optional[_Nodo], desplazamiento: int, cambios: list[tuple[int, Optional[T]]]
+) -> _Nodo:
+    """Copia ``nodo`` con los cambios (ordenados) que caen debajo de él."""
+    copia: list[object] = list(nodo if nodo is not None else _VACIO)
+    if desplazamiento == 0:
+        for indice, valor in cambios:
+            copia[indice & _MASCARA] = valor
+    else:
+        for rama, grupo in groupby(
+            cambios, key=lambda cambio: (cambio[0] >> desplazamiento) & _MASCARA
+        ):
+            hijo = cast("Optional[_Nodo]", copia[rama])
+            copia[rama] = _asignar_en(hijo, desplazamiento - _BITS, list(grupo))
+    return tuple(copia)
+
+
+def _recorrer(nodo: _Nodo, desplazamiento: int, base: int) -> Iterator[tuple[int, object]]:
+    if desplazamiento == 0:
+        for posicion, valor in enumerate(nodo):
+            if valor is not None:
+                yield base + posicion, valor
+        return
+    for posicion, hijo in enumerate(nodo):
+        if hijo is not None:
+            yield from _recorrer(
+                cast("_Nodo", hijo), desplazamiento - _BITS, base + (posicion << desplazamiento)
+            )
+
+
+class FilaPersona(NamedTuple):
+    """Datos inmutables de una persona dentro de una versión."""
+
+    nombre: str
+    pareja_id: int
+    padres_ids: tuple[int, int]
+    hijos_ids: tuple[int, ...]
+
+    @classmethod
+    def de_persona(cls, persona: Persona) -> "FilaPersona":
+        return cls(persona.nombre, persona.pareja_id, persona.padres_ids, tuple(persona.hijos_ids))
+
+
+class _IndicesCompartidos:
+    """
+    Índices de búsqueda comunes a las versiones de una misma línea.
+
+    Solo reciben altas: una persona eliminada sigue indexada porque las
+    versiones anteriores la contienen, y cada versión descarta de los
+    resultados los IDs que no tiene. Alcanza con eso porque ni el ID ni el
+    nombre de una persona cambian, y los IDs no se reutilizan.
+
+    Se construyen en la primera búsqueda. Hasta entonces guardan las filas
+    de la última versión más las personas eliminadas desde la primera; después,
+    las altas de cada versión nueva quedan pendientes hasta la próxima
+    búsqueda, así el escritor no paga el costo de indexar.
+    """
+
+    def __init__(self, numero: int, filas: VectorPersistente[FilaPersona]):
+        # Protege los índices: las búsquedas los modifican al incorporar pendientes
+        self._lock = threading.Lock()
+        # Última versión de la línea: solo ella puede agregar altas
+        self._numero = numero
+        # Filas de la última versión mientras los índices no estén construidos
+        self._filas: Optional[VectorPersistente[FilaPersona]] = filas
+        self._pendientes: list[tuple[int, str]] = []
+        self._indices = IndicesBusqueda()
+        self._nombres: dict[str, list[int]] = {}
+
+    def avanzar(
+        self,
+        numero_anterior: int,
+        numero: int,
+        filas: VectorPersistente[FilaPersona],
+        altas: list[tuple[int, str]],
+        bajas: list[tuple[int, str]],
+    ) -> bool:
+        """
+        Incorpora la versión ``numero``, derivada de ``numero_anterior``.
+
+        Returns:
+            bool: False si ``numero_anterior`` no es la última versión de la
+            línea (la nueva versión se bifurca y necesita índices propios).
+        """
+        with self._lock:
+            if self._numero != numero_anterior:
+                return False
+            self._numero = numero
+            if self._filas is not None:
+                self._filas = filas
+                self._pendientes.extend(bajas)
+            else:
+                self._pendientes.extend(altas)
+            return True
+
+    def _al_dia(self) -> None:
+        """Construye los índices o les agrega las altas pendientes (con el lock tomado)."""
+        entradas: Iterable[tuple[int, str]] = self._pendientes
+        if self._filas is not None:
+            filas = ((persona_id, fila.nombre) for persona_id, fila in self._filas.items())
+            entradas = chain(filas, self._pendientes)
+            self._filas = None
+        indices, nombres = self._indices, self._nombres
+        for persona_id, nombre in entradas:
+            indices.agregar(persona_id, nombre)
+            nombres.setdefault(normalizar_nombre(nombre), []).append(persona_id)
+        self._pendientes = []
+
+    def consultar(self, consulta: Callable[[IndicesBusqueda], list[int]]) -> list[int]:
+        """Ejecuta ``consulta`` sobre los índices al día."""
+        with self._lock:
+            self._al_dia()
+            return consulta(self._indices)
+
+    def con_nombre(self, nombre: str) -> list[int]:
+        """Retorna los IDs indexados con el nombre normalizado ``nombre``."""
+        with self._lock:
+            self._al_dia()
+            return list(self._nombres.get(nombre, ()))
+
+
+class _PersonasVersion(Mapping[int, Persona]):
+    """Mapping de solo lectura ID -> PersonaVista de una versión."""
+
+    __slots__ = ("_version",)
+
+    def __init__(self, version: "VersionArbol"):
+        self._version = version
+
+    def __getitem__(self, persona_id: int) -> Persona:
+        if self._version.filas.get(persona_id) is None:
+            raise KeyError(persona_id)
+        return PersonaVista(persona_id, self._version)
+
+    def __contains__(self, persona_id: object) -> bool:
+        return isinstance(persona_id, int) and self._version.filas.get(persona_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return (persona_id for persona_id, _ in self._version.filas.items())
+
+    def __len__(self) -> int:
+        return self._version.cantidad
+
+
+class VersionArbol:
+    """
+    Versión inmutable del árbol genealógico, de solo lectura.
+
+    Implementa las consultas de ArbolRepository y FuentePersonas: las
+    personas se entregan como PersonaVista, que leen siempre esta versión
+    aunque el árbol siga cambiando. Las modificaciones lanzan
+    ArbolSoloLecturaError. Las raíces y los índices de búsqueda vienen de la
+    versión anterior, actualizados solo con las personas que cambiaron.
+    """
+
+    def __init__(
+        self,
+        numero: int,
+        filas: VectorPersistente[FilaPersona],
+        cantidad: int,
+        raices: Optional[VectorPersistente[bool]] = None,
+        indices: Optional[_IndicesCompartidos] = None,
+    ):
+        """
+        Args:
+            numero: Número de versión (crece con cada modificación publicada).
+            filas: Personas de la versión por ID.
+            cantidad: Cantidad de personas en ``filas``.
+            raices: IDs de las personas sin padres; por defecto se calculan
+                recorriendo ``filas``.
+            indices: Índices de búsqueda de la línea de versiones; por
+                defecto, unos nuevos que se construyen en la primera búsqueda.
+        """
+        self.numero = numero
+        self.filas = filas
+        self.cantidad = cantidad
+        self._personas = _PersonasVersion(self)
+        if raices is None:
+            raices = VectorPersistente[bool]().asignar(
+                (persona_id, True)
+                for persona_id, fila in filas.items()
+                if fila.padres_ids == (SIN_ID, SIN_ID)
+            )
+        self._raices = raices
+        self._indices = indices if indices is not None else _IndicesCompartidos(numero, filas)
+
+    @classmethod
+    def vacia(cls) -> "VersionArbol":
+        return cls(0, VectorPersistente(), 0)
+
+    def con_cambios(self, cambios: Mapping[int, Optional[FilaPersona]]) -> "VersionArbol":
+        """
+        Retorna la versión siguiente con las filas de ``cambios`` reemplazadas.
+
+        Un valor None elimina a la persona. Esta versión no se modifica. Las
+        raíces y los índices se actualizan con los cambios, sin recorrer el
+        resto de las personas.
+        """
+        filas = self.filas
+        cantidad = self.cantidad
+        altas: list[tuple[int, str]] = []
+        bajas: list[tuple[int, str]] = []
+        cambios_raices: list[tuple[int, Optional[bool]]] = []
+        for persona_id, fila in cambios.items():
+            anterior = filas.get(persona_id)
+            if anterior is None and fila is not None:
+                altas.append((persona_id, fila.nombre))
+            elif anterior is not None and fila is None:
+                bajas.append((persona_id, anterior.nombre))
+            cantidad += (fila is not None) - (anterior is not None)
+            era_raiz = anterior is not None and anterior.padres_ids == (SIN_ID, SIN_ID)
+            es_raiz = fila is not None and fila.padres_ids == (SIN_ID, SIN_ID)
+            if era_raiz != es_raiz:
+                cambios_raices.append((persona_id, True if es_raiz else None))
+        numero = self.numero + 1
+        filas = filas.asignar(cambios.items())
+        indices = self._indices
+        if not indices.avanzar(self.numero, numero, filas, altas, bajas):
+            # Versión que se bifurca de una anterior: sus índices no se comparten
+            indices = _IndicesCompartidos(numero, filas)
+        return VersionArbol(numero, filas, cantidad, self._raices.asignar(cambios_raices), indices)
+
+    def _fila(self, persona_id: int) -> FilaPersona:
+        fila = self.filas.get(persona_id)
+        if fila is None:
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return fila
+
+    @property
+    def personas(self) -> Mapping[int, Persona]:
+        return self._personas
+
+    # ==================== FuentePersonas ====================
+
+    def nombre_de(self, persona_id: int) -> str:
+        return self._fila(persona_id).nombre
+
+    def pareja_de(self, persona_id: int) -> int:
+        return self._fila(persona_id).pareja_id
+
+    def padres_de(self, persona_id: int) -> tuple[int, int]:
+        return self._fila(persona_id).padres_ids
+
+    def hijos_de(self, persona_id: int) -> Sequence[int]:
+        return self._fila(persona_id).hijos_ids
+
+    def vista(self, persona_id: int) -> Optional[Persona]:
+        if persona_id == SIN_ID:
+            return None
+        return PersonaVista(persona_id, self)
+
+    def asignar_pareja(self, persona_id: int, pareja_id: int) -> None:
+        self._rechazar("asignar_pareja")
+
+    def asignar_padres(self, persona_id: int, padre0_id: int, padre1_id: int) -> None:
+        self._rechazar("asignar_padres")
+
+    # ==================== ArbolRepository: consultas ====================
+
+    def get_persona(self, persona_id: int) -> Persona:
+        """
+        Devuelve una vista de la persona con el ID especificado.
+
+        Raises:
+            PersonaNoEncontradaError: Si la persona no está en esta versión.
+        """
+        if self.filas.get(persona_id) is None:
+            logger.warning("Persona con ID %s no encontrada", persona_id)
+            raise PersonaNoEncontradaError(persona_id=persona_id)
+        return PersonaVista(persona_id, self)
+
+    def buscar_por_nombre(self, nombre: str) -> list[Persona]:
+        """Busca personas por nombre exacto normalizado, en orden de ID."""
+        ids = self._indices.con_nombre(normalizar_nombre(nombre))
+        return self._vigentes(sorted(ids))
+
+    def buscar_por_prefijo(self, prefijo: str, limite: int = 10) -> list[Persona]:
+        """Busca personas cuyo nombre empieza con ``prefijo``, en orden alfabético."""
+        # Los índices pueden traer personas de otras versiones: se piden más
+        # hasta completar ``limite`` con las de esta o agotar el prefijo
+        pedidos = limite
+        while True:
+            ids = self._indices.consultar(lambda indices: indices.prefijos.buscar(prefijo, pedidos))
+            personas = self._vigentes(ids)
+            if len(personas) >= limite or len(ids) < pedidos:
+                return personas[:limite]
+            pedidos *= 2
+
+    def buscar_aproximado(self, nombre: str, distancia_maxima: int = 2) -> list[Persona]:
+        """Busca personas a ``distancia_maxima`` ediciones o menos, de la más parecida."""
+        return self._vigentes(
+            self._indices.consultar(lambda indices: indices.difuso.buscar(nombre, distancia_maxima))
+        )
+
+    def buscar_por_subcadena(self, texto: str) -> list[Persona]:
+        """Busca personas cuyo nombre contiene ``texto``, ordenadas por ID."""
+        return self._vigentes(
+            self._indices.consultar(lambda indices: indices.trigramas.buscar_subcadena(texto))
+        )
+
+    def buscar_por_regex(self, patron: str) -> list[Persona]:
+        """Busca personas cuyo nombre coincide con la regex, ordenadas por ID."""
+        return self._vigentes(
+            self._indices.consultar(lambda indices: indices.trigramas.buscar_regex(patron))
+        )
+
+    def buscar_por_palabras(self, consulta: str) -> list[Persona]:
+        """Busca personas por palabras (AND/OR, sin acentos), ordenadas por ID."""
+        return self._vigentes(
+            self._indices.consultar(lambda indices: indices.tokens.buscar(consulta))
+        )
+
+    def buscar_fonetico(self, nombre: str) -> list[Persona]:
+        """Busca personas cuyo nombre suena como ``nombre``, ordenadas por ID."""
+        return self._vigentes(
+            self._indices.consultar(lambda indices: indices.fonetico.buscar(nombre))
+        )
+
+    def init_get_root(self) -> list[Persona]:
+        """Devuelve las personas sin padres, ordenadas por ID."""
+        return [PersonaVista(persona_id, self) for persona_id, _ in self._raices.items()]
+
+    def recorrer_arbol_completo(
+        self,
+        visitor: "ArbolVisitorInterface",
+        *otros_visitors: "ArbolVisitorInterface",
+        procesos: int = 1,
+    ) -> None:
+        """
+        Recorre la versión completa desde cada raíz, con varios visitors en una sola pasada.
+
+        Con ``procesos`` distinto de 1 los linajes independientes se recorren en paralelo.
+        """
+        visitors = (visitor, *otros_visitors)
+        logger.debug(
+            "Recorriendo versión %s con visitor(s): %s",
+            self.numero,
+            ", ".join(type(v).__name__ for v in visitors),
+        )
+        if procesos == 1:
+            recorrer_fusionado(self.init_get_root(), visitors)
+        else:
+            recorrer_en_paralelo(self.init_get_root(), self.personas, visitors, procesos or None)
+
+    def _vigentes(self, ids: Iterable[int]) -> list[Persona]:
+        """Vistas de los ``ids`` que están en esta versión, en el mismo orden."""
+        filas = self.filas
+        return [
+            PersonaVista(persona_id, self)
+            for persona_id in ids
+            if filas.get(persona_id) is not None
+        ]
+
+    # ==================== ArbolRepository: modificaciones ====================
+
+    def _rechazar(self, operacion: str) -> NoReturn:
+        logger.warning("Operación %s rechazada: las versiones son de solo lectura", operacion)
+        raise ArbolSoloLecturaError(operacion)
+
+    def registrar_persona(self, nombre: str) -> Persona:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("registrar_persona")
+
+    def registrar_personas_bulk(self, nombres: Iterable[str]) -> list[Persona]:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("registrar_personas_bulk")
+
+    def add_hijo(self, padre: Persona, hijo: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("add_hijo")
+
+    def add_hijos_bulk(self, pares: Iterable[tuple[int, int]]) -> None:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("add_hijos_bulk")
+
+    def add_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("add_pareja")
+
+    def remove_pareja(self, persona1: Persona, persona2: Persona) -> None:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("remove_pareja")
+
+    def eliminar_persona(self, persona_id: int, confirmar_rotura: bool = False) -> None:
+        """Raises: ArbolSoloLecturaError (una versión no se modifica)."""
+        self._rechazar("eliminar_persona")
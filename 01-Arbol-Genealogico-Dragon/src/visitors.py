@@ -1,5 +1,10 @@
-from abc import ABC
-from typing import TYPE_CHECKING
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator, Mapping, MutableSet, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, TextIO
+
+from .models import SIN_ID
 
 if TYPE_CHECKING:
     from .models import Persona
@@ -14,70 +19,329 @@ class ArbolVisitorInterface(ABC):  # patron visitor
         pass
 
 
-class PrintArbolVisitor(ArbolVisitorInterface):  # patron visitor concreto
-    """Clase que representa un visitante del árbol genealógico que imprimira el árbol
-    - Su estado interno es el string que está construyendo
-    - Utiliza recursividad para añadir └— y ├—.
+# ==================== MOTOR DE RECORRIDO ====================
+
+
+class ModoRecorrido(Enum):
+    """Orden en que iterar_recorrido() entrega las personas."""
+
+    PREORDEN = "preorden"
+    POSTORDEN = "postorden"
+    ANCHURA = "anchura"
+
+
+class MapaVisitados(MutableSet[int]):
     """
+    Conjunto de IDs visitados respaldado por un bytearray (un byte por ID).
+
+    Los IDs del repositorio son enteros positivos y consecutivos, así que un
+    byte por ID ocupa mucho menos que un set de enteros y la consulta es un
+    acceso por índice. El bytearray crece a demanda al ver IDs mayores.
+    iterar_recorrido() lee y escribe ``marcas`` directamente para no pagar
+    una llamada a método por persona.
+    """
+
+    __slots__ = ("marcas",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self.marcas = bytearray()
+        for persona_id in ids:
+            self.add(persona_id)
+
+    def __contains__(self, persona_id: object) -> bool:
+        marcas = self.marcas
+        return (
+            isinstance(persona_id, int)
+            and 0 <= persona_id < len(marcas)
+            and marcas[persona_id] == 1
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return (i for i, marca in enumerate(self.marcas) if marca)
+
+    def __len__(self) -> int:
+        return self.marcas.count(1)
+
+    def reservar(self, persona_id: int) -> None:
+        """Amplía el bytearray para que ``persona_id`` sea un índice válido."""
+        if persona_id < 0:
+            raise ValueError(f"ID inválido para MapaVisitados: {persona_id}")
+        marcas = self.marcas
+        if persona_id >= len(marcas):
+            marcas.extend(bytes(max(persona_id + 1, 2 * len(marcas)) - len(marcas)))
+
+    def add(self, persona_id: int) -> None:
+        self.reservar(persona_id)
+        self.marcas[persona_id] = 1
+
+    def discard(self, persona_id: int) -> None:
+        if persona_id in self:
+            self.marcas[persona_id] = 0
+
+    def copia(self) -> "MapaVisitados":
+        """Devuelve un MapaVisitados independiente con los mismos IDs."""
+        nuevo = MapaVisitados()
+        nuevo.marcas = bytearray(self.marcas)
+        return nuevo
+
+    def __repr__(self) -> str:
+        return f"MapaVisitados({list(self)})"
+
+
+def iterar_recorrido(
+    raices: Iterable["Persona"],
+    modo: ModoRecorrido = ModoRecorrido.PREORDEN,
+    visitados: Optional[MapaVisitados] = None,
+) -> Iterator[tuple["Persona", int, bool]]:
+    """
+    Recorre los descendientes de ``raices`` sin recursión.
+
+    Usa una pila explícita (preorden y postorden) o una cola (anchura), por lo
+    que la profundidad del linaje no está limitada por la recursión de Python
+    ni paga un accept_visitor() por nodo. Cada persona se entrega una sola
+    vez aunque sea alcanzable por varios padres; las que ya estén en
+    ``visitados`` se omiten junto con sus descendientes.
+
+    Los hijos de una persona se filtran contra ``visitados`` al entrar en
+    ella, y ``es_ultimo`` indica si es el último de esos hijos (las raíces
+    siempre son últimas).
+
+    Args:
+        raices: Personas desde donde comenzar, en orden.
+        modo: Orden de entrega (preorden, postorden o por anchura).
+        visitados: IDs compartidos entre recorridos. Se modifica.
+                   Por defecto, un MapaVisitados nuevo.
+
+    Yields:
+        tuple[Persona, int, bool]: (persona, profundidad, es_ultimo), con
+        profundidad 0 para las raíces.
+    """
+    if visitados is None:
+        visitados = MapaVisitados()
+    marcas = visitados.marcas
+    reservar = visitados.reservar
+    anchura = modo is ModoRecorrido.ANCHURA
+    postorden = modo is ModoRecorrido.POSTORDEN
+
+    # Preorden y postorden desapilan del final; anchura desencola del principio.
+    # Una profundidad negativa (~profundidad) marca la salida de una persona en postorden.
+    pendientes: deque[tuple["Persona", int, bool]] = deque((r, 0, True) for r in raices)
+    if not anchura:
+        pendientes.reverse()
+    siguiente = pendientes.popleft if anchura else pendientes.pop
+    while pendientes:
+        persona, profundidad, es_ultimo = siguiente()
+        if profundidad < 0:
+            yield persona, ~profundidad, es_ultimo
+            continue
+        persona_id = persona.id
+        if persona_id >= len(marcas):
+            reservar(persona_id)
+        elif marcas[persona_id]:
+            continue
+        marcas[persona_id] = 1
+        if postorden:
+            pendientes.append((persona, ~profundidad, es_ultimo))
+        else:
+            yield persona, profundidad, es_ultimo
+
+        limite = len(marcas)
+        hijos = [h for h in persona.hijos if h.id >= limite or not marcas[h.id]]
+        if not hijos:
+            continue
+        ultimo = len(hijos) - 1
+        profundidad += 1
+        if anchura:
+            pendientes.extend((h, profundidad, i == ultimo) for i, h in enumerate(hijos))
+        else:
+            # Se apilan en orden inverso para desapilarlos en el orden original
+            for i in range(ultimo, -1, -1):
+                pendientes.append((hijos[i], profundidad, i == ultimo))
+
+
+class VisitorRecorrido(ArbolVisitorInterface):
+    """
+    Base para visitors que delegan el recorrido en iterar_recorrido().
+
+    Las subclases solo implementan el hook al_visitar(); visitar() recorre
+    la descendencia de la persona en el ``modo`` de la clase y comparte
+    ``visitados`` entre llamadas, de modo que recorrer varias raíces no
+    repite personas.
+    """
+
+    modo: ModoRecorrido = ModoRecorrido.PREORDEN
 
     def __init__(self):
-        self.resultado: list[str] = []
-        self.visitados: set[int] = set()
+        self.visitados: MapaVisitados = MapaVisitados()
 
     def visitar(self, persona: "Persona"):
+        al_visitar = self.al_visitar
+        for actual, profundidad, es_ultimo in iterar_recorrido(
+            (persona,), self.modo, self.visitados
+        ):
+            al_visitar(actual, profundidad, es_ultimo)
+
+    def al_visitar(self, persona: "Persona", profundidad: int, es_ultimo: bool) -> None:
+        """Hook invocado una vez por persona alcanzada."""
+
+
+def recorrer_fusionado(
+    raices: Sequence["Persona"], visitors: Sequence[ArbolVisitorInterface]
+) -> None:
+    """
+    Recorre las raíces una sola vez por modo, despachando cada persona a varios visitors.
+
+    Los VisitorRecorrido que no redefinen visitar() se agrupan por ``modo`` y
+    cada grupo comparte un único recorrido: N visitors en el mismo modo
+    cuestan una pasada y no N. Cada visitor recibe las mismas llamadas a
+    al_visitar() que si se lo recorriera por separado, y al terminar queda
+    con su propia copia de los IDs visitados. Por eso solo se agrupan los
+    que todavía no visitaron a nadie: uno reutilizado omite a las personas
+    de su propio ``visitados`` y se recorre solo, con ese conjunto.
+
+    Los demás visitors se recorren como antes, raíz por raíz con
+    accept_visitor().
+
+    Args:
+        raices: Raíces del árbol, en el orden en que se deben recorrer.
+        visitors: Visitors a ejecutar.
+    """
+    grupos: dict[ModoRecorrido, list[VisitorRecorrido]] = {}
+    solos: list[VisitorRecorrido] = []
+    for visitor in visitors:
+        if (
+            isinstance(visitor, VisitorRecorrido)
+            and type(visitor).visitar is VisitorRecorrido.visitar
+        ):
+            if visitor.visitados:
+                solos.append(visitor)
+            else:
+                grupos.setdefault(visitor.modo, []).append(visitor)
+        else:
+            for raiz in raices:
+                raiz.accept_visitor(visitor)
+
+    recorridos = [*grupos.items(), *((visitor.modo, [visitor]) for visitor in solos)]
+    for modo, grupo in recorridos:
+        # Un visitor solo conserva su propio conjunto (mismo estado que visitar())
+        visitados = grupo[0].visitados if len(grupo) == 1 else MapaVisitados()
+        hooks = [visitor.al_visitar for visitor in grupo]
+        for raiz in raices:
+            if len(hooks) == 1:
+                hook = hooks[0]
+                for persona, profundidad, es_ultimo in iterar_recorrido((raiz,), modo, visitados):
+                    hook(persona, profundidad, es_ultimo)
+            else:
+                for persona, profundidad, es_ultimo in iterar_recorrido((raiz,), modo, visitados):
+                    for hook in hooks:
+                        hook(persona, profundidad, es_ultimo)
+        if len(grupo) > 1:
+            for visitor in grupo:
+                visitor.visitados = visitados.copia()
+
+
+class VisitorCombinable(ABC):
+    """
+    Visitor cuyos resultados parciales se pueden calcular por separado y combinar.
+
+    Lo usa el recorrido en paralelo: cada proceso ejecuta un parcial nuevo
+    sobre un subconjunto de linajes y luego el visitor original combina, en
+    orden, los parciales devueltos.
+    """
+
+    @abstractmethod
+    def nuevo_parcial(self) -> "VisitorCombinable":
         """
-        Visita una persona y sus hijos de manera recursiva.
-        Args:
-            persona (Persona): La persona a visitar.
+        Retorna un visitor vacío con la misma configuración (debe poder serializarse).
+
+        Las implementaciones construyen ``type(self)``, para que una subclase
+        que redefine al_visitar() se ejecute igual en los procesos; una
+        subclase con otro constructor debe redefinir este método.
         """
-        if persona.id not in self.visitados:
-            # inicia el recorrido desde esta persona como raiz.
-            self._visitar_recursivo(persona, es_ultimo=True, prefijos=[])
 
-    def _visitar_recursivo(self, persona: "Persona", es_ultimo: bool, prefijos: list[str]):
+    @abstractmethod
+    def combinar(self, parcial: "VisitorCombinable", personas: Mapping[int, "Persona"]) -> None:
         """
-        Método auxiliar recursivo que realiza la impresión real.
+        Incorpora los resultados de ``parcial``.
 
         Args:
-            persona (Persona): La persona a visitar.
-            es_ultimo (bool): Indica si es el ultimo hijo de su padre.
-            prefijos (list[str]): Prefijos para la impresión.
+            parcial: Visitor devuelto por un proceso, con sus resultados.
+            personas: Personas del repositorio, para reemplazar por sus
+                originales las copias que vienen en el parcial.
         """
-        # Protección contra ciclos y llamadas duplicadas
-        # (aunque visitar() ya filtra, este método debe ser seguro por sí mismo)
-        if persona.id in self.visitados:  # Defense in Depth
-            return
 
-        # construir el prefijo concatenando los prefijos
-        prefijo_completo = "".join(prefijos)
 
-        # Elegir símbolo: └─ para último hijo, ├─ para hijos intermedios
-        simbolo = "└─" if es_ultimo else "├─"
+class PrintArbolVisitor(VisitorRecorrido, VisitorCombinable):  # patron visitor concreto
+    """Clase que representa un visitante del árbol genealógico que imprimira el árbol
+    - Su estado interno es el string que está construyendo
+    - Recorre en preorden con iterar_recorrido() y añade └— y ├— según la profundidad.
+    - Si recibe un ``destino`` (stream de texto), escribe cada línea apenas se
+      genera en lugar de acumularla en ``resultado``.
+    """
 
-        # Construir la línea con información de la persona
-        persona_id = f" (id: {persona.id})" if persona.id else ""
-        pareja_str = f"-> {persona.pareja.id}" if persona.pareja else ""
+    def __init__(self, destino: Optional[TextIO] = None):
+        super().__init__()
+        self.resultado: list[str] = []
+        self.destino: Optional[TextIO] = destino
+        self.cantidad_lineas: int = 0
+        # Prefijo de cada nivel en la rama actual; los hermanos comparten el string
+        self._prefijos: list[str] = [""]
 
-        self.resultado.append(
-            f"{prefijo_completo}{simbolo} {persona.nombre}{persona_id}{pareja_str}"
-        )
-        self.visitados.add(persona.id)
+    def al_visitar(self, persona: "Persona", profundidad: int, es_ultimo: bool) -> None:
+        linea = self._linea(persona, profundidad, es_ultimo)
+        if self.destino is None:
+            self.resultado.append(linea)
+        else:
+            self.destino.write(linea)
+            self.destino.write("\n")
 
-        # hijos que aún no han sido visitados
-        hijos_no_visitados = [h for h in persona.hijos if h.id not in self.visitados]
+    def iterar_lineas(self, persona: "Persona") -> Iterator[str]:
+        """
+        Genera una a una las líneas del subárbol de ``persona`` en preorden.
 
-        # recorrer hijos no visitados
-        for i, hijo in enumerate(hijos_no_visitados):
-            es_ultimo_hijo = i == len(hijos_no_visitados) - 1
+        Las personas ya visitadas (por este u otro recorrido del mismo
+        visitor) se omiten.
 
-            # crear prefijos para el siguiente nivel
-            nuevos_prefijos = prefijos.copy()
-            nuevo_prefijo = "│  " if not es_ultimo else "   "
+        Args:
+            persona (Persona): Raíz del subárbol a recorrer.
 
-            nuevos_prefijos.append(nuevo_prefijo)
+        Yields:
+            str: Cada línea del árbol, sin salto de línea final.
+        """
+        for actual, profundidad, es_ultimo in iterar_recorrido(
+            (persona,), visitados=self.visitados
+        ):
+            yield self._linea(actual, profundidad, es_ultimo)
+
+    def _linea(self, persona: "Persona", profundidad: int, es_ultimo: bool) -> str:
+        prefijos = self._prefijos
+        prefijo = prefijos[profundidad]
+        # En preorden la rama actual se abandona al volver a una profundidad menor
+        del prefijos[profundidad + 1 :]
+        prefijos.append(prefijo + ("   " if es_ultimo else "│  "))
+
+        # Elegir símbolo: └─ para último hijo, ├─ para hijos intermedios
+        simbolo = "└─" if es_ultimo else "├─"
+        persona_id = f" (id: {persona.id})" if persona.id else ""
+        pareja_id = persona.pareja_id
+        pareja_str = f"-> {pareja_id}" if pareja_id != SIN_ID else ""
+        self.cantidad_lineas += 1
+        return f"{prefijo}{simbolo} {persona.nombre}{persona_id}{pareja_str}"
 
-            # llamada recursiva
-            self._visitar_recursivo(hijo, es_ultimo_hijo, nuevos_prefijos)
+    def nuevo_parcial(self) -> "PrintArbolVisitor":
+        # Sin destino: el proceso acumula las líneas y combinar() las escribe
+        return type(self)()
+
+    def combinar(self, parcial: VisitorCombinable, personas: Mapping[int, "Persona"]) -> None:
+        if not isinstance(parcial, PrintArbolVisitor):
+            raise TypeError(f"No se puede combinar {type(parcial).__name__} con PrintArbolVisitor")
+        if self.destino is None:
+            self.resultado.extend(parcial.resultado)
+        else:
+            for linea in parcial.resultado:
+                self.destino.write(linea)
+                self.destino.write("\n")
+        self.cantidad_lineas += parcial.cantidad_lineas
 
     def ejecutar(self, persona: "Persona"):
         self.visitar(persona)
@@ -89,28 +353,28 @@ class PrintArbolVisitor(ArbolVisitorInterface):  # patron visitor concreto
         return "\n".join(self.resultado)
 
 
-class SearchArbolVisitor(ArbolVisitorInterface):  # patron visitor concreto
+class SearchArbolVisitor(VisitorRecorrido, VisitorCombinable):  # patron visitor concreto
     """Clase que representa un visitante del árbol genealógico que buscara una persona
     - Su estado es el resultado de la búsqueda.
     - No imprime nada, solo acumula nodos que cumplan un criterio.
     """
 
     def __init__(self, nombre_a_buscar: str):
+        super().__init__()
         self.resultado: list["Persona"] = []
         self.nombre_a_buscar: str = nombre_a_buscar.strip().lower()
-        self.visitados: set[int] = set()
-
-    def visitar(self, persona: "Persona"):
-        if persona.id in self.visitados:
-            return
-
-        self.visitados.add(persona.id)
 
+    def al_visitar(self, persona: "Persona", profundidad: int, es_ultimo: bool) -> None:
         if persona.nombre.strip().lower() == self.nombre_a_buscar:
             self.resultado.append(persona)
 
-        for hijo in persona.hijos:
-            hijo.accept_visitor(self)
+    def nuevo_parcial(self) -> "SearchArbolVisitor":
+        return type(self)(self.nombre_a_buscar)
+
+    def combinar(self, parcial: VisitorCombinable, personas: Mapping[int, "Persona"]) -> None:
+        if not isinstance(parcial, SearchArbolVisitor):
+            raise TypeError(f"No se puede combinar {type(parcial).__name__} con SearchArbolVisitor")
+        self.resultado.extend(personas[p.id] for p in parcial.resultado)
 
     def obtener_resultado(self):
         """
@@ -125,3 +389,37 @@ class SearchArbolVisitor(ArbolVisitorInterface):  # patron visitor concreto
             list[Persona]: Lista de personas que cumplen con el criterio de búsqueda.
         """
         return self.resultado
+
+
+class EstadisticasVisitor(VisitorRecorrido, VisitorCombinable):  # patron visitor concreto
+    """Clase que representa un visitante que cuenta personas por generación
+    - Su estado es la cantidad de personas alcanzadas en cada profundidad.
+    - Las raíces están en la profundidad 0.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.por_profundidad: Counter[int] = Counter()
+
+    def al_visitar(self, persona: "Persona", profundidad: int, es_ultimo: bool) -> None:
+        self.por_profundidad[profundidad] += 1
+
+    @property
+    def cantidad(self) -> int:
+        """Total de personas visitadas."""
+        return self.por_profundidad.total()
+
+    @property
+    def profundidad_maxima(self) -> int:
+        """Mayor profundidad alcanzada (-1 si no se visitó a nadie)."""
+        return max(self.por_profundidad, default=-1)
+
+    def nuevo_parcial(self) -> "EstadisticasVisitor":
+        return type(self)()
+
+    def combinar(self, parcial: VisitorCombinable, personas: Mapping[int, "Persona"]) -> None:
+        if not isinstance(parcial, EstadisticasVisitor):
+            raise TypeError(
+                f"No se puede combinar {type(parcial).__name__} con EstadisticasVisitor"
+            )
+        self.por_profundidad.update(parcial.por_profundidad)
@@ -0,0 +1,227 @@
+"""
+Tests para el lock de lectura/escritura (src/concurrencia.py) y el modo
+seguro_para_hilos de ArbolGenealogico.
+"""
+
+import random
+import sys
+import threading
+import time
+
+import pytest
+
+from src.concurrencia import LockLecturaEscritura
+from src.exceptions import ArbolGenealogicoError, PersonaNoEncontradaError
+from src.models import SIN_ID
+from src.repository import ArbolGenealogico
+
+
+def _esperar(condicion, limite: float = 5.0) -> None:
+    fin = time.monotonic() + limite
+    while not condicion():
+        assert time.monotonic() < fin, "tiempo de espera agotado"
+        time.sleep(0.001)
+
+
+def test_lock_lecturas_en_paralelo_y_escritor_preferido():
+    """
+    Test: Las lecturas avanzan juntas y un escritor en espera frena lecturas nuevas
+
+    ARRANGE: Un hilo con la lectura tomada y un escritor esperando
+    ACT: Otro hilo pide una lectura
+    ASSERT: La lectura nueva espera al escritor, que entra al soltarse la primera
+    """
+    # ARRANGE
+    lock = LockLecturaEscritura()
+    eventos: list[str] = []
+    soltar = threading.Event()
+
+    def primer_lector() -> None:
+        with lock.lectura():
+            eventos.append("lector 1")
+            soltar.wait()
+
+    def escritor() -> None:
+        with lock.escritura():
+            eventos.append("escritor")
+
+    def segundo_lector() -> None:
+        with lock.lectura():
+            eventos.append("lector 2")
+
+    hilos = [threading.Thread(target=primer_lector)]
+    hilos[0].start()
+    _esperar(lambda: eventos == ["lector 1"])
+    with lock.lectura():
+        eventos.append("lector en paralelo")
+    hilos.append(threading.Thread(target=escritor))
+    hilos[1].start()
+    _esperar(lambda: lock._escritores_esperando == 1)
+
+    # ACT
+    hilos.append(threading.Thread(target=segundo_lector))
+    hilos[2].start()
+    time.sleep(0.05)
+    bloqueado = eventos[-1] != "lector 2"
+    soltar.set()
+    for hilo in hilos:
+        hilo.join()
+
+    # ASSERT
+    assert bloqueado
+    assert eventos == ["lector 1", "lector en paralelo", "escritor", "lector 2"]
+
+
+def test_lock_reentrante_por_hilo():
+    """
+    Test: Un hilo puede volver a tomar el lock, pero no pasar de lectura a escritura
+    """
+    # ARRANGE
+    lock = LockLecturaEscritura()
+
+    # ACT & ASSERT
+    with lock.escritura():
+        with lock.escritura(), lock.lectura():
+            assert lock._escritor == threading.get_ident()
+    with lock.lectura():
+        with lock.lectura():
+            assert lock._lectores == 1
+        with pytest.raises(RuntimeError, match="lectura a escritura"):
+            with lock.escritura():
+                pass
+    assert (lock._lectores, lock._escritor) == (0, None)
+
+
+def test_arbol_seguro_rechaza_personas_eliminadas_por_otro_hilo():
+    """
+    Test: Relacionar una persona que otro hilo ya eliminó lanza PersonaNoEncontradaError
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico(seguro_para_hilos=True)
+    padre, hijo = arbol.registrar_personas_bulk(["Viserys", "Rhaenyra"])
+    hilo = threading.Thread(target=arbol.eliminar_persona, args=(hijo.id,))
+    hilo.start()
+    hilo.join()
+
+    # ACT & ASSERT
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol.add_hijo(padre, hijo)
+    assert padre.hijos == []
+
+
+def _verificar_invariantes(arbol: ArbolGenealogico) -> list[str]:
+    """Relaciones simétricas, raíces e índice de nombres coherentes con ``personas``."""
+    errores = []
+    with arbol.lectura():
+        personas = arbol.personas
+        for persona_id, persona in personas.items():
+            pareja = persona.pareja
+            if pareja is not None and (
+                personas.get(pareja.id) is not pareja or pareja.pareja is not persona
+            ):
+                errores.append(f"pareja asimétrica en {persona_id}")
+            for hijo in persona.hijos:
+                if personas.get(hijo.id) is not hijo or persona_id not in hijo.padres_ids:
+                    errores.append(f"hijo {hijo.id} de {persona_id} sin vínculo de vuelta")
+            for padre_id in persona.padres_ids:
+                if padre_id != SIN_ID and (
+                    padre_id not in personas or persona not in personas[padre_id].hijos
+                ):
+                    errores.append(f"padre {padre_id} de {persona_id} sin vínculo de vuelta")
+            if persona not in arbol.buscar_por_nombre(persona.nombre):
+                errores.append(f"{persona_id} falta en el índice de nombres")
+        raices = {p.id for p in arbol.init_get_root()}
+        sin_padres = {i for i, p in personas.items() if p.padres_ids == (SIN_ID, SIN_ID)}
+        if raices != sin_padres:
+            errores.append("raíces desactualizadas")
+    return errores
+
+
+def test_arbol_seguro_para_hilos_bajo_carga():
+    """
+    Test: Escritores y lectores concurrentes no rompen las invariantes del árbol
+
+    ARRANGE: Árbol seguro_para_hilos y conmutación de hilos muy frecuente
+    ACT: Cuatro escritores registran, relacionan y eliminan al azar mientras
+         cuatro lectores consultan y verifican invariantes
+    ASSERT: Ninguna invariante rota, ni durante ni al final, y la cantidad
+            de personas coincide con altas menos bajas
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico(seguro_para_hilos=True)
+    arbol.registrar_personas_bulk(f"Inicial {i}" for i in range(20))
+    altas, bajas = [20], [0]
+    contadores = threading.Lock()
+    errores: list[str] = []
+    terminado = threading.Event()
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+
+    def escritor(semilla: int) -> None:
+        rng = random.Random(semilla)
+        for paso in range(250):
+            with arbol.lectura():
+                ids = list(arbol.personas)
+            try:
+                operacion = rng.random()
+                if operacion < 0.3 or len(ids) < 4:
+                    arbol.registrar_persona(f"Persona {semilla}-{paso}")
+                    with contadores:
+                        altas[0] += 1
+                elif operacion < 0.65:
+                    padre_id, hijo_id = sorted(rng.sample(ids, 2))
+                    arbol.add_hijo(arbol.get_persona(padre_id), arbol.get_persona(hijo_id))
+                elif operacion < 0.8:
+                    a, b = rng.sample(ids, 2)
+                    arbol.add_pareja(arbol.get_persona(a), arbol.get_persona(b))
+                elif operacion < 0.87:
+                    persona = arbol.get_persona(rng.choice(ids))
+                    if persona.pareja is not None:
+                        arbol.remove_pareja(persona, persona.pareja)
+                else:
+                    arbol.eliminar_persona(rng.choice(ids), confirmar_rotura=True)
+                    with contadores:
+                        bajas[0] += 1
+            except ArbolGenealogicoError:
+                pass  # validación o persona eliminada por otro hilo
+
+    def lector(semilla: int) -> None:
+        rng = random.Random(semilla)
+        while not terminado.is_set():
+            arbol.buscar_por_prefijo("pers")
+            arbol.buscar_aproximado("Persona 1-1", 1)
+            arbol.buscar_por_palabras("inicial")
+            arbol.init_get_root()
+            try:
+                arbol.get_persona(rng.randrange(1, 400))
+            except PersonaNoEncontradaError:
+                pass
+            if rng.random() < 0.1:
+                errores.extend(_verificar_invariantes(arbol))
+
+    def sin_excepciones(funcion, semilla: int) -> None:
+        # Una excepción inesperada en un hilo no haría fallar el test por sí sola
+        try:
+            funcion(semilla)
+        except Exception as e:
+            errores.append(repr(e))
+
+    escritores = [threading.Thread(target=sin_excepciones, args=(escritor, i)) for i in range(4)]
+    lectores = [threading.Thread(target=sin_excepciones, args=(lector, 10 + i)) for i in range(4)]
+
+    # ACT
+    try:
+        for hilo in escritores + lectores:
+            hilo.start()
+        for hilo in escritores:
+            hilo.join()
+        terminado.set()
+        for hilo in lectores:
+            hilo.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+
+    # ASSERT
+    assert errores == []
+    assert _verificar_invariantes(arbol) == []
+    assert len(arbol.personas) == altas[0] - bajas[0]
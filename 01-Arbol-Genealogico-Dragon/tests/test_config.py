@@ -15,6 +15,30 @@ def test_app_config_from_env():
         config = AppConfig.from_env()
         assert config.log_dir == Path("custom_logs")
         assert config.log_file == "custom.log"
+        assert config.log_en_cola is False
+        assert config.repositorio == "memoria"
+
+
+def test_app_config_repositorio_desde_env():
+    """Verifica que ARBOL_REPOSITORIO y ARBOL_DB elijan el repositorio SQLite."""
+    with patch.dict(os.environ, {"ARBOL_REPOSITORIO": " SQLite ", "ARBOL_DB": "datos/arbol.db"}):
+        config = AppConfig.from_env()
+        assert config.repositorio == "sqlite"
+        assert config.ruta_db == Path("datos/arbol.db")
+
+
+def test_app_config_snapshot_desde_env():
+    """Verifica que ARBOL_SNAPSHOT elija el snapshot del repositorio durable."""
+    with patch.dict(os.environ, {"ARBOL_REPOSITORIO": "durable", "ARBOL_SNAPSHOT": "datos/a.snap"}):
+        config = AppConfig.from_env()
+        assert config.repositorio == "durable"
+        assert config.ruta_snapshot == Path("datos/a.snap")
+
+
+def test_app_config_log_en_cola_desde_env():
+    """Verifica que LOG_QUEUE active el logging en cola."""
+    with patch.dict(os.environ, {"LOG_QUEUE": "1"}):
+        assert AppConfig.from_env().log_en_cola is True
 
 
 def test_app_config_defaults():
@@ -22,3 +46,7 @@ def test_app_config_defaults():
     config = AppConfig()
     assert config.log_dir == Path("logs")
     assert config.log_file == "arbol_genealogico.log"
+    assert config.log_en_cola is False
+    assert config.repositorio == "memoria"
+    assert config.ruta_db == Path("arbol_genealogico.db")
+    assert config.ruta_snapshot == Path("arbol_genealogico.snap")
@@ -5,9 +5,17 @@ Verifica la correcta implementación del patrón Service Locator y Singleton
 en ApplicationContainer.
 """
 
+from pathlib import Path
+
+import pytest
+
+from src.config import AppConfig
 from src.container import ApplicationContainer
 from src.data_loader import DataLoaderDemo
 from src.repository import ArbolGenealogico
+from src.repository_columnar import ArbolColumnar
+from src.repository_durable import ArbolDurable
+from src.repository_sqlite import ArbolSQLite
 from src.ui import DinastiaUI
 
 
@@ -65,3 +73,28 @@ class TestApplicationContainer:
         assert isinstance(loader1, DataLoaderDemo)
         assert isinstance(loader2, DataLoaderDemo)
         assert loader1 is not loader2
+
+    def test_get_arbol_segun_config(self, tmp_path: Path):
+        """
+        Test: get_arbol crea el repositorio elegido en AppConfig.repositorio
+
+        Verifica que "columnar", "sqlite" y "durable" crean el backend
+        correspondiente (en la ruta configurada) y que un nombre desconocido se rechaza.
+        """
+        ruta_db = tmp_path / "arbol.db"
+
+        columnar = ApplicationContainer(AppConfig(repositorio="columnar")).get_arbol()
+        sqlite = ApplicationContainer(AppConfig(repositorio="sqlite", ruta_db=ruta_db)).get_arbol()
+
+        assert isinstance(columnar, ArbolColumnar)
+        assert isinstance(sqlite, ArbolSQLite)
+        assert ruta_db.exists()
+        sqlite.cerrar()
+        ruta_snapshot = tmp_path / "arbol.snap"
+        with ApplicationContainer(
+            AppConfig(repositorio="durable", ruta_snapshot=ruta_snapshot)
+        ).get_arbol() as durable:
+            assert isinstance(durable, ArbolDurable)
+        assert (tmp_path / "arbol.snap.wal.000001").exists()
+        with pytest.raises(ValueError, match="desconocido"):
+            ApplicationContainer(AppConfig(repositorio="csv")).get_arbol()
@@ -130,3 +130,30 @@ def test_get_persona_lanza_error_si_no_existe(arbol_vacio: "ArbolRepository"):
         loader._get_persona(arbol_vacio, "Persona Inexistente")  # type: ignore
 
     assert "Persona 'Persona Inexistente' no encontrada" in str(exc_info.value)
+
+
+def test_get_persona_usa_indice_de_nombres(arbol_vacio: "ArbolRepository"):
+    """
+    Test: _get_persona consulta el índice del repositorio y exige el nombre exacto
+
+    ARRANGE: Dos personas cuyos nombres solo difieren en mayúsculas
+    ACT: Recuperar cada una por su nombre exacto
+    ASSERT: Se usa buscar_por_nombre (sin recorrer personas) y se distingue el exacto
+    """
+    # ARRANGE
+    loader = DataLoaderDemo()
+    mayusculas = arbol_vacio.registrar_persona("AEGON")
+    normal = arbol_vacio.registrar_persona("Aegon")
+
+    # ACT
+    with patch.object(
+        arbol_vacio, "buscar_por_nombre", wraps=arbol_vacio.buscar_por_nombre
+    ) as buscar:
+        encontrada = loader._get_persona(arbol_vacio, "Aegon")  # type: ignore
+
+    # ASSERT
+    assert encontrada is normal
+    buscar.assert_called_once_with("Aegon")
+    assert loader._get_persona(arbol_vacio, "AEGON") is mayusculas  # type: ignore
+    with pytest.raises(PersonaNoEncontradaError):
+        loader._get_persona(arbol_vacio, "aegon")  # type: ignore
@@ -4,7 +4,14 @@ Tests para excepciones personalizadas.
 
 import pytest
 
-from src.exceptions import PersonaNoEncontradaError, RelacionIncestuosaError
+from src.exceptions import (
+    CicloTemporalError,
+    LoteRelacionesError,
+    PersonaNoEncontradaError,
+    RelacionIncestuosaError,
+)
+from src.models import Persona
+from src.validators import CodigoValidacion, ResultadoValidacion
 
 
 def test_persona_no_encontrada_default_message():
@@ -19,3 +26,24 @@ def test_relacion_incestuosa_invalid_type():
         RelacionIncestuosaError("A", "B", "tipo_invalido")  # type: ignore
 
     assert "tipo_intento debe ser uno de" in str(exc_info.value)
+
+
+def test_lote_relaciones_mensaje_con_primer_error():
+    """Verifica que el mensaje resuma los errores y formatee solo el primero."""
+    personas = {1: Persona(1, "Aegon"), 2: Persona(2, "Rhaenys")}
+    resultados = [
+        ResultadoValidacion(CodigoValidacion.PERSONA_NO_ENCONTRADA, 9, 0, 3),
+        ResultadoValidacion(CodigoValidacion.CICLO_TEMPORAL, 1, 2, 5),
+    ]
+
+    exc = LoteRelacionesError(resultados, personas)
+
+    assert exc.resultados == resultados
+    assert str(exc) == (
+        "Lote rechazado: 2 relación(es) inválida(s). "
+        "Primera (posición 3): Persona con ID 9 no encontrada"
+    )
+    assert [(posicion, type(error)) for posicion, error in exc.errores] == [
+        (3, PersonaNoEncontradaError),
+        (5, CicloTemporalError),
+    ]
@@ -0,0 +1,370 @@
+"""
+Tests para los índices de búsqueda por nombre (src/indices.py).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.exceptions import ConsultaInvalidaError
+from src.indices import (
+    IndiceDifuso,
+    IndiceFonetico,
+    IndicePrefijos,
+    IndicesBusqueda,
+    IndiceTokens,
+    IndiceTrigramas,
+    clave_fonetica,
+    distancia_edicion,
+    tokenizar,
+)
+
+
+def test_indice_prefijos_orden_y_limite():
+    """
+    Test: La búsqueda por prefijo retorna IDs en orden alfabético y respeta el límite
+
+    ARRANGE: Nombres con y sin el prefijo, cargados en desorden
+    ACT: Buscar "aeg" con y sin límite
+    ASSERT: Solo los que empiezan con el prefijo, por nombre y luego por ID
+    """
+    # ARRANGE
+    indice = IndicePrefijos()
+    for persona_id, nombre in [
+        (1, "Aemon"),
+        (2, "Aegon"),
+        (3, "Rhaenyra"),
+        (4, "aegon"),
+        (5, "Aegor"),
+    ]:
+        indice.agregar(persona_id, nombre)
+
+    # ACT
+    todos = indice.buscar(" AEG ")
+    primeros = indice.buscar("aeg", limite=2)
+
+    # ASSERT
+    assert todos == [2, 4, 5]
+    assert primeros == [2, 4]
+    assert indice.buscar("ae") == [2, 4, 5, 1]
+    assert indice.buscar("daemon") == []
+
+
+def test_indice_prefijos_incorpora_altas_en_lote(monkeypatch):
+    """
+    Test: Muchas altas pendientes se incorporan con un solo ordenamiento
+    """
+    # ARRANGE
+    monkeypatch.setattr(IndicePrefijos, "MAX_INSERCIONES_SUELTAS", 2)
+    indice = IndicePrefijos()
+    indice.agregar(1, "Viserys")
+    indice.buscar("v")
+
+    # ACT
+    for persona_id, nombre in [(2, "Visenya"), (3, "Vaegon"), (4, "Viserra")]:
+        indice.agregar(persona_id, nombre)
+
+    # ASSERT
+    assert len(indice) == 4
+    assert indice.buscar("vis") == [2, 4, 1]
+    assert indice._pendientes == []  # type: ignore
+
+
+def test_indices_busqueda_quitar_ordenados_y_pendientes():
+    """
+    Test: Las bajas se aplican tanto a entradas ya ordenadas como a pendientes
+    """
+    # ARRANGE
+    indices = IndicesBusqueda.construir([(1, "Aegon"), (2, "Aemond")])
+    indices.prefijos.buscar("a")
+    indices.agregar(3, "Aegon")
+
+    # ACT
+    indices.quitar(1, "Aegon")
+    indices.quitar(3, "Aegon")
+    indices.quitar(9, "Inexistente")
+
+    # ASSERT
+    assert indices.prefijos.buscar("ae") == [2]
+    assert len(indices.prefijos) == 1
+
+
+def test_distancia_edicion():
+    """
+    Test: Distancia de Levenshtein en casos conocidos
+    """
+    # ACT & ASSERT
+    assert distancia_edicion("daemon", "deamon") == 2
+    assert distancia_edicion("jaehaerys", "jahaerys") == 1
+    assert distancia_edicion("", "aegon") == 5
+    assert distancia_edicion("viserys", "viserys") == 0
+    assert distancia_edicion("kitten", "sitting") == 3
+
+
+def test_indice_difuso_busca_dentro_de_la_distancia():
+    """
+    Test: El BK-tree retorna los nombres a distancia <= k, del más cercano al más lejano
+
+    ARRANGE: Nombres parecidos y distintos, con homónimos
+    ACT: Buscar "Jahaerys" con distancia 1 y 2
+    ASSERT: Solo los nombres dentro de la distancia, ordenados por distancia
+    """
+    # ARRANGE
+    indice = IndiceDifuso()
+    nombres = ["Jaehaerys", "Jaehaera", "Aegon", "Jahaerys", "Jaehaerys", "Daemon"]
+    for persona_id, nombre in enumerate(nombres, 1):
+        indice.agregar(persona_id, nombre)
+
+    # ACT
+    cercanos = indice.buscar("jahaerys", distancia_maxima=1)
+    lejanos = indice.buscar(" JAHAERYS ", distancia_maxima=3)
+
+    # ASSERT
+    assert cercanos == [4, 1, 5]
+    assert lejanos == [4, 1, 5, 2]
+    assert indice.buscar("Deamon", 1) == []
+    assert indice.buscar("Deamon") == [6]
+
+
+def test_indice_difuso_quitar():
+    """
+    Test: Las bajas vacían el nodo sin romper la búsqueda en sus descendientes
+    """
+    # ARRANGE
+    indice = IndiceDifuso()
+    indice.agregar(1, "Aegon")
+    indice.agregar(2, "Aemon")
+    indice.buscar("aegon")
+    indice.agregar(3, "Aegor")
+
+    # ACT
+    indice.quitar(1, "Aegon")
+    indice.quitar(3, "Aegor")
+
+    # ASSERT
+    assert indice.buscar("aegon", 1) == [2]
+    assert len(indice) == 1
+
+
+@pytest.fixture
+def indice_trigramas() -> IndiceTrigramas:
+    """Fixture: Índice de trigramas con nombres de reyes y variantes"""
+    indice = IndiceTrigramas()
+    nombres = [
+        "Aegon II",
+        "Aegon III",
+        "Jaehaerys I el Conciliador",
+        "Aegon el Conquistador",
+        "Viserys",
+        "aegon",
+    ]
+    for persona_id, nombre in enumerate(nombres, 1):
+        indice.agregar(persona_id, nombre)
+    return indice
+
+
+def test_indice_trigramas_subcadena(indice_trigramas: IndiceTrigramas):
+    """
+    Test: La búsqueda por subcadena encuentra el texto en cualquier posición
+
+    ARRANGE: Nombres con sobrenombres
+    ACT: Buscar fragmentos largos y cortos (menos de 3 caracteres, sin filtro)
+    ASSERT: IDs ordenados de los nombres que contienen el fragmento
+    """
+    # ACT & ASSERT
+    assert indice_trigramas.buscar_subcadena("CONCILIADOR") == [3]
+    assert indice_trigramas.buscar_subcadena("gon i") == [1, 2]
+    assert indice_trigramas.buscar_subcadena("ae") == [1, 2, 3, 4, 6]
+    assert indice_trigramas.buscar_subcadena("daemon") == []
+
+
+@pytest.mark.parametrize(
+    ("patron", "esperados"),
+    [
+        ("Aegon.*II", [1, 2]),
+        ("^aegon$", [6]),
+        ("(conq|concil)", [3, 4]),
+        ("vis(e)?rys", [5]),
+        ("aego(n)+ i{2,}", [1, 2]),
+        ("i+$", [1, 2]),
+    ],
+)
+def test_indice_trigramas_regex(
+    indice_trigramas: IndiceTrigramas, patron: str, esperados: list[int]
+):
+    """
+    Test: La búsqueda por regex coincide con re.search sobre el nombre normalizado
+    """
+    # ACT & ASSERT
+    assert indice_trigramas.buscar_regex(patron) == esperados
+
+
+def test_indice_trigramas_filtra_candidatos_con_literales(indice_trigramas: IndiceTrigramas):
+    """
+    Test: Los literales obligatorios de la regex descartan nombres sin evaluarla
+
+    ARRANGE: Patrones con literales obligatorios, alternativas y partes opcionales
+    ACT: Calcular el filtro de trigramas
+    ASSERT: Solo quedan los nombres que contienen los literales exigidos
+    """
+    # ARRANGE
+    from src.indices import _analizar_patron
+
+    # ACT
+    con_literal = indice_trigramas._candidatos_patron(_analizar_patron("Aegon.*II"))
+    alternativas = indice_trigramas._candidatos_patron(_analizar_patron("conq|visery"))
+    opcional = indice_trigramas._candidatos_patron(_analizar_patron("(aegon)?x"))
+
+    # ASSERT
+    assert con_literal == {1, 2, 4, 6}
+    assert alternativas == {4, 5}
+    assert opcional is None
+
+
+def test_indice_trigramas_regex_sin_filtro_si_el_parser_cambia(
+    indice_trigramas: IndiceTrigramas, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test: Si el parser interno de re no da la forma esperada, se revisan todos los nombres
+    """
+    # ARRANGE
+    import src.indices
+
+    esperados = indice_trigramas.buscar_regex("Aegon.*II")
+    parser = SimpleNamespace(parse=lambda *_: [("otra forma",)])
+    monkeypatch.setattr(src.indices, "_PARSER_RE", parser)
+
+    # ACT & ASSERT
+    assert src.indices._analizar_patron("Aegon.*II") is None
+    assert indice_trigramas.buscar_regex("Aegon.*II") == esperados
+
+
+def test_indice_trigramas_regex_invalida(indice_trigramas: IndiceTrigramas):
+    """
+    Test: Un patrón mal formado se informa como ConsultaInvalidaError
+    """
+    # ACT & ASSERT
+    with pytest.raises(ConsultaInvalidaError, match="Aegon\\("):
+        indice_trigramas.buscar_regex("Aegon(")
+
+
+def test_indice_trigramas_quitar(indice_trigramas: IndiceTrigramas):
+    """
+    Test: Las bajas quitan al ID de todas sus listas y borran las listas vacías
+    """
+    # ACT
+    indice_trigramas.quitar(5, "Viserys")
+    indice_trigramas.quitar(5, "Viserys")
+
+    # ASSERT
+    assert indice_trigramas.buscar_subcadena("serys") == []
+    assert "ise" not in indice_trigramas._apariciones  # type: ignore
+    assert len(indice_trigramas) == 5
+
+
+def test_tokenizar_quita_mayusculas_y_acentos():
+    """
+    Test: Los tokens no dependen de mayúsculas, acentos ni puntuación
+    """
+    # ACT & ASSERT
+    assert tokenizar("Jaehaerys I, el Conciliador") == ["jaehaerys", "i", "el", "conciliador"]
+    assert tokenizar("  RHAENÝRA  Targaryén ") == ["rhaenyra", "targaryen"]
+    assert tokenizar("Straße") == ["strasse"]
+
+
+def test_indice_tokens_consultas_and_or():
+    """
+    Test: Las palabras se combinan con AND y los grupos con OR
+
+    ARRANGE: Nombres de varias palabras, con y sin acentos
+    ACT: Consultas de una palabra, AND, OR y con acentos
+    ASSERT: IDs ordenados de los nombres que cumplen la consulta
+    """
+    # ARRANGE
+    indice = IndiceTokens()
+    nombres = ["Jaehaerys I el Conciliador", "Aegon el Conquistador", "Aegon II", "Aemónd"]
+    for persona_id, nombre in enumerate(nombres, 1):
+        indice.agregar(persona_id, nombre)
+
+    # ACT & ASSERT
+    assert indice.buscar("jaehaerys") == [1]
+    assert indice.buscar("el") == [1, 2]
+    assert indice.buscar("Aegon el") == [2]
+    assert indice.buscar("aegon ii OR aemond OR daemon") == [3, 4]
+    assert indice.buscar("conciliádor") == [1]
+    assert indice.buscar("aegon daemon") == []
+    assert indice.buscar("OR") == []
+
+
+def test_indice_tokens_quitar():
+    """
+    Test: Las bajas quitan al ID de las listas de sus palabras
+    """
+    # ARRANGE
+    indice = IndiceTokens()
+    indice.agregar(1, "Aegon el Aegon")
+    indice.agregar(2, "Aegon II")
+
+    # ACT
+    indice.quitar(1, "Aegon el Aegon")
+
+    # ASSERT
+    assert indice.buscar("aegon") == [2]
+    assert indice.buscar("el") == []
+    assert len(indice) == 2
+
+
+@pytest.mark.parametrize(
+    ("nombre", "variante"),
+    [
+        ("Visenya", "Vissenia"),
+        ("Jaehaerys", "Jaherys"),
+        ("Daemon", "Deamon"),
+        ("Rhaenyra", "Renira"),
+        ("Alicent", "Alisent"),
+        ("Corlys", "Korlis"),
+        ("Viserys", "Biseris"),
+        ("Quique", "Kike"),
+        ("Aegon", "Égon"),
+    ],
+)
+def test_clave_fonetica_iguala_variantes(nombre: str, variante: str):
+    """
+    Test: Las variantes de escritura que suenan igual comparten código
+    """
+    # ACT & ASSERT
+    assert clave_fonetica(nombre) == clave_fonetica(variante)
+
+
+def test_clave_fonetica_distingue_sonidos():
+    """
+    Test: Nombres que suenan distinto tienen códigos distintos, por palabra
+    """
+    # ACT & ASSERT
+    assert clave_fonetica("Aegon II") == ["AGN", "ii"]
+    assert clave_fonetica("Aemond") != clave_fonetica("Aemon")
+    assert clave_fonetica("Chano") != clave_fonetica("Cano")
+    assert clave_fonetica("Yara") == ["YR"]
+
+
+def test_indice_fonetico_busca_por_sonido():
+    """
+    Test: El índice fonético encuentra nombres por cómo suenan y sigue las bajas
+
+    ARRANGE: Nombres de una y varias palabras
+    ACT: Buscar variantes fonéticas de una y dos palabras
+    ASSERT: IDs ordenados; tras la baja el código sin IDs desaparece
+    """
+    # ARRANGE
+    indice = IndiceFonetico()
+    for persona_id, nombre in enumerate(["Visenya Targaryen", "Visenya", "Rhaenyra"], 1):
+        indice.agregar(persona_id, nombre)
+
+    # ACT & ASSERT
+    assert indice.buscar("Vissenia") == [1, 2]
+    assert indice.buscar("vissenia targarien") == [1]
+    assert indice.buscar("Renira") == [3]
+    assert indice.buscar("") == []
+    indice.quitar(3, "Rhaenyra")
+    assert indice.buscar("Renira") == []
+    assert len(indice) == 2
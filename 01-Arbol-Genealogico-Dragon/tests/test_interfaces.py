@@ -71,6 +71,29 @@ def test_arbol_genealogico_implementa_arbol_repository():
     # 9. Verificar que tiene el método 'eliminar_persona'
     assert hasattr(arbol, "eliminar_persona"), "Debe tener método 'eliminar_persona'"
 
+    # 10. Verificar que tiene el método 'buscar_por_nombre'
+    assert hasattr(arbol, "buscar_por_nombre"), "Debe tener método 'buscar_por_nombre'"
+
+    # 11. Verificar que tiene los métodos de carga en lote
+    assert hasattr(arbol, "registrar_personas_bulk"), "Debe tener método 'registrar_personas_bulk'"
+    assert hasattr(arbol, "add_hijos_bulk"), "Debe tener método 'add_hijos_bulk'"
+
+    # 12. Verificar que tiene el método de búsqueda por prefijo
+    assert hasattr(arbol, "buscar_por_prefijo"), "Debe tener método 'buscar_por_prefijo'"
+
+    # 13. Verificar que tiene el método de búsqueda aproximada
+    assert hasattr(arbol, "buscar_aproximado"), "Debe tener método 'buscar_aproximado'"
+
+    # 14. Verificar que tiene las búsquedas por subcadena y por regex
+    assert hasattr(arbol, "buscar_por_subcadena"), "Debe tener método 'buscar_por_subcadena'"
+    assert hasattr(arbol, "buscar_por_regex"), "Debe tener método 'buscar_por_regex'"
+
+    # 15. Verificar que tiene la búsqueda por palabras
+    assert hasattr(arbol, "buscar_por_palabras"), "Debe tener método 'buscar_por_palabras'"
+
+    # 16. Verificar que tiene la búsqueda fonética
+    assert hasattr(arbol, "buscar_fonetico"), "Debe tener método 'buscar_fonetico'"
+
 
 def test_arbol_repository_registrar_persona():
     """
@@ -416,13 +439,13 @@ def test_ui_protocol_buscar_persona():
     assert str(persona.id) in full_output, "Debe mostrar el ID correcto de la persona"
 
 
-def test_ui_protocol_mostrar_arbol():
+def test_ui_protocol_mostrar_arbol(capsys: pytest.CaptureFixture[str]):
     """
     Test: Verificar que mostrar_arbol funciona según el Protocol
 
     Este test verifica que mostrar_arbol recorre el árbol y muestra
-    su estructura. Usamos un mock de print para verificar que se
-    ejecuta sin errores.
+    su estructura. El árbol se escribe directamente en stdout, por lo
+    que se captura con capsys.
     """
     # ARRANGE
     arbol = ArbolGenealogico()
@@ -433,11 +456,10 @@ def test_ui_protocol_mostrar_arbol():
     ui = DinastiaUI(arbol)
 
     # ACT
-    with patch("builtins.print") as mock_print:
-        ui.mostrar_arbol()
+    ui.mostrar_arbol()
 
     # ASSERT: Verificar que se imprimió la estructura esperada
-    full_output = "".join(str(call) for call in mock_print.call_args_list)
+    full_output = capsys.readouterr().out
 
     assert "Raíz" in full_output, "Debe mostrar el nombre de la raíz"
     assert "Hijo" in full_output, "Debe mostrar el nombre del hijo"
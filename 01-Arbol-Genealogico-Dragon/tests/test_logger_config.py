@@ -3,6 +3,7 @@ Tests para LoggerConfig.
 """
 
 import logging
+import logging.handlers
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -42,3 +43,37 @@ def test_get_logger_convenience():
     with patch("src.utils.logger.LoggerConfig.setup_logger") as mock_setup:
         get_logger("test_name")
         mock_setup.assert_called_once_with("test_name")
+
+
+def test_setup_logger_con_cola_delega_en_listener(tmp_path: Path):
+    """
+    Verifica que con usar_cola=True el logger solo tenga un QueueHandler
+    y que los mensajes lleguen al archivo al detener las colas.
+
+    ARRANGE: Logger con archivo y usar_cola=True
+    ACT: Loguear un mensaje y detener las colas
+    ASSERT: Único handler QueueHandler, mensaje escrito en el archivo
+    """
+    # ARRANGE
+    log_file = tmp_path / "cola.log"
+    name = "queue_logger_test"
+    logger = LoggerConfig.setup_logger(name, log_file=log_file, usar_cola=True)
+
+    try:
+        # ACT
+        logger.info("Mensaje %s", "encolado")
+        LoggerConfig.detener_colas()
+
+        # ASSERT
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        assert "Mensaje encolado" in log_file.read_text(encoding="utf-8")
+    finally:
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+
+
+def test_detener_colas_es_idempotente():
+    """Verifica que detener_colas() sin listeners activos no falle."""
+    LoggerConfig.detener_colas()
+    LoggerConfig.detener_colas()
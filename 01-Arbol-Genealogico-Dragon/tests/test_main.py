@@ -114,3 +114,28 @@ def test_handle_critical_error_no_output():
     with patch("src.main.ConsoleOutput") as mock_console:
         _handle_critical_error(error, logger, None)
         mock_console.return_value.show_error.assert_called_once()
+
+
+@patch("src.main.ApplicationContainer")
+@patch("src.main.setup_application_logging")
+def test_main_conserva_arbol_persistente(
+    mock_setup_logging: MagicMock, mock_container_cls: MagicMock
+):
+    """
+    Test: Con un repositorio que ya tiene personas no se cargan los datos de demostración
+
+    Verifica además que el contenedor recibe la configuración de main().
+    """
+    # ARRANGE
+    config = AppConfig(repositorio="sqlite")
+    mock_container_instance = mock_container_cls.return_value
+    mock_container_instance.get_arbol.return_value.personas = {1: MagicMock()}
+    mock_data_loader = mock_container_instance.get_data_loader.return_value
+
+    # ACT
+    main(config)
+
+    # ASSERT
+    mock_container_cls.assert_called_once_with(config)
+    mock_data_loader.cargar_datos.assert_not_called()
+    mock_container_instance.get_ui.return_value.mostrar_menu_principal.assert_called_once()
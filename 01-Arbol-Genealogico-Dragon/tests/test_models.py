@@ -1,3 +1,6 @@
+import pytest
+
+from src.exceptions import IDInvalidoError, PersonaNoEncontradaError
 from src.models import Persona
 
 
@@ -17,3 +20,114 @@ def test_persona_accept_visitor():
     visitor = Mock()
     p.accept_visitor(visitor)
     visitor.visitar.assert_called_once_with(p)
+
+
+def test_persona_usa_slots_sin_dict():
+    p = Persona(1, "Viserys")
+
+    assert not hasattr(p, "__dict__")
+    assert p.hijos_ids.tolist() == []
+
+
+def test_persona_relaciones_se_guardan_como_ids():
+    padre = Persona(1, "Viserys")
+    madre = Persona(2, "Aemma")
+    hija = Persona(3, "Rhaenyra")
+
+    padre.pareja = madre
+    padre.hijos.append(hija)
+    hija.padres = (padre, madre)
+
+    # Las referencias se resuelven a través del registro compartido
+    assert padre.pareja is madre
+    assert hija.padres == (padre, madre)
+    assert padre.hijos == [hija]
+    assert padre.hijos_ids.tolist() == [3]
+    assert hija in padre.hijos
+    assert madre not in padre.hijos
+
+
+def test_persona_hijos_se_comporta_como_lista():
+    padre = Persona(1, "Baelon")
+    h1, h2, h3 = Persona(2, "Viserys"), Persona(3, "Daemon"), Persona(4, "Aegon")
+
+    padre.hijos.extend([h1, h2])
+    padre.hijos.insert(0, h3)
+    assert list(padre.hijos) == [h3, h1, h2]
+    assert padre.hijos[1] is h1
+    assert padre.hijos[1:] == [h1, h2]
+    assert len(padre.hijos) == 3
+
+    padre.hijos[0] = h2
+    padre.hijos[1:] = [h3]
+    assert list(padre.hijos) == [h2, h3]
+
+    padre.hijos.remove(h2)
+    del padre.hijos[0]
+    assert len(padre.hijos) == 0
+    assert not padre.hijos
+    assert repr(padre.hijos) == "[]"
+
+
+def test_persona_hijos_errores_explicitos():
+    padre = Persona(1, "Baelon")
+    hijo = Persona(2, "Viserys")
+    padre.hijos.append(hijo)
+
+    with pytest.raises(TypeError):
+        padre.hijos[0] = "Viserys"  # type: ignore
+    with pytest.raises(TypeError):
+        padre.hijos[0:1] = hijo  # type: ignore
+    # Un hijo que salió del registro no se resuelve como None
+    del padre._registro[2]  # type: ignore
+    with pytest.raises(PersonaNoEncontradaError, match="ID 2"):
+        padre.hijos[0]
+    assert padre.hijos_ids.tolist() == [2]
+
+
+def test_persona_hijos_remove_inexistente_lanza_value_error():
+    padre = Persona(1, "Baelon")
+
+    with pytest.raises(ValueError):
+        padre.hijos.remove(Persona(2, "Otro"))
+
+
+def test_persona_constructor_con_pareja_e_hijos():
+    pareja = Persona(2, "Alicent")
+    hijo = Persona(3, "Aegon II")
+    p = Persona(1, "Viserys", pareja=pareja, hijos=[hijo])
+
+    assert p.pareja is pareja
+    assert p.hijos == [hijo]
+    assert p.hijos == Persona(4, "Viserys", hijos=[hijo]).hijos
+    assert p.padres == (None, None)
+
+
+def test_persona_comparte_registro_del_repositorio():
+    registro: dict[int, Persona] = {}
+    p1 = Persona(1, "Aegon", registro=registro)
+    p2 = Persona(2, "Rhaenys", registro=registro)
+    registro.update({1: p1, 2: p2})
+
+    p1.pareja = p2
+    p2.pareja = p1
+
+    assert p1.pareja is p2
+    # Una persona quitada del registro deja de resolverse
+    del registro[2]
+    assert p1.pareja is None
+
+
+def test_persona_no_vincula_otra_con_id_ocupado():
+    registro: dict[int, Persona] = {}
+    p1 = Persona(1, "Aegon", registro=registro)
+    p2 = Persona(2, "Rhaenys", registro=registro)
+    registro.update({1: p1, 2: p2})
+    intruso = Persona(2, "Intruso")
+
+    with pytest.raises(IDInvalidoError, match="ID 2"):
+        p1.pareja = intruso
+
+    assert p1.pareja is None
+    assert registro[2] is p2
+    assert intruso.pareja is None
@@ -0,0 +1,192 @@
+import random
+
+import pytest
+
+from src.orden_topologico import (
+    OrdenTopologico,
+    componentes_fuertes,
+    ordenar_topologicamente,
+)
+
+
+class GrafoPrueba:
+    """Grafo padre -> hijo mínimo que alimenta al OrdenTopologico."""
+
+    def __init__(self, cantidad: int):
+        self.hijos: dict[int, list[int]] = {i: [] for i in range(1, cantidad + 1)}
+        self.padres: dict[int, list[int]] = {i: [] for i in range(1, cantidad + 1)}
+        self.orden = OrdenTopologico(self.hijos.__getitem__, self.padres.__getitem__)
+        for i in range(1, cantidad + 1):
+            self.orden.agregar_nodo(i)
+
+    def relacionar(self, padre_id: int, hijo_id: int) -> None:
+        assert not self.orden.crearia_ciclo(padre_id, hijo_id)
+        self.orden.agregar_arista(padre_id, hijo_id)
+        self.hijos[padre_id].append(hijo_id)
+        self.padres[hijo_id].append(padre_id)
+
+    def orden_valido(self) -> bool:
+        rango = self.orden.rango
+        return all(rango(p) < rango(h) for p, hijos in self.hijos.items() for h in hijos)
+
+
+@pytest.fixture
+def grafo() -> GrafoPrueba:
+    return GrafoPrueba(5)
+
+
+def test_relacion_que_respeta_el_orden_no_reordena(grafo: GrafoPrueba):
+    """
+    Test: Relación padre -> hijo con el padre ya antes en el orden
+
+    Resultado: no hay ciclo y los rangos no cambian
+    """
+    # ARRANGE
+    rangos = {i: grafo.orden.rango(i) for i in range(1, 6)}
+
+    # ACT
+    grafo.relacionar(1, 2)
+
+    # ASSERT
+    assert {i: grafo.orden.rango(i) for i in range(1, 6)} == rangos
+
+
+def test_relacion_en_contra_del_orden_reordena_region(grafo: GrafoPrueba):
+    """
+    Test: Relaciones en orden inverso al alta
+
+    Escenario:
+    5 -> 4 -> 3 -> 2 -> 1 (cada una contradice el orden de alta)
+    Resultado: el orden queda válido y la persona 5 pasa a ser la primera
+    """
+    # ACT
+    for padre_id in range(5, 1, -1):
+        grafo.relacionar(padre_id, padre_id - 1)
+
+    # ASSERT
+    assert grafo.orden_valido()
+    assert min(range(1, 6), key=grafo.orden.rango) == 5
+
+
+def test_crearia_ciclo_detecta_ciclos(grafo: GrafoPrueba):
+    """
+    Test: Detección de ciclos directos, indirectos y de una persona consigo misma
+    """
+    # ARRANGE
+    grafo.relacionar(3, 1)
+    grafo.relacionar(1, 2)
+
+    # ACT / ASSERT
+    assert grafo.orden.crearia_ciclo(2, 3)
+    assert grafo.orden.crearia_ciclo(1, 3)
+    assert grafo.orden.crearia_ciclo(4, 4)
+    assert not grafo.orden.crearia_ciclo(4, 3)
+
+
+def test_agregar_arista_rechaza_ciclo_sin_tocar_el_orden(grafo: GrafoPrueba):
+    """
+    Test: Registrar una relación que cierra un ciclo falla aunque se omita crearia_ciclo
+
+    Resultado: RuntimeError (también con python -O) y los rangos no cambian
+    """
+    # ARRANGE
+    grafo.relacionar(1, 2)
+    grafo.relacionar(2, 3)
+    rangos = {i: grafo.orden.rango(i) for i in range(1, 6)}
+
+    # ACT & ASSERT
+    with pytest.raises(RuntimeError, match="ciclo"):
+        grafo.orden.agregar_arista(3, 1)
+    assert {i: grafo.orden.rango(i) for i in range(1, 6)} == rangos
+
+
+def test_reconstruir_rechaza_grafo_con_ciclos(grafo: GrafoPrueba):
+    """
+    Test: reconstruir() sobre relaciones que forman un ciclo
+
+    Resultado: RuntimeError (también con python -O) y los rangos no cambian
+    """
+    # ARRANGE
+    grafo.relacionar(1, 2)
+    rangos = {i: grafo.orden.rango(i) for i in range(1, 6)}
+    # Ciclo 2 -> 3 -> 2 agregado sin pasar por el orden
+    grafo.hijos[2].append(3)
+    grafo.hijos[3].append(2)
+
+    # ACT & ASSERT
+    with pytest.raises(RuntimeError, match="2 persona"):
+        grafo.orden.reconstruir(range(1, 6))
+    assert {i: grafo.orden.rango(i) for i in range(1, 6)} == rangos
+
+
+def test_quitar_nodo_conserva_el_orden(grafo: GrafoPrueba):
+    """
+    Test: Quitar una persona deja huecos en los rangos sin invalidar el orden
+    """
+    # ARRANGE
+    grafo.relacionar(2, 1)
+    grafo.relacionar(4, 2)
+
+    # ACT
+    grafo.orden.quitar_nodo(3)
+    del grafo.hijos[3], grafo.padres[3]
+    grafo.relacionar(5, 4)
+
+    # ASSERT
+    assert 3 not in grafo.orden
+    assert len(grafo.orden) == 4
+    assert grafo.orden_valido()
+
+
+def test_orden_aleatorio_coincide_con_busqueda_de_ancestros():
+    """
+    Test: Relaciones al azar contra una búsqueda de ancestros de referencia
+
+    Resultado: crearia_ciclo coincide con la búsqueda y el orden sigue válido
+    """
+    # ARRANGE
+    rng = random.Random(7)
+    grafo = GrafoPrueba(60)
+
+    def es_descendiente(buscar: int, inicio: int) -> bool:
+        pendientes, visitados = [inicio], set()
+        while pendientes:
+            actual = pendientes.pop()
+            if actual == buscar:
+                return True
+            if actual not in visitados:
+                visitados.add(actual)
+                pendientes.extend(grafo.hijos[actual])
+        return False
+
+    # ACT / ASSERT
+    for _ in range(400):
+        padre_id, hijo_id = rng.randint(1, 60), rng.randint(1, 60)
+        esperado = es_descendiente(padre_id, hijo_id)
+        assert grafo.orden.crearia_ciclo(padre_id, hijo_id) == esperado
+        if not esperado:
+            grafo.relacionar(padre_id, hijo_id)
+    assert grafo.orden_valido()
+
+
+def test_ordenar_topologicamente_y_componentes_fuertes():
+    """
+    Test: Kahn deja sin ordenar los ciclos y lo que desciende de ellos;
+    Tarjan separa cada ciclo en su componente
+
+    Escenario:
+    1 -> 2 -> 3 -> 2 (ciclo 2-3), 3 -> 4, 5 -> 6 -> 5 (ciclo 5-6)
+    """
+    # ARRANGE
+    hijos = {1: [2], 2: [3], 3: [2, 4], 4: [], 5: [6], 6: [5]}
+
+    # ACT
+    orden, restantes = ordenar_topologicamente(hijos, hijos.__getitem__)
+    componente = componentes_fuertes(restantes, hijos.__getitem__)
+
+    # ASSERT
+    assert orden == [1]
+    assert restantes == {2, 3, 4, 5, 6}
+    assert componente[2] == componente[3]
+    assert componente[5] == componente[6]
+    assert len({componente[2], componente[4], componente[5]}) == 3
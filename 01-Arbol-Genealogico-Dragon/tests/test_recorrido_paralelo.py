@@ -0,0 +1,192 @@
+"""
+Tests para el recorrido en paralelo por componentes (src/recorrido_paralelo.py).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models import Persona
+from src.recorrido_paralelo import recorrer_en_paralelo, tomar_instantanea
+from src.repository import ArbolGenealogico
+from src.visitors import EstadisticasVisitor, PrintArbolVisitor, SearchArbolVisitor
+
+
+class BusquedaPorPrefijo(SearchArbolVisitor):
+    """Búsqueda que redefine solo el hook (a nivel de módulo para poder serializarse)."""
+
+    def al_visitar(self, persona: Persona, profundidad: int, es_ultimo: bool) -> None:
+        if persona.nombre.lower().startswith(self.nombre_a_buscar):
+            self.resultado.append(persona)
+
+
+@pytest.fixture
+def arbol_de_casas() -> ArbolGenealogico:
+    """
+    Fixture: Tres casas independientes y una cuarta unida a la primera por un hijo
+
+    - Casa 0: Fundador 0 -> Heredero 0 -> Nieto 0
+    - Casa 1 y 2: igual estructura, sin parentesco con las demás
+    - Casa 3: Fundador 3, padre también de Nieto 0 (se une a la casa 0)
+    """
+    arbol = ArbolGenealogico()
+    nietos = []
+    for casa in range(3):
+        fundador = arbol.registrar_persona(f"Fundador {casa}")
+        heredero = arbol.registrar_persona(f"Heredero {casa}")
+        nieto = arbol.registrar_persona(f"Nieto {casa}")
+        arbol.add_hijo(fundador, heredero)
+        arbol.add_hijo(heredero, nieto)
+        nietos.append(nieto)
+    fundador_unido = arbol.registrar_persona("Fundador 3")
+    arbol.add_hijo(fundador_unido, nietos[0])
+    return arbol
+
+
+def test_tomar_instantanea_agrupa_casas_emparentadas(arbol_de_casas: ArbolGenealogico):
+    """
+    Test: Las raíces que comparten descendientes quedan en la misma componente
+
+    ARRANGE: Cuatro raíces, dos de ellas unidas por un nieto en común
+    ACT: Tomar la instantánea del bosque
+    ASSERT: Tres componentes, en el orden de su primera raíz, con todas las personas
+    """
+    # ARRANGE
+    raices = arbol_de_casas.init_get_root()
+
+    # ACT
+    instantanea, cortes = tomar_instantanea(raices, arbol_de_casas.personas)
+
+    # ASSERT
+    assert cortes == [(4, 2), (7, 3), (10, 4)]
+    assert list(instantanea.raices) == [1, 10, 4, 7]
+    assert sorted(instantanea.ids[:4]) == [1, 2, 3, 10]
+    assert sorted(instantanea.ids) == sorted(arbol_de_casas.personas)
+
+
+def test_instantanea_guarda_relaciones_compactas(arbol_de_casas: ArbolGenealogico):
+    """
+    Test: Un corte de la instantánea conserva nombres, padres e hijos como arrays de IDs
+    """
+    # ARRANGE
+    instantanea, cortes = tomar_instantanea(arbol_de_casas.init_get_root(), arbol_de_casas.personas)
+
+    # ACT
+    segunda = instantanea.cortar(cortes[0][0], cortes[1][0], cortes[0][1], cortes[1][1])
+
+    # ASSERT
+    assert list(segunda.raices) == [4]
+    indice = list(segunda.ids).index(5)
+    assert segunda.nombres[indice] == "Heredero 1"
+    assert (segunda.padres0[indice], segunda.padres1[indice]) == (4, 0)
+    base = segunda.hijos_inicio[0]
+    inicio, fin = segunda.hijos_inicio[indice] - base, segunda.hijos_inicio[indice + 1] - base
+    assert list(segunda.hijos[inicio:fin]) == [6]
+
+
+@patch("src.recorrido_paralelo.PERSONAS_MINIMAS_POR_LOTE", 1)
+def test_recorrido_paralelo_coincide_con_secuencial(arbol_de_casas: ArbolGenealogico):
+    """
+    Test: En paralelo los visitors combinables obtienen los mismos resultados
+
+    ARRANGE: Visitors de impresión, búsqueda y estadísticas, secuenciales y paralelos
+    ACT: Recorrer con procesos=1 y con procesos=2 (lotes de una componente)
+    ASSERT: Mismas líneas (agrupadas por componente), búsqueda y conteos
+    """
+    # ARRANGE
+    secuenciales = (PrintArbolVisitor(), SearchArbolVisitor("Nieto 0"), EstadisticasVisitor())
+    paralelos = (PrintArbolVisitor(), SearchArbolVisitor("Nieto 0"), EstadisticasVisitor())
+    arbol_de_casas.recorrer_arbol_completo(*secuenciales)
+
+    # ACT
+    arbol_de_casas.recorrer_arbol_completo(*paralelos, procesos=2)
+
+    # ASSERT
+    impresion, busqueda, estadisticas = paralelos
+    assert sorted(impresion.resultado) == sorted(secuenciales[0].resultado)
+    # Fundador 3 se imprime junto a su componente y no al final
+    assert impresion.resultado[3] == "└─ Fundador 3 (id: 10)"
+    assert busqueda.obtener_resultado() == [arbol_de_casas.get_persona(3)]
+    assert busqueda.obtener_resultado()[0] is arbol_de_casas.get_persona(3)
+    assert estadisticas.por_profundidad == secuenciales[2].por_profundidad
+    assert estadisticas.cantidad == 10
+    assert impresion.visitados == set(arbol_de_casas.personas)
+
+
+@patch("src.recorrido_paralelo.PERSONAS_MINIMAS_POR_LOTE", 1)
+def test_recorrido_paralelo_ejecuta_localmente_visitors_no_combinables(
+    arbol_de_casas: ArbolGenealogico,
+):
+    """
+    Test: Los visitors que no son combinables se recorren en el proceso actual
+    """
+    # ARRANGE
+    visitor = MagicMock()
+    estadisticas = EstadisticasVisitor()
+
+    # ACT
+    arbol_de_casas.recorrer_arbol_completo(visitor, estadisticas, procesos=2)
+
+    # ASSERT
+    assert visitor.visitar.call_count == len(arbol_de_casas.init_get_root())
+    assert estadisticas.cantidad == 10
+
+
+@patch("src.recorrido_paralelo.PERSONAS_MINIMAS_POR_LOTE", 1)
+def test_recorrido_paralelo_conserva_la_subclase_del_visitor(arbol_de_casas: ArbolGenealogico):
+    """
+    Test: Los parciales de una subclase ejecutan el al_visitar() de la subclase
+
+    ARRANGE: Una búsqueda por prefijo que hereda de SearchArbolVisitor
+    ACT: Recorrer con procesos=1 y con procesos=2
+    ASSERT: Ambos recorridos encuentran las mismas personas
+    """
+    # ARRANGE
+    secuencial = BusquedaPorPrefijo("nieto")
+    paralelo = BusquedaPorPrefijo("nieto")
+    arbol_de_casas.recorrer_arbol_completo(secuencial)
+
+    # ACT
+    arbol_de_casas.recorrer_arbol_completo(paralelo, procesos=2)
+
+    # ASSERT
+    assert type(paralelo.nuevo_parcial()) is BusquedaPorPrefijo
+    assert len(secuencial.resultado) == 3
+    assert sorted(p.id for p in paralelo.resultado) == sorted(p.id for p in secuencial.resultado)
+
+
+@patch("src.recorrido_paralelo.PERSONAS_MINIMAS_POR_LOTE", 1)
+def test_recorrido_paralelo_no_repite_personas_de_un_visitor_reutilizado(
+    arbol_de_casas: ArbolGenealogico,
+):
+    """
+    Test: Un visitor que ya recorrió el árbol no vuelve a contar a nadie en paralelo
+    """
+    # ARRANGE
+    estadisticas = EstadisticasVisitor()
+    arbol_de_casas.recorrer_arbol_completo(estadisticas, procesos=2)
+
+    # ACT
+    arbol_de_casas.recorrer_arbol_completo(estadisticas, procesos=2)
+
+    # ASSERT
+    assert estadisticas.cantidad == 10
+    assert estadisticas.visitados == set(arbol_de_casas.personas)
+
+
+def test_recorrido_paralelo_sin_beneficio_no_crea_procesos(arbol_de_casas: ArbolGenealogico):
+    """
+    Test: Con un único lote se recorre en el proceso actual, sin pool
+    """
+    # ARRANGE
+    estadisticas = EstadisticasVisitor()
+
+    # ACT
+    with patch("src.recorrido_paralelo.ProcessPoolExecutor") as pool:
+        recorrer_en_paralelo(
+            arbol_de_casas.init_get_root(), arbol_de_casas.personas, [estadisticas], 4
+        )
+
+    # ASSERT
+    pool.assert_not_called()
+    assert estadisticas.profundidad_maxima == 2
@@ -6,15 +6,19 @@ import pytest
 
 from src.exceptions import (
     CicloTemporalError,
+    ConsultaInvalidaError,
     EliminacionConDescendientesError,
     IDInvalidoError,
+    LimitePadresExcedidoError,
+    LoteRelacionesError,
     ParejaNoExisteError,
     PersonaNoEncontradaError,
     RelacionInvalidaError,
 )
-from src.models import Persona
+from src.indices import clave_fonetica
+from src.models import SIN_ID, Persona
 from src.repository import ArbolGenealogico
-from src.visitors import PrintArbolVisitor, SearchArbolVisitor
+from src.visitors import PrintArbolVisitor, SearchArbolVisitor, iterar_recorrido
 
 
 def test_registrar_persona_exito(arbol_vacio: ArbolGenealogico):
@@ -126,6 +130,177 @@ def test_get_persona_no_existe(arbol_vacio: ArbolGenealogico):
     assert exc_info.value.persona_id == persona_id_inexistente
 
 
+# ==================== TESTS PARA buscar_por_nombre ====================
+def test_buscar_por_nombre_ignora_mayusculas_y_espacios(arbol_con_datos: ArbolGenealogico):
+    """
+    Test: Búsqueda por nombre normalizado
+
+    Verifica que buscar_por_nombre() encuentra personas sin distinguir
+    mayúsculas ni espacios extremos.
+    """
+    # ACT
+    resultados = arbol_con_datos.buscar_por_nombre("  hIJo ")
+
+    # ASSERT
+    assert [p.nombre for p in resultados] == ["Hijo"]
+
+
+def test_buscar_por_nombre_multiples_resultados(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsqueda con nombres repetidos
+
+    Verifica que se retornan todas las personas con el mismo nombre, ordenadas por ID.
+    """
+    # ARRANGE
+    p1 = arbol_vacio.registrar_persona("Aegon")
+    arbol_vacio.registrar_persona("Rhaenyra")
+    p3 = arbol_vacio.registrar_persona("aegon")
+
+    # ACT
+    resultados = arbol_vacio.buscar_por_nombre("Aegon")
+
+    # ASSERT
+    assert resultados == [p1, p3]
+    assert arbol_vacio.buscar_por_nombre("Inexistente") == []
+
+
+def test_buscar_por_nombre_se_actualiza_al_eliminar(arbol_vacio: ArbolGenealogico):
+    """
+    Test: El índice de nombres se mantiene al eliminar personas
+
+    Verifica que eliminar_persona() quita a la persona del índice.
+    """
+    # ARRANGE
+    p1 = arbol_vacio.registrar_persona("Aegon")
+    p2 = arbol_vacio.registrar_persona("Aegon")
+
+    # ACT
+    arbol_vacio.eliminar_persona(p1.id)
+
+    # ASSERT
+    assert arbol_vacio.buscar_por_nombre("Aegon") == [p2]
+    arbol_vacio.eliminar_persona(p2.id)
+    assert arbol_vacio.buscar_por_nombre("Aegon") == []
+    assert arbol_vacio._indice_nombres == {}  # type: ignore
+
+
+# ==================== TESTS PARA buscar_por_prefijo ====================
+def test_buscar_por_prefijo_autocompleta(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsqueda por prefijo para autocompletar
+
+    Verifica que buscar_por_prefijo() retorna las personas cuyo nombre empieza
+    con el prefijo, en orden alfabético, y que el índice sigue las bajas.
+    """
+    # ARRANGE
+    aemond = arbol_vacio.registrar_persona("Aemond")
+    aegon = arbol_vacio.registrar_persona("Aegon")
+    arbol_vacio.registrar_persona("Rhaenyra")
+    aegon_ii = arbol_vacio.registrar_persona("Aegon II")
+
+    # ACT
+    resultados = arbol_vacio.buscar_por_prefijo("ae")
+
+    # ASSERT
+    assert resultados == [aegon, aegon_ii, aemond]
+    assert arbol_vacio.buscar_por_prefijo("AEG", limite=1) == [aegon]
+    arbol_vacio.eliminar_persona(aegon.id)
+    assert arbol_vacio.buscar_por_prefijo("aeg") == [aegon_ii]
+
+
+# ==================== TESTS PARA buscar_aproximado ====================
+def test_buscar_aproximado_tolera_errores_de_tipeo(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsqueda aproximada por distancia de edición
+
+    Verifica que buscar_aproximado() encuentra nombres mal escritos, del más
+    parecido al menos, y que el índice sigue las bajas.
+    """
+    # ARRANGE
+    daemon = arbol_vacio.registrar_persona("Daemon")
+    jaehaerys = arbol_vacio.registrar_persona("Jaehaerys")
+    jaehaera = arbol_vacio.registrar_persona("Jaehaera")
+
+    # ACT
+    resultados = arbol_vacio.buscar_aproximado("Jahaerys", distancia_maxima=3)
+
+    # ASSERT
+    assert resultados == [jaehaerys, jaehaera]
+    assert arbol_vacio.buscar_aproximado("Deamon") == [daemon]
+    assert arbol_vacio.buscar_aproximado("Deamon", distancia_maxima=1) == []
+    arbol_vacio.eliminar_persona(jaehaerys.id)
+    assert arbol_vacio.buscar_aproximado("Jahaerys", distancia_maxima=3) == [jaehaera]
+
+
+# ==================== TESTS PARA buscar_por_subcadena y buscar_por_regex ====================
+def test_buscar_por_subcadena_y_regex(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsquedas por subcadena y regex con el índice de trigramas
+
+    Verifica que se encuentran fragmentos en cualquier posición del nombre,
+    que el índice sigue las bajas y que una regex inválida se informa.
+    """
+    # ARRANGE
+    aegon_ii = arbol_vacio.registrar_persona("Aegon II")
+    jaehaerys = arbol_vacio.registrar_persona("Jaehaerys I el Conciliador")
+    aegon_iii = arbol_vacio.registrar_persona("Aegon III")
+
+    # ACT
+    resultados = arbol_vacio.buscar_por_subcadena("conciliador")
+
+    # ASSERT
+    assert resultados == [jaehaerys]
+    assert arbol_vacio.buscar_por_regex("Aegon.*II") == [aegon_ii, aegon_iii]
+    arbol_vacio.eliminar_persona(aegon_ii.id)
+    assert arbol_vacio.buscar_por_regex("^aegon i+$") == [aegon_iii]
+    with pytest.raises(ConsultaInvalidaError):
+        arbol_vacio.buscar_por_regex("[Aegon")
+
+
+# ==================== TESTS PARA buscar_por_palabras ====================
+def test_buscar_por_palabras_sin_acentos(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsqueda de texto completo por palabras
+
+    Verifica que buscar_por_palabras() encuentra nombres que contienen todas
+    las palabras, sin distinguir acentos, y que acepta alternativas con OR.
+    """
+    # ARRANGE
+    jaehaerys = arbol_vacio.registrar_persona("Jaehaerys I el Conciliador")
+    aegon = arbol_vacio.registrar_persona("Aegon el Conquistador")
+    aemond = arbol_vacio.registrar_persona("Aemond")
+
+    # ACT
+    resultados = arbol_vacio.buscar_por_palabras("JAEHAÉRYS")
+
+    # ASSERT
+    assert resultados == [jaehaerys]
+    assert arbol_vacio.buscar_por_palabras("el conquistador OR aemond") == [aegon, aemond]
+    arbol_vacio.eliminar_persona(aegon.id)
+    assert arbol_vacio.buscar_por_palabras("el") == [jaehaerys]
+
+
+# ==================== TESTS PARA buscar_fonetico ====================
+def test_buscar_fonetico_calcula_codigos_al_registrar(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Búsqueda por sonido con códigos calculados al registrar
+
+    Verifica que buscar_fonetico() encuentra variantes de escritura y que
+    los códigos de las personas no se recalculan en cada consulta.
+    """
+    # ARRANGE
+    visenya = arbol_vacio.registrar_persona("Visenya")
+    arbol_vacio.registrar_persona("Rhaenys")
+
+    # ACT
+    with patch("src.indices.clave_fonetica", wraps=clave_fonetica) as espia:
+        resultados = arbol_vacio.buscar_fonetico("Vissenia")
+
+    # ASSERT
+    assert resultados == [visenya]
+    espia.assert_called_once_with("Vissenia")
+
+
 # ==================== TESTS PARA init_get_root ====================
 def test_init_get_root_vacio(arbol_vacio: ArbolGenealogico):
     """
@@ -174,6 +349,47 @@ def test_init_get_root_con_multiples_raices(arbol_con_multiples_raices: ArbolGen
     assert "Raiz 2" in nombres_raices
 
 
+def test_init_get_root_se_actualiza_con_mutaciones(arbol_con_datos: ArbolGenealogico):
+    """
+    Test: Conjunto de raíces incremental
+
+    Verifica que las raíces reflejan add_hijo() y eliminar_persona() sin
+    reconstruirse: un hijo que pierde a todos sus padres vuelve a ser raíz.
+    """
+    # ARRANGE
+    padre, madre, hijo = (arbol_con_datos.get_persona(i) for i in (1, 2, 3))
+
+    # ACT & ASSERT
+    arbol_con_datos.eliminar_persona(padre.id, confirmar_rotura=True)
+    assert arbol_con_datos.init_get_root() == [madre]
+
+    arbol_con_datos.eliminar_persona(madre.id, confirmar_rotura=True)
+    assert arbol_con_datos.init_get_root() == [hijo]
+
+    nuevo = arbol_con_datos.registrar_persona("Nuevo")
+    arbol_con_datos.add_hijo(nuevo, hijo)
+    assert arbol_con_datos.init_get_root() == [nuevo]
+
+
+def test_init_get_root_compacta_tras_muchas_bajas(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Compactación del conjunto de raíces
+
+    Verifica que tras muchas bajas el conjunto se reconstruye sin perder raíces.
+    """
+    # ARRANGE
+    ancestro = arbol_vacio.registrar_persona("Ancestro")
+    hijos = [arbol_vacio.registrar_persona(f"Hijo {i}") for i in range(50)]
+
+    # ACT
+    for hijo in hijos:
+        arbol_vacio.add_hijo(ancestro, hijo)
+
+    # ASSERT
+    assert arbol_vacio.init_get_root() == [ancestro]
+    assert arbol_vacio._raices_quitadas < len(hijos)  # type: ignore
+
+
 # ==================== TESTS PARA recorrer_arbol_completo ====================
 def test_recorrer_arbol_completo_con_visitor(arbol_con_datos: ArbolGenealogico):
     """
@@ -230,6 +446,52 @@ def test_recorrer_arbol_vacio(arbol_vacio: ArbolGenealogico):
     assert resultado == "No hay personajes registrados."
 
 
+def test_recorrer_arbol_completo_fusiona_visitors(arbol_completo: ArbolGenealogico):
+    """
+    Test: Varios visitors se ejecutan en una sola pasada con el mismo resultado
+
+    ARRANGE: Árbol de varias generaciones, visitors separados y fusionados
+    ACT: Recorrer uno por uno y luego todos juntos
+    ASSERT: Mismos resultados y un solo recorrido por raíz para los fusionados
+    """
+    # ARRANGE
+    impresion_sola, busqueda_sola = PrintArbolVisitor(), SearchArbolVisitor("Hija")
+    impresion, busqueda = PrintArbolVisitor(), SearchArbolVisitor("Hija")
+    arbol_completo.recorrer_arbol_completo(impresion_sola)
+    arbol_completo.recorrer_arbol_completo(busqueda_sola)
+    raices = len(arbol_completo.init_get_root())
+
+    # ACT
+    with patch("src.visitors.iterar_recorrido", wraps=iterar_recorrido) as recorrido:
+        arbol_completo.recorrer_arbol_completo(impresion, busqueda)
+
+    # ASSERT
+    assert recorrido.call_count == raices
+    assert impresion.get_resultado() == impresion_sola.get_resultado()
+    assert busqueda.obtener_resultado() == busqueda_sola.obtener_resultado()
+    assert impresion.visitados == busqueda.visitados == impresion_sola.visitados
+    assert impresion.visitados is not busqueda.visitados
+
+
+def test_recorrer_arbol_completo_visitor_propio_usa_accept_visitor(
+    arbol_con_datos: ArbolGenealogico,
+):
+    """
+    Test: Un visitor que no usa el motor de recorrido recibe cada raíz por separado
+    """
+    # ARRANGE
+    visitor = MagicMock()
+    busqueda = SearchArbolVisitor("Hijo")
+
+    # ACT
+    arbol_con_datos.recorrer_arbol_completo(visitor, busqueda)
+
+    # ASSERT
+    visitados = [llamada.args[0].nombre for llamada in visitor.visitar.call_args_list]
+    assert visitados == [r.nombre for r in arbol_con_datos.init_get_root()]
+    assert [p.nombre for p in busqueda.obtener_resultado()] == ["Hijo"]
+
+
 # ==================== TESTS PARA add_hijo ====================
 def test_add_hijo_exito(arbol_vacio: ArbolGenealogico):
     """
@@ -326,6 +588,72 @@ def test_add_hijo_bloquea_ciclo_temporal(arbol_vacio: ArbolGenealogico):
     assert "Paradoja temporal" in str(exc_info.value)
 
 
+def test_modificaciones_rechazan_personas_fuera_del_arbol():
+    """
+    Test: Una Persona creada fuera del árbol no se puede relacionar
+
+    Verifica que add_pareja() y add_hijo() lanzan PersonaNoEncontradaError
+    tanto si el ID es de otra persona del árbol como si está libre, sin
+    tocar el registro ni la numeración de IDs.
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico(usar_orden_topologico=False)
+    aenar, gaemon = arbol.registrar_personas_bulk(["Aenar", "Gaemon"])
+
+    # ACT & ASSERT
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol.add_pareja(aenar, Persona(2, "Intruso"))
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol.add_hijo(aenar, Persona(99, "Suelto"))
+
+    assert aenar.pareja is None and gaemon.pareja is None
+    assert list(aenar.hijos_ids) == []
+    assert 99 not in arbol.personas
+    assert arbol.registrar_persona("Daenys").id == 3
+
+
+def test_add_hijo_con_orden_topologico_rechaza_persona_fuera_del_arbol(
+    arbol_vacio: ArbolGenealogico,
+):
+    """
+    Test: add_hijo con el orden topológico activo no filtra un KeyError
+
+    Verifica que un hijo que no está en el árbol se rechaza con
+    PersonaNoEncontradaError antes de consultar su rango en el orden.
+    """
+    # ARRANGE
+    padre = arbol_vacio.registrar_persona("Aenar")
+
+    # ACT & ASSERT
+    with pytest.raises(PersonaNoEncontradaError, match="ID 99"):
+        arbol_vacio.add_hijo(padre, Persona(99, "Suelto"))
+    with pytest.raises(PersonaNoEncontradaError, match="ID 98"):
+        arbol_vacio.add_hijo(Persona(98, "Suelto"), padre)
+
+    assert list(padre.hijos_ids) == []
+    assert padre in arbol_vacio.init_get_root()
+
+
+def test_add_hijo_rechaza_relacion_repetida(arbol_vacio: ArbolGenealogico):
+    """
+    Test: add_hijo no duplica una relación padre-hijo existente
+
+    Verifica que el segundo add_hijo() con el mismo par falla y deja
+    hijos y padres como estaban.
+    """
+    # ARRANGE
+    padre = arbol_vacio.registrar_persona("Padre")
+    hijo = arbol_vacio.registrar_persona("Hijo")
+    arbol_vacio.add_hijo(padre, hijo)
+
+    # ACT & ASSERT
+    with pytest.raises(RelacionInvalidaError, match="Padre ya es padre de Hijo"):
+        arbol_vacio.add_hijo(padre, hijo)
+
+    assert list(padre.hijos_ids) == [hijo.id]
+    assert hijo.padres_ids == (padre.id, SIN_ID)
+
+
 # ==================== TESTS PARA add_pareja ====================
 
 
@@ -634,3 +962,136 @@ def test_eliminar_persona_sin_hijos_no_requiere_confirmacion(
 
     # ASSERT
     assert persona_id not in arbol_con_persona_simple.personas
+
+
+def test_cache_ancestros_se_invalida_al_mutar():
+    """
+    Test: Con usar_cache_ancestros=True, las mutaciones invalidan el cache
+
+    Verifica que un ciclo creado por una relación agregada después de haber
+    poblado el cache se sigue detectando, y que eliminar una persona lo vacía.
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico(usar_cache_ancestros=True, usar_orden_topologico=False)
+    abuelo = arbol.registrar_persona("Abuelo")
+    padre = arbol.registrar_persona("Padre")
+    nieto = arbol.registrar_persona("Nieto")
+    otro = arbol.registrar_persona("Otro")
+    arbol.add_hijo(abuelo, padre)
+    arbol.add_hijo(otro, nieto)  # puebla el cache con los ancestros de Nieto
+
+    # ACT: Padre pasa a ser ancestro de Nieto después de cachear
+    arbol.add_hijo(padre, nieto)
+
+    # ASSERT
+    with pytest.raises(CicloTemporalError):
+        arbol.add_hijo(nieto, abuelo)
+
+    arbol.eliminar_persona(otro.id, confirmar_rotura=True)
+    assert len(arbol._cache_ancestros) == 0
+
+
+def test_orden_topologico_detecta_ciclo_con_relaciones_en_contra_del_alta():
+    """
+    Test: Ciclos detectados cuando las relaciones no siguen el orden de registro
+
+    Escenario:
+    - Se registran Nieto, Padre y Abuelo (en ese orden)
+    - Abuelo -> Padre -> Nieto obliga a reordenar el orden topológico
+    - Intentar Nieto -> padre de Abuelo
+    Resultado: CicloTemporalError con el mismo mensaje que la búsqueda de ancestros
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico()
+    nieto = arbol.registrar_persona("Nieto")
+    padre = arbol.registrar_persona("Padre")
+    abuelo = arbol.registrar_persona("Abuelo")
+    arbol.add_hijo(padre, nieto)
+    arbol.add_hijo(abuelo, padre)
+
+    # ACT / ASSERT
+    with pytest.raises(CicloTemporalError) as exc_info:
+        arbol.add_hijo(nieto, abuelo)
+
+    assert f"{abuelo.nombre} es ancestro de {nieto.nombre}" in str(exc_info.value)
+    assert arbol._orden is not None
+    assert arbol._orden.rango(abuelo.id) < arbol._orden.rango(padre.id)
+    assert arbol._orden.rango(padre.id) < arbol._orden.rango(nieto.id)
+
+
+def test_registrar_personas_bulk_asigna_ids_consecutivos(arbol_vacio: ArbolGenealogico):
+    """
+    Test: registrar_personas_bulk registra todas las personas en orden
+
+    Verifica IDs consecutivos, índice de nombres, raíces y continuidad con
+    registrar_persona().
+    """
+    # ACT
+    personas = arbol_vacio.registrar_personas_bulk(["Aemon", "Baelon", "Daemon"])
+    siguiente = arbol_vacio.registrar_persona("Viserys")
+
+    # ASSERT
+    assert [p.id for p in personas] == [1, 2, 3]
+    assert siguiente.id == 4
+    assert arbol_vacio.buscar_por_nombre("baelon") == [personas[1]]
+    assert len(arbol_vacio.init_get_root()) == 4
+    assert arbol_vacio.registrar_personas_bulk([]) == []
+
+
+def test_add_hijos_bulk_aplica_el_lote(arbol_vacio: ArbolGenealogico):
+    """
+    Test: add_hijos_bulk crea todas las relaciones del lote
+
+    Escenario:
+    - Relaciones en contra del orden de alta (obligan a reconstruir el orden topológico)
+    Resultado: mismas relaciones que con add_hijo y ciclos detectados después
+    """
+    # ARRANGE
+    nieto, padre, madre, abuelo = arbol_vacio.registrar_personas_bulk(
+        ["Nieto", "Padre", "Madre", "Abuelo"]
+    )
+
+    # ACT
+    arbol_vacio.add_hijos_bulk([(padre.id, nieto.id), (madre.id, nieto.id), (abuelo.id, padre.id)])
+
+    # ASSERT
+    assert nieto.padres == (padre, madre)
+    assert list(padre.hijos) == [nieto]
+    assert padre.padres == (abuelo, None)
+    assert arbol_vacio.init_get_root() == [madre, abuelo]
+    with pytest.raises(CicloTemporalError):
+        arbol_vacio.add_hijo(nieto, abuelo)
+
+
+def test_add_hijos_bulk_es_atomico(arbol_vacio: ArbolGenealogico):
+    """
+    Test: Un lote con errores no modifica el árbol y reporta cada relación inválida
+
+    Escenario:
+    - Relación válida, tercer padre, ciclo dentro del lote y persona inexistente
+    Resultado: LoteRelacionesError con las posiciones 2, 3, 4 y 5
+    """
+    # ARRANGE
+    a, b, c, d = arbol_vacio.registrar_personas_bulk(["A", "B", "C", "D"])
+    pares = [
+        (a.id, d.id),
+        (b.id, d.id),
+        (c.id, d.id),  # tercer padre de D
+        (a.id, b.id),
+        (b.id, a.id),  # cierra el ciclo A -> B -> A
+        (a.id, 99),
+    ]
+
+    # ACT
+    with pytest.raises(LoteRelacionesError) as exc_info:
+        arbol_vacio.add_hijos_bulk(pares)
+
+    # ASSERT
+    errores = exc_info.value.errores
+    assert [posicion for posicion, _ in errores] == [2, 3, 4, 5]
+    assert isinstance(errores[0][1], LimitePadresExcedidoError)
+    assert isinstance(errores[1][1], CicloTemporalError)
+    assert isinstance(errores[2][1], CicloTemporalError)
+    assert isinstance(errores[3][1], PersonaNoEncontradaError)
+    assert all(not p.hijos for p in (a, b, c))
+    assert len(arbol_vacio.init_get_root()) == 4
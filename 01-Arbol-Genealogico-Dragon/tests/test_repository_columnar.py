@@ -0,0 +1,384 @@
+# test_repository_columnar.py
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.exceptions import (
+    CicloTemporalError,
+    EliminacionConDescendientesError,
+    LimitePadresExcedidoError,
+    LoteRelacionesError,
+    ParejaNoExisteError,
+    PersonaNoEncontradaError,
+)
+from src.models import PersonaVista
+from src.repository import ArbolGenealogico
+from src.repository_columnar import ArbolColumnar
+from src.ui import DinastiaUI
+from src.visitors import PrintArbolVisitor
+
+
+@pytest.fixture
+def arbol_columnar() -> ArbolColumnar:
+    """
+    Fixture: Árbol columnar con estructura básica
+
+    Estructura:
+    - Padre (id: 1)
+    - Madre (id: 2) <- pareja de Padre
+    - Hijo (id: 3) <- hijo de Padre y Madre
+    """
+    arbol = ArbolColumnar()
+    padre = arbol.registrar_persona("Padre")
+    madre = arbol.registrar_persona("Madre")
+    hijo = arbol.registrar_persona("Hijo")
+    arbol.add_pareja(padre, madre)
+    arbol.add_hijo(padre, hijo)
+    arbol.add_hijo(madre, hijo)
+    return arbol
+
+
+def test_registrar_persona_devuelve_vista():
+    """
+    Test: registrar_persona retorna vistas livianas con IDs secuenciales
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+
+    # ACT
+    p1 = arbol.registrar_persona("Aegon I")
+    p2 = arbol.registrar_persona("Rhaenys")
+
+    # ASSERT
+    assert isinstance(p1, PersonaVista)
+    assert (p1.id, p1.nombre) == (1, "Aegon I")
+    assert p2.id == 2
+    assert arbol.get_persona(1) == p1
+    assert len(arbol.personas) == 2
+    assert list(arbol.personas) == [1, 2]
+
+
+def test_vista_lee_relaciones_de_las_columnas(arbol_columnar: ArbolColumnar):
+    """
+    Test: las vistas resuelven pareja, padres e hijos desde las columnas
+    """
+    # ACT
+    padre, madre, hijo = (arbol_columnar.get_persona(i) for i in (1, 2, 3))
+
+    # ASSERT
+    assert padre.pareja == madre
+    assert madre.pareja == padre
+    assert hijo.padres == (padre, madre)
+    assert padre.hijos == [hijo]
+    assert padre.hijos_ids.tolist() == [3]
+    assert hash(padre) == hash(arbol_columnar.get_persona(1))
+    assert padre != ArbolGenealogico().registrar_persona("Padre")
+
+
+def test_get_persona_inexistente_lanza_error(arbol_columnar: ArbolColumnar):
+    """
+    Test: get_persona lanza PersonaNoEncontradaError para IDs desconocidos
+    """
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol_columnar.get_persona(999)
+    with pytest.raises(KeyError):
+        arbol_columnar.personas[999]
+    assert 999 not in arbol_columnar.personas
+    assert "1" not in arbol_columnar.personas
+
+
+def test_validaciones_se_mantienen(arbol_columnar: ArbolColumnar):
+    """
+    Test: add_hijo aplica las mismas reglas que ArbolGenealogico
+    """
+    # ARRANGE
+    padre, _, hijo = (arbol_columnar.get_persona(i) for i in (1, 2, 3))
+    tercero = arbol_columnar.registrar_persona("Tercero")
+
+    # ACT & ASSERT
+    with pytest.raises(CicloTemporalError):
+        arbol_columnar.add_hijo(hijo, padre)
+    with pytest.raises(LimitePadresExcedidoError):
+        arbol_columnar.add_hijo(tercero, hijo)
+    with pytest.raises(ParejaNoExisteError):
+        arbol_columnar.remove_pareja(padre, tercero)
+
+
+def test_remove_pareja_y_asignacion_directa(arbol_columnar: ArbolColumnar):
+    """
+    Test: remove_pareja limpia la columna de pareja; los setters de la vista escriben
+    """
+    # ARRANGE
+    padre, madre, hijo = (arbol_columnar.get_persona(i) for i in (1, 2, 3))
+
+    # ACT
+    arbol_columnar.remove_pareja(padre, madre)
+    hijo.padres = (None, None)
+
+    # ASSERT
+    assert padre.pareja is None
+    assert madre.pareja is None
+    assert hijo in arbol_columnar.init_get_root()
+    hijo.padres = (padre, None)
+    assert hijo not in arbol_columnar.init_get_root()
+
+
+def test_eliminar_persona_desvincula_todo(arbol_columnar: ArbolColumnar):
+    """
+    Test: eliminar_persona desvincula pareja, padres e hijos y actualiza raíces
+    """
+    # ARRANGE
+    padre, madre, hijo = (arbol_columnar.get_persona(i) for i in (1, 2, 3))
+
+    # ACT & ASSERT
+    with pytest.raises(EliminacionConDescendientesError):
+        arbol_columnar.eliminar_persona(padre.id)
+
+    arbol_columnar.eliminar_persona(padre.id, confirmar_rotura=True)
+    assert madre.pareja is None
+    assert hijo.padres == (None, madre)
+    assert arbol_columnar.init_get_root() == [madre]
+    assert len(arbol_columnar.personas) == 2
+
+    arbol_columnar.eliminar_persona(hijo.id)
+    assert madre.hijos == []
+
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol_columnar.eliminar_persona(hijo.id)
+
+
+def test_buscar_por_nombre_con_tabla_hash():
+    """
+    Test: la tabla de nombres se construye en la primera búsqueda y se mantiene
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    aegons = [arbol.registrar_persona("Aegon") for _ in range(3)]
+    arbol.registrar_persona("Rhaenyra")
+
+    # ACT & ASSERT
+    assert arbol.buscar_por_nombre(" aegon ") == aegons
+    # Suficientes altas para forzar el redimensionamiento de la tabla
+    nuevos = [arbol.registrar_persona("Aegon") for _ in range(20)]
+    arbol.eliminar_persona(aegons[0].id)
+    assert arbol.buscar_por_nombre("AEGON") == aegons[1:] + nuevos
+    assert arbol.buscar_por_nombre("Daemon") == []
+
+
+def test_buscar_por_prefijo_columnar():
+    """
+    Test: el índice de prefijos se construye en la primera búsqueda y se mantiene
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.registrar_personas_bulk(["Aemond", "Aegon", "Rhaenyra"])
+
+    # ACT
+    resultados = arbol.buscar_por_prefijo("ae")
+    nuevo = arbol.registrar_persona("Aegon II")
+    arbol.eliminar_persona(2)
+
+    # ASSERT
+    assert [p.id for p in resultados] == [2, 1]
+    assert all(isinstance(p, PersonaVista) for p in resultados)
+    assert arbol.buscar_por_prefijo("aeg") == [nuevo]
+
+
+def test_buscar_aproximado_columnar():
+    """
+    Test: la búsqueda aproximada usa los mismos índices perezosos que la de prefijos
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.registrar_personas_bulk(["Daemon", "Jaehaerys"])
+
+    # ACT
+    resultados = arbol.buscar_aproximado("deamon")
+    nuevo = arbol.registrar_persona("Deamons")
+
+    # ASSERT
+    assert [p.id for p in resultados] == [1]
+    assert arbol.buscar_aproximado("deamon") == [nuevo, arbol.get_persona(1)]
+
+
+def test_buscar_por_subcadena_y_regex_columnar():
+    """
+    Test: las búsquedas por trigramas devuelven vistas y siguen altas y bajas
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.registrar_personas_bulk(["Aegon II", "Jaehaerys I el Conciliador"])
+
+    # ACT
+    resultados = arbol.buscar_por_subcadena("concil")
+    nuevo = arbol.registrar_persona("Aegon III")
+    arbol.eliminar_persona(1)
+
+    # ASSERT
+    assert [p.id for p in resultados] == [2]
+    assert arbol.buscar_por_regex("aegon i+") == [nuevo]
+
+
+def test_buscar_por_palabras_columnar():
+    """
+    Test: la búsqueda por palabras usa el índice de tokens y devuelve vistas
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.registrar_personas_bulk(["Jaehaerys I el Conciliador", "Aemond"])
+
+    # ACT
+    resultados = arbol.buscar_por_palabras("conciliádor")
+
+    # ASSERT
+    assert [p.id for p in resultados] == [1]
+    assert isinstance(resultados[0], PersonaVista)
+
+
+def test_buscar_fonetico_columnar():
+    """
+    Test: la búsqueda fonética funciona sobre las columnas y sigue las altas
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.registrar_personas_bulk(["Visenya", "Rhaenyra"])
+
+    # ACT
+    resultados = arbol.buscar_fonetico("Renira")
+    nueva = arbol.registrar_persona("Vicenia")
+
+    # ASSERT
+    assert [p.id for p in resultados] == [2]
+    assert arbol.buscar_fonetico("Vissenia") == [arbol.get_persona(1), nueva]
+
+
+def test_compactar_conserva_orden_de_hijos():
+    """
+    Test: el CSR compactado conserva el orden de alta de los hijos
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    padre = arbol.registrar_persona("Jaehaerys")
+    hijos = [arbol.registrar_persona(f"Hijo {i}") for i in range(5)]
+    for hijo in hijos:
+        arbol.add_hijo(padre, hijo)
+
+    # ACT
+    arbol.compactar()
+    arbol.eliminar_persona(hijos[2].id)
+    arbol.compactar()
+
+    # ASSERT
+    assert padre.hijos == hijos[:2] + hijos[3:]
+    assert arbol.get_persona(hijos[0].id).hijos == []
+
+
+def test_compactacion_automatica_por_umbral():
+    """
+    Test: la compactación se dispara sola al superar el umbral de modificaciones
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    arbol.MIN_MODIFICADOS_COMPACTAR = 4
+    raiz = arbol.registrar_persona("Raiz")
+    padres = [arbol.registrar_persona(f"Padre {i}") for i in range(10)]
+
+    # ACT
+    for padre in padres:
+        arbol.add_hijo(raiz, padre)
+        arbol.add_hijo(padre, arbol.registrar_persona(f"Hijo de {padre.nombre}"))
+
+    # ASSERT
+    assert len(arbol._hijos_modificados) <= 4  # type: ignore
+    assert [h.nombre for h in padres[0].hijos] == ["Hijo de Padre 0"]
+    assert raiz.hijos == padres
+
+
+def test_raices_se_compactan_tras_muchas_bajas():
+    """
+    Test: el conjunto de raíces se compacta sin perder raíces
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    ancestro = arbol.registrar_persona("Ancestro")
+
+    # ACT
+    for i in range(50):
+        arbol.add_hijo(ancestro, arbol.registrar_persona(f"Hijo {i}"))
+
+    # ASSERT
+    assert arbol.init_get_root() == [ancestro]
+
+
+def test_datos_demo_identicos_a_arbol_genealogico():
+    """
+    Test: DataLoaderDemo y PrintArbolVisitor producen el mismo árbol en ambos backends
+    """
+    # ARRANGE
+    columnar = ArbolColumnar()
+    clasico = ArbolGenealogico()
+
+    # ACT
+    DataLoaderDemo().cargar_datos(columnar)
+    DataLoaderDemo().cargar_datos(clasico)
+    visitor_columnar = PrintArbolVisitor()
+    visitor_clasico = PrintArbolVisitor()
+    columnar.recorrer_arbol_completo(visitor_columnar)
+    clasico.recorrer_arbol_completo(visitor_clasico)
+
+    # ASSERT
+    assert len(columnar.personas) == len(clasico.personas)
+    assert visitor_columnar.get_resultado() == visitor_clasico.get_resultado()
+
+
+@patch("src.ui.DinastiaUI.pedir_dato", return_value="Hijo")
+@patch("src.ui.UIMessages.error")
+@patch("src.ui.UIMessages.success")
+def test_dinastia_ui_funciona_con_arbol_columnar(
+    mock_success: MagicMock,
+    mock_error: MagicMock,
+    mock_pedir_dato: MagicMock,
+    arbol_columnar: ArbolColumnar,
+    capsys: pytest.CaptureFixture[str],
+):
+    """
+    Test: DinastiaUI busca y muestra personas sobre el repositorio columnar
+    """
+    # ARRANGE
+    ui = DinastiaUI(arbol_columnar)
+
+    # ACT
+    ui.buscar_persona()
+    ui.mostrar_arbol()
+
+    # ASSERT
+    mock_error.assert_not_called()
+    assert any("Hijo (3)" in str(call) for call in mock_success.call_args_list)
+    assert "└─ Padre" in capsys.readouterr().out
+
+
+def test_carga_en_lote_columnar():
+    """
+    Test: registrar_personas_bulk y add_hijos_bulk sobre columnas
+
+    Verifica relaciones, raíces, búsqueda por nombre y atomicidad ante errores.
+    """
+    # ARRANGE
+    arbol = ArbolColumnar()
+    padre, madre, hijo = arbol.registrar_personas_bulk(["Padre", "Madre", "Hijo"])
+
+    # ACT
+    arbol.add_hijos_bulk([(padre.id, hijo.id), (madre.id, hijo.id)])
+
+    # ASSERT
+    assert hijo.padres == (padre, madre)
+    assert arbol.init_get_root() == [padre, madre]
+    assert arbol.buscar_por_nombre("madre") == [madre]
+    # Padre -> Madre -> Hijo -> Padre: ambas relaciones nuevas forman el ciclo
+    with pytest.raises(LoteRelacionesError) as exc_info:
+        arbol.add_hijos_bulk([(padre.id, madre.id), (hijo.id, padre.id)])
+    assert [posicion for posicion, _ in exc_info.value.errores] == [0, 1]
+    assert all(isinstance(e, CicloTemporalError) for _, e in exc_info.value.errores)
+    assert list(padre.hijos) == [hijo]
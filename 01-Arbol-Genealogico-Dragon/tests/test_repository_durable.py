@@ -0,0 +1,271 @@
+"""
+Tests para el diario de cambios (src/diario.py) y el repositorio durable
+(src/repository_durable.py).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.diario import DiarioEscritura, Registro, TipoRegistro, leer_diario
+from src.exceptions import CicloTemporalError, DiarioFallidoError, DiarioInvalidoError
+from src.repository import ArbolGenealogico
+from src.repository_durable import ArbolDurable
+from src.snapshot import crc_de_snapshot
+from src.visitors import PrintArbolVisitor
+
+
+def _impresion(arbol) -> str:
+    visitor = PrintArbolVisitor()
+    arbol.recorrer_arbol_completo(visitor)
+    return visitor.resultado
+
+
+def _segmentos(ruta: Path) -> list[str]:
+    return sorted(p.name for p in ruta.parent.glob(ruta.name + ".wal.*"))
+
+
+def test_diario_ida_y_vuelta_y_corte_al_final(tmp_path: Path):
+    """
+    Test: Los registros se leen como se escribieron y un registro incompleto se descarta
+
+    ARRANGE: Segmento con tres registros y bytes de un cuarto a medio escribir
+    ACT: Leer el segmento y reabrirlo para escribir
+    ASSERT: Tres registros, fin válido antes del corte y el corte truncado al reabrir
+    """
+    # ARRANGE
+    ruta = tmp_path / "a.wal.000001"
+    registros = [
+        Registro(TipoRegistro.REGISTRAR_PERSONA, 1, nombre="Rhaenyra Targaryen"),
+        Registro(TipoRegistro.ADD_HIJO, 1, 2),
+        Registro(TipoRegistro.ELIMINAR_PERSONA, 2),
+    ]
+    diario = DiarioEscritura.crear(ruta, base=1234)
+    for registro in registros:
+        diario.agregar(registro)
+    diario.cerrar()
+    completo = ruta.stat().st_size
+    with open(ruta, "ab") as archivo:
+        archivo.write(b"\x01\x02\x03\x04\x05")
+
+    # ACT
+    lectura = leer_diario(ruta)
+    DiarioEscritura(ruta, lectura.fin_valido).cerrar()
+
+    # ASSERT
+    assert lectura.base == 1234
+    assert lectura.registros == registros
+    assert (lectura.fin_valido, lectura.tamano) == (completo, completo + 5)
+    assert ruta.stat().st_size == completo
+    ruta.write_bytes(b"no es un diario!")
+    with pytest.raises(DiarioInvalidoError, match="no es un diario"):
+        leer_diario(ruta)
+
+
+def test_diario_fsync_por_lotes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test: Con fsync_cada=3 se hace un fsync cada tres confirmaciones
+    """
+    # ARRANGE
+    llamadas = []
+    monkeypatch.setattr("src.diario.os.fsync", llamadas.append)
+    diario = DiarioEscritura.crear(tmp_path / "a.wal.000001", base=0, fsync_cada=3)
+    llamadas.clear()
+
+    # ACT
+    for persona_id in range(1, 8):
+        diario.agregar(Registro(TipoRegistro.ELIMINAR_PERSONA, persona_id))
+        diario.confirmar()
+
+    # ASSERT
+    assert len(llamadas) == 2
+    diario.cerrar()
+    assert len(llamadas) == 3
+
+
+def test_durable_recupera_el_arbol_al_reabrir(tmp_path: Path):
+    """
+    Test: Las modificaciones sobreviven al cierre sin escribir ningún snapshot
+
+    ARRANGE: Árbol de demostración cargado en un ArbolDurable, más pareja y baja
+    ACT: Cerrar y reabrir el árbol
+    ASSERT: Misma impresión y mismo próximo ID que el árbol en memoria
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    clasico = ArbolGenealogico()
+    DataLoaderDemo().cargar_datos(clasico)
+    with ArbolDurable(ruta) as arbol:
+        DataLoaderDemo().cargar_datos(arbol)
+        for destino in (arbol, clasico):
+            gael = destino.buscar_por_nombre("Gael")[0]
+            destino.eliminar_persona(gael.id, confirmar_rotura=True)
+        with pytest.raises(CicloTemporalError):
+            raiz = arbol.init_get_root()[0]
+            arbol.add_hijo(raiz.hijos[0], raiz)
+
+    # ACT
+    with ArbolDurable(ruta) as reabierto:
+        # ASSERT
+        assert not ruta.exists()
+        assert list(reabierto.personas) == list(clasico.personas)
+        assert _impresion(reabierto) == _impresion(clasico)
+        assert reabierto.registrar_persona("Nueva").id == clasico.registrar_persona("Nueva").id
+
+
+def test_durable_agrupar_escribe_una_sola_vez(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test: Dentro de agrupar() los cambios se escriben juntos al salir del bloque
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    llamadas = []
+    monkeypatch.setattr("src.diario.os.fsync", llamadas.append)
+    arbol = ArbolDurable(ruta)
+    llamadas.clear()
+
+    # ACT
+    with arbol.agrupar():
+        padre, hijo = arbol.registrar_persona("Viserys"), arbol.registrar_persona("Rhaenyra")
+        arbol.add_hijo(padre, hijo)
+        sin_escribir = len(leer_diario(tmp_path / "arbol.snap.wal.000001").registros)
+
+    # ASSERT
+    assert sin_escribir == 0
+    assert len(leer_diario(tmp_path / "arbol.snap.wal.000001").registros) == 3
+    assert len(llamadas) == 1
+    arbol.cerrar()
+
+
+def test_durable_queda_inutilizable_si_falla_el_diario(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test: Si escribir el diario falla, el árbol no sigue con cambios que no están en disco
+
+    ARRANGE: Árbol durable con una persona guardada y fsync que falla
+    ACT: Registrar otra persona, seguir usándolo y reabrirlo
+    ASSERT: El error llega al llamador, las operaciones siguientes lanzan
+            DiarioFallidoError y al reabrir solo está lo que se guardó
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    arbol = ArbolDurable(ruta)
+    arbol.registrar_persona("Viserys")
+
+    def fsync_fallido(descriptor: int) -> None:
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("src.diario.os.fsync", fsync_fallido)
+
+    # ACT & ASSERT
+    with pytest.raises(OSError, match="No space"):
+        arbol.registrar_persona("Rhaenyra")
+    with pytest.raises(DiarioFallidoError, match="volver a abrirse"):
+        arbol.get_persona(1)
+    with pytest.raises(DiarioFallidoError):
+        arbol.registrar_persona("Daemon")
+    with pytest.raises(DiarioFallidoError):
+        arbol.compactar()
+    arbol.cerrar()
+    monkeypatch.undo()
+    reabierto = ArbolDurable(ruta)
+    assert [p.nombre for p in reabierto.personas.values()][0] == "Viserys"
+    assert reabierto.buscar_por_nombre("Daemon") == []
+    reabierto.cerrar()
+
+
+def test_durable_compacta_y_recupera(tmp_path: Path):
+    """
+    Test: Compactar escribe el snapshot, abre un segmento nuevo y borra los anteriores
+
+    ARRANGE: Árbol con cambios antes y después de compactar (en segundo plano)
+    ACT: Reabrir el árbol
+    ASSERT: Snapshot más el segmento nuevo reconstruyen el mismo árbol
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    with ArbolDurable(ruta) as arbol:
+        DataLoaderDemo().cargar_datos(arbol)
+        arbol.compactar()
+        arbol.registrar_persona("Después de compactar")
+        arbol.esperar_compactacion()
+        esperado = _impresion(arbol)
+        cantidad = len(arbol.personas)
+
+    # ACT
+    with ArbolDurable(ruta) as reabierto:
+        # ASSERT
+        assert _segmentos(ruta) == ["arbol.snap.wal.000002"]
+        assert leer_diario(tmp_path / "arbol.snap.wal.000002").base == crc_de_snapshot(ruta)
+        assert len(reabierto.personas) == cantidad
+        assert _impresion(reabierto) == esperado
+
+
+def test_durable_compacta_automaticamente(tmp_path: Path):
+    """
+    Test: Al superar max_bytes_diario el segmento se compacta solo
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+
+    # ACT
+    with ArbolDurable(ruta, max_bytes_diario=200) as arbol:
+        for numero in range(10):
+            arbol.registrar_persona(f"Persona {numero}")
+
+    # ASSERT
+    assert ruta.exists() and len(_segmentos(ruta)) == 1
+    with ArbolDurable(ruta) as reabierto:
+        assert [p.nombre for p in reabierto.personas.values()][-1] == "Persona 9"
+
+
+def test_durable_recupera_corte_durante_la_compactacion(tmp_path: Path):
+    """
+    Test: Un corte entre abrir el segmento nuevo y escribir el snapshot no pierde cambios
+
+    ARRANGE: Compactación cuyo snapshot no llegó a escribirse (segmentos 1 y 2
+             presentes, el 2 basado en un snapshot que no existe)
+    ACT: Reabrir; luego simular que el snapshot viejo quedó y el 1 se borró
+    ASSERT: Se aplican los segmentos que corresponden; si ninguno, error
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    arbol = ArbolDurable(ruta)
+    arbol.registrar_personas_bulk(["Aemma", "Viserys"])
+    arbol._escribir_compactacion = lambda *args: None
+    arbol.compactar(en_segundo_plano=False)
+    arbol.add_hijo(arbol.get_persona(1), arbol.get_persona(2))
+    arbol.cerrar()
+
+    # ACT
+    with ArbolDurable(ruta) as reabierto:
+        # ASSERT
+        assert not ruta.exists()
+        assert _segmentos(ruta) == ["arbol.snap.wal.000001", "arbol.snap.wal.000002"]
+        assert reabierto.get_persona(2).padres_ids == (1, 0)
+
+    (tmp_path / "arbol.snap.wal.000001").unlink()
+    with pytest.raises(DiarioInvalidoError, match="ningún segmento"):
+        ArbolDurable(ruta)
+
+
+def test_durable_rechaza_registro_dañado_antes_del_final(tmp_path: Path):
+    """
+    Test: Un registro dañado en un segmento que no es el último es un error
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    arbol = ArbolDurable(ruta)
+    arbol.registrar_persona("Aemma")
+    arbol._escribir_compactacion = lambda *args: None
+    arbol.compactar(en_segundo_plano=False)
+    arbol.cerrar()
+    primero = tmp_path / "arbol.snap.wal.000001"
+    with open(primero, "ab") as archivo:
+        archivo.write(b"\x00" * 3)
+
+    # ACT & ASSERT
+    with pytest.raises(DiarioInvalidoError, match="antes del final"):
+        ArbolDurable(ruta)
@@ -0,0 +1,148 @@
+"""
+Tests para el repositorio de solo lectura sobre un snapshot mapeado
+(src/repository_mmap.py).
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.exceptions import ArbolSoloLecturaError, PersonaNoEncontradaError, SnapshotInvalidoError
+from src.models import PersonaVista
+from src.repository import ArbolGenealogico
+from src.repository_mmap import ArbolMapeado
+from src.visitors import EstadisticasVisitor, PrintArbolVisitor
+
+
+@pytest.fixture
+def ruta_demo(tmp_path: Path) -> Path:
+    """
+    Fixture: Snapshot del árbol de demostración sin "Gael" (IDs con huecos)
+    """
+    arbol = ArbolGenealogico()
+    DataLoaderDemo().cargar_datos(arbol)
+    arbol.eliminar_persona(arbol.buscar_por_nombre("Gael")[0].id)
+    ruta = tmp_path / "demo.snap"
+    arbol.save_snapshot(ruta)
+    return ruta
+
+
+def test_arbol_mapeado_coincide_con_el_original(ruta_demo: Path):
+    """
+    Test: El árbol mapeado expone las mismas personas, relaciones y recorrido
+
+    ARRANGE: Snapshot del árbol de demostración y el árbol cargado en memoria
+    ACT: Abrir el snapshot con ArbolMapeado
+    ASSERT: Mismos IDs, nombres, relaciones, raíces e impresión
+    """
+    # ARRANGE
+    original = ArbolGenealogico.load_snapshot(ruta_demo)
+
+    # ACT
+    with ArbolMapeado(ruta_demo) as mapeado:
+        # ASSERT
+        assert list(mapeado.personas) == list(original.personas)
+        for persona_id, persona in original.personas.items():
+            vista = mapeado.get_persona(persona_id)
+            assert isinstance(vista, PersonaVista)
+            assert (vista.nombre, vista.pareja_id, vista.padres_ids) == (
+                persona.nombre,
+                persona.pareja_id,
+                persona.padres_ids,
+            )
+            assert list(vista.hijos_ids) == list(persona.hijos_ids)
+        assert [p.id for p in mapeado.init_get_root()] == [p.id for p in original.init_get_root()]
+        impresion_mapeada, impresion_original = PrintArbolVisitor(), PrintArbolVisitor()
+        mapeado.recorrer_arbol_completo(impresion_mapeada)
+        original.recorrer_arbol_completo(impresion_original)
+        assert impresion_mapeada.resultado == impresion_original.resultado
+
+
+def test_arbol_mapeado_busca_por_nombre_e_indices(ruta_demo: Path):
+    """
+    Test: Las búsquedas construyen sus índices desde los nombres del mmap
+    """
+    # ARRANGE
+    with ArbolMapeado(ruta_demo) as arbol:
+        # ACT
+        exacta = arbol.buscar_por_nombre("  aegon i ")
+        prefijo = arbol.buscar_por_prefijo("rhae")
+        fonetica = arbol.buscar_fonetico("Jaeheris")
+
+        # ASSERT
+        assert [p.nombre for p in exacta] == ["Aegon I"]
+        assert prefijo and all(p.nombre.lower().startswith("rhae") for p in prefijo)
+        assert "Jaehaerys I el Conciliador" in [p.nombre for p in fonetica]
+        assert arbol.buscar_por_nombre("Gael") == []
+
+
+def test_arbol_mapeado_ids_densos_y_con_huecos(tmp_path: Path, ruta_demo: Path):
+    """
+    Test: Las personas se ubican por posición si los IDs son 1..n y por búsqueda binaria si no
+    """
+    # ARRANGE
+    denso = ArbolGenealogico()
+    denso.registrar_personas_bulk(["Aegon", "Visenya", "Rhaenys"])
+    ruta_densa = tmp_path / "denso.snap"
+    denso.save_snapshot(ruta_densa)
+
+    # ACT
+    with ArbolMapeado(ruta_densa) as arbol_denso, ArbolMapeado(ruta_demo) as arbol_huecos:
+        # ASSERT
+        assert arbol_denso.fila(3) == 2
+        assert arbol_denso.fila(4) is None and 0 not in arbol_denso.personas
+        eliminado = max(arbol_huecos.personas) + 1
+        assert all(arbol_huecos.fila(i) is not None for i in arbol_huecos.personas)
+        assert arbol_huecos.fila(eliminado) is None
+        with pytest.raises(PersonaNoEncontradaError):
+            arbol_huecos.get_persona(eliminado)
+
+
+def test_arbol_mapeado_rechaza_modificaciones(ruta_demo: Path):
+    """
+    Test: Registrar, relacionar o eliminar personas lanza ArbolSoloLecturaError
+    """
+    # ARRANGE
+    with ArbolMapeado(ruta_demo) as arbol:
+        raiz = arbol.init_get_root()[0]
+
+        # ACT & ASSERT
+        with pytest.raises(ArbolSoloLecturaError, match="registrar_persona"):
+            arbol.registrar_persona("Nueva")
+        with pytest.raises(ArbolSoloLecturaError):
+            arbol.add_hijos_bulk([(raiz.id, raiz.id)])
+        with pytest.raises(ArbolSoloLecturaError):
+            arbol.eliminar_persona(raiz.id)
+        with pytest.raises(ArbolSoloLecturaError):
+            raiz.pareja = None
+
+
+def test_arbol_mapeado_se_cierra_y_rechaza_archivos_invalidos(tmp_path: Path, ruta_demo: Path):
+    """
+    Test: cerrar() libera el mmap aunque se hayan leído hijos, y los archivos inválidos se rechazan
+    """
+    # ARRANGE
+    arbol = ArbolMapeado(ruta_demo)
+    hijos = arbol.init_get_root()[0].hijos
+    estadisticas = EstadisticasVisitor()
+    arbol.recorrer_arbol_completo(estadisticas)
+    vacio = tmp_path / "vacio.snap"
+    vacio.write_bytes(b"")
+
+    # ACT
+    arbol.cerrar()
+    arbol.cerrar()
+
+    # ASSERT
+    assert hijos and estadisticas.cantidad == len(
+        ArbolGenealogico.load_snapshot(ruta_demo).personas
+    )
+    with pytest.raises(SnapshotInvalidoError, match="truncado"):
+        ArbolMapeado(vacio)
+    dañado = bytearray(ruta_demo.read_bytes())
+    dañado[100] ^= 1
+    ruta_demo.write_bytes(bytes(dañado))
+    with pytest.raises(SnapshotInvalidoError, match="CRC32"):
+        ArbolMapeado(ruta_demo)
+    ArbolMapeado(ruta_demo, verificar_crc=False).cerrar()
@@ -0,0 +1,194 @@
+"""
+Tests para el repositorio persistente sobre SQLite (src/repository_sqlite.py).
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.exceptions import (
+    CicloTemporalError,
+    EliminacionConDescendientesError,
+    LimitePadresExcedidoError,
+    LoteRelacionesError,
+    PersonaNoEncontradaError,
+)
+from src.models import PersonaVista
+from src.repository import ArbolGenealogico
+from src.repository_sqlite import ArbolSQLite
+from src.visitors import PrintArbolVisitor
+
+
+@pytest.fixture
+def arbol_sqlite() -> ArbolSQLite:
+    """
+    Fixture: Base temporal con tres generaciones
+
+    Estructura:
+    - Abuelo (1) <-> Abuela (2)
+    - Padre (3), hijo de ambos, <-> Madre (4)
+    - Hijo (5), hijo de Padre y Madre
+    """
+    arbol = ArbolSQLite()
+    abuelo, abuela, padre, madre, hijo = arbol.registrar_personas_bulk(
+        ["Abuelo", "Abuela", "Padre", "Madre", "Hijo"]
+    )
+    arbol.add_pareja(abuelo, abuela)
+    arbol.add_pareja(padre, madre)
+    arbol.add_hijos_bulk([(1, 3), (2, 3), (3, 5), (4, 5)])
+    return arbol
+
+
+def test_sqlite_lee_personas_y_relaciones(arbol_sqlite: ArbolSQLite):
+    """
+    Test: Las vistas leen nombre, pareja, padres e hijos de la base
+
+    ARRANGE: Base con tres generaciones
+    ACT: Obtener personas y raíces
+    ASSERT: Relaciones, raíces y cantidad correctas
+    """
+    # ACT
+    padre = arbol_sqlite.get_persona(3)
+
+    # ASSERT
+    assert isinstance(padre, PersonaVista)
+    assert (padre.nombre, padre.pareja_id, padre.padres_ids) == ("Padre", 4, (1, 2))
+    assert [h.nombre for h in padre.hijos] == ["Hijo"]
+    assert [p.id for p in arbol_sqlite.init_get_root()] == [1, 2, 4]
+    assert len(arbol_sqlite.personas) == 5 and list(arbol_sqlite.personas) == [1, 2, 3, 4, 5]
+    with pytest.raises(PersonaNoEncontradaError):
+        arbol_sqlite.get_persona(99)
+
+
+def test_sqlite_ancestros_y_descendientes_con_cte(arbol_sqlite: ArbolSQLite):
+    """
+    Test: Ancestros y descendientes se resuelven con CTE recursivas
+    """
+    # ACT
+    ancestros = arbol_sqlite.ancestros(5)
+    descendientes = arbol_sqlite.descendientes(1)
+
+    # ASSERT
+    assert [p.id for p in ancestros] == [1, 2, 3, 4]
+    assert [p.id for p in descendientes] == [3, 5]
+    assert arbol_sqlite.ancestros(1) == []
+    assert arbol_sqlite.crearia_ciclo(5, 1)
+    assert not arbol_sqlite.crearia_ciclo(1, 4)
+
+
+def test_sqlite_valida_ciclos_y_limite_de_padres(arbol_sqlite: ArbolSQLite):
+    """
+    Test: add_hijo y add_hijos_bulk aplican las mismas validaciones que ArbolGenealogico
+    """
+    # ARRANGE
+    abuelo, hijo = arbol_sqlite.get_persona(1), arbol_sqlite.get_persona(5)
+    extra = arbol_sqlite.registrar_persona("Extra")
+
+    # ACT & ASSERT
+    with pytest.raises(CicloTemporalError):
+        arbol_sqlite.add_hijo(hijo, abuelo)
+    with pytest.raises(LimitePadresExcedidoError):
+        arbol_sqlite.add_hijo(extra, hijo)
+    with pytest.raises(LoteRelacionesError):
+        arbol_sqlite.add_hijos_bulk([(6, 4), (5, 6), (4, 1)])
+    assert arbol_sqlite.get_persona(4).padres_ids == (0, 0)
+    arbol_sqlite.add_hijo(extra, arbol_sqlite.get_persona(4))
+    assert not arbol_sqlite.respeta_orden(1, 2)
+    assert [p.id for p in arbol_sqlite.ancestros(5)] == [1, 2, 3, 4, 6]
+
+
+def test_sqlite_ciclos_en_lote_coinciden_con_arbol_genealogico():
+    """
+    Test: La CTE de ciclos en lote rechaza las mismas relaciones que ArbolGenealogico
+
+    ARRANGE: El mismo árbol en ambos repositorios, con relaciones de padre
+             de ID mayor (sin el atajo del orden por IDs)
+    ACT: Lotes al azar con ciclos dentro del lote y contra lo ya guardado
+    ASSERT: Las mismas posiciones rechazadas en cada lote, y los válidos se aplican
+    """
+    # ARRANGE
+    rng = random.Random(7)
+    sqlite, memoria = ArbolSQLite(), ArbolGenealogico()
+    for arbol in (sqlite, memoria):
+        arbol.registrar_personas_bulk(f"Persona {i}" for i in range(1, 61))
+        arbol.add_hijos_bulk([(40, 3), (3, 20), (20, 50)])
+
+    # ACT & ASSERT
+    for _ in range(40):
+        pares = list({tuple(rng.sample(range(1, 61), 2)) for _ in range(6)})
+        rechazos = []
+        for arbol in (sqlite, memoria):
+            try:
+                arbol.add_hijos_bulk(pares)
+                rechazos.append(None)
+            except LoteRelacionesError as e:
+                rechazos.append([(r.codigo, r.posicion) for r in e.resultados])
+        assert rechazos[0] == rechazos[1], pares
+    assert {i: sqlite.padres_de(i) for i in range(1, 61)} == {
+        i: memoria.get_persona(i).padres_ids for i in range(1, 61)
+    }
+
+
+def test_sqlite_eliminar_persona_desvincula_todo(arbol_sqlite: ArbolSQLite):
+    """
+    Test: Eliminar una persona quita su pareja, sus relaciones y la fila
+    """
+    # ACT
+    with pytest.raises(EliminacionConDescendientesError):
+        arbol_sqlite.eliminar_persona(3)
+    arbol_sqlite.eliminar_persona(3, confirmar_rotura=True)
+
+    # ASSERT
+    assert 3 not in arbol_sqlite.personas
+    assert arbol_sqlite.get_persona(4).pareja is None
+    assert arbol_sqlite.get_persona(5).padres_ids == (0, 4)
+    assert arbol_sqlite.get_persona(1).hijos == []
+    assert len(arbol_sqlite.personas) == 4
+    assert arbol_sqlite.registrar_persona("Nuevo").id == 6
+
+
+def test_sqlite_busquedas(arbol_sqlite: ArbolSQLite):
+    """
+    Test: Nombre exacto y prefijo usan la base; las demás búsquedas los índices en memoria
+    """
+    # ACT
+    nueva = arbol_sqlite.registrar_persona("Abuelita")
+
+    # ASSERT
+    assert arbol_sqlite.buscar_por_nombre("  PADRE ") == [arbol_sqlite.get_persona(3)]
+    assert [p.id for p in arbol_sqlite.buscar_por_prefijo("abu")] == [2, 6, 1]
+    assert arbol_sqlite.buscar_por_prefijo("abu", limite=1) == [arbol_sqlite.get_persona(2)]
+    assert arbol_sqlite.buscar_por_subcadena("elit") == [nueva]
+    assert [p.id for p in arbol_sqlite.buscar_aproximado("Madra", 1)] == [4]
+    arbol_sqlite.eliminar_persona(nueva.id)
+    assert arbol_sqlite.buscar_por_subcadena("elit") == []
+
+
+def test_sqlite_persiste_entre_conexiones(tmp_path: Path):
+    """
+    Test: Al reabrir la base se recuperan el árbol, los contadores y el orden de los hijos
+
+    ARRANGE: Árbol de demostración cargado en una base en disco
+    ACT: Cerrar y reabrir la base
+    ASSERT: Misma impresión que ArbolGenealogico y próximo ID conservado
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.db"
+    with ArbolSQLite(ruta) as arbol:
+        DataLoaderDemo().cargar_datos(arbol)
+        cantidad = len(arbol.personas)
+    clasico = ArbolGenealogico()
+    DataLoaderDemo().cargar_datos(clasico)
+
+    # ACT
+    with ArbolSQLite(ruta) as reabierto:
+        impresion_sqlite, impresion_clasica = PrintArbolVisitor(), PrintArbolVisitor()
+        reabierto.recorrer_arbol_completo(impresion_sqlite)
+        clasico.recorrer_arbol_completo(impresion_clasica)
+
+        # ASSERT
+        assert len(reabierto.personas) == cantidad == len(clasico.personas)
+        assert impresion_sqlite.resultado == impresion_clasica.resultado
+        assert reabierto.registrar_persona("Nueva").id == clasico.registrar_persona("Nueva").id
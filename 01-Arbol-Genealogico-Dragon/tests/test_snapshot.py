@@ -0,0 +1,165 @@
+"""
+Tests para el formato de snapshots binarios (src/snapshot.py) y
+ArbolGenealogico.save_snapshot() / load_snapshot().
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.exceptions import CicloTemporalError, SnapshotInvalidoError
+from src.repository import ArbolGenealogico
+from src.snapshot import BANDERA_ASCII, BANDERA_ORDEN, leer_snapshot
+from src.visitors import PrintArbolVisitor
+
+
+def _relaciones(arbol: ArbolGenealogico) -> list[tuple]:
+    return [
+        (p.id, p.nombre, p.pareja_id, p.padres_ids, list(p.hijos_ids))
+        for p in arbol.personas.values()
+    ]
+
+
+def test_snapshot_ida_y_vuelta_conserva_el_arbol(tmp_path: Path):
+    """
+    Test: Guardar y cargar un snapshot reconstruye exactamente el mismo árbol
+
+    ARRANGE: Árbol de demostración con una persona eliminada (huecos en los IDs)
+    ACT: save_snapshot() y load_snapshot()
+    ASSERT: Mismas personas, relaciones, raíces, impresión y próximo ID
+    """
+    # ARRANGE
+    original = ArbolGenealogico()
+    DataLoaderDemo().cargar_datos(original)
+    original.eliminar_persona(original.buscar_por_nombre("Gael")[0].id)
+    ruta = tmp_path / "arbol.snap"
+
+    # ACT
+    original.save_snapshot(ruta)
+    cargado = ArbolGenealogico.load_snapshot(ruta)
+
+    # ASSERT
+    assert _relaciones(cargado) == _relaciones(original)
+    assert [p.id for p in cargado.init_get_root()] == [p.id for p in original.init_get_root()]
+    impresion_original, impresion_cargada = PrintArbolVisitor(), PrintArbolVisitor()
+    original.recorrer_arbol_completo(impresion_original)
+    cargado.recorrer_arbol_completo(impresion_cargada)
+    assert impresion_cargada.resultado == impresion_original.resultado
+    assert cargado.registrar_persona("Nueva").id == original.registrar_persona("Nueva").id
+
+
+def test_snapshot_cargado_sigue_validando_y_buscando(tmp_path: Path, arbol_completo):
+    """
+    Test: El árbol cargado valida relaciones nuevas y reconstruye sus índices al buscar
+
+    ARRANGE: Árbol de tres generaciones guardado en un snapshot
+    ACT: Cargarlo, buscar, agregar y eliminar personas
+    ASSERT: El orden topológico detecta ciclos y las búsquedas ven los cambios
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    arbol_completo.save_snapshot(ruta)
+
+    # ACT
+    cargado = ArbolGenealogico.load_snapshot(ruta)
+    abuelo, hijo = cargado.get_persona(1), cargado.get_persona(5)
+
+    # ASSERT
+    with pytest.raises(CicloTemporalError):
+        cargado.add_hijo(hijo, abuelo)
+    assert cargado.buscar_por_nombre("hija") == [cargado.get_persona(6)]
+    nieto = cargado.registrar_persona("Nieto")
+    cargado.add_hijo(hijo, nieto)
+    assert cargado.buscar_por_prefijo("ni") == [nieto]
+    assert cargado.buscar_por_palabras("abuela") == [cargado.get_persona(2)]
+    cargado.eliminar_persona(nieto.id)
+    assert cargado.buscar_por_prefijo("ni") == []
+
+
+def test_snapshot_sin_orden_topologico_lo_recalcula(tmp_path: Path, arbol_completo):
+    """
+    Test: Un snapshot guardado sin orden topológico lo recalcula al cargar
+    """
+    # ARRANGE
+    sin_orden = ArbolGenealogico(usar_orden_topologico=False)
+    DataLoaderDemo().cargar_datos(sin_orden)
+    ruta = tmp_path / "sin_orden.snap"
+    sin_orden.save_snapshot(ruta)
+
+    # ACT
+    cargado = ArbolGenealogico.load_snapshot(ruta)
+
+    # ASSERT
+    assert not leer_snapshot(ruta).banderas & BANDERA_ORDEN
+    aegon_i = cargado.buscar_por_nombre("Aegon I")[0]
+    daeron_ii = cargado.buscar_por_nombre("Daeron II")[0]
+    with pytest.raises(CicloTemporalError):
+        cargado.add_hijo(daeron_ii, aegon_i)
+
+
+def test_snapshot_nombres_no_ascii(tmp_path: Path):
+    """
+    Test: Los nombres con acentos se guardan en UTF-8 y se decodifican igual
+    """
+    # ARRANGE
+    arbol = ArbolGenealogico()
+    arbol.registrar_personas_bulk(["Aegon III Veneno de Dragón", "Daeron I el Joven Dragón", ""])
+    ruta = tmp_path / "acentos.snap"
+
+    # ACT
+    arbol.save_snapshot(ruta)
+    datos = leer_snapshot(ruta)
+
+    # ASSERT
+    assert not datos.banderas & BANDERA_ASCII
+    assert datos.nombre(1) == "Daeron I el Joven Dragón"
+    assert [p.nombre for p in ArbolGenealogico.load_snapshot(ruta).personas.values()] == [
+        "Aegon III Veneno de Dragón",
+        "Daeron I el Joven Dragón",
+        "",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("dañar", "mensaje"),
+    [
+        (lambda datos: datos[:-1], "truncado"),
+        (lambda datos: b"OTROARCH" + datos[8:], "no es un snapshot"),
+        (lambda datos: datos[:8] + b"\x09\x00" + datos[10:], "versión 9"),
+        (lambda datos: datos[:100] + bytes([datos[100] ^ 1]) + datos[101:], "CRC32"),
+        (lambda datos: b"", "truncado"),
+    ],
+)
+def test_snapshot_dañado_se_rechaza(tmp_path: Path, arbol_con_datos, dañar, mensaje: str):
+    """
+    Test: Los archivos truncados, ajenos, de otra versión o dañados se rechazan
+
+    ARRANGE: Snapshot válido modificado byte a byte
+    ACT: Cargarlo
+    ASSERT: SnapshotInvalidoError con el motivo
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    arbol_con_datos.save_snapshot(ruta)
+    ruta.write_bytes(dañar(ruta.read_bytes()))
+
+    # ACT & ASSERT
+    with pytest.raises(SnapshotInvalidoError, match=mensaje):
+        ArbolGenealogico.load_snapshot(ruta)
+
+
+def test_save_snapshot_reemplaza_de_forma_atomica(tmp_path: Path, arbol_con_datos):
+    """
+    Test: Guardar sobre un snapshot existente lo reemplaza sin dejar temporales
+    """
+    # ARRANGE
+    ruta = tmp_path / "arbol.snap"
+    ArbolGenealogico().save_snapshot(ruta)
+
+    # ACT
+    arbol_con_datos.save_snapshot(ruta)
+
+    # ASSERT
+    assert [p.name for p in tmp_path.iterdir()] == ["arbol.snap"]
+    assert len(ArbolGenealogico.load_snapshot(ruta).personas) == 3
@@ -311,6 +311,163 @@ class TestBuscarPersona:
         assert any("Padre" in str(call) for call in mock_success.call_args_list)
         mock_error.assert_not_called()
 
+    @patch("src.ui.DinastiaUI.pedir_dato", return_value="ma*")
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_por_prefijo(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        mock_pedir_dato: MagicMock,
+        arbol_con_datos: ArbolGenealogico,
+    ):
+        """
+        Test: Buscar persona por prefijo
+
+        Verifica que una consulta terminada en * busca por comienzo del nombre.
+        """
+        # ARRANGE
+        ui = DinastiaUI(arbol_con_datos)
+
+        # ACT
+        ui.buscar_persona()
+
+        # ASSERT
+        mock_success.assert_any_call("- Madre (2)")
+        assert mock_success.call_count == 2
+        mock_error.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("consulta", "esperados"),
+        [("Hilo~", ["- Hijo (3)"]), ("Mdare~1", []), ("Mdare~2", ["- Madre (2)"])],
+    )
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_aproximada(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        consulta: str,
+        esperados: list[str],
+        arbol_con_datos: ArbolGenealogico,
+    ):
+        """
+        Test: Buscar persona tolerando errores de tipeo
+
+        Verifica que una consulta terminada en ~ o ~N usa la búsqueda aproximada.
+        """
+        # ARRANGE
+        ui = DinastiaUI(arbol_con_datos)
+
+        # ACT
+        with patch.object(DinastiaUI, "pedir_dato", return_value=consulta):
+            ui.buscar_persona()
+
+        # ASSERT
+        mostrados = [c.args[0] for c in mock_success.call_args_list if c.args[0].startswith("- ")]
+        assert mostrados == esperados
+        assert mock_error.called == (not esperados)
+
+    @pytest.mark.parametrize(
+        ("consulta", "esperados"),
+        [("*dr*", ["- Padre (1)", "- Madre (2)"]), ("/^[pm].*e$/", ["- Padre (1)", "- Madre (2)"])],
+    )
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_por_subcadena_y_regex(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        consulta: str,
+        esperados: list[str],
+        arbol_con_datos: ArbolGenealogico,
+    ):
+        """
+        Test: Buscar persona por fragmento (*texto*) o por expresión regular (/patrón/)
+        """
+        # ARRANGE
+        ui = DinastiaUI(arbol_con_datos)
+
+        # ACT
+        with patch.object(DinastiaUI, "pedir_dato", return_value=consulta):
+            ui.buscar_persona()
+
+        # ASSERT
+        mostrados = [c.args[0] for c in mock_success.call_args_list if c.args[0].startswith("- ")]
+        assert mostrados == esperados
+        mock_error.assert_not_called()
+
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_sin_coincidencia_exacta_busca_por_palabras(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        arbol_vacio: ArbolGenealogico,
+    ):
+        """
+        Test: Si no hay un nombre exacto se busca por palabras, sin acentos
+        """
+        # ARRANGE
+        arbol_vacio.registrar_persona("Jaehaerys I el Conciliador")
+        ui = DinastiaUI(arbol_vacio)
+
+        # ACT
+        with patch.object(DinastiaUI, "pedir_dato", return_value="jaehaérys"):
+            ui.buscar_persona()
+
+        # ASSERT
+        mock_success.assert_any_call("- Jaehaerys I el Conciliador (1)")
+        mock_error.assert_not_called()
+
+    @patch("src.ui.DinastiaUI.pedir_dato", return_value="Vissenia")
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_por_sonido(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        mock_pedir_dato: MagicMock,
+        arbol_vacio: ArbolGenealogico,
+    ):
+        """
+        Test: Sin coincidencias exactas ni por palabras, se busca por cómo suena
+        """
+        # ARRANGE
+        arbol_vacio.registrar_persona("Visenya")
+        ui = DinastiaUI(arbol_vacio)
+
+        # ACT
+        ui.buscar_persona()
+
+        # ASSERT
+        mock_success.assert_any_call("- Visenya (1)")
+        mock_error.assert_not_called()
+
+    @patch("src.ui.DinastiaUI.pedir_dato", return_value="/Padre(/")
+    @patch("src.ui.UIMessages.error")
+    @patch("src.ui.UIMessages.success")
+    def test_buscar_persona_regex_invalida(
+        self,
+        mock_success: MagicMock,
+        mock_error: MagicMock,
+        mock_pedir_dato: MagicMock,
+        arbol_con_datos: ArbolGenealogico,
+    ):
+        """
+        Test: Una regex mal formada se informa como error sin interrumpir la UI
+        """
+        # ARRANGE
+        ui = DinastiaUI(arbol_con_datos)
+
+        # ACT
+        ui.buscar_persona()
+
+        # ASSERT
+        mock_error.assert_called_once()
+        assert "Consulta inválida" in mock_error.call_args.args[0]
+        mock_success.assert_not_called()
+
 
 # ==================== TESTS PARA mostrar_arbol ====================
 
@@ -325,11 +482,12 @@ class TestMostrarArbol:
         mock_success: MagicMock,
         mock_error: MagicMock,
         arbol_con_datos: ArbolGenealogico,
+        capsys: pytest.CaptureFixture[str],
     ):
         """
         Test: Mostrar árbol con datos
 
-        Verifica que mostrar_arbol() imprime el árbol correctamente.
+        Verifica que mostrar_arbol() escribe el árbol directamente en consola.
         """
         # ARRANGE
         ui = DinastiaUI(arbol_con_datos)
@@ -338,10 +496,10 @@ class TestMostrarArbol:
         ui.mostrar_arbol()
 
         # ASSERT
-        mock_success.assert_called_once()
-        # Verificar que se imprimió algo (el resultado del visitor)
-        call_args = mock_success.call_args[0][0]
-        assert "Padre" in call_args or "Madre" in call_args or "Hijo" in call_args
+        salida = capsys.readouterr().out
+        assert "Padre" in salida or "Madre" in salida or "Hijo" in salida
+        # El árbol se escribe línea a línea; UIMessages solo informa el total
+        mock_success.assert_called_once_with("Árbol mostrado: 3 persona(s).")
         mock_error.assert_not_called()
 
     @patch("builtins.print")
@@ -951,22 +1109,20 @@ class TestMenuPrincipal:
 class TestUIDataErrors:
     """Tests para capturar errores de ArbolGenealogicoError en UI"""
 
-    @patch("src.ui.SearchArbolVisitor")
     @patch("src.ui.DinastiaUI.pedir_dato", return_value="Test")
     @patch("src.ui.UIMessages.error")
     def test_buscar_persona_error_generico(
         self,
         mock_error: MagicMock,
         mock_pedir: MagicMock,
-        mock_visitor: MagicMock,
         arbol_vacio: ArbolGenealogico,
     ):
-        """Cubre líneas 119-121"""
+        """Cubre el manejo de errores de buscar_persona"""
         ui = DinastiaUI(arbol_vacio)
-        # Forzar error al recorrer
+        # Forzar error al consultar el índice
         with patch.object(
             arbol_vacio,
-            "recorrer_arbol_completo",
+            "buscar_por_nombre",
             side_effect=ArbolGenealogicoError("Error search"),
         ):
             ui.buscar_persona()
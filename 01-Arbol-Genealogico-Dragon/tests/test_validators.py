@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from unittest.mock import Mock, PropertyMock
 
 import pytest
@@ -8,10 +9,17 @@ from src.exceptions import (
     IDInvalidoError,
     LimitePadresExcedidoError,
     ParejaNoExisteError,
+    PersonaNoEncontradaError,
     RelacionIncestuosaError,
     RelacionInvalidaError,
 )
-from src.validators import FamilyValidator
+from src.models import Persona
+from src.validators import (
+    CacheAncestros,
+    CodigoValidacion,
+    FamilyValidator,
+    ResultadoValidacion,
+)
 
 
 @pytest.fixture
@@ -425,6 +433,310 @@ def test_validar_hijo_detecta_ciclo_tres_generaciones(validador_vacio: FamilyVal
     assert "Paradoja temporal" in str(e.value)
 
 
+def _cadena_de_generaciones(cantidad: int) -> list[Persona]:
+    """Crea un linaje lineal de 'cantidad' personas sueltas (cada una hija de la anterior)."""
+    linaje = [Persona(1, "Gen 1")]
+    for i in range(2, cantidad + 1):
+        hijo = Persona(i, f"Gen {i}")
+        hijo.padres = (linaje[-1], None)
+        linaje.append(hijo)
+    return linaje
+
+
+def test_validar_hijo_linaje_profundo_sin_recursion(validador_vacio: FamilyValidator):
+    """
+    Test: Detección de ciclo en un linaje más profundo que el límite de recursión
+
+    Escenario:
+    - Linaje lineal de 5000 generaciones
+    Resultado: ERROR (ciclo temporal) sin RecursionError
+    """
+    # ARRANGE
+    linaje = _cadena_de_generaciones(5000)
+
+    # ACT / ASSERT
+    with pytest.raises(CicloTemporalError):
+        validador_vacio.validar(linaje[-1], linaje[0], "hijo")
+
+
+def test_es_ancestro_de_pedigri_colapsado_visita_cada_ancestro_una_vez(
+    validador_vacio: FamilyValidator,
+):
+    """
+    Test: Pedigrí con colapso (mismos ancestros por ambas ramas)
+
+    Escenario:
+    - Cada generación tiene dos hermanos que son padres de ambos hijos de la siguiente
+    Resultado: se consulta 'padres' una sola vez por persona
+    """
+
+    # ARRANGE
+    def persona_contada(persona_id: int, padres: list[Mock | None]) -> tuple[Mock, PropertyMock]:
+        persona = Mock(id=persona_id, nombre=f"P{persona_id}")
+        lectura_padres = PropertyMock(return_value=padres)
+        type(persona).padres = lectura_padres
+        return persona, lectura_padres
+
+    lecturas: list[PropertyMock] = []
+    generacion: list[Mock] = []
+    padres: list[Mock | None] = [None, None]
+    for g in range(30):
+        generacion = []
+        for persona_id in (2 * g + 1, 2 * g + 2):
+            persona, lectura = persona_contada(persona_id, padres)
+            generacion.append(persona)
+            lecturas.append(lectura)
+        padres = [generacion[0], generacion[1]]
+    desconocido = Mock(id=999, nombre="Desconocido")
+
+    # ACT
+    es_ancestro = validador_vacio._es_ancestro_de(desconocido, generacion[0])
+
+    # ASSERT
+    assert es_ancestro is False
+    # Cada ancestro compartido se explora una sola vez, sin importar por cuántas ramas llegue
+    assert max(lectura.call_count for lectura in lecturas) == 1
+
+
+def test_cache_ancestros_calcula_e_invalida():
+    """
+    Test: CacheAncestros memoriza los ancestros y se invalida por descendientes
+
+    Escenario:
+    - Abuelo -> Padre -> Nieto
+    - Se invalida desde Padre
+    Resultado: se descartan Padre y Nieto, Abuelo se conserva
+    """
+    # ARRANGE
+    abuelo, padre, nieto = _cadena_de_generaciones(3)
+    abuelo.hijos.append(padre)
+    padre.hijos.append(nieto)
+    cache = CacheAncestros()
+
+    # ACT
+    ancestros_nieto = cache.ancestros(nieto)
+
+    # ASSERT
+    assert ancestros_nieto == {abuelo.id, padre.id}
+    assert len(cache) == 3
+
+    cache.invalidar_descendientes(padre)
+    assert len(cache) == 1
+
+    cache.invalidar()
+    assert len(cache) == 0
+
+
+def test_validar_hijo_con_cache_detecta_ciclo():
+    """
+    Test: El validador usa el CacheAncestros si se le pasa uno
+
+    Escenario:
+    Abuelo -> Padre -> Nieto, validador con cache
+    Intentamos: Nieto -> Padre de Abuelo
+    Resultado: ERROR (ciclo temporal) y el cache queda poblado
+    """
+    # ARRANGE
+    abuelo, _, nieto = _cadena_de_generaciones(3)
+    cache = CacheAncestros()
+    validador = FamilyValidator({}, cache_ancestros=cache)
+
+    # ACT / ASSERT
+    with pytest.raises(CicloTemporalError) as e:
+        validador.validar(nieto, abuelo, "hijo")
+
+    assert f"{abuelo.nombre} es ancestro de {nieto.nombre}" in str(e.value)
+    assert len(cache) == 3
+
+
+def _lote_de_personas(*nombres: str) -> dict[int, Persona]:
+    """Personas sueltas con registro compartido, indexadas por ID desde 1."""
+    registro: dict[int, Persona] = {}
+    for persona_id, nombre in enumerate(nombres, start=1):
+        registro[persona_id] = Persona(persona_id, nombre, registro=registro)
+    return registro
+
+
+def test_validar_lote_hijos_valido():
+    """
+    Test: Lote válido que combina relaciones nuevas con existentes
+
+    Resultado: sin errores
+    """
+    # ARRANGE
+    personas = _lote_de_personas("Abuelo", "Padre", "Madre", "Hijo")
+    personas[2].padres = (personas[1], None)
+    personas[1].hijos.append(personas[2])
+
+    # ACT
+    resultados = FamilyValidator(personas).validar_lote([(2, 4), (3, 4), (1, 3)])
+
+    # ASSERT
+    assert resultados == []
+
+
+def test_validar_lote_hijos_reporta_cada_regla():
+    """
+    Test: Cada regla de validar(..., "hijo") se reporta con un registro compacto
+
+    Escenario:
+    - Propio padre, repetida, tercer padre, pareja, persona inexistente
+    - Ciclo que pasa por una relación ya existente
+    Resultado: un registro por relación inválida, en orden de posición, que
+    se convierte en la misma excepción que lanzaría validar()
+    """
+    # ARRANGE
+    personas = _lote_de_personas("A", "B", "C", "D", "E")
+    personas[1].pareja = personas[5]
+    personas[5].pareja = personas[1]
+    personas[3].padres = (personas[2], None)
+    personas[2].hijos.append(personas[3])
+    pares = [
+        (1, 1),
+        (2, 3),  # ya existe
+        (1, 4),
+        (2, 4),
+        (3, 4),  # tercer padre
+        (1, 5),  # son pareja
+        (7, 4),
+        (3, 2),  # ciclo con la relación existente 2 -> 3
+    ]
+
+    # ACT
+    resultados = FamilyValidator(personas).validar_lote(pares)
+
+    # ASSERT
+    assert resultados == [
+        ResultadoValidacion(CodigoValidacion.PROPIO_PADRE, 1, 1, 0),
+        ResultadoValidacion(CodigoValidacion.RELACION_REPETIDA, 2, 3, 1),
+        ResultadoValidacion(CodigoValidacion.LIMITE_PADRES, 3, 4, 4),
+        ResultadoValidacion(CodigoValidacion.SON_PAREJA, 1, 5, 5),
+        ResultadoValidacion(CodigoValidacion.PERSONA_NO_ENCONTRADA, 7, 0, 6),
+        ResultadoValidacion(CodigoValidacion.CICLO_TEMPORAL, 3, 2, 7),
+    ]
+    excepciones = [type(r.a_excepcion(personas)) for r in resultados]
+    assert excepciones == [
+        RelacionInvalidaError,
+        RelacionInvalidaError,
+        LimitePadresExcedidoError,
+        RelacionIncestuosaError,
+        PersonaNoEncontradaError,
+        CicloTemporalError,
+    ]
+    assert resultados[0].mensaje(personas) == "A no puede ser su propio padre"
+    assert resultados[1].mensaje(personas) == "B ya es padre de C"
+
+
+def test_validar_lote_parejas():
+    """
+    Test: Lote de parejas con conflictos dentro del lote y con datos existentes
+
+    Resultado: propia pareja, pareja ya asignada en el lote y padre-hijo
+    """
+    # ARRANGE
+    personas = _lote_de_personas("A", "B", "C", "D")
+    personas[4].padres = (personas[3], None)
+    personas[3].hijos.append(personas[4])
+
+    # ACT
+    resultados = FamilyValidator(personas).validar_lote([(1, 1), (1, 2), (2, 3), (3, 4)], "pareja")
+
+    # ASSERT
+    assert [(r.codigo, r.persona1_id, r.persona2_id) for r in resultados] == [
+        (CodigoValidacion.PROPIA_PAREJA, 1, 1),
+        (CodigoValidacion.YA_TIENE_PAREJA, 2, 1),
+        (CodigoValidacion.PADRE_HIJO_COMO_PAREJA, 3, 4),
+    ]
+    assert resultados[1].mensaje(personas) == "B ya tiene una pareja: A."
+
+
+def test_validar_lote_relacion_invalida(validador_vacio: FamilyValidator):
+    """
+    Test: Tipo de relación desconocido en validar_lote y check
+
+    Resultado: ERROR (igual que validar)
+    """
+    persona = Persona(1, "A")
+    with pytest.raises(RelacionInvalidaError):
+        validador_vacio.validar_lote([(1, 1)], "primo")
+    with pytest.raises(RelacionInvalidaError):
+        validador_vacio.check(persona, persona, "primo")
+
+
+def _sin_cambios(p: dict[int, Persona]) -> None:
+    pass
+
+
+def _son_pareja(p: dict[int, Persona]) -> None:
+    p[1].pareja = p[2]
+    p[2].pareja = p[1]
+
+
+def _hijo_con_dos_padres(p: dict[int, Persona]) -> None:
+    p[2].padres = (p[3], p[4])
+
+
+def _padre_es_hijo_del_hijo(p: dict[int, Persona]) -> None:
+    p[1].padres = (p[2], None)
+    p[2].hijos.append(p[1])
+
+
+def _primera_ya_tiene_pareja(p: dict[int, Persona]) -> None:
+    p[1].pareja = p[3]
+
+
+def _primera_es_padre_de_segunda(p: dict[int, Persona]) -> None:
+    p[2].padres = (p[1], None)
+
+
+@pytest.mark.parametrize(
+    "relacion, preparar, codigo_esperado",
+    [
+        ("hijo", _sin_cambios, None),
+        ("hijo", _primera_es_padre_de_segunda, CodigoValidacion.RELACION_REPETIDA),
+        ("hijo", _son_pareja, CodigoValidacion.SON_PAREJA),
+        ("hijo", _hijo_con_dos_padres, CodigoValidacion.LIMITE_PADRES),
+        ("hijo", _padre_es_hijo_del_hijo, CodigoValidacion.CICLO_TEMPORAL),
+        ("pareja", _sin_cambios, None),
+        ("pareja", _primera_ya_tiene_pareja, CodigoValidacion.YA_TIENE_PAREJA),
+        ("pareja", _primera_es_padre_de_segunda, CodigoValidacion.PADRE_HIJO_COMO_PAREJA),
+    ],
+)
+def test_check_coincide_con_validar(
+    relacion: str,
+    preparar: Callable[[dict[int, Persona]], None],
+    codigo_esperado: CodigoValidacion | None,
+):
+    """
+    Test: check() detecta lo mismo que validar() sin lanzar excepciones
+
+    Escenario:
+    - Persona 1 y 2 en distintas situaciones (pareja, padres completos, ciclo)
+    Resultado: check() devuelve el código esperado y su excepción tiene el
+    mismo tipo y mensaje que la que lanza validar()
+    """
+    # ARRANGE
+    personas = _lote_de_personas("A", "B", "C", "D")
+    preparar(personas)
+    validador = FamilyValidator(personas)
+
+    # ACT
+    resultado = validador.check(personas[1], personas[2], relacion)
+
+    # ASSERT
+    if codigo_esperado is None:
+        assert resultado is None
+        validador.validar(personas[1], personas[2], relacion)
+        return
+    assert resultado is not None
+    assert resultado.codigo == codigo_esperado
+    with pytest.raises(RelacionInvalidaError) as e:
+        validador.validar(personas[1], personas[2], relacion)
+    esperado = resultado.a_excepcion(personas)
+    assert type(e.value) is type(esperado)
+    assert str(e.value) == str(esperado)
+
+
 # ================= validar_hijo end =================
 
 
@@ -0,0 +1,189 @@
+"""
+Tests para las versiones inmutables del árbol (src/versiones.py) y el
+repositorio versionado (src/repository_versionado.py).
+"""
+
+import threading
+
+import pytest
+
+from src.data_loader import DataLoaderDemo
+from src.exceptions import ArbolSoloLecturaError, PersonaNoEncontradaError
+from src.models import SIN_ID
+from src.repository import ArbolGenealogico
+from src.repository_versionado import ArbolVersionado
+from src.versiones import FilaPersona, VectorPersistente
+from src.visitors import PrintArbolVisitor
+
+
+def _impresion(arbol) -> str:
+    visitor = PrintArbolVisitor()
+    arbol.recorrer_arbol_completo(visitor)
+    return visitor.resultado
+
+
+def test_vector_persistente_comparte_estructura():
+    """
+    Test: asignar() retorna un vector nuevo y deja el anterior intacto
+
+    ARRANGE: Vector con 2000 posiciones (tres niveles)
+    ACT: Cambiar, borrar y agregar posiciones, también fuera de la capacidad
+    ASSERT: El vector original no cambia y los nodos no tocados se comparten
+    """
+    # ARRANGE
+    original = VectorPersistente().asignar((i, f"v{i}") for i in range(1, 2001))
+
+    # ACT
+    nuevo = original.asignar([(5, "cinco"), (1500, None), (40_000, "lejos")])
+
+    # ASSERT
+    assert (original.get(5), original.get(1500), original.get(40_000)) == ("v5", "v1500", None)
+    assert (nuevo.get(5), nuevo.get(1500), nuevo.get(40_000)) == ("cinco", None, "lejos")
+    assert nuevo.get(1999) == "v1999" and nuevo.get(-1) is None and nuevo.get(0) is None
+    assert [i for i, _ in nuevo.items()] == [*range(1, 1500), *range(1501, 2001), 40_000]
+    # La rama de los índices 1024..2047 no se tocó al cambiar el 5
+    parcial = original.asignar([(5, "cinco")])
+    assert parcial._raiz[1] is original._raiz[1]
+    assert original.asignar([]) is original
+
+
+def test_version_fijada_no_ve_cambios_posteriores():
+    """
+    Test: Una versión fijada conserva su estado mientras el árbol cambia
+
+    ARRANGE: Árbol versionado con padre e hijo
+    ACT: Fijar la versión, eliminar al padre y agregar una persona
+    ASSERT: La versión fijada sigue igual; la nueva refleja los cambios
+    """
+    # ARRANGE
+    arbol = ArbolVersionado()
+    padre, hijo = arbol.registrar_personas_bulk(["Viserys", "Rhaenyra"])
+    arbol.add_hijo(padre, hijo)
+
+    # ACT
+    fijada = arbol.version()
+    arbol.eliminar_persona(padre.id, confirmar_rotura=True)
+    arbol.registrar_persona("Daemon")
+    actual = arbol.version()
+
+    # ASSERT
+    assert fijada.get_persona(2).padres_ids == (1, SIN_ID)
+    assert [h.nombre for h in fijada.get_persona(1).hijos] == ["Rhaenyra"]
+    assert [p.nombre for p in fijada.init_get_root()] == ["Viserys"]
+    assert len(fijada.personas) == 2 and fijada.buscar_por_nombre("daemon") == []
+    assert actual.numero > fijada.numero
+    assert actual.get_persona(2).padres_ids == (SIN_ID, SIN_ID)
+    assert list(actual.personas) == [2, 3] and len(actual.personas) == 2
+    with pytest.raises(PersonaNoEncontradaError):
+        actual.get_persona(1)
+    with pytest.raises(ArbolSoloLecturaError):
+        actual.registrar_persona("Otra")
+    with pytest.raises(ArbolSoloLecturaError):
+        actual.get_persona(2).pareja = None
+
+
+def test_indices_compartidos_entre_versiones():
+    """
+    Test: Las versiones comparten índices pero cada una responde con sus personas
+
+    ARRANGE: Árbol versionado con una búsqueda hecha (índices construidos)
+    ACT: Fijar la versión, eliminar y agregar personas, y bifurcar una versión vieja
+    ASSERT: Cada versión encuentra solo a sus personas, el límite de prefijos
+            se completa salteando las ajenas y las raíces siguen los cambios
+    """
+    # ARRANGE
+    arbol = ArbolVersionado()
+    personas = arbol.registrar_personas_bulk([f"Rhaena {i}" for i in range(5)])
+    assert len(arbol.buscar_por_prefijo("rhaena")) == 5
+
+    # ACT
+    fijada = arbol.version()
+    for persona in personas[:3]:
+        arbol.eliminar_persona(persona.id)
+    arbol.registrar_persona("Rhaena Nueva")
+    arbol.add_hijo(personas[3], personas[4])
+    actual = arbol.version()
+    bifurcada = fijada.con_cambios({9: FilaPersona("Rhaena Otra", SIN_ID, (SIN_ID, SIN_ID), ())})
+
+    # ASSERT
+    assert [p.id for p in fijada.buscar_por_prefijo("rhaena", 3)] == [1, 2, 3]
+    assert [p.id for p in actual.buscar_por_prefijo("rhaena", 3)] == [4, 5, 6]
+    assert [p.id for p in fijada.buscar_por_nombre("rhaena 1")] == [2]
+    assert actual.buscar_por_nombre("rhaena 1") == []
+    assert [p.id for p in actual.buscar_por_palabras("rhaena")] == [4, 5, 6]
+    assert [p.id for p in fijada.buscar_aproximado("Rhaena Nueva", 0)] == []
+    assert [p.id for p in bifurcada.buscar_por_subcadena("otra")] == [9]
+    assert actual.buscar_por_subcadena("otra") == []
+    assert [p.id for p in fijada.init_get_root()] == [1, 2, 3, 4, 5]
+    assert [p.id for p in actual.init_get_root()] == [4, 6]
+
+
+def test_arbol_versionado_coincide_con_arbol_genealogico():
+    """
+    Test: Cargar la demo por ArbolVersionado da las mismas consultas que ArbolGenealogico
+    """
+    # ARRANGE
+    clasico = ArbolGenealogico()
+    DataLoaderDemo().cargar_datos(clasico)
+
+    # ACT
+    versionado = ArbolVersionado()
+    DataLoaderDemo().cargar_datos(versionado)
+    envuelto = ArbolVersionado(clasico)
+
+    # ASSERT
+    for arbol in (versionado, envuelto):
+        assert list(arbol.personas) == list(clasico.personas)
+        assert _impresion(arbol) == _impresion(clasico)
+        assert [p.id for p in arbol.buscar_por_prefijo("rhae")] == [
+            p.id for p in clasico.buscar_por_prefijo("rhae")
+        ]
+        assert [p.id for p in arbol.buscar_fonetico("Jaeheris")] == [
+            p.id for p in clasico.buscar_fonetico("Jaeheris")
+        ]
+
+
+def test_lectores_concurrentes_ven_versiones_consistentes():
+    """
+    Test: Lectores sin locks siempre ven versiones internamente consistentes
+
+    ARRANGE: Un escritor que agrega y elimina hijos de a pares
+    ACT: Varios lectores fijan versiones y las recorren mientras tanto
+    ASSERT: En cada versión, hijos y padres coinciden y la cantidad es exacta
+    """
+    # ARRANGE
+    arbol = ArbolVersionado()
+    raiz = arbol.registrar_persona("Raíz")
+    errores: list[str] = []
+    terminado = threading.Event()
+
+    def escritor() -> None:
+        for numero in range(300):
+            hijo = arbol.registrar_persona(f"Hijo {numero}")
+            arbol.add_hijo(raiz, hijo)
+            if numero % 3 == 0:
+                arbol.eliminar_persona(hijo.id)
+        terminado.set()
+
+    def lector() -> None:
+        while not terminado.is_set():
+            version = arbol.version()
+            hijos = list(version.get_persona(raiz.id).hijos_ids)
+            ids = list(version.personas)
+            if len(ids) != len(version.personas):
+                errores.append(f"cantidad inconsistente en la versión {version.numero}")
+            for hijo_id in hijos:
+                if version.padres_de(hijo_id) != (raiz.id, SIN_ID):
+                    errores.append(f"hijo {hijo_id} sin su padre en la versión {version.numero}")
+
+    # ACT
+    hilos = [threading.Thread(target=lector) for _ in range(4)]
+    hilos.append(threading.Thread(target=escritor))
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    # ASSERT
+    assert errores == []
+    assert len(arbol.get_persona(raiz.id).hijos) == 200
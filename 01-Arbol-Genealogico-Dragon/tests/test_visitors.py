@@ -1,5 +1,19 @@
+import io
+
+import pytest
+
 from src.models import Persona
-from src.visitors import ArbolVisitorInterface, PrintArbolVisitor, SearchArbolVisitor
+from src.visitors import (
+    ArbolVisitorInterface,
+    EstadisticasVisitor,
+    MapaVisitados,
+    ModoRecorrido,
+    PrintArbolVisitor,
+    SearchArbolVisitor,
+    VisitorRecorrido,
+    iterar_recorrido,
+    recorrer_fusionado,
+)
 
 
 def test_base_visitor_interface_coverage():
@@ -141,21 +155,70 @@ def test_print_visitor_evita_ciclos_recursivos():
     # Si pasa este test sin colgarse, la línea 47 hizo su trabajo
 
 
-def test_print_visitor_recursivo_detecta_visitados():
-    """Cubre específicamente la línea 47"""
+def test_print_visitor_iterar_lineas_detecta_visitados():
+    """Verifica que una persona ya visitada no vuelva a generar líneas"""
     p1 = Persona(1, "A")
     visitor = PrintArbolVisitor()
 
     # Llamamos una vez
-    visitor._visitar_recursivo(p1, True, [])  # type: ignore
+    primeras = list(visitor.iterar_lineas(p1))
 
     # Llamamos de nuevo con la misma persona (ya visitada)
-    visitor._visitar_recursivo(p1, True, [])  # type: ignore
+    segundas = list(visitor.iterar_lineas(p1))
 
-    # Si no hay error, la línea 47 funcionó
+    assert primeras == ["└─ A (id: 1)"]
+    assert segundas == []
     assert p1.id in visitor.visitados
 
 
+def test_print_visitor_linaje_profundo_sin_recursion():
+    """
+    Test: Un linaje más profundo que el límite de recursión se imprime completo
+
+    ARRANGE: Cadena de 5000 generaciones
+    ACT: Ejecutar el visitor desde la raíz
+    ASSERT: Una línea por persona y la última con el prefijo más largo
+    """
+    # ARRANGE
+    personas = [Persona(i, f"P{i}") for i in range(1, 5001)]
+    for padre, hijo in zip(personas, personas[1:]):
+        padre.hijos.append(hijo)
+    visitor = PrintArbolVisitor()
+
+    # ACT
+    lineas = visitor.ejecutar(personas[0]).split("\n")
+
+    # ASSERT
+    assert len(lineas) == 5000
+    assert lineas[-1] == "   " * 4999 + "└─ P5000 (id: 5000)"
+
+
+def test_print_visitor_escribe_en_destino():
+    """
+    Test: Con un destino, las líneas se escriben en el stream y no se acumulan
+
+    ARRANGE: Padre con dos hijos y un StringIO como destino
+    ACT: Visitar al padre
+    ASSERT: El stream contiene el árbol y resultado queda vacío
+    """
+    # ARRANGE
+    padre = Persona(1, "Viserys")
+    padre.hijos.append(Persona(2, "Rhaenyra"))
+    padre.hijos.append(Persona(3, "Aegon"))
+    destino = io.StringIO()
+    visitor = PrintArbolVisitor(destino=destino)
+
+    # ACT
+    visitor.visitar(padre)
+
+    # ASSERT
+    assert destino.getvalue() == (
+        "└─ Viserys (id: 1)\n   ├─ Rhaenyra (id: 2)\n   └─ Aegon (id: 3)\n"
+    )
+    assert visitor.resultado == []
+    assert visitor.cantidad_lineas == 3
+
+
 def test_print_visitor_con_pareja():
     """
     Test: Cubre la línea 59 - Persona con pareja
@@ -377,3 +440,171 @@ def test_print_visitor_init():
     # ASSERT
     assert visitor.resultado == []
     assert visitor.visitados == set()
+
+
+# ==================== MOTOR DE RECORRIDO ====================
+
+
+def _familia_para_recorrido() -> Persona:
+    """
+    Raíz(1) con hijos A(2) y B(3); A tiene a C(4), y D(5) es hijo de A y de B.
+    """
+    raiz, a, b, c, d = (Persona(i, n) for i, n in enumerate("RABCD", start=1))
+    raiz.hijos.extend([a, b])
+    a.hijos.extend([c, d])
+    b.hijos.append(d)
+    return raiz
+
+
+@pytest.mark.parametrize(
+    ("modo", "esperado"),
+    [
+        (ModoRecorrido.PREORDEN, [("R", 0), ("A", 1), ("C", 2), ("D", 2), ("B", 1)]),
+        (ModoRecorrido.POSTORDEN, [("C", 2), ("D", 2), ("A", 1), ("B", 1), ("R", 0)]),
+        (ModoRecorrido.ANCHURA, [("R", 0), ("A", 1), ("B", 1), ("C", 2), ("D", 2)]),
+    ],
+)
+def test_iterar_recorrido_modos(modo: ModoRecorrido, esperado: list[tuple[str, int]]):
+    """
+    Test: Cada modo entrega a cada persona una sola vez, en su orden y con su profundidad
+
+    ARRANGE: Familia donde D es alcanzable desde A y desde B
+    ACT: Recorrer en el modo dado
+    ASSERT: Orden y profundidades esperados, sin repetir a D
+    """
+    # ARRANGE
+    raiz = _familia_para_recorrido()
+
+    # ACT
+    recorrido = [(p.nombre, prof) for p, prof, _ in iterar_recorrido([raiz], modo)]
+
+    # ASSERT
+    assert recorrido == esperado
+
+
+def test_iterar_recorrido_respeta_visitados_compartidos():
+    """
+    Test: Las personas ya presentes en visitados se omiten con su descendencia
+
+    ARRANGE: Familia de prueba y un MapaVisitados que ya contiene a A
+    ACT: Recorrer en preorden desde la raíz
+    ASSERT: Ni A ni C aparecen; D sigue alcanzable a través de B
+    """
+    # ARRANGE
+    raiz = _familia_para_recorrido()
+    visitados = MapaVisitados([2])
+
+    # ACT
+    nombres = [p.nombre for p, _, _ in iterar_recorrido([raiz], visitados=visitados)]
+
+    # ASSERT
+    assert nombres == ["R", "B", "D"]
+    assert set(visitados) == {1, 2, 3, 5}
+
+
+def test_iterar_recorrido_linaje_profundo():
+    """
+    Test: Un linaje más profundo que el límite de recursión se recorre en todos los modos
+    """
+    # ARRANGE
+    personas = [Persona(i, f"P{i}") for i in range(1, 5001)]
+    for padre, hijo in zip(personas, personas[1:]):
+        padre.hijos.append(hijo)
+
+    for modo in ModoRecorrido:
+        # ACT
+        recorrido = list(iterar_recorrido([personas[0]], modo))
+
+        # ASSERT
+        assert len(recorrido) == 5000
+        assert max(prof for _, prof, _ in recorrido) == 4999
+
+
+def test_mapa_visitados_se_comporta_como_conjunto():
+    """
+    Test: MapaVisitados crece a demanda y se compara como un set de IDs
+    """
+    # ARRANGE
+    visitados = MapaVisitados()
+
+    # ACT
+    visitados.add(3)
+    visitados.add(1000)
+    visitados.add(3)
+    visitados.discard(7)
+
+    # ASSERT
+    assert len(visitados) == 2
+    assert 1000 in visitados and 3 in visitados
+    assert 4 not in visitados and 5000 not in visitados and "3" not in visitados
+    assert visitados == {3, 1000}
+    with pytest.raises(ValueError):
+        visitados.add(-1)
+
+
+def test_visitor_recorrido_personalizado_usa_hook():
+    """
+    Test: Un visitor nuevo solo implementa al_visitar y hereda el recorrido
+    """
+
+    # ARRANGE
+    class ProfundidadMaximaVisitor(VisitorRecorrido):
+        modo = ModoRecorrido.POSTORDEN
+
+        def __init__(self):
+            super().__init__()
+            self.maxima = 0
+
+        def al_visitar(self, persona: Persona, profundidad: int, es_ultimo: bool) -> None:
+            self.maxima = max(self.maxima, profundidad)
+
+    visitor = ProfundidadMaximaVisitor()
+
+    # ACT
+    _familia_para_recorrido().accept_visitor(visitor)
+
+    # ASSERT
+    assert visitor.maxima == 2
+    assert len(visitor.visitados) == 5
+
+
+def test_combinar_rechaza_parciales_de_otro_tipo():
+    """
+    Test: combinar() con un parcial de otra clase lanza TypeError, también con -O
+    """
+    # ARRANGE
+    impresion = PrintArbolVisitor()
+    busqueda = SearchArbolVisitor("Aegon")
+
+    # ACT & ASSERT
+    with pytest.raises(TypeError, match="SearchArbolVisitor con PrintArbolVisitor"):
+        impresion.combinar(busqueda, {})
+    with pytest.raises(TypeError, match="PrintArbolVisitor con SearchArbolVisitor"):
+        busqueda.combinar(impresion, {})
+    assert impresion.resultado == [] and busqueda.resultado == []
+
+
+def test_recorrer_fusionado_respeta_visitados_de_un_visitor_reutilizado():
+    """
+    Test: Un visitor que ya recorrió el árbol no vuelve a contar a nadie al fusionarse
+
+    ARRANGE: Dos estadísticas que ya recorrieron la familia una vez
+    ACT: Recorrer de nuevo una sola, y la otra junto con un visitor nuevo
+    ASSERT: Ambas quedan igual que tras la primera pasada y el visitor
+            nuevo recorre a toda la familia
+    """
+    # ARRANGE
+    raiz = _familia_para_recorrido()
+    solo, fusionado = EstadisticasVisitor(), EstadisticasVisitor()
+    recorrer_fusionado([raiz], [solo])
+    recorrer_fusionado([raiz], [fusionado])
+    nuevo = PrintArbolVisitor()
+
+    # ACT
+    recorrer_fusionado([raiz], [solo])
+    recorrer_fusionado([raiz], [fusionado, nuevo])
+
+    # ASSERT
+    assert solo.cantidad == fusionado.cantidad == 5
+    assert fusionado.visitados == {1, 2, 3, 4, 5}
+    assert nuevo.cantidad_lineas == 5